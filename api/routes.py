@@ -1,14 +1,25 @@
 from typing import List
 
 import pandas as pd
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
+from api.service import AnalyzerPool, MicroBatcher
 from ev_qa_framework import EVBatteryAnalyzer, EVQAFramework
 from ev_qa_framework.models import BatteryTelemetryModel
 
 router = APIRouter()
 
+_batcher: MicroBatcher | None = None
+
+
+def get_batcher() -> MicroBatcher:
+    """Process-wide batcher; the warm analyzer pool is built on first use."""
+    global _batcher
+    if _batcher is None:
+        _batcher = MicroBatcher(AnalyzerPool.from_environment())
+    return _batcher
+
 
 class AnalysisRequest(BaseModel):
     telemetry: List[dict]
@@ -23,14 +34,11 @@ class AnalysisResponse(BaseModel):
 
 
 @router.post("/analyze", response_model=AnalysisResponse)
-async def analyze_telemetry(request: AnalysisRequest):
+async def analyze_telemetry(request: AnalysisRequest, batcher: MicroBatcher = Depends(get_batcher)):
     """Analyze battery telemetry using ML and rule-based methods"""
     try:
-        # Initialize framework
-        qa = EVQAFramework("API-Analyzer")
-
-        # Run analysis
-        results = await qa.run_test_suite(request.telemetry)
+        # Scored on a warm, pre-trained analyzer together with concurrent requests
+        results = await batcher.submit(request.telemetry)
 
         return AnalysisResponse(
             total_samples=results["ml_analysis"]["total_samples"],
@@ -0,0 +1,239 @@
+"""Warm analyzer pool and request micro-batching for the analysis API."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import queue
+import time
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ev_qa_framework import EVQAFramework
+from ev_qa_framework.config import FrameworkConfig
+from ev_qa_framework.metrics import (
+    api_analysis_batch_size,
+    api_analysis_latency_seconds,
+    api_analysis_queue_depth,
+    api_analysis_queue_wait_seconds,
+)
+
+# CSV or Parquet file with baseline telemetry used to pre-train the pool
+BASELINE_ENV = "EV_QA_BASELINE_PATH"
+# Number of warm analyzers (and executor threads)
+WORKERS_ENV = "EV_QA_API_WORKERS"
+
+
+def nominal_baseline(
+    config: FrameworkConfig | None = None, n_samples: int = 2000, seed: int = 0
+) -> pd.DataFrame:
+    """Synthetic in-spec telemetry used when no baseline file is configured."""
+    thresholds = (config or FrameworkConfig()).safety_thresholds
+    rng = np.random.default_rng(seed)
+    v_mid = (thresholds.min_voltage + thresholds.max_voltage) / 2
+    v_span = thresholds.max_voltage - thresholds.min_voltage
+    max_current = thresholds.max_current or 500.0
+    return pd.DataFrame(
+        {
+            "voltage": np.clip(
+                rng.normal(v_mid, v_span / 6, n_samples),
+                thresholds.min_voltage,
+                thresholds.max_voltage,
+            ),
+            "current": rng.normal(0.0, max_current / 4, n_samples),
+            "temp": rng.normal(30.0, 8.0, n_samples),
+            "soc": rng.uniform(thresholds.min_soc, 100.0, n_samples),
+        }
+    )
+
+
+def load_baseline(path: str | None = None) -> pd.DataFrame:
+    """Load baseline telemetry from *path* or ``$EV_QA_BASELINE_PATH``.
+
+    Falls back to :func:`nominal_baseline` when neither is set.
+    """
+    path = path or os.environ.get(BASELINE_ENV)
+    if not path:
+        return nominal_baseline()
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+class AnalyzerPool:
+    """
+    Fixed set of pre-trained ``EVQAFramework`` instances.
+
+    The ML analyzer is fitted once on the baseline at construction and
+    copied for the remaining slots. Each instance is used by one worker at
+    a time; :meth:`acquire` blocks until one is free.
+
+    Args:
+        baseline: Telemetry the analyzers are fitted on.
+        size: Number of warm instances.
+        config: Framework configuration shared by all instances.
+    """
+
+    def __init__(
+        self, baseline: pd.DataFrame, size: int = 4, config: FrameworkConfig | None = None
+    ):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        template = EVQAFramework("API-Analyzer", config)
+        template.ml_analyzer.fit(baseline)
+        self.size = size
+        self._idle: queue.Queue[EVQAFramework] = queue.Queue()
+        self._idle.put(template)
+        for _ in range(size - 1):
+            self._idle.put(copy.deepcopy(template))
+
+    @classmethod
+    def from_environment(cls) -> "AnalyzerPool":
+        """Build a pool sized and trained from environment settings."""
+        size = int(os.environ.get(WORKERS_ENV, min(4, os.cpu_count() or 1)))
+        return cls(load_baseline(), size)
+
+    @contextmanager
+    def acquire(self) -> Iterator[EVQAFramework]:
+        """Borrow an idle instance for the duration of the block."""
+        qa = self._idle.get()
+        try:
+            yield qa
+        finally:
+            self._idle.put(qa)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent analysis requests into batches run off the event loop.
+
+    The first queued request opens a batch; everything arriving within
+    ``max_delay`` seconds (up to ``max_batch_size`` requests) joins it. The
+    batch is scored through ``EVQAFramework.run_test_suites`` on an executor
+    thread, so a single ``score_samples`` call covers all of its requests.
+
+    Args:
+        pool: Warm analyzers to run batches on.
+        max_batch_size: Upper bound on requests per batch.
+        max_delay: Latency budget (seconds) spent waiting to fill a batch.
+        executor: Executor for CPU-bound work. Defaults to a thread pool
+            with one worker per pooled analyzer.
+    """
+
+    def __init__(
+        self,
+        pool: AnalyzerPool,
+        max_batch_size: int = 32,
+        max_delay: float = 0.005,
+        executor: Executor | None = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.pool = pool
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=pool.size, thread_name_prefix="ev-qa-api"
+        )
+        self._queue: asyncio.Queue | None = None
+        self._collector: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the batch collector on the running event loop (idempotent)."""
+        if self._collector is None or self._collector.done():
+            self._queue = asyncio.Queue()
+            self._collector = asyncio.create_task(self._collect())
+
+    async def stop(self) -> None:
+        """Stop collecting; running batches finish, queued requests are cancelled."""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+        api_analysis_queue_depth.set(0)
+
+    async def submit(self, telemetry: list[dict[str, Any]]) -> dict[str, Any]:
+        """Queue one request and wait for its ``run_test_suite`` result."""
+        await self.start()
+        assert self._queue is not None
+        enqueued = time.perf_counter()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((telemetry, future, enqueued))
+        api_analysis_queue_depth.set(self._queue.qsize())
+        try:
+            return await future
+        finally:
+            api_analysis_latency_seconds.observe(time.perf_counter() - enqueued)
+
+    async def _collect(self) -> None:
+        assert self._queue is not None
+        while True:
+            first = await self._queue.get()
+            remaining = first[2] + self.max_delay - time.perf_counter()
+            if remaining > 0 and self._queue.qsize() < self.max_batch_size - 1:
+                try:
+                    await asyncio.sleep(remaining)
+                except asyncio.CancelledError:
+                    # stop() during the delay: `first` is no longer in the queue
+                    # it drains, so cancel it here like the requests still queued
+                    first[1].cancel()
+                    raise
+            batch = [first]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            api_analysis_queue_depth.set(self._queue.qsize())
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list[tuple[list[dict], asyncio.Future, float]]) -> None:
+        started = time.perf_counter()
+        for _, _, enqueued in batch:
+            api_analysis_queue_wait_seconds.observe(started - enqueued)
+        api_analysis_batch_size.observe(len(batch))
+
+        suites = [telemetry for telemetry, _, _ in batch]
+        loop = asyncio.get_running_loop()
+        try:
+            outcomes = await loop.run_in_executor(self._executor, self._run, suites)
+        except Exception as e:
+            outcomes = [e] * len(batch)
+        for (_, future, _), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def _run(self, suites: list[list[dict]]) -> list[dict[str, Any] | Exception]:
+        with self.pool.acquire() as qa:
+            try:
+                return list(qa.run_test_suites(suites))
+            except Exception:
+                if len(suites) == 1:
+                    raise
+            # Re-run one by one so a single bad request cannot fail its neighbours
+            outcomes: list[dict[str, Any] | Exception] = []
+            for suite in suites:
+                try:
+                    outcomes.append(qa.run_test_suites([suite])[0])
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
@@ -11,7 +11,6 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 
 import numpy as np
-import pandas as pd
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -23,16 +22,19 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from fastapi.responses import Response
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from api.routes import router  # noqa: E402
-from ev_qa_framework import SOHPredictor  # noqa: E402
+from api.routes import get_batcher, router  # noqa: E402
 from ev_qa_framework.metrics import *  # noqa: F401,F403 — register metrics
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize background tasks on startup."""
+    # Build and pre-train the analyzer pool before serving requests
+    batcher = get_batcher()
+    await batcher.start()
     asyncio.create_task(telemetry_streamer())
     yield
+    await batcher.stop()
 
 
 app = FastAPI(title="EV Battery Monitor", version="1.0.0", lifespan=lifespan)
@@ -109,6 +111,10 @@ async def telemetry_streamer():
     Generate realistic telemetry with occasional anomalies
     and ML-based SOH prediction
     """
+    import pandas as pd
+
+    from ev_qa_framework.soh_predictor import SOHPredictor
+
     # Simulation data for SOH predictor
     df_history = pd.DataFrame(
         {
@@ -119,8 +125,10 @@ async def telemetry_streamer():
         }
     )
 
+    # Training (and the TensorFlow import behind it) runs in a worker thread
+    # so startup and the websocket clients are not blocked by it
     predictor = SOHPredictor(sequence_length=10)
-    predictor.train(df_history, epochs=5)
+    await asyncio.to_thread(predictor.train, df_history, epochs=5)
 
     current_soh = 99.8
 
@@ -180,7 +188,7 @@ async def telemetry_streamer():
 
         # Predict SOH degradation (very slowly)
         try:
-            predictor.predict_next(df_history)
+            await asyncio.to_thread(predictor.predict_next, df_history)
             # In simulation, we'll slowly decrease real SOH based on temp
             degradation = 0.001 if data["temperature"] < 45 else 0.005
             current_soh -= degradation
@@ -2,25 +2,44 @@
 
 __version__ = "2.5.0"
 
-# Core imports — always available (lightweight)
-from .analysis import AnomalyDetector, EVBatteryAnalyzer
-from .config import (
-    FrameworkConfig,
-    MLConfig,
-    SafetyThresholds,
-    get_default_config,
-    get_tesla_config,
-)
-from .framework import EVQAFramework
-from .models import BatteryCellDataModel, BatteryTelemetryModel
-from .thermal_runaway import ThermalRunawayPredictor
+from typing import TYPE_CHECKING
 
-# Lazy-loaded modules — imported on first access
+if TYPE_CHECKING:
+    from .analysis import AnomalyDetector, EVBatteryAnalyzer
+    from .config import (
+        FrameworkConfig,
+        MLConfig,
+        SafetyThresholds,
+        get_default_config,
+        get_tesla_config,
+    )
+    from .framework import EVQAFramework
+    from .models import BatteryCellDataModel, BatteryTelemetryModel
+    from .thermal_runaway import FleetThermalMonitor, ThermalRunawayMonitor, ThermalRunawayPredictor
+
+# Everything is imported on first access, so ``import ev_qa_framework`` stays
+# cheap and pandas / scikit-learn load only when a feature needs them.
 _LAZY_IMPORTS: dict[str, str] = {
+    # Core
+    "EVQAFramework": ".framework",
+    "BatteryTelemetryModel": ".models",
+    "BatteryCellDataModel": ".models",
+    "EVBatteryAnalyzer": ".analysis",
+    "AnomalyDetector": ".analysis",
+    "ThermalRunawayPredictor": ".thermal_runaway",
+    "ThermalRunawayMonitor": ".thermal_runaway",
+    "FleetThermalMonitor": ".thermal_runaway",
+    "FrameworkConfig": ".config",
+    "SafetyThresholds": ".config",
+    "MLConfig": ".config",
+    "get_default_config": ".config",
+    "get_tesla_config": ".config",
     # CAN bus
     "CANBatterySimulator": ".can_bus",
+    "CANDispatcher": ".can_bus",
     "CANHardwareInterface": ".can_bus",
     "CANTelemetryReceiver": ".can_bus",
+    "CyclicFrameSender": ".can_bus",
     "DBCFileSimulator": ".can_bus",
     "HardwareCANError": ".can_bus",
     "CANConnectionError": ".can_bus",
@@ -30,12 +49,16 @@ _LAZY_IMPORTS: dict[str, str] = {
     "OBD2Adapter": ".can_bus",
     "OBD2ConnectionError": ".can_bus",
     "OBD2ProtocolError": ".can_bus",
+    "CANRecorder": ".can_recorder",
+    "open_recording": ".can_recorder",
+    "TraceReplayer": ".trace_replay",
     "detect_can_interfaces": ".can_bus",
     "find_hardware_can_interfaces": ".can_bus",
     "find_available_can_channel": ".can_bus",
     # DBC
     "DBCParser": ".dbc_parser",
     "builtin_dbc": ".dbc_parser",
+    "FrameSynthesizer": ".dbc_parser",
     # Cell balance
     "CellBalanceAnalyzer": ".cell_balance",
     # Chemistry
@@ -45,15 +68,19 @@ _LAZY_IMPORTS: dict[str, str] = {
     "ChemistryKey": ".chemistries",
     "ALL_CHEMISTRIES": ".chemistries",
     "OCVCurve": ".chemistries",
+    "OCVTable": ".chemistries",
     "OCV_LFP": ".chemistries",
     "OCV_NMC": ".chemistries",
     "OCV_NCA": ".chemistries",
     "AgingModel": ".chemistries",
+    "AgingGrid": ".chemistries",
+    "project_grid": ".chemistries",
     "AGING_LFP": ".chemistries",
     "AGING_NMC": ".chemistries",
     "AGING_NCA": ".chemistries",
     "ThermalParams": ".chemistries",
     "ThermalModel": ".chemistries",
+    "neighbour_coupling": ".chemistries",
     "THERMAL_LFP": ".chemistries",
     "THERMAL_NMC": ".chemistries",
     "THERMAL_NCA": ".chemistries",
@@ -72,13 +99,18 @@ _LAZY_IMPORTS: dict[str, str] = {
     "hil": ".hil",
     "bms_protocol": ".bms_protocol",
     "modbus": ".modbus",
+    "can_recorder": ".can_recorder",
+    "trace_replay": ".trace_replay",
     # v2.0 classes
     "BatteryScorer": ".battery_scoring",
     "PhysicsFeatureExtractor": ".physics_features",
     "FleetAnalytics": ".fleet_analytics",
     "FleetAlert": ".fleet_analytics",
+    "FleetReferenceModel": ".fleet_analytics",
     "BatteryDigitalTwin": ".digital_twin",
     "BatteryState": ".digital_twin",
+    "BatteryFleetTwin": ".digital_twin",
+    "DegradationHorizon": ".digital_twin",
     "V2GScenarioGenerator": ".v2g_scenarios",
     "V2GHealthAnalyzer": ".v2g_scenarios",
     "V2SScenarioGenerator": ".v2g_scenarios",
@@ -98,7 +130,10 @@ _LAZY_IMPORTS: dict[str, str] = {
     "BMSModbusTCPInterface": ".bms_protocol",
     "BMSModbusRTUInterface": ".bms_protocol",
     "ProtocolType": ".bms_protocol",
+    "BMSPollingScheduler": ".bms_protocol",
+    "DevicePollStats": ".bms_protocol",
     "ModbusTCPClient": ".modbus",
+    "AsyncModbusTCPClient": ".modbus",
     "ModbusRTUClient": ".modbus",
     "BMS_REGISTER_MAP": ".modbus",
     # BMS adapters
@@ -107,6 +142,10 @@ _LAZY_IMPORTS: dict[str, str] = {
     "BYDBMSAdapter": ".bms_adapters",
     "NioBMSAdapter": ".bms_adapters",
     # Metrics
+    "api_analysis_batch_size": ".metrics",
+    "api_analysis_latency_seconds": ".metrics",
+    "api_analysis_queue_depth": ".metrics",
+    "api_analysis_queue_wait_seconds": ".metrics",
     "battery_anomaly_total": ".metrics",
     "battery_cell_imbalance_max": ".metrics",
     "battery_current_amps": ".metrics",
@@ -114,23 +153,13 @@ _LAZY_IMPORTS: dict[str, str] = {
     "battery_soh_percent": ".metrics",
     "battery_temperature_celsius": ".metrics",
     "battery_voltage_volts": ".metrics",
+    "bms_poll_latency_seconds": ".metrics",
+    "bms_poll_misses_total": ".metrics",
     # Vector export
     "VectorExporter": ".vector_export",
 }
 
-__all__ = list(_LAZY_IMPORTS.keys()) + [
-    "EVQAFramework",
-    "BatteryTelemetryModel",
-    "BatteryCellDataModel",
-    "EVBatteryAnalyzer",
-    "AnomalyDetector",
-    "ThermalRunawayPredictor",
-    "FrameworkConfig",
-    "SafetyThresholds",
-    "MLConfig",
-    "get_default_config",
-    "get_tesla_config",
-]
+__all__ = list(_LAZY_IMPORTS.keys())
 
 
 def __getattr__(name: str):
@@ -8,13 +8,17 @@ Machine learning module for anomaly detection in battery telemetry.
 import json
 import logging
 import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.ensemble import IsolationForest
 
 from .physics_features import PhysicsFeatureExtractor
 from .utils import normalize_columns
@@ -42,6 +46,10 @@ class EVBatteryAnalyzer:
         contamination: Expected proportion of anomalies in the dataset (default 0.1 = 10%)
     """
 
+    # Features used for detection; SOC is a dependent variable and is left out
+    FEATURES: list[str] = ["voltage", "current", "temp"]
+    MIN_SAMPLES = 10
+
     def __init__(
         self,
         contamination: float = 0.1,
@@ -66,6 +74,10 @@ class EVBatteryAnalyzer:
             - contamination affects sensitivity: lower value = fewer false positives
             - n_estimators recommended 100+ for stable results
         """
+        import pandas as pd
+        from sklearn.ensemble import IsolationForest
+        from sklearn.preprocessing import StandardScaler
+
         # Create the Isolation Forest model with configured parameters
         self.model = IsolationForest(
             contamination=contamination,  # Expected proportion of anomalies
@@ -89,7 +101,9 @@ class EVBatteryAnalyzer:
         self.warning_threshold = warning_threshold
         self.physics_extractor = PhysicsFeatureExtractor()
 
-    def analyze_telemetry(self, df_telemetry: pd.DataFrame) -> dict[str, Any]:
+    def analyze_telemetry(
+        self, df_telemetry: pd.DataFrame, *, normalized: bool = False
+    ) -> dict[str, Any]:
         """
         Analyze battery telemetry for anomalies.
 
@@ -103,6 +117,8 @@ class EVBatteryAnalyzer:
         Args:
             df_telemetry: DataFrame with columns ['voltage', 'current', 'temp', 'soc'].
                          Each row represents a single point in time.
+            normalized: Set when the column names have already been passed
+                through ``normalize_columns``; skips the defensive copy.
 
         Returns:
             Dictionary with analysis results:
@@ -123,26 +139,13 @@ class EVBatteryAnalyzer:
             >>> print(results['anomalies_detected'])
             1
         """
-        # Step 1: Data preparation — normalize column names
-        from .utils import normalize_columns, require_columns
-
-        df: pd.DataFrame = normalize_columns(df_telemetry)
-        require_columns(df, ["voltage", "current", "temp"])
-
-        MIN_SAMPLES = 10
-        if len(df) < MIN_SAMPLES:
-            return {
-                "total_samples": len(df),
-                "anomalies_detected": 0,
-                "anomaly_percentage": 0.0,
-                "severity": "UNKNOWN",
-                "error": f"Insufficient data: {len(df)} samples < {MIN_SAMPLES} minimum",
-            }
+        df, error = self._prepare(df_telemetry, normalized)
+        if error is not None:
+            return error
 
         # Step 1: Select only numeric features for analysis
         # SOC is not used for detection as it is a dependent variable
-        features: list[str] = ["voltage", "current", "temp"]
-        X: pd.DataFrame = df[features]
+        X: pd.DataFrame = df[self.FEATURES]
 
         # Step 2: Normalize data (mean=0, std=1)
         # Use existing scaler if already fitted, otherwise fit_transform
@@ -151,18 +154,104 @@ class EVBatteryAnalyzer:
         else:
             X_scaled = self.scaler.fit_transform(X)  # type: ignore
 
-        # Step 3: Train model and predict anomalies
-        if hasattr(self.model, "estimators_"):
-            predictions = self.model.predict(X_scaled)  # type: ignore[arg-type]
-        else:
+        # Step 3: Train model (once)
+        if not hasattr(self.model, "estimators_"):
             self.model.fit(X_scaled)
-            predictions = self.model.predict(X_scaled)  # type: ignore[arg-type]
 
         # Step 4: Compute anomaly scores (lower = more anomalous point)
-        # score_samples works for an already-fitted model
         anomaly_scores: np.ndarray = self.model.score_samples(X_scaled)  # type: ignore
+        result, self.anomalies = self._summarize(df_telemetry, df, anomaly_scores)
+        return result
+
+    def fit(self, df_telemetry: pd.DataFrame) -> "EVBatteryAnalyzer":
+        """
+        Fit the scaler and Isolation Forest on baseline telemetry.
+
+        Subsequent ``analyze_telemetry`` calls score against this baseline
+        instead of fitting on their own data.
+
+        Args:
+            df_telemetry: Baseline DataFrame with voltage, current and temp columns.
+
+        Returns:
+            self, for chaining.
+        """
+        from .utils import require_columns
+
+        df = normalize_columns(df_telemetry)
+        require_columns(df, self.FEATURES)
+        X_scaled = self.scaler.fit_transform(df[self.FEATURES])
+        self.model.fit(X_scaled)
+        return self
+
+    @property
+    def is_fitted(self) -> bool:
+        """True once both the scaler and the forest have been fitted."""
+        return hasattr(self.scaler, "mean_") and hasattr(self.model, "estimators_")
+
+    def analyze_telemetry_batch(self, frames: Sequence[pd.DataFrame]) -> list[dict[str, Any]]:
+        """
+        Score several telemetry frames against the fitted model in one pass.
+
+        All valid frames are scaled and scored with a single ``score_samples``
+        call, then split back per frame. ``self.anomalies`` is not updated.
+
+        Args:
+            frames: DataFrames in the format accepted by ``analyze_telemetry``.
 
-        # Step 5: Filter anomalies
+        Returns:
+            One result dict per frame, identical to calling
+            ``analyze_telemetry`` on each frame with the same fitted model.
+
+        Raises:
+            ValueError: If the model has not been fitted yet.
+        """
+        import pandas as pd
+
+        if not self.is_fitted:
+            raise ValueError("Model not trained! Call fit() or analyze_telemetry() first")
+
+        prepared = [self._prepare(frame) for frame in frames]
+        valid = [i for i, (_, error) in enumerate(prepared) if error is None]
+        results: list[dict[str, Any]] = [error for _, error in prepared]  # type: ignore[misc]
+        if not valid:
+            return results
+
+        X = pd.concat([prepared[i][0][self.FEATURES] for i in valid], ignore_index=True)
+        scores = self.model.score_samples(self.scaler.transform(X))  # type: ignore
+        bounds = np.cumsum([len(prepared[i][0]) for i in valid])[:-1]
+        for i, frame_scores in zip(valid, np.split(scores, bounds)):
+            results[i], _ = self._summarize(frames[i], prepared[i][0], frame_scores)
+        return results
+
+    def _prepare(
+        self, df_telemetry: pd.DataFrame, normalized: bool = False
+    ) -> tuple[pd.DataFrame, dict[str, Any] | None]:
+        """Normalize columns; return an error result for undersized input."""
+        from .utils import require_columns
+
+        df: pd.DataFrame = df_telemetry if normalized else normalize_columns(df_telemetry)
+        require_columns(df, self.FEATURES)
+
+        if len(df) < self.MIN_SAMPLES:
+            return df, {
+                "total_samples": len(df),
+                "anomalies_detected": 0,
+                "anomaly_percentage": 0.0,
+                "severity": "UNKNOWN",
+                "error": f"Insufficient data: {len(df)} samples < {self.MIN_SAMPLES} minimum",
+            }
+        return df, None
+
+    def _summarize(
+        self, df_telemetry: pd.DataFrame, df: pd.DataFrame, anomaly_scores: np.ndarray
+    ) -> tuple[dict[str, Any], pd.DataFrame]:
+        """Build the analysis result and anomaly rows from per-sample scores."""
+        # predict() is just score_samples() compared against offset_, so the
+        # labels are derived from the scores instead of walking the trees twice.
+        predictions = np.where(anomaly_scores < self.model.offset_, -1, 1)
+
+        # Filter anomalies
         # In addition to the standard prediction (-1), also account for cases
         # where score_samples dropped below warning_threshold. This helps avoid
         # missing rare outliers on small samples (e.g. when the model was trained
@@ -170,16 +259,16 @@ class EVBatteryAnalyzer:
         mask: np.ndarray = (predictions == -1) | (anomaly_scores < self.warning_threshold)
 
         # Apply mask to the same DataFrame used to build X to ensure index alignment
-        self.anomalies = df_telemetry.iloc[mask].copy()  # type: ignore
+        anomalies = df_telemetry.iloc[mask].copy()  # type: ignore
 
         # Add anomaly scores to results for further analysis
-        if not self.anomalies.empty:
-            self.anomalies["anomaly_score"] = anomaly_scores[mask]
+        if not anomalies.empty:
+            anomalies["anomaly_score"] = anomaly_scores[mask]
 
-        # Step 6: Build analysis result
+        # Build analysis result
         total = len(df_telemetry)
-        count = len(self.anomalies)
-        # Step 7: Detect gradient attacks
+        count = len(anomalies)
+        # Detect gradient attacks
         gradient = self._detect_gradient_attack(df)
         if gradient["gradient_detected"]:
             # Boost severity if gradient detected
@@ -197,7 +286,7 @@ class EVBatteryAnalyzer:
             "anomaly_percentage": (count / total) * 100 if total else 0.0,
             "severity": severity,
             "gradient_attack": gradient,
-        }
+        }, anomalies
 
     def _detect_gradient_attack(self, df: pd.DataFrame) -> dict:
         """Detect slow monotonic drifts that evade IsolationForest.
@@ -579,6 +668,8 @@ class AnomalyDetector(EVBatteryAnalyzer):
 
 if __name__ == "__main__":
     # EVBatteryAnalyzer usage example
+    import pandas as pd
+
     print("=== EVBatteryAnalyzer Test ===")
     analyzer = EVBatteryAnalyzer()
 
@@ -627,48 +718,253 @@ if __name__ == "__main__":
     print(f"Scores: {scores}")
 
 
+def _average_path_length(n_samples: np.ndarray | float) -> np.ndarray:
+    """Average unsuccessful BST search path length ``c(n)`` used by IsolationForest."""
+    n = np.asarray(n_samples, dtype=float)
+    safe = np.maximum(n, 3.0)  # avoid log(0) in the branch np.where discards
+    general = 2.0 * (np.log(safe - 1.0) + np.euler_gamma) - 2.0 * (safe - 1.0) / safe
+    return np.where(n <= 1, 0.0, np.where(n == 2, 1.0, general))
+
+
+class _CompiledForest:
+    """Flat NumPy copy of a fitted IsolationForest for fast small-batch scoring.
+
+    ``IsolationForest.score_samples`` dispatches through joblib and one tree
+    object at a time, which costs milliseconds even for a single row. Here all
+    trees are padded into ``(n_trees, max_nodes)`` tables and walked in
+    lock-step, giving the same scores in tens of microseconds.
+    Only forests trained on the full feature set (``max_features=1.0``) are
+    supported.
+    """
+
+    def __init__(self, model: IsolationForest):
+        if model.max_features != 1.0:
+            raise ValueError("Only IsolationForest(max_features=1.0) can be compiled")
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        shape = (len(trees), max(tree.node_count for tree in trees))
+        self.left = np.zeros(shape, dtype=np.intp)
+        self.right = np.zeros(shape, dtype=np.intp)
+        self.feature = np.zeros(shape, dtype=np.intp)
+        self.threshold = np.zeros(shape, dtype=float)
+        self.path_length = np.zeros(shape, dtype=float)
+        self.max_depth = 0
+        for i, tree in enumerate(trees):
+            n = tree.node_count
+            nodes = np.arange(n)
+            leaf = tree.children_left == -1
+            # Leaves point to themselves so every tree can take max_depth steps
+            self.left[i, :n] = np.where(leaf, nodes, tree.children_left)
+            self.right[i, :n] = np.where(leaf, nodes, tree.children_right)
+            self.feature[i, :n] = np.where(leaf, 0, tree.feature)
+            self.threshold[i, :n] = tree.threshold
+            depth = np.zeros(n)
+            frontier, level = np.array([0]), 0
+            while frontier.size:
+                depth[frontier] = level
+                children = np.concatenate(
+                    [tree.children_left[frontier], tree.children_right[frontier]]
+                )
+                frontier, level = children[children != -1], level + 1
+            self.path_length[i, :n] = depth + _average_path_length(tree.n_node_samples)
+            self.max_depth = max(self.max_depth, tree.max_depth)
+        self.denominator = len(trees) * float(_average_path_length(model.max_samples_))
+        self.offset = float(model.offset_)
+
+    def score_samples(self, x: np.ndarray) -> np.ndarray:
+        """Equivalent of ``IsolationForest.score_samples`` for a 2-D array."""
+        # sklearn trees compare float32 inputs against float64 thresholds
+        x = np.asarray(x, dtype=np.float32).astype(float)
+        rows = np.arange(len(x))[:, None]
+        trees = np.arange(self.left.shape[0])[None, :]
+        node = np.zeros((len(x), self.left.shape[0]), dtype=np.intp)
+        for _ in range(self.max_depth):
+            go_left = x[rows, self.feature[trees, node]] <= self.threshold[trees, node]
+            node = np.where(go_left, self.left[trees, node], self.right[trees, node])
+        depths = self.path_length[trees, node].sum(axis=1)
+        return -(2.0 ** (-depths / self.denominator))
+
+
 class StreamingAnomalyDetector:
-    """Online anomaly detection with sliding window for real-time telemetry."""
+    """Online anomaly detection with sliding window for real-time telemetry.
+
+    Samples are kept in a fixed-size NumPy ring buffer and the window mean and
+    variance are maintained incrementally (Welford's algorithm with removal,
+    recomputed exactly once per pass over the buffer to stop rounding drift),
+    so each ``update`` costs amortised O(1) plus one walk through a compiled
+    copy of the forest. Every ``retrain_every`` updates a new IsolationForest is fitted on
+    a snapshot of the window — on a background executor by default — and
+    swapped in together with the scaling statistics it was trained with.
+    """
 
-    def __init__(self, window_size: int = 100, contamination: float = 0.1, retrain_every: int = 10):
+    FEATURES: tuple[str, ...] = ("voltage", "current", "temp")
+    MIN_SAMPLES: int = 10
+
+    def __init__(
+        self,
+        window_size: int = 100,
+        contamination: float = 0.1,
+        retrain_every: int = 10,
+        n_estimators: int = 100,
+        background: bool = True,
+        executor: Executor | None = None,
+    ):
+        """
+        Args:
+            window_size: Number of most recent samples kept in the window.
+            contamination: Expected proportion of anomalies.
+            retrain_every: Retrain the model every N scored updates.
+            n_estimators: Number of trees in each IsolationForest.
+            background: Retrain on *executor* instead of the calling thread.
+                The very first model is always fitted synchronously.
+            executor: Executor for background retraining. Defaults to a
+                small thread pool shared by all detectors in the process.
+        """
         self.window_size = window_size
         self.contamination = contamination
         self.retrain_every = retrain_every
-        self._buffer: list[dict] = []
-        self._model: IsolationForest | None = None
-        self._scaler: StandardScaler = StandardScaler()
+        self.n_estimators = n_estimators
+        self.background = background
+        self._executor = executor
+        n_features = len(self.FEATURES)
+        self._buffer = np.empty((window_size, n_features), dtype=float)
+        self._head = 0  # next write position
+        self._count = 0
+        self._mean = np.zeros(n_features)
+        self._m2 = np.zeros(n_features)
+        # (forest, mean, scale) — replaced as a whole so readers never see a mix
+        self._model: tuple[_CompiledForest, np.ndarray, np.ndarray] | None = None
+        self._pending: Future | None = None
+        self._generation = 0
         self._update_count = 0
 
+    @property
+    def mean(self) -> np.ndarray:
+        """Running per-feature mean of the current window."""
+        return self._mean.copy()
+
+    @property
+    def std(self) -> np.ndarray:
+        """Running per-feature population standard deviation of the window."""
+        if self._count == 0:
+            return np.zeros_like(self._m2)
+        return np.sqrt(np.maximum(self._m2, 0.0) / self._count)
+
     def update(self, sample: dict) -> dict | None:
         """Add a sample and return anomaly result if window is full."""
-        self._buffer.append(sample)
-        if len(self._buffer) > self.window_size:
-            self._buffer.pop(0)
-        if len(self._buffer) < 10:
+        try:
+            x = np.array([float(sample[col]) for col in self.FEATURES])
+        except KeyError:
+            return None
+
+        if self._count == self.window_size:
+            self._remove(self._buffer[self._head])
+        self._buffer[self._head] = x
+        self._head = (self._head + 1) % self.window_size
+        self._add(x)
+        if self._head == 0:
+            self._resync()
+
+        if self._count < self.MIN_SAMPLES:
             return None
         self._update_count += 1
-        df = pd.DataFrame(self._buffer)
-        for col in ["voltage", "current", "temp"]:
-            if col not in df.columns:
-                return None
-        X = df[["voltage", "current", "temp"]].values
-        X_scaled = self._scaler.fit_transform(X)
-        if self._model is None or self._update_count % self.retrain_every == 0:
-            self._model = IsolationForest(
-                contamination=self.contamination, n_estimators=100, random_state=42
-            )
-            self._model.fit(X_scaled)
-        scores = self._model.score_samples(X_scaled)
-        last_score = scores[-1]
-        is_anomaly = self._model.predict(X_scaled[[-1]])[0] == -1
+
+        if self._model is None:
+            self._model = self._fit(self._snapshot())
+        elif self._update_count % self.retrain_every == 0:
+            self._schedule_retrain()
+
+        forest, mean, scale = self._model
+        score = float(forest.score_samples(((x - mean) / scale).reshape(1, -1))[0])
         return {
-            "is_anomaly": bool(is_anomaly),
-            "score": float(last_score),
-            "window_size": len(self._buffer),
+            "is_anomaly": bool(score < forest.offset),
+            "score": score,
+            "window_size": self._count,
         }
 
     def reset(self) -> None:
         """Clear buffer and retrain on next update."""
-        self._buffer.clear()
+        self._head = 0
+        self._count = 0
+        self._mean[:] = 0.0
+        self._m2[:] = 0.0
         self._model = None
-        self._scaler = StandardScaler()
+        self._pending = None
+        self._generation += 1  # discard results of in-flight retrains
+        self._update_count = 0
+
+    def _add(self, x: np.ndarray) -> None:
+        self._count += 1
+        delta = x - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (x - self._mean)
+
+    def _remove(self, x: np.ndarray) -> None:
+        self._count -= 1
+        if self._count == 0:
+            self._mean[:] = 0.0
+            self._m2[:] = 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (x - self._mean)
+
+    def _resync(self) -> None:
+        # Exact recompute once per pass over the buffer keeps rounding error
+        # from the incremental updates from accumulating in _m2
+        window = self._buffer[: self._count]
+        self._mean = window.mean(axis=0)
+        self._m2 = ((window - self._mean) ** 2).sum(axis=0)
+
+    def _snapshot(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copy the window together with the scaling statistics to train on."""
+        scale = self.std
+        scale[scale == 0.0] = 1.0  # same convention as StandardScaler
+        return self._buffer[: self._count].copy(), self._mean.copy(), scale
+
+    def _fit(
+        self, snapshot: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> tuple[_CompiledForest, np.ndarray, np.ndarray]:
+        from sklearn.ensemble import IsolationForest
+
+        window, mean, scale = snapshot
+        model = IsolationForest(
+            contamination=self.contamination, n_estimators=self.n_estimators, random_state=42
+        )
+        model.fit((window - mean) / scale)
+        return _CompiledForest(model), mean, scale
+
+    def _schedule_retrain(self) -> None:
+        snapshot = self._snapshot()
+        if not self.background:
+            self._model = self._fit(snapshot)
+            return
+        if self._pending is not None and not self._pending.done():
+            return  # previous retrain still running; keep serving the current model
+        generation = self._generation
+        executor = self._executor or _streaming_executor()
+        self._pending = executor.submit(self._fit, snapshot)
+        self._pending.add_done_callback(lambda fut: self._swap(fut, generation))
+
+    def _swap(self, future: Future, generation: int) -> None:
+        if future.cancelled() or generation != self._generation:
+            return
+        error = future.exception()
+        if error is not None:
+            logger.warning("Streaming retrain failed: %s", error)
+            return
+        self._model = future.result()
+
+
+_STREAMING_EXECUTOR: ThreadPoolExecutor | None = None
+_STREAMING_EXECUTOR_LOCK = threading.Lock()
+
+
+def _streaming_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used for background retraining."""
+    global _STREAMING_EXECUTOR
+    with _STREAMING_EXECUTOR_LOCK:
+        if _STREAMING_EXECUTOR is None:
+            _STREAMING_EXECUTOR = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="ev-qa-retrain"
+            )
+        return _STREAMING_EXECUTOR
@@ -4,12 +4,12 @@ AutoML pipeline for automatic SOH model selection and hyperparameter tuning.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor, IsolationForest, RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import cross_val_score
-from sklearn.preprocessing import MinMaxScaler
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .config import FrameworkConfig
 
@@ -21,6 +21,8 @@ class AutoMLSOH:
     """
 
     def __init__(self, config: FrameworkConfig | None = None):
+        from sklearn.preprocessing import MinMaxScaler
+
         self.config = config or FrameworkConfig()
         self.best_model = None
         self.best_score = float("-inf")
@@ -38,6 +40,9 @@ class AutoMLSOH:
         Returns:
             dict with best model info
         """
+        from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+        from sklearn.model_selection import cross_val_score
+
         features = ["voltage", "current", "temperature"]
         available_features = [f for f in features if f in df.columns]
 
@@ -108,6 +113,8 @@ class AutoMLSOH:
 
     def evaluate(self, df: pd.DataFrame, target_col: str = "soh") -> dict:
         """Evaluate the best model on test data."""
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
         if self.best_model is None:
             raise ValueError("No model trained. Call fit() first.")
 
@@ -145,6 +152,8 @@ class AutoMLAnomaly:
         Returns:
             dict with best model info
         """
+        from sklearn.ensemble import IsolationForest
+
         features = ["voltage", "current", "temperature"]
         available_features = [f for f in features if f in df.columns]
 
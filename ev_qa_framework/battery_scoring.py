@@ -6,12 +6,18 @@ single 0–100 health score with letter grades and actionable recommendations.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .analysis import EVBatteryAnalyzer
 from .cell_balance import CellBalanceAnalyzer
-from .thermal_runaway import ThermalRunawayPredictor
+from .thermal_runaway import TemperatureStats, ThermalRunawayPredictor
+from .utils import normalize_columns
 
 # ---------------------------------------------------------------------------
 # Default weights (must sum to 1.0)
@@ -89,6 +95,7 @@ class BatteryScorer:
         self,
         telemetry_df: pd.DataFrame,
         cell_voltages: list[float] | None = None,
+        anomaly_percentage: float | None = None,
     ) -> dict:
         """Compute composite battery health score.
 
@@ -99,6 +106,9 @@ class BatteryScorer:
             soc. Optionally soh.
         cell_voltages : list[float] | None
             Overrides voltages provided at init. Used for cell balance.
+        anomaly_percentage : float | None
+            Precomputed anomaly percentage (e.g. from a fleet reference
+            model). If given, the internal anomaly analyzer is not run.
 
         Returns
         -------
@@ -106,23 +116,25 @@ class BatteryScorer:
             score, grade, soh_score, anomaly_score, cell_balance_score,
             thermal_score, details
         """
-        df = telemetry_df.copy()
-        # Normalise column name
-        if "temperature" in df.columns and "temp" not in df.columns:
-            df = df.rename(columns={"temperature": "temp"})
+        # Normalise column names once; every component works on this frame.
+        df = normalize_columns(telemetry_df)
+        temps = df["temp"].to_numpy() if "temp" in df.columns else None
 
         # --- SOH component ---
         soh_score = self._compute_soh(df)
 
         # --- Anomaly component ---
-        anomaly_score = self._compute_anomaly(df)
+        if anomaly_percentage is not None:
+            anomaly_score = self._anomaly_pct_to_score(anomaly_percentage)
+        else:
+            anomaly_score = self._compute_anomaly(df)
 
         # --- Cell balance component ---
         voltages = cell_voltages if cell_voltages is not None else self.cell_voltages
         cell_balance_score = self._compute_cell_balance(voltages)
 
         # --- Thermal component ---
-        thermal_score = self._compute_thermal(df)
+        thermal_score = self._compute_thermal(df, temps)
 
         # --- Weighted composite ---
         composite = (
@@ -159,6 +171,56 @@ class BatteryScorer:
             },
         }
 
+    def compute_scores_batch(
+        self,
+        frames: Sequence[pd.DataFrame] | Mapping[str, pd.DataFrame],
+        cell_voltages: Sequence[list[float] | None] | None = None,
+    ) -> pd.DataFrame:
+        """Score many packs in one call.
+
+        Parameters
+        ----------
+        frames : sequence or mapping of pd.DataFrame
+            Telemetry per pack. A mapping's keys become the result index.
+        cell_voltages : sequence of (list[float] | None) | None
+            Per-pack cell voltages, aligned with *frames*. Packs without an
+            entry fall back to the voltages provided at init.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per pack with columns score, grade, soh_score,
+            anomaly_score, cell_balance_score, thermal_score.
+        """
+        import pandas as pd
+
+        if isinstance(frames, Mapping):
+            index = list(frames.keys())
+            frames = list(frames.values())
+        else:
+            index = None
+            frames = list(frames)
+        if cell_voltages is not None and len(cell_voltages) != len(frames):
+            raise ValueError(
+                f"cell_voltages has {len(cell_voltages)} entries for {len(frames)} frames"
+            )
+
+        rows = []
+        for i, df in enumerate(frames):
+            voltages = cell_voltages[i] if cell_voltages is not None else None
+            result = self.compute_score(df, cell_voltages=voltages)
+            result.pop("details")
+            rows.append(result)
+        columns = [
+            "score",
+            "grade",
+            "soh_score",
+            "anomaly_score",
+            "cell_balance_score",
+            "thermal_score",
+        ]
+        return pd.DataFrame(rows, index=index, columns=columns)
+
     @staticmethod
     def get_grade(score: float) -> str:
         """Map numeric score to letter grade.
@@ -253,14 +315,16 @@ class BatteryScorer:
         # No SOH data available — assume perfect
         return 100.0
 
+    @staticmethod
+    def _anomaly_pct_to_score(pct: float) -> float:
+        # Map: 0% anomalies -> 100, 50%+ anomalies -> 0
+        return max(0.0, 100.0 - pct * 2)
+
     def _compute_anomaly(self, df: pd.DataFrame) -> float:
         """Anomaly score: 100 – penalty based on anomaly percentage."""
         try:
-            result = self._anomaly_analyzer.analyze_telemetry(df)
-            pct = result.get("anomaly_percentage", 0.0)
-            # Map: 0% anomalies -> 100, 100% anomalies -> 0
-            score = max(0.0, 100.0 - pct * 2)
-            return score
+            result = self._anomaly_analyzer.analyze_telemetry(df, normalized=True)
+            return self._anomaly_pct_to_score(result.get("anomaly_percentage", 0.0))
         except Exception as e:
             import logging
 
@@ -284,10 +348,14 @@ class BatteryScorer:
             logging.getLogger(__name__).warning("Scoring component failed: %s", e)
             return 50.0
 
-    def _compute_thermal(self, df: pd.DataFrame) -> float:
+    def _compute_thermal(self, df: pd.DataFrame, temps: np.ndarray | None = None) -> float:
         """Thermal risk score: 100 for LOW, decreasing for higher risk."""
         try:
-            result = self._thermal_predictor.predict_risk(df)
+            if temps is not None:
+                stats = TemperatureStats.from_temps(temps)
+                result = self._thermal_predictor.predict_risk_from_temps(temps, stats)
+            else:
+                result = self._thermal_predictor.predict_risk(df)
             level = result.get("risk_level", "LOW")
             mapping = {"LOW": 100.0, "MEDIUM": 70.0, "HIGH": 40.0, "CRITICAL": 10.0}
             return mapping.get(level, 100.0)
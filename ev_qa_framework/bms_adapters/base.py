@@ -11,30 +11,48 @@ import logging
 import struct
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ev_qa_framework.bms_protocol import BMSTelemetry
 
+if TYPE_CHECKING:
+    from ev_qa_framework.can_bus import CANDispatcher
+
 logger = logging.getLogger(__name__)
 
 
 class BaseBMSAdapter(ABC):
     """Abstract base for manufacturer-specific BMS adapters.
 
-    Subclasses implement connect/disconnect for CAN hardware access
-    and static decode methods that parse raw CAN data bytes.
+    Subclasses implement static decode methods that parse raw CAN data
+    bytes and ``_decode_all``, which turns the latest frame per CAN ID into
+    a BMSTelemetry.
+
+    Frames are collected by a :class:`~ev_qa_framework.can_bus.CANDispatcher`
+    in the background, so ``read_telemetry`` decodes a snapshot of the
+    latest frames without waiting on the bus. Pass a shared ``dispatcher``
+    to let several adapters (or other consumers) use one bus; otherwise
+    ``connect`` opens a bus and a private dispatcher.
 
     CAN hardware (python-can) is lazy-imported only in connect(),
     so decode functions work without any hardware dependencies.
     """
 
     manufacturer: str = "generic"
+    protocol: str = "generic_can"
     can_ids: dict[str, int] = {}
 
-    def __init__(self, channel: str = "can0", bitrate: int = 500_000):
+    def __init__(
+        self,
+        channel: str = "can0",
+        bitrate: int = 500_000,
+        dispatcher: CANDispatcher | None = None,
+    ):
         self.channel = channel
         self.bitrate = bitrate
         self._bus = None
+        self._dispatcher = dispatcher
+        self._owns_dispatcher = dispatcher is None
         self._connected = False
 
     @property
@@ -43,14 +61,22 @@ class BaseBMSAdapter(ABC):
 
     def connect(self) -> bool:
         """Establish CAN bus connection. Lazy-imports python-can."""
+        if not self._owns_dispatcher:
+            # The shared dispatcher's owner manages the bus
+            self._connected = True
+            return True
         try:
             import can  # noqa: F401
 
+            from ev_qa_framework.can_bus import CANDispatcher
+
             self._bus = can.interface.Bus(
                 channel=self.channel,
                 interface="socketcan",
                 bitrate=self.bitrate,
             )
+            self._dispatcher = CANDispatcher(self._bus)
+            self._dispatcher.start()
             self._connected = True
             logger.info("%s BMS connected on %s", self.manufacturer, self.channel)
             return True
@@ -63,6 +89,9 @@ class BaseBMSAdapter(ABC):
 
     def disconnect(self) -> None:
         """Close CAN bus connection."""
+        if self._owns_dispatcher and self._dispatcher is not None:
+            self._dispatcher.stop()
+            self._dispatcher = None
         if self._bus:
             try:
                 self._bus.shutdown()
@@ -71,9 +100,20 @@ class BaseBMSAdapter(ABC):
             self._bus = None
         self._connected = False
 
-    @abstractmethod
     def read_telemetry(self) -> BMSTelemetry:
-        """Read and decode all CAN messages into BMSTelemetry."""
+        """Decode the latest cached CAN frames into BMSTelemetry."""
+        if not self._connected or self._dispatcher is None:
+            return BMSTelemetry(protocol=self.protocol, source=self.channel)
+        try:
+            frames = self._dispatcher.snapshot(self.can_ids.values())
+            return self._decode_all(frames)
+        except Exception as e:
+            logger.error("%s CAN decode error: %s", self.manufacturer, e)
+            return BMSTelemetry(protocol=self.protocol, source=self.channel)
+
+    @abstractmethod
+    def _decode_all(self, frames: dict[int, bytes]) -> BMSTelemetry:
+        """Decode the latest frame per CAN ID into BMSTelemetry."""
 
     @abstractmethod
     def health_check(self) -> dict[str, Any]:
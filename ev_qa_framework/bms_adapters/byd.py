@@ -14,7 +14,6 @@ CAN ID mapping (extended 29-bit, community-sourced):
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
 from ev_qa_framework.bms_protocol import BMSTelemetry
@@ -51,68 +50,40 @@ class BYDBMSAdapter(BaseBMSAdapter):
     Args:
         channel: CAN interface name (e.g. 'can0', 'vcan0').
         bitrate: CAN bus bitrate (default 500000).
+        dispatcher: Shared CANDispatcher to read frames from instead of
+            opening a bus of its own.
     """
 
     manufacturer = "byd"
+    protocol = "byd_can"
     can_ids = {
         "voltage": CAN_ID_VOLTAGE,
         "current_temp": CAN_ID_CURRENT_TEMP,
         "cells": CAN_ID_CELLS,
     }
 
-    def __init__(self, channel: str = "can0", bitrate: int = 500_000):
-        super().__init__(channel=channel, bitrate=bitrate)
-        self._latest: dict[int, bytes] = {}
-
-    def disconnect(self) -> None:
-        """Disconnect from CAN bus."""
-        if self._bus:
-            try:
-                self._bus.shutdown()
-            except Exception:
-                pass
-            self._bus = None
-        self._connected = False
-
-    def read_telemetry(self) -> BMSTelemetry:
-        """Read CAN frames and decode into BMSTelemetry."""
-        if not self._connected or not self._bus:
-            return BMSTelemetry(protocol="byd_can", source=self.channel)
-
-        try:
-            deadline = time.monotonic() + 0.5
-            while time.monotonic() < deadline:
-                msg = self._bus.recv(timeout=0.1)
-                if msg is not None:
-                    self._latest[msg.arbitration_id] = msg.data
-        except Exception as e:
-            logger.error("BYD CAN read error: %s", e)
-            return BMSTelemetry(protocol="byd_can", source=self.channel)
-
-        return self._decode_all()
-
-    def _decode_all(self) -> BMSTelemetry:
+    def _decode_all(self, frames: dict[int, bytes]) -> BMSTelemetry:
         """Decode all cached CAN frames into BMSTelemetry."""
         telemetry = BMSTelemetry(
-            protocol="byd_can",
+            protocol=self.protocol,
             timestamp=now_timestamp(),
             source=self.channel,
         )
 
-        if CAN_ID_VOLTAGE in self._latest:
-            telemetry.pack_voltage = decode_voltage(self._latest[CAN_ID_VOLTAGE])
+        if CAN_ID_VOLTAGE in frames:
+            telemetry.pack_voltage = decode_voltage(frames[CAN_ID_VOLTAGE])
 
-        if CAN_ID_CURRENT_TEMP in self._latest:
+        if CAN_ID_CURRENT_TEMP in frames:
             current, t_max, t_min, t_avg = decode_current_temp(
-                self._latest[CAN_ID_CURRENT_TEMP]
+                frames[CAN_ID_CURRENT_TEMP]
             )
             telemetry.pack_current = current
             telemetry.temperature_max = t_max
             telemetry.temperature_min = t_min
             telemetry.temperature_avg = t_avg
 
-        if CAN_ID_CELLS in self._latest:
-            cells = decode_cells(self._latest[CAN_ID_CELLS])
+        if CAN_ID_CELLS in frames:
+            cells = decode_cells(frames[CAN_ID_CELLS])
             telemetry.cell_voltages = cells
             if cells:
                 telemetry.cell_voltage_min = min(cells)
@@ -135,7 +106,7 @@ class BYDBMSAdapter(BaseBMSAdapter):
         """Return BYD-specific metadata."""
         return {
             "manufacturer": "byd",
-            "protocol": "byd_can",
+            "protocol": self.protocol,
             "can_ids": self.can_ids,
             "description": "BYD Blade Battery BMS CAN decoder",
         }
@@ -15,7 +15,6 @@ CAN ID mapping (community-sourced):
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
 from ev_qa_framework.bms_protocol import BMSTelemetry
@@ -44,9 +43,12 @@ class NioBMSAdapter(BaseBMSAdapter):
     Args:
         channel: CAN interface name (e.g. 'can0', 'vcan0').
         bitrate: CAN bus bitrate (default 500000).
+        dispatcher: Shared CANDispatcher to read frames from instead of
+            opening a bus of its own.
     """
 
     manufacturer = "nio"
+    protocol = "nio_can"
     can_ids = {
         "pack_voltage": CAN_ID_PACK_VOLTAGE,
         "pack_current": CAN_ID_PACK_CURRENT,
@@ -54,65 +56,34 @@ class NioBMSAdapter(BaseBMSAdapter):
         "soh": CAN_ID_SOH,
     }
 
-    def __init__(self, channel: str = "can0", bitrate: int = 500_000):
-        super().__init__(channel=channel, bitrate=bitrate)
-        self._latest: dict[int, bytes] = {}
-
-    def disconnect(self) -> None:
-        """Disconnect from CAN bus."""
-        if self._bus:
-            try:
-                self._bus.shutdown()
-            except Exception:
-                pass
-            self._bus = None
-        self._connected = False
-
-    def read_telemetry(self) -> BMSTelemetry:
-        """Read CAN frames and decode into BMSTelemetry."""
-        if not self._connected or not self._bus:
-            return BMSTelemetry(protocol="nio_can", source=self.channel)
-
-        try:
-            deadline = time.monotonic() + 0.5
-            while time.monotonic() < deadline:
-                msg = self._bus.recv(timeout=0.1)
-                if msg is not None:
-                    self._latest[msg.arbitration_id] = msg.data
-        except Exception as e:
-            logger.error("Nio CAN read error: %s", e)
-            return BMSTelemetry(protocol="nio_can", source=self.channel)
-
-        return self._decode_all()
-
-    def _decode_all(self) -> BMSTelemetry:
+    def _decode_all(self, frames: dict[int, bytes]) -> BMSTelemetry:
         """Decode all cached CAN frames into BMSTelemetry."""
         telemetry = BMSTelemetry(
-            protocol="nio_can",
+            protocol=self.protocol,
             timestamp=now_timestamp(),
             source=self.channel,
         )
 
-        if CAN_ID_PACK_VOLTAGE in self._latest:
+        if CAN_ID_PACK_VOLTAGE in frames:
             telemetry.pack_voltage = decode_voltage(
-                self._latest[CAN_ID_PACK_VOLTAGE]
+                frames[CAN_ID_PACK_VOLTAGE]
             )
 
-        if CAN_ID_PACK_CURRENT in self._latest:
+        if CAN_ID_PACK_CURRENT in frames:
             telemetry.pack_current = decode_current(
-                self._latest[CAN_ID_PACK_CURRENT]
+                frames[CAN_ID_PACK_CURRENT]
             )
 
-        if CAN_ID_TEMPERATURE in self._latest:
+        if CAN_ID_TEMPERATURE in frames:
             t_max, t_min, t_avg = decode_temperature(
-                self._latest[CAN_ID_TEMPERATURE]
+                frames[CAN_ID_TEMPERATURE]
             )
             telemetry.temperature_max = t_max
             telemetry.temperature_min = t_min
             telemetry.temperature_avg = t_avg
 
-        if CAN_ID_SOH in self._latest:
-            telemetry.soh = decode_soh(self._latest[CAN_ID_SOH])
+        if CAN_ID_SOH in frames:
+            telemetry.soh = decode_soh(frames[CAN_ID_SOH])
 
         return telemetry
 
@@ -130,7 +101,7 @@ class NioBMSAdapter(BaseBMSAdapter):
         """Return Nio-specific metadata."""
         return {
             "manufacturer": "nio",
-            "protocol": "nio_can",
+            "protocol": self.protocol,
             "can_ids": self.can_ids,
             "description": "Nio BMS CAN decoder",
         }
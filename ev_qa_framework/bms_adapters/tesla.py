@@ -15,7 +15,6 @@ CAN ID mapping (community-sourced):
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
 from ev_qa_framework.bms_protocol import BMSTelemetry
@@ -44,9 +43,12 @@ class TeslaBMSAdapter(BaseBMSAdapter):
     Args:
         channel: CAN interface name (e.g. 'can0', 'vcan0').
         bitrate: CAN bus bitrate (default 500000).
+        dispatcher: Shared CANDispatcher to read frames from instead of
+            opening a bus of its own.
     """
 
     manufacturer = "tesla"
+    protocol = "tesla_can"
     can_ids = {
         "voltage_current": CAN_ID_VOLTAGE_CURRENT,
         "soc": CAN_ID_SOC,
@@ -54,64 +56,33 @@ class TeslaBMSAdapter(BaseBMSAdapter):
         "cell_stats": CAN_ID_CELL_STATS,
     }
 
-    def __init__(self, channel: str = "can0", bitrate: int = 500_000):
-        super().__init__(channel=channel, bitrate=bitrate)
-        self._latest: dict[int, bytes] = {}
-
-    def disconnect(self) -> None:
-        """Disconnect from CAN bus."""
-        if self._bus:
-            try:
-                self._bus.shutdown()
-            except Exception:
-                pass
-            self._bus = None
-        self._connected = False
-
-    def read_telemetry(self) -> BMSTelemetry:
-        """Read CAN frames and decode into BMSTelemetry."""
-        if not self._connected or not self._bus:
-            return BMSTelemetry(protocol="tesla_can", source=self.channel)
-
-        try:
-            deadline = time.monotonic() + 0.5
-            while time.monotonic() < deadline:
-                msg = self._bus.recv(timeout=0.1)
-                if msg is not None:
-                    self._latest[msg.arbitration_id] = msg.data
-        except Exception as e:
-            logger.error("Tesla CAN read error: %s", e)
-            return BMSTelemetry(protocol="tesla_can", source=self.channel)
-
-        return self._decode_all()
-
-    def _decode_all(self) -> BMSTelemetry:
+    def _decode_all(self, frames: dict[int, bytes]) -> BMSTelemetry:
         """Decode all cached CAN frames into BMSTelemetry."""
         telemetry = BMSTelemetry(
-            protocol="tesla_can",
+            protocol=self.protocol,
             timestamp=now_timestamp(),
             source=self.channel,
         )
 
-        if CAN_ID_VOLTAGE_CURRENT in self._latest:
-            v, i = decode_voltage_current(self._latest[CAN_ID_VOLTAGE_CURRENT])
+        if CAN_ID_VOLTAGE_CURRENT in frames:
+            v, i = decode_voltage_current(frames[CAN_ID_VOLTAGE_CURRENT])
             telemetry.pack_voltage = v
             telemetry.pack_current = i
 
-        if CAN_ID_SOC in self._latest:
-            telemetry.soc = decode_soc(self._latest[CAN_ID_SOC])
+        if CAN_ID_SOC in frames:
+            telemetry.soc = decode_soc(frames[CAN_ID_SOC])
 
-        if CAN_ID_TEMPERATURE in self._latest:
+        if CAN_ID_TEMPERATURE in frames:
             t_max, t_min, t_avg = decode_temperature(
-                self._latest[CAN_ID_TEMPERATURE]
+                frames[CAN_ID_TEMPERATURE]
             )
             telemetry.temperature_max = t_max
             telemetry.temperature_min = t_min
             telemetry.temperature_avg = t_avg
 
-        if CAN_ID_CELL_STATS in self._latest:
+        if CAN_ID_CELL_STATS in frames:
             v_min, v_max, delta = decode_cell_stats(
-                self._latest[CAN_ID_CELL_STATS]
+                frames[CAN_ID_CELL_STATS]
             )
             telemetry.cell_voltage_min = v_min
             telemetry.cell_voltage_max = v_max
@@ -133,7 +104,7 @@ class TeslaBMSAdapter(BaseBMSAdapter):
         """Return Tesla-specific metadata."""
         return {
             "manufacturer": "tesla",
-            "protocol": "tesla_can",
+            "protocol": self.protocol,
             "can_ids": self.can_ids,
             "description": "Tesla Model S/X/3/Y BMS CAN decoder",
         }
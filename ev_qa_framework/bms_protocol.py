@@ -13,6 +13,7 @@ The abstraction layer offers:
 - Unified telemetry data model (same dict structure regardless of protocol)
 - Connection health monitoring
 - Automatic failover between protocols
+- Concurrent polling of many BMS units (BMSPollingScheduler)
 
 Architecture:
     BMSProtocolManager (auto-detect + unified interface)
@@ -35,16 +36,29 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import ipaddress
+import itertools
 import logging
 import platform
+import random
+import struct
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
+
+from .metrics import bms_poll_latency_seconds, bms_poll_misses_total
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 # ── Protocol Types ──────────────────────────────────────────────────────────
 
@@ -535,98 +549,249 @@ def scan_can_interfaces() -> list[DetectedBMS]:
     return results
 
 
-def scan_modbus_tcp(
-    hosts: list[str] | None = None,
-    port: int = 502,
-    timeout: float = 1.0,
-) -> list[DetectedBMS]:
-    """Scan for Modbus TCP devices on the network.
-
-    Attempts TCP connection to each host:port to check if a Modbus
-    device is listening.
+def _iter_concurrent(
+    fn: Callable[[_T], _R | None], items: Iterable[_T], max_workers: int
+) -> Iterator[tuple[int, _R]]:
+    """Run *fn* over *items* on a thread pool, yielding results as they complete.
 
-    Args:
-        hosts: List of IP addresses to scan. Defaults to common BMS addresses.
-        port: Modbus TCP port (default 502).
-        timeout: Connection timeout per host.
+    Yields ``(index, result)`` for every call that returned something other
+    than None. At most ``max_workers`` calls are queued at a time, so
+    arbitrarily large sweeps are consumed lazily.
     """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    indexed = enumerate(items)
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bms-scan")
+    try:
+        pending = {
+            pool.submit(fn, item): index for index, item in itertools.islice(indexed, max_workers)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                result = future.result()
+                if result is not None:
+                    yield index, result
+            for index, item in itertools.islice(indexed, len(done)):
+                pending[pool.submit(fn, item)] = index
+    finally:
+        # Abandoned generators must not wait for a whole subnet sweep
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def expand_hosts(hosts: Iterable[str]) -> Iterator[str]:
+    """Expand host entries, allowing CIDR ranges such as ``"192.168.1.0/24"``.
+
+    Plain addresses and hostnames pass through unchanged; networks yield
+    their usable host addresses lazily.
+    """
+    for entry in hosts:
+        if "/" not in entry:
+            yield entry
+            continue
+        for address in ipaddress.ip_network(entry, strict=False).hosts():
+            yield str(address)
+
+
+def _probe_modbus_tcp(
+    host: str, port: int, timeout: float, unit_id: int, probe: bool
+) -> DetectedBMS | None:
+    """Check one host; with *probe*, require a Modbus reply to an FC03 read."""
     import socket
 
-    if hosts is None:
-        hosts = ["192.168.1.100", "192.168.0.100", "10.0.0.100"]
-
-    results: list[DetectedBMS] = []
-    for host in hosts:
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
+            if sock.connect_ex((host, port)) != 0:
+                return None
+            if probe:
+                from ev_qa_framework.modbus import _build_read_pdu, _build_tcp_mbap
+
+                # Any well-formed response, including a Modbus exception,
+                # means a Modbus server is answering
+                pdu = _build_read_pdu(0x03, 0, 1)
+                sock.sendall(_build_tcp_mbap(0x5CA7, len(pdu) + 1, unit_id) + pdu)
+                header = b""
+                while len(header) < 7:
+                    chunk = sock.recv(7 - len(header))
+                    if not chunk:
+                        return None
+                    header += chunk
+                tid, protocol_id, _, _ = struct.unpack(">HHHB", header)
+                if tid != 0x5CA7 or protocol_id != 0:
+                    return None
+        finally:
             sock.close()
-            if result == 0:
-                results.append(
-                    DetectedBMS(
-                        protocol=ProtocolType.MODBUS_TCP,
-                        description=f"Modbus TCP device at {host}:{port}",
-                        config={"host": host, "port": port, "unit_id": 1},
-                        priority=8,
-                    )
-                )
-        except OSError:
-            pass
+    except OSError:
+        return None
+
+    return DetectedBMS(
+        protocol=ProtocolType.MODBUS_TCP,
+        description=f"Modbus TCP device at {host}:{port}",
+        config={"host": host, "port": port, "unit_id": unit_id},
+        priority=8,
+    )
+
+
+def _scan_modbus_tcp(
+    hosts: Iterable[str] | None,
+    port: int,
+    timeout: float,
+    max_workers: int,
+    probe: bool,
+    unit_id: int,
+) -> Iterator[tuple[int, DetectedBMS]]:
+    if hosts is None:
+        hosts = ["192.168.1.100", "192.168.0.100", "10.0.0.100"]
 
-    return results
+    def check(host: str) -> DetectedBMS | None:
+        return _probe_modbus_tcp(host, port, timeout, unit_id, probe)
 
+    return _iter_concurrent(check, expand_hosts(hosts), max_workers)
 
-def scan_modbus_rtu(
-    ports: list[str] | None = None,
-    baudrates: list[int] | None = None,
-) -> list[DetectedBMS]:
-    """Scan for Modbus RTU devices on serial ports.
 
-    Attempts to open each serial port and send a Modbus probe
-    (read holding register 0) to detect responding devices.
+def iter_scan_modbus_tcp(
+    hosts: Iterable[str] | None = None,
+    port: int = 502,
+    timeout: float = 1.0,
+    max_workers: int = 64,
+    probe: bool = False,
+    unit_id: int = 1,
+) -> Iterator[DetectedBMS]:
+    """Scan for Modbus TCP devices concurrently, yielding each as it is found.
 
     Args:
-        ports: List of serial port paths. Auto-detects if None.
-        baudrates: List of baud rates to try. Defaults to common rates.
+        hosts: Addresses, hostnames or CIDR ranges. Defaults to common BMS addresses.
+        port: Modbus TCP port (default 502).
+        timeout: Connection timeout per host.
+        max_workers: Maximum number of hosts probed at once.
+        probe: Also send a holding-register read and require a Modbus
+            response, rather than accepting any open port.
+        unit_id: Unit ID used for the probe and in the returned config.
     """
-    if baudrates is None:
-        baudrates = [9600, 19200, 38400, 115200]
+    for _, detected in _scan_modbus_tcp(hosts, port, timeout, max_workers, probe, unit_id):
+        yield detected
 
-    results: list[DetectedBMS] = []
 
-    if ports is None:
-        # Auto-detect serial ports
-        ports = _auto_detect_serial_ports()
+def scan_modbus_tcp(
+    hosts: Iterable[str] | None = None,
+    port: int = 502,
+    timeout: float = 1.0,
+    max_workers: int = 64,
+    probe: bool = False,
+    unit_id: int = 1,
+) -> list[DetectedBMS]:
+    """Scan for Modbus TCP devices on the network.
+
+    Attempts TCP connection to each host:port to check if a Modbus
+    device is listening. Hosts are checked concurrently; results keep the
+    order of *hosts*. See :func:`iter_scan_modbus_tcp` for the arguments
+    and a progressive variant.
+    """
+    found = _scan_modbus_tcp(hosts, port, timeout, max_workers, probe, unit_id)
+    return [detected for _, detected in sorted(found, key=lambda r: r[0])]
+
+
+def _probe_modbus_rtu(
+    port: str, baudrates: list[int], timeout: float, unit_id: int
+) -> DetectedBMS | None:
+    """Sweep *baudrates* on one serial port, reusing a single open handle."""
+    from ev_qa_framework.modbus import ModbusRTUClient
 
-    for port in ports:
+    client = ModbusRTUClient(
+        port=port, baudrate=baudrates[0], unit_id=unit_id, timeout=timeout, retries=1
+    )
+    try:
+        client.connect()
+    except Exception as e:
+        logger.debug("Cannot open %s: %s", port, e)
+        return None
+    try:
         for baud in baudrates:
             try:
-                from ev_qa_framework.modbus import ModbusRTUClient
-
-                client = ModbusRTUClient(port=port, baudrate=baud, unit_id=1, timeout=1.0)
-                client.connect()
+                client.set_baudrate(baud)
                 # Try to read register 0
                 client.read_holding_registers(0, 1)
-                client.disconnect()
-
-                results.append(
-                    DetectedBMS(
-                        protocol=ProtocolType.MODBUS_RTU,
-                        description=f"Modbus RTU device at {port} @ {baud} baud",
-                        config={
-                            "port": port,
-                            "baudrate": baud,
-                            "unit_id": 1,
-                        },
-                        priority=7,
-                    )
-                )
-                break  # Found at this baudrate, no need to try others
             except Exception:
                 continue
+            return DetectedBMS(
+                protocol=ProtocolType.MODBUS_RTU,
+                description=f"Modbus RTU device at {port} @ {baud} baud",
+                config={
+                    "port": port,
+                    "baudrate": baud,
+                    "unit_id": unit_id,
+                },
+                priority=7,
+            )
+    finally:
+        client.disconnect()
+    return None
+
+
+def _scan_modbus_rtu(
+    ports: Iterable[str] | None,
+    baudrates: list[int] | None,
+    timeout: float,
+    max_workers: int,
+    unit_id: int,
+) -> Iterator[tuple[int, DetectedBMS]]:
+    if baudrates is None:
+        baudrates = [9600, 19200, 38400, 115200]
+    if ports is None:
+        # Auto-detect serial ports
+        ports = _auto_detect_serial_ports()
+    if not baudrates:
+        return iter(())
 
-    return results
+    def check(port: str) -> DetectedBMS | None:
+        return _probe_modbus_rtu(port, baudrates, timeout, unit_id)
+
+    return _iter_concurrent(check, ports, max_workers)
+
+
+def iter_scan_modbus_rtu(
+    ports: Iterable[str] | None = None,
+    baudrates: list[int] | None = None,
+    timeout: float = 1.0,
+    max_workers: int = 8,
+    unit_id: int = 1,
+) -> Iterator[DetectedBMS]:
+    """Scan serial ports for Modbus RTU devices concurrently, yielding each as found.
+
+    Ports are swept in parallel. Baud rates on one port are necessarily
+    tried in sequence, but on a single open handle that is reconfigured
+    between attempts rather than reopened.
+
+    Args:
+        ports: Serial port paths. Auto-detects if None.
+        baudrates: Baud rates to try, in order. Defaults to common rates.
+        timeout: Response timeout per probe.
+        max_workers: Maximum number of ports probed at once.
+        unit_id: Unit ID to probe.
+    """
+    for _, detected in _scan_modbus_rtu(ports, baudrates, timeout, max_workers, unit_id):
+        yield detected
+
+
+def scan_modbus_rtu(
+    ports: Iterable[str] | None = None,
+    baudrates: list[int] | None = None,
+    timeout: float = 1.0,
+    max_workers: int = 8,
+    unit_id: int = 1,
+) -> list[DetectedBMS]:
+    """Scan for Modbus RTU devices on serial ports.
+
+    Attempts to open each serial port and send a Modbus probe
+    (read holding register 0) to detect responding devices. Ports are
+    scanned concurrently; results keep the order of *ports*. See
+    :func:`iter_scan_modbus_rtu` for the arguments and a progressive variant.
+    """
+    found = _scan_modbus_rtu(ports, baudrates, timeout, max_workers, unit_id)
+    return [detected for _, detected in sorted(found, key=lambda r: r[0])]
 
 
 def _auto_detect_serial_ports() -> list[str]:
@@ -707,17 +872,19 @@ class BMSProtocolManager:
         """
         self._detected = []
 
-        # Scan CAN
-        self._detected.extend(scan_can_interfaces())
-
-        # Scan Modbus TCP
         tcp_hosts = self.config.get("modbus_tcp_hosts")
-        self._detected.extend(scan_modbus_tcp(hosts=tcp_hosts))
-
-        # Scan Modbus RTU
         rtu_ports = self.config.get("modbus_rtu_ports")
         rtu_baudrates = self.config.get("modbus_rtu_baudrates")
-        self._detected.extend(scan_modbus_rtu(ports=rtu_ports, baudrates=rtu_baudrates))
+
+        # Scan CAN, Modbus TCP and Modbus RTU side by side
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="bms-detect") as pool:
+            scans = [
+                pool.submit(scan_can_interfaces),
+                pool.submit(scan_modbus_tcp, hosts=tcp_hosts),
+                pool.submit(scan_modbus_rtu, ports=rtu_ports, baudrates=rtu_baudrates),
+            ]
+            for scan in scans:
+                self._detected.extend(scan.result())
 
         # Sort by priority (highest first)
         self._detected.sort(key=lambda d: d.priority, reverse=True)
@@ -882,3 +1049,287 @@ class BMSProtocolManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.disconnect()
+
+
+# ── Multi-Device Polling Scheduler ──────────────────────────────────────────
+
+
+@dataclass
+class DevicePollStats:
+    """Per-device polling statistics kept by BMSPollingScheduler."""
+
+    polls: int = 0
+    misses: int = 0
+    timeouts: int = 0
+    consecutive_failures: int = 0
+    last_latency: float | None = None  # s, successful reads only
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    last_success: float | None = None  # wall-clock timestamp
+    backoff: float = 0.0  # current retry delay, 0 when healthy
+
+    @property
+    def mean_latency(self) -> float | None:
+        successes = self.polls - self.misses
+        return self.total_latency / successes if successes else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to plain dict."""
+        return {
+            "polls": self.polls,
+            "misses": self.misses,
+            "timeouts": self.timeouts,
+            "consecutive_failures": self.consecutive_failures,
+            "last_latency": self.last_latency,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+            "last_success": self.last_success,
+            "backoff": self.backoff,
+        }
+
+
+@dataclass
+class _PolledDevice:
+    device_id: str
+    interface: BMSInterface
+    interval: float
+    stats: DevicePollStats = field(default_factory=DevicePollStats)
+    deadline: float = 0.0  # nominal (un-jittered) loop time of the next poll
+    read: asyncio.Future | None = None  # executor future, may outlive a timeout
+
+
+class BMSPollingScheduler:
+    """Poll many BMS units concurrently, each at its own rate.
+
+    ``read_telemetry`` is blocking on every interface, so reads run on a
+    thread pool while a single asyncio task keeps a heap of per-device
+    deadlines. Deadlines stay on each device's nominal grid (slots missed
+    because a read ran long are skipped rather than queued up) and every
+    poll fires at a random offset of up to ``jitter * interval`` after its
+    slot, so devices sharing a rate do not hit the bus in lockstep.
+
+    A read that raises, times out, or returns empty telemetry
+    (``timestamp == 0``) counts as a miss. The device is then retried with
+    exponential backoff capped at ``max_backoff`` and, if its interface
+    dropped, reconnected before the next read. A device whose previous read
+    is still stuck in a worker thread is not read again until that thread
+    returns, so a hung unit occupies at most one worker and healthy devices
+    keep their schedule.
+
+    Successful readings go into :attr:`queue` with ``source`` set to the
+    device id. The queue is bounded; when consumers fall behind the oldest
+    reading is dropped and counted in :attr:`dropped`.
+
+    Args:
+        queue_size: Capacity of the shared telemetry queue.
+        timeout: Per-read timeout in seconds.
+        jitter: Fraction of the poll interval used as random start offset.
+        max_backoff: Upper bound on the retry delay of a failing device (s).
+        max_workers: Threads available for blocking reads.
+        seed: Seed for the jitter RNG.
+
+    Usage::
+
+        scheduler = BMSPollingScheduler(timeout=0.5)
+        for rack, iface in interfaces.items():
+            scheduler.add_device(rack, iface, interval=1.0)
+        await scheduler.start()
+        telemetry = await scheduler.queue.get()
+        ...
+        await scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 1024,
+        timeout: float = 1.0,
+        jitter: float = 0.1,
+        max_backoff: float = 60.0,
+        max_workers: int = 32,
+        seed: int | None = None,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if timeout <= 0:
+            raise ValueError("timeout must be > 0")
+        if not 0.0 <= jitter < 1.0:
+            raise ValueError("jitter must be in [0, 1)")
+        self.timeout = timeout
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.queue: asyncio.Queue[BMSTelemetry] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._rng = random.Random(seed)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bms-poll")
+        self._devices: dict[str, _PolledDevice] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = 0  # heap tie-breaker
+        self._wakeup: asyncio.Event | None = None
+        self._runner: asyncio.Task | None = None
+        self._stopping = False
+        self._polls: set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._runner is not None and not self._runner.done() and not self._stopping
+
+    def add_device(self, device_id: str, interface: BMSInterface, interval: float = 1.0) -> None:
+        """Register a device; it is first polled at a random phase within one interval."""
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if device_id in self._devices:
+            raise ValueError(f"Device already registered: {device_id}")
+        device = _PolledDevice(device_id, interface, interval)
+        self._devices[device_id] = device
+        if self.is_running:
+            self._schedule_initial(device, asyncio.get_running_loop().time())
+
+    def remove_device(self, device_id: str) -> None:
+        """Stop polling a device. An in-progress read is allowed to finish."""
+        self._devices.pop(device_id, None)
+
+    def stats(self) -> dict[str, DevicePollStats]:
+        """Per-device polling statistics keyed by device id."""
+        return {device_id: device.stats for device_id, device in self._devices.items()}
+
+    async def start(self) -> None:
+        """Start polling on the running event loop (idempotent)."""
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._heap.clear()
+        now = asyncio.get_running_loop().time()
+        for device in self._devices.values():
+            self._schedule_initial(device, now)
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop scheduling and wait for outstanding polls (bounded by ``timeout``)."""
+        if self._runner is not None:
+            # Ask the runner to exit rather than cancelling it: on Python 3.11
+            # a cancel racing a wakeup inside wait_for() can be swallowed
+            self._stopping = True
+            assert self._wakeup is not None
+            self._wakeup.set()
+            done, _ = await asyncio.wait({self._runner}, timeout=self.timeout)
+            if not done:
+                self._runner.cancel()
+                await asyncio.wait({self._runner}, timeout=self.timeout)
+            self._runner = None
+        if self._polls:
+            await asyncio.gather(*self._polls, return_exceptions=True)
+
+    def close(self) -> None:
+        """Release the worker threads. Call after :meth:`stop`."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -- scheduling --
+
+    def _schedule_initial(self, device: _PolledDevice, now: float) -> None:
+        device.deadline = now + self._rng.uniform(0.0, device.interval)
+        self._push(device, device.deadline)
+
+    def _push(self, device: _PolledDevice, deadline: float) -> None:
+        fire_at = deadline + self._rng.uniform(0.0, self.jitter * device.interval)
+        self._seq += 1
+        heapq.heappush(self._heap, (fire_at, self._seq, device.device_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            fire_at, _, device_id = self._heap[0]
+            delay = fire_at - loop.time()
+            if delay > 0:
+                # Sleep until the earliest deadline or until a device is added
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            device = self._devices.get(device_id)
+            if device is None:
+                continue
+            task = asyncio.create_task(self._poll(device))
+            self._polls.add(task)
+            task.add_done_callback(self._polls.discard)
+
+    async def _poll(self, device: _PolledDevice) -> None:
+        loop = asyncio.get_running_loop()
+        stats = device.stats
+        stats.polls += 1
+        reason: str | None = None
+        telemetry: BMSTelemetry | None = None
+        started = loop.time()
+
+        if device.read is not None and not device.read.done():
+            # Previous read is still blocked in its worker thread
+            reason = "busy"
+        else:
+            device.read = loop.run_in_executor(self._executor, self._read, device.interface)
+            try:
+                telemetry = await asyncio.wait_for(asyncio.shield(device.read), self.timeout)
+            except asyncio.TimeoutError:
+                reason = "timeout"
+                stats.timeouts += 1
+            except Exception as e:
+                logger.debug("Poll of %s failed: %s", device.device_id, e)
+                reason = "error"
+            else:
+                if telemetry.timestamp == 0.0:
+                    reason = "no_data"
+
+        now = loop.time()
+        if self._devices.get(device.device_id) is not device:
+            # Removed (or removed and re-added) while the read was in flight
+            return
+
+        if reason is None:
+            assert telemetry is not None
+            latency = now - started
+            stats.last_latency = latency
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.last_success = telemetry.timestamp
+            stats.consecutive_failures = 0
+            stats.backoff = 0.0
+            bms_poll_latency_seconds.labels(device_id=device.device_id).observe(latency)
+            telemetry.source = device.device_id
+            self._publish(telemetry)
+
+            device.deadline += device.interval
+            if device.deadline < now:
+                skipped = (now - device.deadline) // device.interval + 1
+                device.deadline += skipped * device.interval
+        else:
+            stats.misses += 1
+            stats.consecutive_failures += 1
+            stats.backoff = min(device.interval * 2**stats.consecutive_failures, self.max_backoff)
+            bms_poll_misses_total.labels(device_id=device.device_id, reason=reason).inc()
+            device.deadline = now + stats.backoff
+
+        if self.is_running:
+            self._push(device, device.deadline)
+
+    @staticmethod
+    def _read(interface: BMSInterface) -> BMSTelemetry:
+        if not interface.is_connected and not interface.connect():
+            raise ConnectionError("BMS connect failed")
+        return interface.read_telemetry()
+
+    def _publish(self, telemetry: BMSTelemetry) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(telemetry)
+                return
+            except asyncio.QueueFull:
+                self.queue.get_nowait()
+                self.dropped += 1
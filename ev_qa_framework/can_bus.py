@@ -11,18 +11,20 @@ Supports:
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 import os
 import platform
-import random
 import re
 import threading
 import time
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import can
 
-from .dbc_parser import DBCParser, battery_dbc_content
+from .dbc_parser import DBCParser, FrameSynthesizer, Message, Signal, builtin_dbc
 
 logger = logging.getLogger(__name__)
 
@@ -825,9 +827,338 @@ class OBD2Adapter:
         self.disconnect()
 
 
+# ── CAN Frame Dispatch ─────────────────────────────────────────────────────
+
+FrameHandler = Callable[[can.Message], Any]
+
+
+class CANDispatcher(can.Listener):
+    """Fan frames from one CAN bus out to many consumers by arbitration ID.
+
+    A ``can.Notifier`` owns the only receive loop on the bus and pushes
+    every frame to :meth:`on_message_received`, so consumers never call
+    ``bus.recv`` themselves. Each frame
+
+    - replaces the latest-value cache entry for its ID, and
+    - is passed to the handlers subscribed to that ID (and to wildcard
+      handlers subscribed with ``None``).
+
+    The receive path takes no locks: cache updates are single dict
+    assignments, and the handler table is copy-on-write (subscribing builds
+    a new table and swaps the reference). Readers therefore get a
+    consistent :meth:`snapshot` in microseconds without waiting on the bus.
+
+    The dispatcher can also be fed directly (``dispatcher.on_message_received``)
+    by code that already owns a receive loop.
+
+    Args:
+        bus: Bus to read from. May be None when frames are fed manually.
+        timeout: Notifier ``recv`` timeout; bounds how long :meth:`stop` waits.
+        loop: Optional asyncio loop; handlers then run on the loop thread
+            and coroutine handlers are scheduled as tasks.
+    """
+
+    def __init__(
+        self,
+        bus: can.BusABC | None = None,
+        timeout: float = 1.0,
+        loop: Any = None,
+    ):
+        self.bus = bus
+        self.timeout = timeout
+        self.loop = loop
+        self._notifier: can.Notifier | None = None
+        self._handlers: dict[int | None, tuple[FrameHandler, ...]] = {}
+        self._subscribe_lock = threading.Lock()
+        self._latest: dict[int, bytes] = {}
+        self._timestamps: dict[int, float] = {}
+        self.frame_count = 0
+        self.error_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._notifier is not None
+
+    def start(self) -> None:
+        """Start the notifier thread (idempotent)."""
+        if self._notifier is None and self.bus is not None:
+            self._notifier = can.Notifier(self.bus, [self], timeout=self.timeout, loop=self.loop)
+
+    def stop(self) -> None:
+        """Stop the notifier thread. The bus itself is left open."""
+        notifier, self._notifier = self._notifier, None
+        if notifier is not None:
+            notifier.remove_listener(self)
+            notifier.stop(timeout=self.timeout + 1.0)
+
+    def subscribe(self, can_id: int | None, handler: FrameHandler) -> Callable[[], None]:
+        """Call *handler* for every frame with *can_id* (``None`` = all frames).
+
+        Returns a function that removes the subscription.
+        """
+        with self._subscribe_lock:
+            handlers = dict(self._handlers)
+            handlers[can_id] = handlers.get(can_id, ()) + (handler,)
+            self._handlers = handlers
+
+        def unsubscribe() -> None:
+            with self._subscribe_lock:
+                handlers = dict(self._handlers)
+                remaining = tuple(h for h in handlers.get(can_id, ()) if h is not handler)
+                if remaining:
+                    handlers[can_id] = remaining
+                else:
+                    handlers.pop(can_id, None)
+                self._handlers = handlers
+
+        return unsubscribe
+
+    def latest(self, can_id: int) -> bytes | None:
+        """Payload of the most recent frame with *can_id*, if any."""
+        return self._latest.get(can_id)
+
+    def last_seen(self, can_id: int) -> float | None:
+        """Bus timestamp of the most recent frame with *can_id*, if any."""
+        return self._timestamps.get(can_id)
+
+    def snapshot(self, can_ids: Iterable[int] | None = None) -> dict[int, bytes]:
+        """Latest payload per arbitration ID, optionally restricted to *can_ids*."""
+        if can_ids is None:
+            return dict(self._latest)
+        latest = self._latest
+        return {can_id: latest[can_id] for can_id in can_ids if can_id in latest}
+
+    def clear(self) -> None:
+        """Forget all cached frames."""
+        self._latest = {}
+        self._timestamps = {}
+
+    def on_message_received(self, msg: can.Message) -> Any:
+        can_id = msg.arbitration_id
+        self._latest[can_id] = bytes(msg.data)
+        self._timestamps[can_id] = msg.timestamp
+        self.frame_count += 1
+
+        handlers = self._handlers
+        for handler in handlers.get(can_id, ()) + handlers.get(None, ()):
+            try:
+                result = handler(msg)
+            except Exception as e:
+                self.error_count += 1
+                logger.error("CAN handler for 0x%X failed: %s", can_id, e)
+                continue
+            if self.loop is not None and asyncio.iscoroutine(result):
+                self.loop.create_task(result)
+
+    def on_error(self, exc: Exception) -> None:
+        self.error_count += 1
+        logger.warning("CAN receive error on dispatcher: %s", exc)
+        if self.loop is None:
+            # Called on the notifier thread, which retries recv() after this
+            # returns: back off so a failing bus does not spin it. With a
+            # loop the call runs on the loop thread and the notifier thread
+            # has already exited, so sleeping would only block the loop.
+            time.sleep(0.1)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+# ── Cyclic Frame Generation ────────────────────────────────────────────────
+
+
+class _CyclicStream:
+    """Send state of one periodic message: schedule plus a block of payloads."""
+
+    __slots__ = ("can_id", "period", "extended", "dlc", "payload", "pos", "count")
+
+    def __init__(self, can_id: int, period: float, extended: bool):
+        self.can_id = can_id
+        self.period = period
+        self.extended = extended
+        self.dlc = 0
+        self.payload = b""
+        self.pos = 0
+        self.count = 0
+
+
+class CyclicFrameSender:
+    """
+    Send synthesized frames, each message at its own cycle time.
+
+    Payloads come from a :class:`~ev_qa_framework.dbc_parser.FrameSynthesizer`
+    in blocks of ``block_size`` frames per message, so the send loop only
+    slices bytes and builds a ``can.Message``. Deadlines are absolute
+    (``start + k * period`` on the monotonic clock), so rates do not drift
+    with send latency; the loop sleeps until ``spin_threshold`` before the
+    next deadline and busy-waits the rest. Frames that fall behind are sent
+    immediately; one that misses its slot by more than a whole period is
+    counted in ``late_frames``.
+
+    Args:
+        synthesizer: Source of payloads; owned by the sender thread.
+        send: Callable taking a ``can.Message`` (e.g. ``bus.send``).
+        cycle_times: Seconds between frames, per CAN ID.
+        block_size: Frames synthesized per message at a time.
+        spin_threshold: Seconds before a deadline to stop sleeping and spin.
+    """
+
+    def __init__(
+        self,
+        synthesizer: FrameSynthesizer,
+        send: Callable[[can.Message], Any],
+        cycle_times: dict[int, float],
+        block_size: int = 256,
+        spin_threshold: float = 0.001,
+    ):
+        for can_id, period in cycle_times.items():
+            if period <= 0:
+                raise ValueError(f"cycle time for 0x{can_id:X} must be positive, got {period}")
+        self.synthesizer = synthesizer
+        self.send = send
+        self.cycle_times = dict(cycle_times)
+        self.block_size = block_size
+        self.spin_threshold = spin_threshold
+
+        self.frames_sent = 0
+        self.send_errors = 0
+        self.late_frames = 0
+        self.max_lateness = 0.0
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def frame_rate(self) -> float:
+        """Nominal frames per second across all messages."""
+        return sum(1.0 / period for period in self.cycle_times.values())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "frames_sent": self.frames_sent,
+            "send_errors": self.send_errors,
+            "late_frames": self.late_frames,
+            "max_lateness": self.max_lateness,
+        }
+
+    def start(self) -> None:
+        """Start the sender thread (idempotent)."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="can-cyclic-sender", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 3.0) -> None:
+        """Stop sending and wait for the thread to exit."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _refill(self, stream: _CyclicStream) -> None:
+        block = self.synthesizer.synthesize(stream.can_id, self.block_size)
+        stream.dlc = block.shape[1]
+        stream.payload = block.tobytes()
+        stream.pos = 0
+        stream.count = len(block)
+
+    def _run(self) -> None:
+        clock = time.perf_counter
+        spin = self.spin_threshold
+        start = clock()
+        heap: list[tuple[float, int, _CyclicStream]] = []
+        for seq, (can_id, period) in enumerate(self.cycle_times.items()):
+            msg_def = self.synthesizer.messages.get(can_id)
+            extended = msg_def.is_extended if msg_def is not None else can_id > 0x7FF
+            heap.append((start, seq, _CyclicStream(can_id, period, extended)))
+        heapq.heapify(heap)
+
+        while self._running and heap:
+            due, seq, stream = heap[0]
+            delay = due - clock()
+            if delay > spin:
+                # Sleep in short slices so stop() is honoured promptly
+                time.sleep(min(delay - spin, 0.05))
+                continue
+            while clock() < due:
+                pass
+            late = clock() - due
+            if late > stream.period:
+                self.late_frames += 1
+            if late > self.max_lateness:
+                self.max_lateness = late
+
+            if stream.pos == stream.count:
+                self._refill(stream)
+            offset = stream.pos * stream.dlc
+            stream.pos += 1
+            msg = can.Message(
+                arbitration_id=stream.can_id,
+                data=stream.payload[offset : offset + stream.dlc],
+                is_extended_id=stream.extended,
+                check=False,
+            )
+            try:
+                self.send(msg)
+                self.frames_sent += 1
+            except Exception as e:
+                if not self.send_errors:
+                    logger.warning("Cyclic send of 0x%X failed: %s", stream.can_id, e)
+                self.send_errors += 1
+            heapq.heapreplace(heap, (due + stream.period, seq, stream))
+
+
 # ── Enhanced CAN Battery Simulator ──────────────────────────────────────────
 
 
+def _battery_sim_messages() -> list[Message]:
+    """Frame layout sent by CANBatterySimulator (big-endian, as CANTelemetryReceiver reads)."""
+
+    def sig(name: str, start: int, length: int, signed: bool, scale: float, unit: str) -> Signal:
+        return Signal(name, start, length, "Motorola", signed, scale, 0.0, 0, 0, unit)
+
+    return [
+        Message(
+            id=0x101,
+            name="VoltageCurrent",
+            dlc=8,
+            transmitter="EV_BMS",
+            signals={
+                "Voltage": sig("Voltage", 0, 16, False, 0.1, "V"),
+                "Current": sig("Current", 16, 16, True, 0.1, "A"),
+            },
+        ),
+        Message(
+            id=0x102,
+            name="TempSOC",
+            dlc=8,
+            transmitter="EV_BMS",
+            signals={
+                "Temperature": sig("Temperature", 0, 8, True, 1.0, "degC"),
+                "SOC": sig("SOC", 8, 8, False, 1.0, "%"),
+            },
+        ),
+    ]
+
+
+# Physical ranges of the simulated telemetry: nominal value +/- noise
+_BATTERY_SIM_RANGES = {
+    "Voltage": (394.0, 398.0),
+    "Current": (45.0, 55.0),
+    "Temperature": (34.0, 37.0),
+    "SOC": (80.0, 80.0),
+}
+
+
 class CANBatterySimulator:
     """
     Simulates battery telemetry messages on a CAN bus.
@@ -838,6 +1169,9 @@ class CANBatterySimulator:
     Messages:
     - 0x101: Voltage (uint16, 0.1V res) and Current (int16, 0.1A res)
     - 0x102: Temperature (int8, 1°C res) and SOC (uint8, 1% res)
+
+    Both are sent every ``interval`` seconds by a :class:`CyclicFrameSender`;
+    lower the interval to generate load.
     """
 
     def __init__(
@@ -846,21 +1180,30 @@ class CANBatterySimulator:
         hardware: bool = False,
         bitrate: int = 500000,
         auto_reconnect: bool = True,
+        interval: float = 1.0,
+        seed: int | None = None,
     ):
         self.channel = channel
         self.hardware = hardware
         self.bitrate = bitrate
         self.auto_reconnect = auto_reconnect
+        self.interval = interval
+        self.seed = seed
 
         self._hw_interface: CANHardwareInterface | None = None
         self.bus: can.interface.Bus | None = None
         self.running = False
-        self._thread: threading.Thread | None = None
+        self._sender: CyclicFrameSender | None = None
 
     @property
     def is_hardware(self) -> bool:
         return self.hardware or (self._hw_interface is not None and self._hw_interface.is_hardware)
 
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Sender counters (frames sent, send errors, late frames)."""
+        return self._sender.stats if self._sender is not None else {}
+
     def start(self):
         """Start simulation on the configured CAN interface."""
         if self.hardware:
@@ -892,14 +1235,19 @@ class CANBatterySimulator:
                 self.bus = None
 
         self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        synthesizer = FrameSynthesizer(
+            _battery_sim_messages(), ranges=_BATTERY_SIM_RANGES, seed=self.seed
+        )
+        self._sender = CyclicFrameSender(
+            synthesizer, self._send, {0x101: self.interval, 0x102: self.interval}
+        )
+        self._sender.start()
 
     def stop(self):
         """Stop simulation."""
         self.running = False
-        if self._thread:
-            self._thread.join(timeout=3)
+        if self._sender:
+            self._sender.stop(timeout=3)
 
         if self._hw_interface:
             self._hw_interface.disconnect()
@@ -911,60 +1259,11 @@ class CANBatterySimulator:
                 pass
             self.bus = None
 
-    def _run(self):
-        """Internal simulation loop."""
-        base_voltage = 396.0
-        base_current = 50.0
-        base_temp = 35
-        base_soc = 80
-
-        while self.running:
-            voltage = base_voltage + random.uniform(-2, 2)
-            current = base_current + random.uniform(-5, 5)
-            temp = base_temp + random.randint(-1, 2)
-            soc = base_soc
-
-            # Pack 0x101: Voltage (2 bytes), Current (2 bytes)
-            v_scaled = int(voltage * 10)
-            c_scaled = int(current * 10)
-            data1 = [
-                (v_scaled >> 8) & 0xFF,
-                v_scaled & 0xFF,
-                (c_scaled >> 8) & 0xFF,
-                c_scaled & 0xFF,
-                0,
-                0,
-                0,
-                0,
-            ]
-            msg1 = can.Message(
-                arbitration_id=0x101,
-                data=data1,
-                is_extended_id=False,
-            )
-
-            # Pack 0x102: Temperature (1 byte), SOC (1 byte)
-            data2 = [temp & 0xFF, soc & 0xFF, 0, 0, 0, 0, 0, 0]
-            msg2 = can.Message(
-                arbitration_id=0x102,
-                data=data2,
-                is_extended_id=False,
-            )
-
-            if self._hw_interface:
-                try:
-                    self._hw_interface.send(msg1)
-                    self._hw_interface.send(msg2)
-                except HardwareCANError as e:
-                    logger.error("Hardware CAN send failed: %s", e)
-            elif self.bus:
-                try:
-                    self.bus.send(msg1)
-                    self.bus.send(msg2)
-                except can.CanError:
-                    pass
-
-            time.sleep(1.0)
+    def _send(self, msg: can.Message) -> None:
+        if self._hw_interface:
+            self._hw_interface.send(msg)
+        elif self.bus:
+            self.bus.send(msg)
 
 
 class CANTelemetryReceiver:
@@ -972,6 +1271,8 @@ class CANTelemetryReceiver:
     Receives and decodes battery telemetry from a CAN bus.
 
     Supports both virtual CAN (vcan0) and real socketCAN interfaces.
+    Frames are routed through :attr:`dispatcher`, to which other consumers
+    of the same bus can subscribe.
     """
 
     def __init__(
@@ -997,6 +1298,11 @@ class CANTelemetryReceiver:
         self._running = False
         self._thread: threading.Thread | None = None
 
+        # Other consumers may subscribe to the same bus through the dispatcher
+        self.dispatcher = CANDispatcher()
+        self.dispatcher.subscribe(0x101, self._on_voltage_current)
+        self.dispatcher.subscribe(0x102, self._on_temperature_soc)
+
     @property
     def is_hardware(self) -> bool:
         return self.hardware or (self._hw_interface is not None and self._hw_interface.is_hardware)
@@ -1025,12 +1331,19 @@ class CANTelemetryReceiver:
                 self.bus = None
 
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        if self._hw_interface is None and self.bus is not None:
+            # Frames are pushed by a can.Notifier; no receive loop of our own
+            self.dispatcher.bus = self.bus
+            self.dispatcher.start()
+        else:
+            # Hardware reads go through CANHardwareInterface for reconnect handling
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
 
     def stop(self):
         """Stop receiver."""
         self._running = False
+        self.dispatcher.stop()
         if self._thread:
             self._thread.join(timeout=3)
 
@@ -1054,41 +1367,33 @@ class CANTelemetryReceiver:
         return value
 
     def _run(self):
-        """Internal receiver loop."""
+        """Receive loop for the hardware interface; frames go to the dispatcher."""
         while self._running:
-            msg: can.Message | None = None
-
-            if self._hw_interface:
-                try:
-                    msg = self._hw_interface.recv(timeout=1.0)
-                except HardwareCANError as e:
-                    logger.error("Hardware CAN receive error: %s", e)
-                    continue
-                except Exception:
-                    continue
-            elif self.bus:
-                try:
-                    msg = self.bus.recv(timeout=1.0)
-                except can.CanError:
-                    continue
-            else:
+            if self._hw_interface is None:
                 time.sleep(0.1)
                 continue
-
-            if msg is None:
+            try:
+                msg = self._hw_interface.recv(timeout=1.0)
+            except HardwareCANError as e:
+                logger.error("Hardware CAN receive error: %s", e)
                 continue
-
-            if msg.arbitration_id == 0x101:
-                v_scaled = (msg.data[0] << 8) | msg.data[1]
-                c_scaled = (msg.data[2] << 8) | msg.data[3]
-                # Handle signed current (2's complement)
-                c_scaled = self._to_signed(c_scaled, 16)
-                self.latest_data["voltage"] = v_scaled / 10.0
-                self.latest_data["current"] = c_scaled / 10.0
-            elif msg.arbitration_id == 0x102:
-                temp = self._to_signed(msg.data[0], 8)
-                self.latest_data["temperature"] = float(temp)
-                self.latest_data["soc"] = float(msg.data[1])
+            except Exception:
+                continue
+            if msg is not None:
+                self.dispatcher.on_message_received(msg)
+
+    def _on_voltage_current(self, msg: can.Message) -> None:
+        v_scaled = (msg.data[0] << 8) | msg.data[1]
+        c_scaled = (msg.data[2] << 8) | msg.data[3]
+        # Handle signed current (2's complement)
+        c_scaled = self._to_signed(c_scaled, 16)
+        self.latest_data["voltage"] = v_scaled / 10.0
+        self.latest_data["current"] = c_scaled / 10.0
+
+    def _on_temperature_soc(self, msg: can.Message) -> None:
+        temp = self._to_signed(msg.data[0], 8)
+        self.latest_data["temperature"] = float(temp)
+        self.latest_data["soc"] = float(msg.data[1])
 
     def get_telemetry(self) -> dict[str, Any]:
         """Return latest telemetry."""
@@ -1103,31 +1408,69 @@ class DBCFileSimulator:
     data for all defined messages and signals. Supports both CAN 2.0B
     and J1939 (29-bit) IDs automatically.
 
+    Each message is sent at its ``GenMsgCycleTime`` from the DBC, falling
+    back to ``default_cycle_time``; payloads are synthesized in NumPy blocks
+    by a :class:`~ev_qa_framework.dbc_parser.FrameSynthesizer`.
+
     Args:
         dbc_path: Path to .dbc file, or None to use built-in battery DBC.
+        cycle_times: Seconds between frames per CAN ID, overriding the DBC.
+        default_cycle_time: Seconds between frames for messages without a
+            cycle time.
+        rate_multiplier: Divide every cycle time by this factor, e.g. 100 to
+            load-test a gateway at 100x the nominal bus load.
+        ranges: Physical ``(low, high)`` per signal name, overriding the DBC.
+        seed: Seed for reproducible traffic.
     """
 
-    def __init__(self, dbc_path: str | None = None):
-        if dbc_path:
-            self.dbc = DBCParser(dbc_path)
-        else:
-            import tempfile
+    def __init__(
+        self,
+        dbc_path: str | None = None,
+        cycle_times: dict[int, float] | None = None,
+        default_cycle_time: float = 1.0,
+        rate_multiplier: float = 1.0,
+        ranges: dict[str, tuple[float, float]] | None = None,
+        seed: int | None = None,
+    ):
+        self.dbc = DBCParser(dbc_path) if dbc_path else builtin_dbc()
 
-            tmp = tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".dbc",
-                delete=False,
-            )
-            tmp.write(battery_dbc_content())
-            tmp.close()
-            self.dbc = DBCParser(tmp.name)
-            os.unlink(tmp.name)
+        if rate_multiplier <= 0:
+            raise ValueError(f"rate_multiplier must be positive, got {rate_multiplier}")
+        self.cycle_times = self._resolve_cycle_times(
+            cycle_times or {}, default_cycle_time, rate_multiplier
+        )
+        self.ranges = ranges
+        self.seed = seed
 
         self.running = False
-        self._thread: threading.Thread | None = None
+        self._sender: CyclicFrameSender | None = None
         self._hw_interface: CANHardwareInterface | None = None
         self._bus: can.interface.Bus | None = None
 
+    def _resolve_cycle_times(
+        self, overrides: dict[int, float], default: float, multiplier: float
+    ) -> dict[int, float]:
+        resolved = {}
+        for can_id, msg_def in self.dbc.messages.items():
+            if can_id in overrides:
+                period = overrides[can_id]
+            elif msg_def.cycle_time > 0:
+                period = msg_def.cycle_time / 1000.0
+            else:
+                period = default
+            resolved[can_id] = period / multiplier
+        return resolved
+
+    @property
+    def frame_rate(self) -> float:
+        """Nominal frames per second across all messages."""
+        return sum(1.0 / period for period in self.cycle_times.values())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Sender counters (frames sent, send errors, late frames)."""
+        return self._sender.stats if self._sender is not None else {}
+
     def start(
         self,
         channel: str = "vcan0",
@@ -1168,14 +1511,15 @@ class DBCFileSimulator:
                 self._bus = None
 
         self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        synthesizer = FrameSynthesizer(self.dbc, ranges=self.ranges, seed=self.seed)
+        self._sender = CyclicFrameSender(synthesizer, self._send, self.cycle_times)
+        self._sender.start()
 
     def stop(self):
         """Stop simulation."""
         self.running = False
-        if self._thread:
-            self._thread.join(timeout=3)
+        if self._sender:
+            self._sender.stop(timeout=3)
 
         if self._hw_interface:
             self._hw_interface.disconnect()
@@ -1187,59 +1531,8 @@ class DBCFileSimulator:
                 pass
             self._bus = None
 
-    def _run(self):
-        """Main simulation loop."""
-        while self.running:
-            for can_id, msg_def in self.dbc.messages.items():
-                data = self._generate_frame(msg_def)
-                msg = can.Message(
-                    arbitration_id=can_id,
-                    data=data,
-                    is_extended_id=msg_def.is_extended,
-                )
-
-                if self._hw_interface:
-                    try:
-                        self._hw_interface.send(msg)
-                    except HardwareCANError as e:
-                        logger.error("DBC send failed: %s", e)
-                elif self._bus:
-                    try:
-                        self._bus.send(msg)
-                    except can.CanError:
-                        pass
-
-            time.sleep(1.0)
-
-    def _generate_frame(self, msg_def) -> list[int]:
-        """Generate random CAN data bytes for a message definition."""
-        data = [0] * 8
-        for sig_name, sig in msg_def.signals.items():
-            raw = self._random_raw(sig)
-            self._place_raw(data, sig, raw)
-        return data
-
-    @staticmethod
-    def _random_raw(sig) -> int:
-        """Generate a random raw value within the signal's range."""
-        if sig.min_val < sig.max_val:
-            phys = random.uniform(sig.min_val, sig.max_val)
-        else:
-            phys = random.uniform(0, 100)
-        raw = sig.physical_to_raw(phys)
-        max_raw = (1 << sig.length) - 1
-        return max(0, min(raw, max_raw))
-
-    @staticmethod
-    def _place_raw(data: list[int], sig, raw: int):
-        """Place a raw integer into the CAN data bytes."""
-        for i in range(sig.length):
-            bit_pos = sig.start_bit + i if sig.byte_order == "Intel" else sig.start_bit - i
-            byte_idx = bit_pos // 8
-            bit_in_byte = bit_pos % 8
-            if byte_idx >= len(data):
-                continue
-            if (raw >> i) & 1:
-                data[byte_idx] |= 1 << bit_in_byte
-            else:
-                data[byte_idx] &= ~(1 << bit_in_byte)
+    def _send(self, msg: can.Message) -> None:
+        if self._hw_interface:
+            self._hw_interface.send(msg)
+        elif self._bus:
+            self._bus.send(msg)
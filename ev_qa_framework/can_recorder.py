@@ -0,0 +1,334 @@
+"""High-rate CAN bus recorder writing a binary columnar trace.
+
+Frames are packed into preallocated NumPy structured arrays of
+:data:`FRAME_DTYPE` (timestamp, arbitration ID, channel, DLC, flags and a
+64-byte payload, so CAN FD fits) and appended to disk in fixed-size chunks
+by a background writer thread. The file is a 64-byte header followed by
+raw records, so it can be memory-mapped directly with
+:func:`open_recording` and read while it is still being written.
+
+Usage:
+    with CANRecorder("trace.evcan") as recorder:
+        recorder.attach(bus)          # python-can bus, CANHardwareInterface
+        time.sleep(60)                # or CANDispatcher
+    print(recorder.stats)
+
+    frames = open_recording("trace.evcan")
+    frames["can_id"], frames["timestamp"]
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import can
+import numpy as np
+
+from .can_bus import CANDispatcher, CANHardwareInterface
+
+logger = logging.getLogger(__name__)
+
+# One 80-byte record per frame
+FRAME_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),  # s, as reported by the interface (hardware if available)
+        ("can_id", "<u4"),
+        ("channel", "<u2"),
+        ("dlc", "u1"),  # payload length in bytes
+        ("flags", "u1"),
+        ("data", "u1", (64,)),
+    ]
+)
+
+FLAG_EXTENDED = 0x01
+FLAG_REMOTE = 0x02
+FLAG_ERROR = 0x04
+FLAG_FD = 0x08
+FLAG_BRS = 0x10
+FLAG_ESI = 0x20
+FLAG_RX = 0x40
+
+RECORDING_MAGIC = b"EVQACAN\x00"
+RECORDING_VERSION = 1
+HEADER_SIZE = 64
+
+# magic, version, header size, record size, start time (wall clock)
+_HEADER = struct.Struct("<8sHHH2xd")
+# timestamp, can_id, channel, dlc, flags — the fixed part of a record
+_RECORD_HEAD = struct.Struct("<dIHBB")
+_DATA_OFFSET = FRAME_DTYPE.fields["data"][1]
+
+
+class RecordingFormatError(ValueError):
+    """Raised when a file is not a CAN recording this version can read."""
+
+
+@dataclass(frozen=True)
+class RecordingHeader:
+    """Metadata stored at the start of a recording."""
+
+    version: int
+    record_size: int
+    start_time: float
+
+
+def read_header(path: str | Path) -> RecordingHeader:
+    """Read and validate the header of a recording."""
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise RecordingFormatError(f"{path}: file too short for a recording header")
+    magic, version, header_size, record_size, start_time = _HEADER.unpack_from(raw)
+    if magic != RECORDING_MAGIC:
+        raise RecordingFormatError(f"{path}: not a CAN recording")
+    if version != RECORDING_VERSION or header_size != HEADER_SIZE:
+        raise RecordingFormatError(f"{path}: unsupported recording version {version}")
+    if record_size != FRAME_DTYPE.itemsize:
+        raise RecordingFormatError(f"{path}: unexpected record size {record_size}")
+    return RecordingHeader(version=version, record_size=record_size, start_time=start_time)
+
+
+def open_recording(path: str | Path) -> np.ndarray:
+    """Memory-map a recording as a read-only structured array of :data:`FRAME_DTYPE`.
+
+    Only complete records are mapped, so a file that is still being
+    written (or was cut short) can be opened safely.
+    """
+    read_header(path)
+    size = Path(path).stat().st_size
+    n = (size - HEADER_SIZE) // FRAME_DTYPE.itemsize
+    if n == 0:
+        return np.empty(0, dtype=FRAME_DTYPE)
+    return np.memmap(path, dtype=FRAME_DTYPE, mode="r", offset=HEADER_SIZE, shape=(n,))
+
+
+def message_flags(msg: can.Message) -> int:
+    """Pack the boolean attributes of a python-can message into record flags."""
+    return (
+        (FLAG_EXTENDED if msg.is_extended_id else 0)
+        | (FLAG_REMOTE if msg.is_remote_frame else 0)
+        | (FLAG_ERROR if msg.is_error_frame else 0)
+        | (FLAG_FD if msg.is_fd else 0)
+        | (FLAG_BRS if msg.bitrate_switch else 0)
+        | (FLAG_ESI if msg.error_state_indicator else 0)
+        | (FLAG_RX if msg.is_rx else 0)
+    )
+
+
+class _Tap(can.Listener):
+    """Notifier listener that stamps frames with a fixed channel number."""
+
+    def __init__(self, recorder: CANRecorder, channel: int):
+        self.recorder = recorder
+        self.channel = channel
+
+    def on_message_received(self, msg: can.Message) -> None:
+        self.recorder.record(msg, self.channel)
+
+
+class CANRecorder:
+    """Record CAN frames to a memory-mappable binary file.
+
+    Incoming frames are packed into the active chunk buffer (a struct
+    ``pack_into`` plus one slice copy per frame). Full chunks are handed to
+    a writer thread and the recorder continues in the next free buffer, so
+    disk latency never blocks the receive path. If the writer falls so far
+    behind that all ``n_buffers`` are in flight, frames are dropped and
+    counted instead of stalling the bus.
+
+    Args:
+        path: Output file; overwritten if it exists.
+        chunk_size: Frames per buffer and per disk write.
+        n_buffers: Number of preallocated chunk buffers.
+    """
+
+    def __init__(self, path: str | Path, chunk_size: int = 4096, n_buffers: int = 8):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if n_buffers < 2:
+            raise ValueError("n_buffers must be >= 2")
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.received = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.chunks_flushed = 0
+
+        self._free: deque[np.ndarray] = deque(
+            np.zeros(chunk_size, dtype=FRAME_DTYPE) for _ in range(n_buffers)
+        )
+        self._full: queue.Queue[tuple[np.ndarray, int] | None] = queue.Queue()
+        self._active: np.ndarray | None = None
+        self._view: memoryview | None = None
+        self._fill = 0
+        self._lock = threading.Lock()
+        self._notifiers: list[can.Notifier] = []
+        self._unsubscribe: list[Any] = []
+        self._writer: threading.Thread | None = None
+        self._file = None
+        self._error: BaseException | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self._writer is not None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Frame counters; ``pending`` frames are buffered but not yet on disk."""
+        return {
+            "received": self.received,
+            "recorded": self.received - self.dropped,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+            "pending": self.received - self.dropped - self.flushed,
+            "chunks_flushed": self.chunks_flushed,
+        }
+
+    def start(self, start_time: float | None = None) -> None:
+        """Create the file and start the writer thread (idempotent)."""
+        if self._writer is not None:
+            return
+        self._file = open(self.path, "wb")
+        header = _HEADER.pack(
+            RECORDING_MAGIC,
+            RECORDING_VERSION,
+            HEADER_SIZE,
+            FRAME_DTYPE.itemsize,
+            time.time() if start_time is None else start_time,
+        )
+        self._file.write(header.ljust(HEADER_SIZE, b"\x00"))
+        self._file.flush()
+        self._writer = threading.Thread(target=self._write_loop, name="can-recorder", daemon=True)
+        self._writer.start()
+
+    def attach(
+        self,
+        source: can.BusABC | CANHardwareInterface | CANDispatcher,
+        channel: int = 0,
+    ) -> None:
+        """Record every frame from *source*, tagged with *channel*.
+
+        A python-can bus or a connected ``CANHardwareInterface`` gets its
+        own ``can.Notifier``; a ``CANDispatcher`` is subscribed to, so the
+        recorder shares the bus with the dispatcher's other consumers.
+        """
+        self.start()
+        if isinstance(source, CANDispatcher):
+            self._unsubscribe.append(source.subscribe(None, lambda msg: self.record(msg, channel)))
+            return
+        bus = source.bus if isinstance(source, CANHardwareInterface) else source
+        if bus is None:
+            raise ValueError("CAN interface is not connected")
+        self._notifiers.append(can.Notifier(bus, [_Tap(self, channel)], timeout=0.5))
+
+    def record(self, msg: can.Message, channel: int = 0) -> None:
+        """Append one frame. Called from receive threads; never blocks on I/O."""
+        with self._lock:
+            self.received += 1
+            if self._active is None and not self._next_buffer():
+                self.dropped += 1
+                return
+            data = msg.data
+            n = min(len(data), 64)
+            offset = self._fill * FRAME_DTYPE.itemsize
+            _RECORD_HEAD.pack_into(
+                self._view,
+                offset,
+                msg.timestamp,
+                msg.arbitration_id,
+                channel,
+                n,
+                message_flags(msg),
+            )
+            self._view[offset + _DATA_OFFSET : offset + _DATA_OFFSET + n] = data[:n]
+            self._fill += 1
+            if self._fill == self.chunk_size:
+                self._hand_off()
+
+    def flush(self) -> None:
+        """Write out the partially filled chunk and wait until the writer is idle."""
+        with self._lock:
+            if self._active is not None and self._fill:
+                self._hand_off()
+        if self._writer is not None:
+            self._full.join()
+        if self._error is not None:
+            raise OSError(f"CAN recorder write failed: {self._error}") from self._error
+
+    def stop(self) -> None:
+        """Detach from all sources, flush remaining frames and close the file."""
+        for notifier in self._notifiers:
+            notifier.stop(timeout=1.0)
+        self._notifiers.clear()
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe.clear()
+        if self._writer is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._full.put(None)
+            self._writer.join()
+            self._writer = None
+            self._file.close()
+            self._file = None
+        logger.info(
+            "CAN recording %s: %d frames written, %d dropped",
+            self.path,
+            self.flushed,
+            self.dropped,
+        )
+
+    def _next_buffer(self) -> bool:
+        try:
+            self._active = self._free.popleft()
+        except IndexError:
+            return False
+        self._view = memoryview(self._active.view(np.uint8))
+        self._fill = 0
+        return True
+
+    def _hand_off(self) -> None:
+        self._full.put((self._active, self._fill))
+        self._active = None
+        self._view = None
+        self._next_buffer()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._full.get()
+            try:
+                if item is None:
+                    return
+                buffer, n = item
+                raw = buffer.view(np.uint8)[: n * FRAME_DTYPE.itemsize]
+                if self._error is None:
+                    try:
+                        self._file.write(raw)
+                        self._file.flush()
+                    except OSError as e:
+                        logger.error("CAN recorder write to %s failed: %s", self.path, e)
+                        self._error = e
+                    else:
+                        self.flushed += n
+                        self.chunks_flushed += 1
+                raw[:] = 0
+                self._free.append(buffer)
+            finally:
+                self._full.task_done()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
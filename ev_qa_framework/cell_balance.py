@@ -5,14 +5,8 @@ Uses statistical methods, configurable thresholds, and linear regression trend
 prediction to identify cell imbalance conditions before they become critical.
 """
 
-import matplotlib
 import numpy as np
 
-matplotlib.use("Agg")  # no-display backend for headless/server use
-
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
-
 
 class CellBalanceAnalyzer:
     """
@@ -132,6 +126,8 @@ class CellBalanceAnalyzer:
         (slope, intercept)
             Linear regression coefficients. (0.0, 0.0) if insufficient data.
         """
+        from sklearn.linear_model import LinearRegression
+
         if len(timeline_measurements) < 2:
             return (0.0, 0.0)
 
@@ -164,6 +160,11 @@ class CellBalanceAnalyzer:
         save_path : str, optional
             Path to save the figure.
         """
+        import matplotlib
+
+        matplotlib.use("Agg")  # no-display backend for headless/server use
+        import matplotlib.pyplot as plt
+
         if not timeline_voltages:
             raise ValueError("No data to plot.")
 
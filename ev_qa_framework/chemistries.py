@@ -21,11 +21,19 @@ from __future__ import annotations
 import json
 import math
 import os
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
-from typing import Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Scalar or array input to the broadcasting model functions
+ArrayLike = float | Sequence[float] | np.ndarray
+
 # ---------------------------------------------------------------------------
 # Supported chemistry identifiers
 # ---------------------------------------------------------------------------
@@ -34,6 +42,21 @@ ChemistryKey = Literal["lfp", "nmc", "nca"]
 ALL_CHEMISTRIES: list[ChemistryKey] = ["lfp", "nmc", "nca"]
 
 
+def _scalar_or_array(value: np.ndarray) -> float | np.ndarray:
+    """Return 0-d results as a plain float so scalar callers see no change."""
+    return float(value) if np.ndim(value) == 0 else value
+
+
+_PLAIN_NUMBERS = frozenset({int, float})
+
+
+def _operands(*values: ArrayLike) -> tuple[tuple[Any, ...], Any]:
+    """Return the inputs and the ``exp`` to use: ``math`` for plain numbers, NumPy otherwise."""
+    if {type(v) for v in values} <= _PLAIN_NUMBERS:
+        return values, math.exp
+    return tuple(np.asarray(v, dtype=np.float64) for v in values), np.exp
+
+
 # ---------------------------------------------------------------------------
 # SOH / degradation parameters
 # ---------------------------------------------------------------------------
@@ -126,19 +149,36 @@ class OCVCurve:
     ocv_points: list[float] = field(default_factory=list)
     name: str = "Generic OCV"
 
-    def get_ocv(self, soc: float) -> float:
+    def compile(self, soc_resolution: float = 0.01, voltage_resolution: float = 1e-4) -> OCVTable:
+        """Compile the curve into dense, uniformly sampled lookup tables.
+
+        Tables are memoized by the curve points and resolutions, so repeated
+        calls are cheap and edits to the points are picked up.
+
+        Args:
+            soc_resolution: SOC step of the forward table (%).
+            voltage_resolution: OCV step of the inverse table (V).
+
+        Returns:
+            The compiled :class:`OCVTable`.
+        """
+        return _compile_ocv_table(
+            tuple(self.soc_points), tuple(self.ocv_points), soc_resolution, voltage_resolution
+        )
+
+    def get_ocv(self, soc: ArrayLike) -> float | np.ndarray:
         """Get OCV at a given SOC using linear interpolation.
 
         Args:
-            soc: State of Charge (0-100 %).
+            soc: State of Charge (0-100 %), scalar or array. Values outside
+                the curve's SOC range are clamped.
 
         Returns:
-            Open Circuit Voltage in Volts.
+            Open Circuit Voltage in Volts (float for scalar input).
         """
         if not self.soc_points or not self.ocv_points:
-            return 3.7
-        soc_clamped = max(self.soc_points[0], min(self.soc_points[-1], soc))
-        return float(np.interp(soc_clamped, self.soc_points, self.ocv_points))
+            return 3.7 if np.ndim(soc) == 0 else np.full(np.shape(soc), 3.7)
+        return self.compile().ocv_at(soc)
 
     def get_ocv_array(self, soc_array: np.ndarray) -> np.ndarray:
         """Get OCV for an array of SOC values.
@@ -151,24 +191,25 @@ class OCVCurve:
         """
         if not self.soc_points or not self.ocv_points:
             return np.full_like(soc_array, 3.7)
-        return np.interp(soc_array, self.soc_points, self.ocv_points)
+        return np.asarray(self.compile().ocv_at(soc_array))
 
-    def get_soc_from_ocv(self, ocv: float) -> float:
+    def get_soc_from_ocv(self, ocv: ArrayLike) -> float | np.ndarray:
         """Estimate SOC from OCV (inverse lookup).
 
-        Note: For LFP, this is unreliable in the flat plateau region
-        (SOC 20-80 %) because OCV barely changes.
+        The inverse is taken on the monotonic envelope of the curve, and a
+        flat segment maps to the SOC at its midpoint. For LFP the plateau
+        (SOC 20-80 %) is still nearly flat, so a few mV of measurement error
+        shift the estimate by several percent.
 
         Args:
-            ocv: Open Circuit Voltage in Volts.
+            ocv: Open Circuit Voltage in Volts, scalar or array.
 
         Returns:
-            Estimated SOC (0-100 %).
+            Estimated SOC (0-100 %), float for scalar input.
         """
         if not self.soc_points or not self.ocv_points:
-            return 50.0
-        ocv_clamped = max(self.ocv_points[0], min(self.ocv_points[-1], ocv))
-        return float(np.interp(ocv_clamped, self.ocv_points, self.soc_points))
+            return 50.0 if np.ndim(ocv) == 0 else np.full(np.shape(ocv), 50.0)
+        return self.compile().soc_at(ocv)
 
     def to_dict(self) -> dict:
         return {
@@ -186,6 +227,148 @@ class OCVCurve:
         )
 
 
+# Below this many elements np.interp on the curve knots beats the table gather
+_DENSE_LOOKUP_MIN_SIZE = 2048
+
+
+@dataclass(frozen=True, eq=False)
+class OCVTable:
+    """Uniformly sampled OCV(SOC) and SOC(OCV) tables for O(1) lookups.
+
+    A lookup computes the table index from the value directly and
+    interpolates linearly between the two neighbouring samples, so its cost
+    does not depend on the number of curve points. Scalars and large arrays
+    use the tables; small arrays are interpolated on the knots with
+    ``np.interp``, which has less per-call overhead. Build one with
+    :meth:`OCVCurve.compile`.
+
+    Attributes:
+        soc_start: SOC of the first forward sample (%).
+        soc_step: SOC spacing of the forward table (%).
+        ocv: OCV at each forward sample (V).
+        ocv_start: OCV of the first inverse sample (V).
+        ocv_step: OCV spacing of the inverse table (V).
+        soc: SOC at each inverse sample (%).
+        soc_knots: Curve SOC points (%).
+        ocv_knots: Curve OCV points (V).
+        inverse_ocv_knots: Strictly increasing OCV knots of the inverse (V).
+        inverse_soc_knots: SOC at each inverse knot (%).
+    """
+
+    soc_start: float
+    soc_step: float
+    ocv: np.ndarray
+    ocv_start: float
+    ocv_step: float
+    soc: np.ndarray
+    soc_knots: np.ndarray
+    ocv_knots: np.ndarray
+    inverse_ocv_knots: np.ndarray
+    inverse_soc_knots: np.ndarray
+
+    def __post_init__(self) -> None:
+        for name, start, step, values, xp, fp in (
+            ("_forward", self.soc_start, self.soc_step, self.ocv, self.soc_knots, self.ocv_knots),
+            (
+                "_inverse",
+                self.ocv_start,
+                self.ocv_step,
+                self.soc,
+                self.inverse_ocv_knots,
+                self.inverse_soc_knots,
+            ),
+        ):
+            slope = np.append(np.diff(values), 0.0)
+            lookup = (start, step, values, slope, values.tolist(), slope.tolist(), xp, fp)
+            object.__setattr__(self, name, lookup)
+
+    def ocv_at(self, soc: ArrayLike) -> float | np.ndarray:
+        """Look up OCV (V) for SOC (%), clamped to the curve range."""
+        return _table_lookup(soc, *self._forward)
+
+    def soc_at(self, ocv: ArrayLike) -> float | np.ndarray:
+        """Look up SOC (%) for OCV (V), clamped to the curve range."""
+        return _table_lookup(ocv, *self._inverse)
+
+
+def _table_lookup(
+    x: ArrayLike,
+    start: float,
+    step: float,
+    values: np.ndarray,
+    slope: np.ndarray,
+    values_list: list[float],
+    slope_list: list[float],
+    xp: np.ndarray,
+    fp: np.ndarray,
+) -> float | np.ndarray:
+    """Linear interpolation in a uniformly sampled table, clamped at both ends."""
+    last = len(values_list) - 1
+    if type(x) in _PLAIN_NUMBERS:
+        pos = (x - start) / step
+        if pos <= 0.0:
+            return values_list[0]
+        if pos >= last:
+            return values_list[last]
+        if pos != pos:
+            return math.nan
+        i = int(pos)
+        return values_list[i] + (pos - i) * slope_list[i]
+    x = np.asarray(x, dtype=np.float64)
+    if x.size < _DENSE_LOOKUP_MIN_SIZE:
+        return _scalar_or_array(np.interp(x, xp, fp))
+    pos = ((x - start) / step).clip(0.0, last)
+    with np.errstate(invalid="ignore"):  # NaN -> clipped index, result stays NaN
+        idx = pos.astype(np.intp).clip(0, last - 1)
+    return values[idx] + (pos - idx) * slope[idx]
+
+
+def _uniform_samples(start: float, stop: float, resolution: float) -> np.ndarray:
+    """Uniform grid from *start* to *stop* with spacing at most *resolution*."""
+    if resolution <= 0:
+        raise ValueError(f"resolution must be positive, got {resolution}")
+    n = max(int(math.ceil((stop - start) / resolution - 1e-9)) + 1, 2)
+    return np.linspace(start, stop, n)
+
+
+@lru_cache(maxsize=64)
+def _compile_ocv_table(
+    soc_points: tuple[float, ...],
+    ocv_points: tuple[float, ...],
+    soc_resolution: float,
+    voltage_resolution: float,
+) -> OCVTable:
+    soc = np.asarray(soc_points, dtype=np.float64)
+    ocv = np.asarray(ocv_points, dtype=np.float64)
+    if soc.shape != ocv.shape or soc.size == 0:
+        raise ValueError("soc_points and ocv_points must be non-empty and of equal length")
+    if np.any(np.diff(soc) < 0):
+        raise ValueError("soc_points must be increasing")
+
+    soc_grid = _uniform_samples(soc[0], soc[-1], soc_resolution)
+
+    # Invert the non-decreasing envelope; each run of equal OCV (a flat
+    # segment, or a dip flattened by the envelope) becomes one knot at the
+    # midpoint of its SOC range
+    envelope = np.maximum.accumulate(ocv)
+    knots, first, counts = np.unique(envelope, return_index=True, return_counts=True)
+    knot_soc = (soc[first] + soc[first + counts - 1]) / 2.0
+    ocv_grid = _uniform_samples(knots[0], knots[-1], voltage_resolution)
+
+    return OCVTable(
+        soc_start=float(soc_grid[0]),
+        soc_step=float(soc_grid[1] - soc_grid[0]) or 1.0,
+        ocv=np.interp(soc_grid, soc, ocv),
+        ocv_start=float(ocv_grid[0]),
+        ocv_step=float(ocv_grid[1] - ocv_grid[0]) or 1.0,
+        soc=np.interp(ocv_grid, knots, knot_soc),
+        soc_knots=soc,
+        ocv_knots=ocv,
+        inverse_ocv_knots=knots,
+        inverse_soc_knots=knot_soc,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Aging model
 # ---------------------------------------------------------------------------
@@ -223,10 +406,13 @@ class AgingModel:
 
     R: float = 8.314  # Gas constant J/(mol·K)
 
-    def calendar_aging_rate(self, temperature_c: float, soc_pct: float = 50.0) -> float:
+    def calendar_aging_rate(
+        self, temperature_c: ArrayLike, soc_pct: ArrayLike = 50.0
+    ) -> float | np.ndarray:
         """Compute calendar aging rate (% capacity loss per year).
 
-        Uses Arrhenius equation with SOC stress factor.
+        Uses Arrhenius equation with SOC stress factor. Inputs broadcast
+        against each other; scalar inputs give a float.
 
         Args:
             temperature_c: Temperature in Celsius.
@@ -235,23 +421,27 @@ class AgingModel:
         Returns:
             Capacity loss per year in %.
         """
+        (temperature_c, soc_pct), exp = _operands(temperature_c, soc_pct)
         T_kelvin = temperature_c + 273.15
         T_ref = 298.15  # 25°C reference
-        arrhenius_factor = math.exp(
+        arrhenius_factor = exp(
             -self.activation_energy_calendar / self.R * (1.0 / T_kelvin - 1.0 / T_ref)
         )
         soc_stress = 1.0 + 0.02 * (soc_pct - 50.0)
         base_rate = 20.0 / self.calendar_life_years
-        return base_rate * arrhenius_factor * soc_stress
+        rate = base_rate * arrhenius_factor * soc_stress
+        return rate if exp is math.exp else _scalar_or_array(rate)
 
     def cycle_aging_rate(
         self,
-        temperature_c: float,
-        c_rate: float = 1.0,
-        dod_pct: float = 80.0,
-    ) -> float:
+        temperature_c: ArrayLike,
+        c_rate: ArrayLike = 1.0,
+        dod_pct: ArrayLike = 80.0,
+    ) -> float | np.ndarray:
         """Compute cycle aging rate (% capacity loss per equivalent full cycle).
 
+        Inputs broadcast against each other; scalar inputs give a float.
+
         Args:
             temperature_c: Temperature in Celsius.
             c_rate: Charge/discharge C-rate.
@@ -260,28 +450,36 @@ class AgingModel:
         Returns:
             Capacity loss per equivalent full cycle in %.
         """
+        (temperature_c, c_rate, dod_pct), exp = _operands(temperature_c, c_rate, dod_pct)
         T_kelvin = temperature_c + 273.15
         T_ref = 298.15
-        arrhenius_factor = math.exp(
+        arrhenius_factor = exp(
             -self.activation_energy_cycle / self.R * (1.0 / T_kelvin - 1.0 / T_ref)
         )
         c_stress = c_rate**1.5
         dod_stress = (dod_pct / 80.0) ** 1.3
         base_rate = 20.0 / self.cycle_life_80
-        return base_rate * arrhenius_factor * c_stress * dod_stress
+        rate = base_rate * arrhenius_factor * c_stress * dod_stress
+        return rate if exp is math.exp else _scalar_or_array(rate)
 
     def predict_soh(
         self,
-        initial_soh: float = 100.0,
-        years: float = 1.0,
-        cycles_per_year: int = 300,
-        temperature_c: float = 25.0,
-        soc_pct: float = 50.0,
-        c_rate: float = 1.0,
-        dod_pct: float = 80.0,
-    ) -> float:
+        initial_soh: ArrayLike = 100.0,
+        years: ArrayLike = 1.0,
+        cycles_per_year: ArrayLike = 300,
+        temperature_c: ArrayLike = 25.0,
+        soc_pct: ArrayLike = 50.0,
+        c_rate: ArrayLike = 1.0,
+        dod_pct: ArrayLike = 80.0,
+    ) -> float | np.ndarray:
         """Predict SOH after given time and cycling conditions.
 
+        Losses are applied year by year; a year that starts below the knee
+        point loses ``knee_factor`` times as much. All inputs broadcast
+        against each other and the knee is tracked per element, so a whole
+        operating-condition grid is projected in ``max(years)`` array steps.
+        All-scalar inputs take a plain-float path and return a float.
+
         Args:
             initial_soh: Starting SOH (%).
             years: Number of years.
@@ -294,6 +492,21 @@ class AgingModel:
         Returns:
             Predicted SOH (%).
         """
+        inputs = (initial_soh, years, cycles_per_year, temperature_c, soc_pct, c_rate, dod_pct)
+        if {type(x) for x in inputs} <= _PLAIN_NUMBERS:
+            return self._predict_soh_scalar(*inputs)
+        return _scalar_or_array(self._predict_soh_array(*inputs))
+
+    def _predict_soh_scalar(
+        self,
+        initial_soh: float,
+        years: float,
+        cycles_per_year: float,
+        temperature_c: float,
+        soc_pct: float,
+        c_rate: float,
+        dod_pct: float,
+    ) -> float:
         soh = initial_soh
         cal_rate = self.calendar_aging_rate(temperature_c, soc_pct)
         cyc_rate = self.cycle_aging_rate(temperature_c, c_rate, dod_pct)
@@ -317,6 +530,51 @@ class AgingModel:
 
         return max(0.0, soh)
 
+    def _predict_soh_array(
+        self,
+        initial_soh: ArrayLike,
+        years: ArrayLike,
+        cycles_per_year: ArrayLike,
+        temperature_c: ArrayLike,
+        soc_pct: ArrayLike,
+        c_rate: ArrayLike,
+        dod_pct: ArrayLike,
+    ) -> np.ndarray:
+        # Same arithmetic as the scalar loop, with the knee tracked per element
+        years = np.asarray(years, dtype=np.float64)
+        cal_rate = np.asarray(self.calendar_aging_rate(temperature_c, soc_pct))
+        cyc_rate = np.asarray(self.cycle_aging_rate(temperature_c, c_rate, dod_pct))
+        cyc_rate_year = cyc_rate * np.asarray(cycles_per_year, dtype=np.float64)
+        whole_years = np.trunc(years)
+        frac = np.maximum(years - whole_years, 0.0)
+
+        initial = np.asarray(initial_soh, dtype=np.float64)
+        shape = np.broadcast_shapes(initial.shape, years.shape, cal_rate.shape, cyc_rate_year.shape)
+        soh = np.array(np.broadcast_to(initial, shape))
+        knee, factor = self.knee_point_soh, self.knee_factor
+
+        n_years = int(whole_years.max(initial=0.0))
+        uniform = whole_years.ndim == 0
+        for year in range(n_years):
+            below = soh < knee
+            loss = np.where(below, cal_rate * factor, cal_rate) + np.where(
+                below, cyc_rate_year * factor, cyc_rate_year
+            )
+            if uniform:
+                soh -= loss
+            else:
+                soh -= np.where(whole_years > year, loss, 0.0)
+
+        if np.any(frac > 0):
+            below = soh < knee
+            cal_loss = cal_rate * frac
+            cyc_loss = cyc_rate_year * frac
+            soh -= np.where(below, cal_loss * factor, cal_loss) + np.where(
+                below, cyc_loss * factor, cyc_loss
+            )
+
+        return np.maximum(soh, 0.0)
+
     def to_dict(self) -> dict:
         return {
             "arrhenius_preexponential_calendar": self.arrhenius_preexponential_calendar,
@@ -428,6 +686,162 @@ class ThermalModel:
             temperatures.append(temp)
         return temperatures
 
+    def simulate_cells(
+        self,
+        current_profile: ArrayLike,
+        initial_temperature: ArrayLike,
+        ambient_temperature: ArrayLike,
+        dt_seconds: float = 1.0,
+        *,
+        n_cells: int | None = None,
+        reference_resistance: ArrayLike | None = None,
+        cell_mass_kg: ArrayLike | None = None,
+        heat_transfer_coeff: ArrayLike | None = None,
+        coupling: np.ndarray | None = None,
+        every: int = 1,
+        chunk_size: int = 4096,
+        dtype: Any = np.float64,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Simulate the temperatures of many cells at once.
+
+        Array counterpart of :meth:`simulate_thermal` with the same explicit
+        Euler step, applied to every cell per time step. Cell parameters
+        default to this model's and may be given per cell to model spread.
+        The optional ``coupling`` matrix adds conduction between cells:
+        ``coupling[i, j]`` is the thermal conductance (W/K) between cells
+        ``i`` and ``j`` (see :func:`neighbour_coupling`); the diagonal is
+        ignored.
+
+        The current profile is converted and expanded into per-step
+        coefficients ``chunk_size`` steps at a time, so memory stays bounded
+        for long profiles.
+
+        Args:
+            current_profile: ``(T,)`` current (Amps) shared by all cells, as
+                in a series string, or ``(T, cells)`` per-cell currents.
+            initial_temperature: Starting temperature (°C), scalar or per cell.
+            ambient_temperature: Ambient temperature (°C), scalar or per cell.
+            dt_seconds: Time step in seconds.
+            n_cells: Number of cells; inferred from the array inputs if None.
+            reference_resistance: Resistance at 25°C (Ohm), scalar or per cell.
+            cell_mass_kg: Cell mass (kg), scalar or per cell.
+            heat_transfer_coeff: Heat transfer to ambient (W/K), scalar or per cell.
+            coupling: Optional ``(cells, cells)`` conductance matrix (W/K).
+            every: Record the temperatures after every ``every``-th step.
+            chunk_size: Time steps prepared per chunk.
+            dtype: Floating-point type of the computation and result
+                (``np.float64`` or ``np.float32``).
+            out: Optional preallocated ``(T // every + 1, cells)`` array.
+
+        Returns:
+            Array of shape ``(T // every + 1, cells)``; row ``r`` holds the
+            temperatures after ``r * every`` steps (row 0 is the initial
+            state), so with ``every=1`` column ``i`` matches
+            :meth:`simulate_thermal` for cell ``i``. Unlike
+            :meth:`simulate_thermal`, which integrates any time step, this
+            raises ``ValueError`` when ``dt_seconds`` is too large for the
+            explicit step to stay stable.
+
+        Raises:
+            ValueError: If input shapes disagree, or the time step is too
+                large for the heat transfer and conduction terms to stay stable.
+        """
+        dtype = np.dtype(dtype)
+        if dtype.kind != "f":
+            raise ValueError(f"dtype must be a floating-point type, got {dtype}")
+        if every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+        currents = np.asarray(current_profile)
+        if currents.ndim not in (1, 2):
+            raise ValueError("current_profile must have shape (T,) or (T, cells)")
+        if coupling is not None:
+            coupling = np.asarray(coupling, dtype=np.float64)
+            if coupling.ndim != 2 or coupling.shape[0] != coupling.shape[1]:
+                raise ValueError("coupling must be a square (cells, cells) matrix")
+
+        per_cell = {
+            "initial_temperature": initial_temperature,
+            "ambient_temperature": ambient_temperature,
+            "reference_resistance": (
+                self.reference_resistance if reference_resistance is None else reference_resistance
+            ),
+            "cell_mass_kg": self.cell_mass_kg if cell_mass_kg is None else cell_mass_kg,
+            "heat_transfer_coeff": (
+                self.heat_transfer_coeff if heat_transfer_coeff is None else heat_transfer_coeff
+            ),
+        }
+        sizes = {name: np.size(value) for name, value in per_cell.items()}
+        if currents.ndim == 2:
+            sizes["current_profile"] = currents.shape[1]
+        if coupling is not None:
+            sizes["coupling"] = coupling.shape[0]
+        if n_cells is None:
+            n_cells = max(sizes.values())
+        mismatched = sorted(name for name, size in sizes.items() if size not in (1, n_cells))
+        if mismatched:
+            raise ValueError(f"{', '.join(mismatched)} must be scalar or have {n_cells} cells")
+        params = {
+            name: np.broadcast_to(np.asarray(value, dtype=np.float64).ravel(), (n_cells,))
+            for name, value in per_cell.items()
+        }
+
+        # T' = T + a * (I^2 R(T) - h (T - T_amb) + sum_j G_ij (T_j - T))
+        # with R(T) = R_ref (1 + alpha (T - 25)), a = dt / (m cp)
+        alpha = self.resistance_temp_coeff
+        a = dt_seconds / (params["cell_mass_kg"] * self.thermal_params.specific_heat_capacity)
+        ah = a * params["heat_transfer_coeff"]
+        damping = ah.copy()
+        conduction = None
+        if coupling is not None:
+            g = coupling.copy()
+            np.fill_diagonal(g, 0.0)
+            g_sum = g.sum(axis=1)
+            damping += a * g_sum
+            conduction = (a[:, None] * (g - np.diag(g_sum))).astype(dtype)
+        if damping.max(initial=0.0) > 1.0:
+            raise ValueError(
+                f"dt_seconds={dt_seconds} is too large for this heat transfer/coupling "
+                f"(dt * (h + sum G) / (m * cp) = {damping.max():.3g} > 1)"
+            )
+        heat_scale = (a * params["reference_resistance"]).astype(dtype)
+        decay = (1.0 - ah).astype(dtype)
+        ambient_gain = (ah * params["ambient_temperature"]).astype(dtype)
+        alpha_t = dtype.type(alpha)
+        offset_t = dtype.type(1.0 - 25.0 * alpha)
+
+        n_steps = currents.shape[0]
+        shape = (n_steps // every + 1, n_cells)
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}, got {out.shape}")
+
+        temp = params["initial_temperature"].astype(dtype)
+        out[0] = temp
+        nxt = np.empty_like(temp)
+        for lo in range(0, n_steps, chunk_size):
+            chunk = np.asarray(currents[lo : lo + chunk_size], dtype=dtype)
+            if chunk.ndim == 1:
+                chunk = chunk[:, None]
+            # Per step: T' = gain * T + bias (+ conduction @ T)
+            heat = chunk * chunk * heat_scale
+            gain = decay + alpha_t * heat
+            bias = offset_t * heat + ambient_gain
+            for k in range(chunk.shape[0]):
+                np.multiply(gain[k], temp, out=nxt)
+                nxt += bias[k]
+                if conduction is not None:
+                    nxt += conduction @ temp
+                temp, nxt = nxt, temp
+                step = lo + k + 1
+                if step % every == 0:
+                    out[step // every] = temp
+        return out
+
     def to_dict(self) -> dict:
         return {
             "thermal_params": {
@@ -466,6 +880,26 @@ class ThermalModel:
         )
 
 
+def neighbour_coupling(n_cells: int, conductance: float, ring: bool = False) -> np.ndarray:
+    """Build a conductance matrix linking each cell to its neighbours in a row.
+
+    Args:
+        n_cells: Number of cells.
+        conductance: Thermal conductance between adjacent cells (W/K).
+        ring: Also link the last cell to the first.
+
+    Returns:
+        Symmetric ``(n_cells, n_cells)`` matrix for
+        :meth:`ThermalModel.simulate_cells`.
+    """
+    g = np.zeros((n_cells, n_cells))
+    idx = np.arange(n_cells - 1)
+    g[idx, idx + 1] = g[idx + 1, idx] = conductance
+    if ring and n_cells > 2:
+        g[0, -1] = g[-1, 0] = conductance
+    return g
+
+
 # ===================================================================
 # Built-in OCV curves (published datasheet data)
 # ===================================================================
@@ -692,22 +1126,22 @@ class BatteryChemistryProfile:
     # ------------------------------------------------------------------
     # Chemistry-aware methods
     # ------------------------------------------------------------------
-    def get_ocv(self, soc: float) -> float:
+    def get_ocv(self, soc: ArrayLike) -> float | np.ndarray:
         """Get Open Circuit Voltage at given SOC.
 
         Args:
-            soc: State of Charge (0-100 %).
+            soc: State of Charge (0-100 %), scalar or array.
 
         Returns:
             Open Circuit Voltage in Volts.
         """
         return self.ocv_curve.get_ocv(soc)
 
-    def get_soc_from_ocv(self, ocv: float) -> float:
+    def get_soc_from_ocv(self, ocv: ArrayLike) -> float | np.ndarray:
         """Estimate SOC from OCV.
 
         Args:
-            ocv: Open Circuit Voltage in Volts.
+            ocv: Open Circuit Voltage in Volts, scalar or array.
 
         Returns:
             Estimated SOC (0-100 %).
@@ -785,18 +1219,38 @@ class BatteryChemistryProfile:
         """Compute nominal pack voltage."""
         return self.cell_nominal_voltage * cells_in_series
 
-    def pack_ocv(self, soc: float, cells_in_series: int = 96) -> float:
+    def pack_ocv(
+        self, soc: ArrayLike, cells_in_series: int | np.ndarray = 96
+    ) -> float | np.ndarray:
         """Compute pack OCV at given SOC.
 
         Args:
-            soc: State of Charge (0-100 %).
-            cells_in_series: Number of cells in series.
+            soc: State of Charge (0-100 %), scalar or ``(N,)`` for N packs.
+            cells_in_series: Number of cells in series, scalar or per pack.
 
         Returns:
             Pack Open Circuit Voltage in Volts.
         """
         return self.get_ocv(soc) * cells_in_series
 
+    def pack_soc_from_ocv(
+        self, pack_ocv: ArrayLike, cells_in_series: int | np.ndarray = 96
+    ) -> float | np.ndarray:
+        """Estimate SOC from pack OCV, assuming balanced cells.
+
+        Args:
+            pack_ocv: Pack Open Circuit Voltage in Volts, scalar or ``(N,)``.
+            cells_in_series: Number of cells in series, scalar or per pack.
+
+        Returns:
+            Estimated SOC (0-100 %).
+        """
+        if type(pack_ocv) in _PLAIN_NUMBERS and type(cells_in_series) in _PLAIN_NUMBERS:
+            return self.get_soc_from_ocv(pack_ocv / cells_in_series)
+        return self.get_soc_from_ocv(
+            np.asarray(pack_ocv, dtype=np.float64) / np.asarray(cells_in_series)
+        )
+
     def to_safety_thresholds_dict(
         self,
         cells_in_series: int = 96,
@@ -1050,3 +1504,196 @@ def load_custom_profile_from_file(path: str) -> BatteryChemistryProfile:
     profile = BatteryChemistryProfile.load_from_file(path)
     register_custom_profile(profile)
     return profile
+
+
+# ===================================================================
+# Aging projections over operating-condition grids
+# ===================================================================
+GRID_AXES: tuple[str, ...] = (
+    "initial_soh",
+    "years",
+    "cycles_per_year",
+    "temperature_c",
+    "soc_pct",
+    "c_rate",
+    "dod_pct",
+)
+
+
+@dataclass
+class AgingGrid:
+    """Labelled N-dimensional array of projected SOH.
+
+    A minimal stand-in for ``xarray.DataArray``: ``values`` has one axis per
+    name in ``dims``, labelled by ``coords``; inputs held fixed are kept in
+    ``attrs``. Use :meth:`to_xarray` when xarray is installed.
+    """
+
+    values: np.ndarray
+    dims: tuple[str, ...]
+    coords: dict[str, np.ndarray]
+    name: str = "soh"
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.values.shape
+
+    @property
+    def size(self) -> int:
+        return self.values.size
+
+    def sel(self, **indexers: Any) -> AgingGrid | float:
+        """Select by coordinate label.
+
+        A scalar label drops its dimension, a list of labels keeps it. Float
+        coordinates are matched with ``np.isclose``.
+
+        Raises:
+            KeyError: If a dimension or label does not exist.
+        """
+        index: list[Any] = [slice(None)] * len(self.dims)
+        dims, coords = list(self.dims), dict(self.coords)
+        for dim, label in indexers.items():
+            if dim not in self.dims:
+                raise KeyError(f"Unknown dimension '{dim}'. Valid: {', '.join(self.dims)}")
+            axis = self.dims.index(dim)
+            positions = [self._position(dim, item) for item in np.atleast_1d(label)]
+            if np.ndim(label) == 0:
+                index[axis] = positions[0]
+                dims.remove(dim)
+                del coords[dim]
+            else:
+                index[axis] = positions
+                coords[dim] = self.coords[dim][positions]
+        # Apply list selections one axis at a time (NumPy would pair them up)
+        values = self.values
+        for axis in reversed(range(len(index))):
+            if isinstance(index[axis], list):
+                values = np.take(values, index[axis], axis=axis)
+                index[axis] = slice(None)
+        values = values[tuple(index)]
+        if not dims:
+            return float(values)
+        return AgingGrid(values, tuple(dims), coords, self.name, dict(self.attrs))
+
+    def _position(self, dim: str, label: Any) -> int:
+        coord = self.coords[dim]
+        if coord.dtype.kind in "fc":
+            matches = np.flatnonzero(np.isclose(coord, float(label)))
+        else:
+            matches = np.flatnonzero(coord == label)
+        if not len(matches):
+            raise KeyError(f"{label!r} not found in coordinate '{dim}'")
+        return int(matches[0])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Long-format DataFrame: one column per dimension plus the values."""
+        import pandas as pd
+
+        grids = np.meshgrid(*(self.coords[d] for d in self.dims), indexing="ij")
+        data = {dim: grid.ravel() for dim, grid in zip(self.dims, grids)}
+        data[self.name] = self.values.ravel()
+        return pd.DataFrame(data)
+
+    def to_xarray(self) -> Any:
+        """Convert to an ``xarray.DataArray`` (requires xarray)."""
+        try:
+            import xarray as xr
+        except ImportError as exc:
+            raise ImportError(
+                "xarray is required for AgingGrid.to_xarray(). Install it via: pip install xarray"
+            ) from exc
+        return xr.DataArray(
+            self.values, dims=self.dims, coords=self.coords, name=self.name, attrs=self.attrs
+        )
+
+
+def _aging_model_of(profile: ChemistryKey | BatteryChemistryProfile | AgingModel) -> AgingModel:
+    if isinstance(profile, AgingModel):
+        return profile
+    if isinstance(profile, str):
+        profile = get_profile(profile)
+    return profile.aging_model
+
+
+def _profile_label(profile: ChemistryKey | BatteryChemistryProfile | AgingModel) -> str:
+    if isinstance(profile, str):
+        return profile
+    if isinstance(profile, BatteryChemistryProfile):
+        return profile.short_name
+    return "custom"
+
+
+def project_grid(
+    profile: ChemistryKey
+    | BatteryChemistryProfile
+    | AgingModel
+    | Sequence[ChemistryKey | BatteryChemistryProfile | AgingModel]
+    | None = None,
+    **axes: ArrayLike,
+) -> AgingGrid:
+    """Project SOH over a grid of operating conditions.
+
+    Every keyword in :data:`GRID_AXES` given as a 1-D array becomes a grid
+    dimension, in keyword order; scalars are held fixed (and recorded in
+    ``attrs``); omitted inputs use the ``AgingModel.predict_soh`` defaults.
+    The whole cube is evaluated with one broadcast ``predict_soh`` call per
+    chemistry.
+
+    Args:
+        profile: Chemistry key, profile or aging model; a sequence of them,
+            or ``None`` for every entry in ``BUILTIN_PROFILES``, adds a
+            leading ``chemistry`` dimension.
+        **axes: Grid axes or fixed values, e.g.
+            ``temperature_c=np.arange(-10, 46, 5), years=np.arange(0, 16)``.
+
+    Returns:
+        :class:`AgingGrid` of projected SOH (%).
+
+    Raises:
+        ValueError: For unknown axis names or axes that are not 1-D.
+        KeyError: For unknown chemistry keys.
+    """
+    unknown = set(axes) - set(GRID_AXES)
+    if unknown:
+        raise ValueError(
+            f"Unknown grid axes: {', '.join(sorted(unknown))}. Valid: {', '.join(GRID_AXES)}"
+        )
+
+    dims: list[str] = []
+    coords: dict[str, np.ndarray] = {}
+    fixed: dict[str, float] = {}
+    for name, value in axes.items():
+        arr = np.asarray(value, dtype=np.float64)
+        if arr.ndim == 0:
+            fixed[name] = float(arr)
+        elif arr.ndim == 1:
+            dims.append(name)
+            coords[name] = arr
+        else:
+            raise ValueError(f"Grid axis '{name}' must be 1-D, got shape {arr.shape}")
+
+    # Each axis varies along its own dimension of the output
+    inputs: dict[str, ArrayLike] = dict(fixed)
+    for axis, name in enumerate(dims):
+        shape = [1] * len(dims)
+        shape[axis] = len(coords[name])
+        inputs[name] = coords[name].reshape(shape)
+    grid_shape = tuple(len(coords[name]) for name in dims)
+
+    if profile is None:
+        profiles: list[Any] = list(BUILTIN_PROFILES.values())
+    elif isinstance(profile, (str, BatteryChemistryProfile, AgingModel)):
+        model = _aging_model_of(profile)
+        values = np.broadcast_to(model.predict_soh(**inputs), grid_shape)
+        attrs = {"chemistry": _profile_label(profile), **fixed}
+        return AgingGrid(np.array(values), tuple(dims), coords, attrs=attrs)
+    else:
+        profiles = list(profile)
+
+    values = np.empty((len(profiles),) + grid_shape)
+    for k, item in enumerate(profiles):
+        values[k] = _aging_model_of(item).predict_soh(**inputs)
+    coords = {"chemistry": np.array([_profile_label(p) for p in profiles]), **coords}
+    return AgingGrid(values, ("chemistry", *dims), coords, attrs=dict(fixed))
@@ -9,11 +9,8 @@ import os
 import time
 from typing import Optional
 
-import pandas as pd
-
-from .analysis import EVBatteryAnalyzer
-from .can_bus import CANBatterySimulator, CANTelemetryReceiver, DBCFileSimulator
-from .soh_predictor import SOHPredictor
+# pandas, scikit-learn and TensorFlow are imported inside the commands that
+# need them, so ``ev-qa --help`` and argument validation stay fast.
 
 
 def print_dashboard_start() -> None:
@@ -56,10 +53,12 @@ def validate_model_dir(path: str) -> str:
 def analyze_csv(file_path: str, output: Optional[str] = None) -> None:
     """Analyze telemetry from CSV file"""
     validate_input_file(file_path)
-    df = pd.read_csv(file_path)
+    import pandas as pd  # noqa: PLC0415
 
+    from .analysis import EVBatteryAnalyzer  # noqa: PLC0415
     from .utils import normalize_columns  # noqa: PLC0415
 
+    df = pd.read_csv(file_path)
     df = normalize_columns(df)
 
     # Initialize framework with ML
@@ -82,6 +81,8 @@ def analyze_csv(file_path: str, output: Optional[str] = None) -> None:
 def run_can_demo(duration: int = 10) -> None:
     """Run a live CAN bus emulation demo"""
     print(f"Starting CAN Bus Emulation Demo ({duration}s)...")
+    from .can_bus import CANBatterySimulator, CANTelemetryReceiver  # noqa: PLC0415
+
     sim = CANBatterySimulator()
     receiver = CANTelemetryReceiver()
 
@@ -114,6 +115,8 @@ def run_dbc_emulate(dbc_path: Optional[str] = None, duration: int = 10) -> None:
         print(f"Loading DBC: {dbc_path}")
     else:
         print("Using built-in battery DBC")
+    from .can_bus import DBCFileSimulator  # noqa: PLC0415
+
     sim = DBCFileSimulator(dbc_path=dbc_path)
     sim.start()
 
@@ -131,6 +134,10 @@ def train_soh_model(csv_path: str, model_path: str) -> None:
     validate_csv_path(csv_path)
     validate_model_dir(model_path)
     print(f"🧠 Training SOH Predictor from {csv_path}...")
+    import pandas as pd  # noqa: PLC0415
+
+    from .soh_predictor import SOHPredictor  # noqa: PLC0415
+
     df = pd.read_csv(csv_path)
     predictor = SOHPredictor()
     predictor.train(df, epochs=5)
@@ -173,6 +180,8 @@ def main() -> None:
     try:
         args = parser.parse_args()
     except SystemExit as exc:
+        if not exc.code:  # --help exits cleanly
+            raise
         raise SystemExit(
             "Usage: ev-qa <command> [options]\n"
             "Command not recognized: use analyze, can-demo, emulate, train-soh or dashboard.\n"
@@ -9,14 +9,76 @@ Usage:
     msg_def = dbc.get_message(0x101)
     decoded = dbc.decode(can_id=0x101, data=b"...")
     print(dbc.get_signal_value(0x101, b"...", "Voltage"))
+    columns = dbc.decode_batch(can_ids, payloads)  # (N,) ids, (N, 8) uint8
+    payload = dbc.encode(0x101, {"Voltage": 396.2, "Current": -12.5})
+    block = FrameSynthesizer(dbc).synthesize(0x101, 1000)  # (1000, 8) uint8
+
+Parsed definitions are cached by content hash in-process and, when enabled,
+on disk (``cache=True``/a directory, or ``$EV_QA_DBC_CACHE_DIR`` set), so
+re-opening an unchanged DBC skips the text parse entirely.
 
 DBC format: https://vector.com/candb-format
 """
 
+import hashlib
+import json
+import logging
+import os
 import re
+import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+__all__ = ["Signal", "Message", "DBCParser", "FrameSynthesizer", "default_cache_dir"]
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing changes what ends up in Message/Signal, to invalidate caches
+_CACHE_FORMAT = 1
+_MEMO_SIZE = 16
+
+# content digest -> serialized parse result, most recently used last
+_parse_memo: OrderedDict[str, dict] = OrderedDict()
+_parse_memo_lock = threading.Lock()
+
+_BO_RE = re.compile(r"BO_\s+(\d+)\s+(\S+)\s*:\s*(\d+)\s+(\S+)")
+_MUX_RE = re.compile(r"\s+m\d+\s*:")
+_SG_RE = re.compile(
+    r"SG_\s+"
+    r"(\S+)\s*:\s*"  # signal name
+    r"(\d+)\|(\d+)@(\d)([\+\-])\s*"  # start|len@byteorder+sign
+    r"\(([^,]+),([^)]+)\)\s*"  # (scale, offset)
+    r"\[([^|]*)\|([^\]]*)\]\s*"  # [min|max]
+    r'"([^"]*)"\s*'  # "unit"
+    r"(\S*)"  # receivers (optional)
+)
+# Some DBCs omit [min|max]
+_SG_NO_RANGE_RE = re.compile(
+    r"SG_\s+"
+    r"(\S+)\s*:\s*"
+    r"(\d+)\|(\d+)@(\d)([\+\-])\s*"
+    r"\(([^,]+),([^)]+)\)\s*"
+    r'"([^"]*)"\s*'
+    r"(\S*)"
+)
+_CM_BO_RE = re.compile(r'CM_\s+BO_\s+(\d+)\s+"([^"]*)"\s*;')
+_CM_SG_RE = re.compile(r'CM_\s+SG_\s+(\d+)\s+(\S+)\s+"([^"]*)"\s*;')
+_CYCLE_DEFAULT_RE = re.compile(r'BA_DEF_DEF_\s+"GenMsgCycleTime"\s+(\d+)\s*;')
+_CYCLE_RE = re.compile(r'BA_\s+"GenMsgCycleTime"\s+BO_\s+(\d+)\s+(\d+)\s*;')
+
+
+def default_cache_dir() -> Path:
+    """Directory for cached DBC parses: ``$EV_QA_DBC_CACHE_DIR`` or the user cache dir."""
+    env = os.environ.get("EV_QA_DBC_CACHE_DIR")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "ev-qa-framework" / "dbc"
 
-__all__ = ["Signal", "Message", "DBCParser"]
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -60,6 +122,38 @@ class Message:
     signals: dict[str, Signal] = field(default_factory=dict)
     comment: str = ""
     is_extended: bool = False  # True = 29-bit (J1939 style)
+    cycle_time: int = 0  # GenMsgCycleTime in ms; 0 = not cyclic / not specified
+
+
+@dataclass(frozen=True)
+class _SignalPlan:
+    """Precomputed shift/mask extraction for one signal."""
+
+    name: str
+    intel: bool
+    shift: int  # right shift applied to the little- or big-endian frame word
+    mask: int
+    length: int
+    signed: bool
+    scale: float
+    offset: float
+
+
+@dataclass(frozen=True)
+class _MessagePlan:
+    """Decode plan for one message: frame width in bytes plus per-signal plans."""
+
+    width: int
+    signals: tuple[_SignalPlan, ...]
+    needs_le: bool
+    needs_be: bool
+
+
+def _raw_limits(sp: _SignalPlan) -> tuple[int, int]:
+    """Smallest and largest raw value the signal's bit field can hold."""
+    if sp.signed:
+        return -(1 << (sp.length - 1)), (1 << (sp.length - 1)) - 1
+    return 0, (1 << sp.length) - 1
 
 
 # ---------------------------------------------------------------------------
@@ -71,30 +165,64 @@ class DBCParser:
     """
     Parse a Vector CANdb (.dbc) file and provide message/signal lookups.
 
+    Each message is compiled into a decode plan on first use: the payload
+    is read as one little-endian and/or big-endian integer and each signal
+    is a single shift and mask. Call :meth:`compile` after editing
+    ``messages`` by hand.
+
+    The parse result is cached under the BLAKE2 hash of the file content,
+    in-process and, if the disk cache is enabled, as compact JSON in a cache
+    directory, so a DBC that has not changed is never parsed twice. Every
+    parser still gets its own ``Message``/``Signal`` objects.
+
     Thread-safe after construction.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the .dbc file.
+    cache : bool, path or None, default None
+        ``True`` uses :func:`default_cache_dir`, a path selects another
+        directory (e.g. the DBC's own), ``False`` disables the disk cache.
+        ``None`` enables it only when ``$EV_QA_DBC_CACHE_DIR`` is set.
     """
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, cache: bool | str | os.PathLike | None = None):
         # Path traversal prevention
-        import os as _os
-
-        self.filepath = _os.path.realpath(filepath)
+        self.filepath = os.path.realpath(filepath)
         _allowed = (".dbc", ".txt", ".csv")
         if not self.filepath.lower().endswith(_allowed):
             raise ValueError(f"DBC file must have extension {_allowed}, got: {filepath}")
-        if not _os.path.isfile(self.filepath):
+        if not os.path.isfile(self.filepath):
             raise FileNotFoundError(f"DBC file not found: {filepath}")
 
+        self._init_state()
+        with open(filepath, encoding="latin-1") as f:
+            self._raw = f.read()
+        self._load(cache)
+
+    @classmethod
+    def from_string(cls, content: str, cache: bool | str | os.PathLike = False) -> "DBCParser":
+        """
+        Parse DBC text held in memory, without a file.
+
+        The in-process cache applies as for files; the disk cache is off
+        unless *cache* is given.
+        """
+        parser = cls.__new__(cls)
+        parser.filepath = ""
+        parser._init_state()
+        parser._raw = content
+        parser._load(cache)
+        return parser
+
+    def _init_state(self) -> None:
         self.messages: dict[int, Message] = {}  # keyed by CAN ID
         self._by_name: dict[str, Message] = {}  # keyed by message name
         self.version: str = ""
         self.comments: dict[str, str] = {}  # node->comment, etc.
         self._raw = ""
-
-        with open(filepath, encoding="latin-1") as f:
-            self._raw = f.read()
-
-        self._parse()
+        self._plans: dict[int, _MessagePlan] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -134,26 +262,385 @@ class DBCParser:
         -------
         dict mapping signal name -> physical value.
         """
-        msg = self.messages.get(can_id)
-        if msg is None:
+        plan = self._get_plan(can_id)
+        if plan is None:
             return {}
 
         result: dict[str, float] = {}
-        for sig_name, sig in msg.signals.items():
-            raw = self._extract_raw(data, sig)
-            result[sig_name] = sig.raw_to_physical(raw)
+        le, be = self._frame_words(plan, data)
+        for sp in plan.signals:
+            result[sp.name] = self._decode_signal(sp, le, be)
         return result
 
+    def decode_batch(self, can_ids, payloads) -> dict[str, np.ndarray]:
+        """
+        Decode many frames at once into per-signal NumPy columns.
+
+        Parameters
+        ----------
+        can_ids : array-like of int, shape (N,)
+            CAN arbitration ID of each frame.
+        payloads : array-like of uint8, shape (N, B)
+            Frame payloads, zero-padded to a common width (usually 8).
+
+        Returns
+        -------
+        dict mapping signal name -> float64 array of length N. Row ``i`` holds
+        the value ``decode(can_ids[i], payloads[i])`` would return for that
+        signal, or NaN if frame ``i`` does not carry it.
+        """
+        can_ids = np.asarray(can_ids, dtype=np.int64).ravel()
+        payloads = np.asarray(payloads, dtype=np.uint8)
+        if payloads.ndim != 2 or len(payloads) != len(can_ids):
+            raise ValueError(
+                f"payloads must have shape (N, B) with N={len(can_ids)}, got {payloads.shape}"
+            )
+
+        n = len(can_ids)
+        columns: dict[str, np.ndarray] = {}
+        if n == 0:
+            return columns
+
+        # Group row indices by CAN ID with a single stable sort
+        order = np.argsort(can_ids, kind="stable")
+        sorted_ids = can_ids[order]
+        bounds = np.flatnonzero(np.diff(sorted_ids)) + 1
+        for rows in np.split(order, bounds):
+            plan = self._get_plan(int(can_ids[rows[0]]))
+            if plan is None:
+                continue
+            block = payloads[rows, : plan.width]
+            if block.shape[1] < plan.width:
+                block = np.pad(block, ((0, 0), (0, plan.width - block.shape[1])))
+            for name, values in self._decode_block(plan, block).items():
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = np.full(n, np.nan)
+                column[rows] = values
+        return columns
+
     def get_signal_value(self, can_id: int, data: bytes, signal_name: str) -> float | None:
         """Decode a single named signal from raw CAN data."""
-        msg = self.messages.get(can_id)
-        if msg is None:
+        plan = self._get_plan(can_id)
+        if plan is None:
+            return None
+        for sp in plan.signals:
+            if sp.name == signal_name:
+                le, be = self._frame_words(plan, data)
+                return self._decode_signal(sp, le, be)
+        return None
+
+    def encode(self, can_id: int, values: dict[str, float]) -> bytes:
+        """
+        Encode physical signal values into a CAN payload.
+
+        Signals missing from *values* are encoded as raw 0; values outside
+        what a signal can hold saturate at its raw limits.
+
+        Raises
+        ------
+        ValueError
+            If *can_id* is not defined or a signal name is unknown.
+        """
+        block = self.encode_batch(can_id, {name: [value] for name, value in values.items()})
+        return block[0].tobytes()
+
+    def encode_batch(self, can_id: int, columns, raw: bool = False) -> np.ndarray:
+        """
+        Encode many frames of one message at once.
+
+        Parameters
+        ----------
+        can_id : int
+            CAN arbitration ID of the message.
+        columns : dict of str -> array-like, shape (N,)
+            Signal values per frame. Physical values unless *raw* is True.
+        raw : bool
+            Treat *columns* as raw integer field values.
+
+        Returns
+        -------
+        ``(N, width)`` uint8 array of payloads, ``width`` being at least 8.
+        """
+        plan = self._get_plan(can_id)
+        if plan is None:
+            raise ValueError(f"Unknown CAN ID 0x{can_id:X}")
+        by_name = {sp.name: sp for sp in plan.signals}
+        unknown = set(columns) - set(by_name)
+        if unknown:
+            raise ValueError(f"Unknown signals for 0x{can_id:X}: {sorted(unknown)}")
+
+        arrays = {name: np.asarray(values).ravel() for name, values in columns.items()}
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("all signal columns must have the same length")
+        n = lengths.pop() if lengths else 1
+
+        raws = []
+        for sp in plan.signals:
+            values = arrays.get(sp.name)
+            if values is None:
+                raws.append(np.zeros(n, dtype=np.int64))
+                continue
+            lo, hi = _raw_limits(sp)
+            if not raw:
+                values = np.rint((values.astype(np.float64) - sp.offset) / sp.scale)
+            values = np.clip(values, lo, min(hi, np.iinfo(np.int64).max))
+            raws.append(values.astype(np.int64))
+        return self._encode_block(plan, raws, n)
+
+    def compile(self) -> None:
+        """(Re)build decode plans for all messages in ``self.messages``."""
+        self._plans = {can_id: self._compile_message(msg) for can_id, msg in self.messages.items()}
+
+    # ------------------------------------------------------------------
+    # Parse cache
+    # ------------------------------------------------------------------
+
+    def _load(self, cache) -> None:
+        """Fill the parser from the in-process or disk cache, parsing only on a miss."""
+        digest = hashlib.blake2b(
+            self._raw.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
+        with _parse_memo_lock:
+            state = _parse_memo.get(digest)
+        if cache is None:
+            cache = bool(os.environ.get("EV_QA_DBC_CACHE_DIR"))
+        cache_file = None
+        if cache:
+            directory = default_cache_dir() if cache is True else Path(cache)
+            cache_file = directory / f"{digest}.v{_CACHE_FORMAT}.json"
+        if state is None and cache_file is not None:
+            state = self._read_cache(cache_file)
+
+        if state is None:
+            self._parse()
+            state = self._dump_state()
+            if cache_file is not None:
+                self._write_cache(cache_file, state)
+        else:
+            self._restore_state(state)
+
+        with _parse_memo_lock:
+            _parse_memo[digest] = state
+            _parse_memo.move_to_end(digest)
+            while len(_parse_memo) > _MEMO_SIZE:
+                _parse_memo.popitem(last=False)
+
+    def _dump_state(self) -> dict:
+        """Serialize parsed definitions to JSON-compatible lists."""
+        return {
+            "format": _CACHE_FORMAT,
+            "version": self.version,
+            "comments": self.comments,
+            "messages": [
+                [
+                    msg.id,
+                    msg.name,
+                    msg.dlc,
+                    msg.transmitter,
+                    msg.comment,
+                    msg.is_extended,
+                    msg.cycle_time,
+                    [
+                        [
+                            sig.name,
+                            sig.start_bit,
+                            sig.length,
+                            sig.byte_order,
+                            sig.signed,
+                            sig.scale,
+                            sig.offset,
+                            sig.min_val,
+                            sig.max_val,
+                            sig.unit,
+                            sig.receiver,
+                            sig.comment,
+                        ]
+                        for sig in msg.signals.values()
+                    ],
+                ]
+                for msg in self.messages.values()
+            ],
+        }
+
+    def _restore_state(self, state: dict) -> None:
+        self.version = state["version"]
+        self.comments = dict(state["comments"])
+        for can_id, name, dlc, transmitter, comment, is_extended, cycle_time, signals in state[
+            "messages"
+        ]:
+            msg = Message(
+                id=can_id,
+                name=name,
+                dlc=dlc,
+                transmitter=transmitter,
+                signals={s[0]: Signal(*s[:10], list(s[10]), s[11]) for s in signals},
+                comment=comment,
+                is_extended=is_extended,
+                cycle_time=cycle_time,
+            )
+            self.messages[can_id] = msg
+            self._by_name[name] = msg
+
+    @staticmethod
+    def _read_cache(path: Path) -> dict | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
             return None
-        sig = msg.signals.get(signal_name)
-        if sig is None:
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable DBC cache %s: %s", path, e)
             return None
-        raw = self._extract_raw(data, sig)
-        return sig.raw_to_physical(raw)
+        if not isinstance(state, dict) or state.get("format") != _CACHE_FORMAT:
+            return None
+        return state
+
+    @staticmethod
+    def _write_cache(path: Path, state: dict) -> None:
+        """Write atomically so concurrent workers never read a partial file."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f, separators=(",", ":"))
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.debug("Could not write DBC cache %s: %s", path, e)
+
+    # ------------------------------------------------------------------
+    # Compiled decoding
+    # ------------------------------------------------------------------
+
+    def _get_plan(self, can_id: int) -> _MessagePlan | None:
+        plan = self._plans.get(can_id)
+        if plan is None:
+            msg = self.messages.get(can_id)
+            if msg is None:
+                return None
+            plan = self._plans[can_id] = self._compile_message(msg)
+        return plan
+
+    @staticmethod
+    def _compile_message(msg: Message) -> _MessagePlan:
+        """
+        Build a decode plan equivalent to the bit loops in ``_extract_raw``.
+
+        Intel signals are ``(le >> start_bit) & mask`` on the little-endian
+        frame word. Motorola signals walk bit positions MSB-first through
+        consecutive bytes, which is a contiguous field of the big-endian frame
+        word: ``(be >> (8 * width - start_bit - length)) & mask``.
+        """
+        needed = max(
+            ((sig.start_bit + sig.length + 7) // 8 for sig in msg.signals.values()), default=0
+        )
+        width = max(8, needed)
+        plans = []
+        for sig in msg.signals.values():
+            intel = sig.byte_order == "Intel"
+            shift = sig.start_bit if intel else 8 * width - sig.start_bit - sig.length
+            plans.append(
+                _SignalPlan(
+                    name=sig.name,
+                    intel=intel,
+                    shift=shift,
+                    mask=(1 << sig.length) - 1,
+                    length=sig.length,
+                    signed=sig.signed,
+                    scale=sig.scale,
+                    offset=sig.offset,
+                )
+            )
+        return _MessagePlan(
+            width=width,
+            signals=tuple(plans),
+            needs_le=any(p.intel for p in plans),
+            needs_be=any(not p.intel for p in plans),
+        )
+
+    @staticmethod
+    def _frame_words(plan: _MessagePlan, data: bytes) -> tuple[int, int]:
+        """Read the zero-padded payload as little- and big-endian integers."""
+        buf = bytes(data[: plan.width]).ljust(plan.width, b"\x00")
+        le = int.from_bytes(buf, "little") if plan.needs_le else 0
+        be = int.from_bytes(buf, "big") if plan.needs_be else 0
+        return le, be
+
+    @staticmethod
+    def _decode_signal(sp: _SignalPlan, le: int, be: int) -> float:
+        raw = ((le if sp.intel else be) >> sp.shift) & sp.mask
+        if sp.signed and (raw >> (sp.length - 1)) & 1:
+            raw -= 1 << sp.length
+        return raw * sp.scale + sp.offset
+
+    @staticmethod
+    def _decode_block(plan: _MessagePlan, block: np.ndarray) -> dict[str, np.ndarray]:
+        """Vectorised decode of an ``(M, plan.width)`` uint8 block for one message."""
+        if plan.width == 8:
+            frames = np.ascontiguousarray(block)
+            le = frames.view("<u8").ravel()
+            be = frames.view(">u8").ravel().astype(np.uint64)
+            out: dict[str, np.ndarray] = {}
+            for sp in plan.signals:
+                word = le if sp.intel else be
+                raw = (word >> np.uint64(sp.shift)) & np.uint64(sp.mask)
+                if sp.signed:
+                    # Sign-extend: move the field to the top, then arithmetic shift back
+                    spare = np.uint64(64 - sp.length)
+                    values = (raw << spare).view(np.int64) >> np.int64(64 - sp.length)
+                else:
+                    values = raw
+                out[sp.name] = values * sp.scale + sp.offset
+            return out
+
+        # CAN FD frames wider than 64 bits: fall back to per-row integer decode
+        rows = [bytes(r) for r in block]
+        out = {sp.name: np.empty(len(rows)) for sp in plan.signals}
+        for i, data in enumerate(rows):
+            le, be = DBCParser._frame_words(plan, data)
+            for sp in plan.signals:
+                out[sp.name][i] = DBCParser._decode_signal(sp, le, be)
+        return out
+
+    @staticmethod
+    def _encode_block(plan: _MessagePlan, raws: list[np.ndarray], n: int) -> np.ndarray:
+        """Pack raw values (one int64 array per ``plan.signals`` entry) into ``(n, width)`` bytes."""
+        if plan.width == 8:
+            le = np.zeros(n, dtype=np.uint64)
+            be = np.zeros(n, dtype=np.uint64)
+            for sp, raw in zip(plan.signals, raws):
+                # Two's complement of negative raws is what the mask keeps
+                field = (raw.astype(np.uint64) & np.uint64(sp.mask)) << np.uint64(sp.shift)
+                if sp.intel:
+                    le |= field
+                else:
+                    be |= field
+            block = le.astype("<u8").view(np.uint8).reshape(n, 8)
+            if plan.needs_be:
+                block = block | be.astype(">u8").view(np.uint8).reshape(n, 8)
+            return block
+
+        # CAN FD frames wider than 64 bits: per-row integer encode
+        columns = [raw.tolist() for raw in raws]
+        block = np.empty((n, plan.width), dtype=np.uint8)
+        for i in range(n):
+            le = be = 0
+            for sp, column in zip(plan.signals, columns):
+                field = (column[i] & sp.mask) << sp.shift
+                if sp.intel:
+                    le |= field
+                else:
+                    be |= field
+            word = le.to_bytes(plan.width, "little")
+            block[i] = np.frombuffer(word, dtype=np.uint8) | np.frombuffer(
+                be.to_bytes(plan.width, "big"), dtype=np.uint8
+            )
+        return block
 
     # ------------------------------------------------------------------
     # Internal parsing
@@ -178,6 +665,9 @@ class DBCParser:
         # Pass 3: parse CM_ (comments)
         self._parse_comments(lines)
 
+        # Pass 4: message cycle times (BA_DEF_DEF_ / BA_ "GenMsgCycleTime")
+        self._parse_cycle_times(lines)
+
     # ------------------------------------------------------------------
     def _parse_message(self, line: str, all_lines: list[str], lineno: int):
         """
@@ -188,8 +678,7 @@ class DBCParser:
           SG_ <name> <start_bit>|<length>@<byte_order>+<sign> (<scale>,<offset>) [<min>|<max>] "<unit>" <receivers>
         """
         # BO_ 101 VoltageMessage: 8 TransmitterName
-        pattern = r"BO_\s+(\d+)\s+(\S+)\s*:\s*(\d+)\s+(\S+)"
-        m = re.match(pattern, line)
+        m = _BO_RE.match(line)
         if not m:
             return
 
@@ -237,29 +726,11 @@ class DBCParser:
         """
         # Strip multiplexor indicator like "m0" after the name
         # SG_ Name m0 : ...
-        line_clean = re.sub(r"\s+m\d+\s*:", ":", line)
-
-        pattern = (
-            r"SG_\s+"
-            r"(\S+)\s*:\s*"  # signal name
-            r"(\d+)\|(\d+)@(\d)([\+\-])\s*"  # start|len@byteorder+sign
-            r"\(([^,]+),([^)]+)\)\s*"  # (scale, offset)
-            r"\[([^|]*)\|([^\]]*)\]\s*"  # [min|max]
-            r'"([^"]*)"\s*'  # "unit"
-            r"(\S*)"  # receivers (optional)
-        )
-        m = re.match(pattern, line_clean)
+        line_clean = _MUX_RE.sub(":", line)
+
+        m = _SG_RE.match(line_clean)
         if not m:
-            # Try without [min|max] (some DBCs omit)
-            pattern2 = (
-                r"SG_\s+"
-                r"(\S+)\s*:\s*"
-                r"(\d+)\|(\d+)@(\d)([\+\-])\s*"
-                r"\(([^,]+),([^)]+)\)\s*"
-                r'"([^"]*)"\s*'
-                r"(\S*)"
-            )
-            m = re.match(pattern2, line_clean)
+            m = _SG_NO_RANGE_RE.match(line_clean)
             if not m:
                 return None
 
@@ -319,7 +790,7 @@ class DBCParser:
                 continue
 
             # CM_ BO_ <id> "<comment>";
-            m = re.match(r'CM_\s+BO_\s+(\d+)\s+"([^"]*)"\s*;', stripped)
+            m = _CM_BO_RE.match(stripped)
             if m:
                 can_id = int(m.group(1))
                 comment = m.group(2)
@@ -328,7 +799,7 @@ class DBCParser:
                 continue
 
             # CM_ SG_ <id> <signal_name> "<comment>";
-            m = re.match(r'CM_\s+SG_\s+(\d+)\s+(\S+)\s+"([^"]*)"\s*;', stripped)
+            m = _CM_SG_RE.match(stripped)
             if m:
                 can_id = int(m.group(1))
                 sig_name = m.group(2)
@@ -338,7 +809,27 @@ class DBCParser:
                     msg.signals[sig_name].comment = comment
 
     # ------------------------------------------------------------------
-    # Raw value extraction from CAN data
+    def _parse_cycle_times(self, lines: list[str]):
+        """Apply the ``GenMsgCycleTime`` attribute (default and per message)."""
+        default = 0
+        explicit: dict[int, int] = {}
+        for line in lines:
+            stripped = line.strip()
+            if not stripped.startswith("BA_"):
+                continue
+            m = _CYCLE_DEFAULT_RE.match(stripped)
+            if m:
+                default = int(m.group(1))
+                continue
+            m = _CYCLE_RE.match(stripped)
+            if m:
+                explicit[int(m.group(1))] = int(m.group(2))
+        for can_id, msg in self.messages.items():
+            msg.cycle_time = explicit.get(can_id, default)
+
+    # ------------------------------------------------------------------
+    # Raw value extraction from CAN data (bit-by-bit reference implementation;
+    # decode() and decode_batch() use the compiled plans above)
     # ------------------------------------------------------------------
 
     @staticmethod
@@ -393,6 +884,83 @@ class DBCParser:
         return value
 
 
+# ---------------------------------------------------------------------------
+# Frame synthesis
+# ---------------------------------------------------------------------------
+
+
+class FrameSynthesizer:
+    """
+    Generate blocks of random, in-range payloads for DBC messages.
+
+    Each message is compiled once into its pack plan plus the raw range of
+    every signal: the DBC ``[min|max]`` (0-100 physical when the DBC leaves
+    it empty), clipped to what the bit field can hold. :meth:`synthesize`
+    then draws one NumPy integer array per signal and packs the whole block
+    with shifts and ORs on 64-bit frame words, instead of placing bits one
+    frame at a time.
+
+    Not thread-safe; give each sender thread its own instance.
+
+    Parameters
+    ----------
+    messages : DBCParser or iterable of Message
+        Message definitions to synthesize.
+    ranges : dict of str -> (float, float), optional
+        Physical ``(low, high)`` per signal name, overriding the DBC range
+        for every message carrying that signal. ``low == high`` gives a
+        constant signal.
+    seed : int, optional
+        Seed for reproducible traffic.
+    """
+
+    def __init__(self, messages, ranges: dict[str, tuple[float, float]] | None = None, seed=None):
+        if isinstance(messages, DBCParser):
+            messages = messages.list_messages()
+        self.messages: dict[int, Message] = {msg.id: msg for msg in messages}
+        self.ranges = dict(ranges or {})
+        self._rng = np.random.default_rng(seed)
+        self._compiled: dict[int, tuple[_MessagePlan, list[tuple[int, int]], int]] = {}
+
+    def synthesize(self, can_id: int, n: int) -> np.ndarray:
+        """
+        Return ``n`` random payloads for *can_id*.
+
+        Returns
+        -------
+        ``(n, dlc)`` uint8 array; every signal decodes to a value in range.
+        """
+        plan, bounds, dlc = self._compile(can_id)
+        raws = [self._rng.integers(lo, hi, size=n, endpoint=True) for lo, hi in bounds]
+        return DBCParser._encode_block(plan, raws, n)[:, :dlc]
+
+    def _compile(self, can_id: int) -> tuple[_MessagePlan, list[tuple[int, int]], int]:
+        compiled = self._compiled.get(can_id)
+        if compiled is not None:
+            return compiled
+        msg = self.messages.get(can_id)
+        if msg is None:
+            raise ValueError(f"Unknown CAN ID 0x{can_id:X}")
+
+        plan = DBCParser._compile_message(msg)
+        bounds = []
+        for sp, sig in zip(plan.signals, msg.signals.values()):
+            if sig.name in self.ranges:
+                low, high = self.ranges[sig.name]
+            elif sig.min_val < sig.max_val:
+                low, high = sig.min_val, sig.max_val
+            else:
+                low, high = 0.0, 100.0
+            raw_a, raw_b = sorted((sig.physical_to_raw(low), sig.physical_to_raw(high)))
+            lo, hi = _raw_limits(sp)
+            hi = min(hi, np.iinfo(np.int64).max)
+            raw_a, raw_b = min(max(raw_a, lo), hi), min(max(raw_b, lo), hi)
+            bounds.append((raw_a, raw_b))
+        dlc = msg.dlc if 0 < msg.dlc <= plan.width else plan.width
+        compiled = self._compiled[can_id] = (plan, bounds, dlc)
+        return compiled
+
+
 # ---------------------------------------------------------------------------
 # Convenience: built-in battery DBC
 # ---------------------------------------------------------------------------
@@ -438,6 +1006,11 @@ BO_ 65273 BatterySOC: 8 EV_BMS
  SG_ SOC : 0|8@1+ (1,0) [0|100] "%" EV_BMS
  SG_ SOH : 8|8@1+ (1,0) [0|100] "%" EV_BMS
 
+BA_DEF_ BO_ "GenMsgCycleTime" INT 0 65535;
+BA_DEF_DEF_ "GenMsgCycleTime" 1000;
+BA_ "GenMsgCycleTime" BO_ 257 100;
+BA_ "GenMsgCycleTime" BO_ 258 100;
+
 CM_ BO_ 257 "Battery voltage and current (CAN 2.0B 0x101)";
 CM_ BO_ 258 "Battery temperature and SOC (CAN 2.0B 0x102)";
 CM_ BO_ 259 "Battery state of health";
@@ -453,17 +1026,4 @@ CM_ SG_ 65270 CellTemp_1 "Cell 1 temperature";
 
 def builtin_dbc() -> DBCParser:
     """Return a DBCParser loaded with the built-in battery definition."""
-    import os
-    import tempfile
-
-    tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".dbc", delete=False)
-    try:
-        tmp.write(battery_dbc_content())
-        tmp.close()
-        parser = DBCParser(tmp.name)
-        return parser
-    finally:
-        try:
-            os.unlink(tmp.name)
-        except OSError:
-            pass
+    return DBCParser.from_string(battery_dbc_content())
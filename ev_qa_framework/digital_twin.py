@@ -6,15 +6,23 @@ Simulates battery behavior including:
 - Capacity fade (linear + knee-point model)
 - Resistance growth (exponential model)
 - Thermal model (simplified)
+
+``BatteryDigitalTwin`` follows one pack step by step; ``BatteryFleetTwin``
+runs the same model for N packs at once on NumPy columns, for Monte Carlo
+and fleet what-if studies.
 """
 
 from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .config import FrameworkConfig
 from .physics_features import PhysicsFeatureExtractor
@@ -47,6 +55,118 @@ class BatteryState:
         }
 
 
+@dataclass(frozen=True)
+class DegradationHorizon:
+    """
+    Closed-form SOH trajectory of the digital twin's capacity fade model.
+
+    The twin loses ``fade_rate`` SOH points per hour of operation while SOH
+    is above ``knee_point`` and ``fade_rate * knee_factor`` below it; one
+    equivalent cycle is ``steps_per_cycle`` steps of ``step_hours`` (charge
+    then discharge, as in ``BatteryDigitalTwin.predict_soh``). Fade does not
+    depend on current, so the trajectory is piecewise linear in the number
+    of steps and both directions — SOH after N cycles, cycles until a target
+    SOH — are answered without stepping.
+
+    All methods broadcast: ``soh`` and the parameters may be arrays (one
+    value per pack), and ``cycles_to`` evaluates every target for every
+    starting state in one pass.
+    """
+
+    fade_rate: float | np.ndarray = 0.002
+    knee_point: float | np.ndarray = 80.0
+    knee_factor: float | np.ndarray = 2.0
+    step_hours: float = 1.0
+    steps_per_cycle: int = 2
+
+    # Tolerance for landing exactly on the knee or a target after whole steps
+    _EPS = 1e-9
+
+    def _segments(self, soh: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return per-step fade above/below the knee, steps above it, and SOH at the knee."""
+        above = np.asarray(self.fade_rate, dtype=np.float64) * self.step_hours
+        below = above * self.knee_factor
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps_above = np.where(
+                soh > self.knee_point, np.ceil((soh - self.knee_point) / above - self._EPS), 0.0
+            )
+        return above, below, steps_above, soh - above * steps_above
+
+    def soh_after(self, soh: float | np.ndarray, n_cycles: float | np.ndarray) -> np.ndarray:
+        """
+        SOH after ``n_cycles`` equivalent full cycles.
+
+        Args:
+            soh: starting SOH (%), scalar or array
+            n_cycles: cycles to project, broadcast against ``soh``
+
+        Returns:
+            Projected SOH, never below 0
+        """
+        soh = np.asarray(soh, dtype=np.float64)
+        steps = np.asarray(n_cycles, dtype=np.float64) * self.steps_per_cycle
+        above, below, steps_above, soh_knee = self._segments(soh)
+        projected = np.where(
+            steps <= steps_above,
+            soh - above * steps,
+            soh_knee - below * (steps - steps_above),
+        )
+        return np.maximum(projected, 0.0)
+
+    def cycles_to(
+        self,
+        soh: float | np.ndarray,
+        targets: float | np.ndarray,
+        max_cycles: float = 10_000,
+    ) -> np.ndarray:
+        """
+        Cycles until SOH first drops to or below each target.
+
+        Args:
+            soh: starting SOH (%), scalar or array of shape ``S``
+            targets: target SOH values, scalar or array of shape ``M``
+            max_cycles: horizon; targets not reached within it are NaN
+
+        Returns:
+            Array of shape ``S + M`` with whole cycles (0 where the start is
+            already at or below the target)
+        """
+        soh = np.asarray(soh, dtype=np.float64)[..., None]
+        targets = np.asarray(targets, dtype=np.float64)
+        scalar_targets = targets.ndim == 0
+        targets = np.atleast_1d(targets)
+
+        horizon = self
+        if np.ndim(self.fade_rate) or np.ndim(self.knee_point) or np.ndim(self.knee_factor):
+            # Per-pack parameters line up with the leading (state) axis
+            horizon = DegradationHorizon(
+                np.asarray(self.fade_rate)[..., None],
+                np.asarray(self.knee_point)[..., None],
+                np.asarray(self.knee_factor)[..., None],
+                self.step_hours,
+                self.steps_per_cycle,
+            )
+        above, below, steps_above, soh_knee = horizon._segments(soh)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = np.where(
+                targets >= soh_knee,
+                np.ceil((soh - targets) / above - self._EPS),
+                steps_above + np.ceil((soh_knee - targets) / below - self._EPS),
+            )
+            steps = np.where(soh <= targets, 0.0, steps)
+            cycles = np.ceil(steps / self.steps_per_cycle)
+            cycles = np.where((targets >= 0.0) & (cycles <= max_cycles), cycles, np.nan)
+        return cycles[..., 0] if scalar_targets else cycles
+
+
+@lru_cache(maxsize=4096)
+def _cycles_to_soh_cached(
+    horizon: DegradationHorizon, soh: float, targets: tuple[float, ...], max_cycles: float
+) -> tuple[float | None, ...]:
+    cycles = horizon.cycles_to(soh, np.asarray(targets), max_cycles)
+    return tuple(None if math.isnan(c) else float(c) for c in cycles.tolist())
+
+
 class BatteryDigitalTwin:
     """
     Virtual battery model for simulation and prediction.
@@ -147,69 +267,288 @@ class BatteryDigitalTwin:
         Returns:
             DataFrame with state at each step
         """
-        for _, row in cycle_profile.iterrows():
-            self.step(dt, row["current"])
+        import pandas as pd
+
+        for current in cycle_profile["current"].to_numpy(dtype=float).tolist():
+            self.step(dt, current)
 
         return pd.DataFrame(self._history)
 
+    @property
+    def horizon(self) -> DegradationHorizon:
+        """Closed-form SOH projection for the current degradation parameters."""
+        return DegradationHorizon(self._fade_rate, self._knee_point, self._knee_factor)
+
     def predict_soh(self, n_cycles: int, avg_current: float = 50.0) -> float:
         """
         Predict SOH after N equivalent full cycles.
 
         Args:
             n_cycles: number of equivalent full cycles
-            avg_current: average current per cycle
+            avg_current: average current per cycle (capacity fade in this
+                model is time-based, so it does not change the result)
 
         Returns:
             Predicted SOH
         """
-        # Simulate without modifying state
-        temp_twin = BatteryDigitalTwin(self.config)
-        temp_twin.state = BatteryState(
-            voltage=self.state.voltage,
-            soc=self.state.soc,
-            soh=self.state.soh,
-            cycle_count=self.state.cycle_count,
-            capacity_ah=self.state.capacity_ah,
-            internal_resistance=self.state.internal_resistance,
-            temperature=self.state.temperature,
-        )
+        return float(self.horizon.soh_after(self.state.soh, n_cycles))
 
-        dt = 1.0  # 1 hour steps
-        for _ in range(n_cycles):
-            # Simulate one full cycle: charge then discharge
-            temp_twin.step(dt, avg_current)  # charge
-            temp_twin.step(dt, -avg_current)  # discharge
+    def estimate_cycles_to_soh(
+        self, targets: tuple[float, ...] | list[float], max_cycles: int = 10_000
+    ) -> tuple[Optional[float], ...]:
+        """
+        Estimate remaining cycles until SOH reaches each target.
+
+        Results are memoized by (SOH, model parameters, targets), so
+        dashboards can call this for every vehicle on every refresh.
 
-        return temp_twin.state.soh
+        Args:
+            targets: target SOH values (%)
+            max_cycles: horizon; targets not reached within it give None
+
+        Returns:
+            Cycles per target, 0.0 if already at or below it
+        """
+        return _cycles_to_soh_cached(
+            self.horizon, float(self.state.soh), tuple(map(float, targets)), float(max_cycles)
+        )
 
     def get_degradation_summary(self) -> dict:
         """Return degradation summary."""
+        to_80, to_70 = self.estimate_cycles_to_soh((80.0, 70.0))
         return {
             "current_soh": self.state.soh,
             "cycle_count": self.state.cycle_count,
             "capacity_remaining_ah": self.state.capacity_ah,
             "internal_resistance": self.state.internal_resistance,
-            "estimated_cycles_to_80": self._estimate_cycles_to_soh(80.0),
-            "estimated_cycles_to_70": self._estimate_cycles_to_soh(70.0),
+            "estimated_cycles_to_80": to_80,
+            "estimated_cycles_to_70": to_70,
         }
 
     def _estimate_cycles_to_soh(self, target_soh: float) -> Optional[float]:
         """Estimate remaining cycles to reach target SOH."""
-        if self.state.soh <= target_soh:
-            return 0.0
-
-        predicted = self.predict_soh(1000)
-        if predicted <= target_soh:
-            # Binary search for exact cycle count
-            lo, hi = 0, 10000
-            while lo < hi:
-                mid = (lo + hi) // 2
-                p = self.predict_soh(mid)
-                if p <= target_soh:
-                    hi = mid
-                else:
-                    lo = mid + 1
-            return float(lo)
-
-        return None  # Won't reach target in 10000 cycles
+        return self.estimate_cycles_to_soh((target_soh,))[0]
+
+
+class BatteryFleetTwin:
+    """
+    Digital twin of N battery packs stepped in lockstep.
+
+    Runs the ``BatteryDigitalTwin`` model on struct-of-arrays state: each
+    state variable is an ``(N,)`` float64 column (``soc``, ``soh``,
+    ``internal_resistance``, ``temperature``, ``cycle_count``, ...), and a
+    step is a handful of NumPy operations over all packs. History is not
+    kept per step; :meth:`simulate` writes the requested fields into one
+    preallocated ``(T // every, N, k)`` array (or a caller-supplied one,
+    e.g. float32 or a ``np.memmap``).
+
+    Initial state and degradation parameters accept scalars or ``(N,)``
+    arrays, so per-pack spreads for Monte Carlo studies need no extra code.
+
+    Example:
+        fleet = BatteryFleetTwin(5000, soh=rng.normal(98, 1, 5000))
+        history = fleet.simulate(currents, dt=1.0, fields=("soh",), every=24)
+    """
+
+    STATE_FIELDS: tuple[str, ...] = (
+        "voltage",
+        "current",
+        "temperature",
+        "soc",
+        "soh",
+        "cycle_count",
+        "capacity_ah",
+        "internal_resistance",
+    )
+
+    nominal_capacity_ah = 100.0
+    nominal_resistance = 0.05  # Ohms
+
+    def __init__(
+        self,
+        n_packs: int,
+        config: Optional[FrameworkConfig] = None,
+        *,
+        soc: float | np.ndarray = 80.0,
+        soh: float | np.ndarray = 100.0,
+        temperature: float | np.ndarray = 25.0,
+        ambient_temperature: float | np.ndarray = 25.0,
+        cycle_count: float | np.ndarray = 0.0,
+        fade_rate: float | np.ndarray = 0.002,
+        knee_point: float | np.ndarray = 80.0,
+        knee_factor: float | np.ndarray = 2.0,
+        resistance_growth_rate: float | np.ndarray = 0.001,
+        thermal_coeff: float | np.ndarray = 0.5,
+    ):
+        """
+        Args:
+            n_packs: number of packs N
+            config: framework configuration
+            soc, soh, temperature, ambient_temperature, cycle_count: initial
+                state, scalar or one value per pack
+            fade_rate, knee_point, knee_factor, resistance_growth_rate,
+                thermal_coeff: degradation model parameters (see
+                ``BatteryDigitalTwin``), scalar or one value per pack
+        """
+        if n_packs < 1:
+            raise ValueError(f"n_packs must be >= 1, got {n_packs}")
+        self.n_packs = n_packs
+        self.config = config or FrameworkConfig()
+        self._initial = {
+            "soc": soc,
+            "soh": soh,
+            "temperature": temperature,
+            "ambient_temperature": ambient_temperature,
+            "cycle_count": cycle_count,
+        }
+
+        self._fade_rate = self._param(fade_rate, "fade_rate")
+        self._knee_point = self._param(knee_point, "knee_point")
+        self._knee_factor = self._param(knee_factor, "knee_factor")
+        self._resistance_growth_rate = self._param(resistance_growth_rate, "resistance_growth_rate")
+        self._thermal_coeff = self._param(thermal_coeff, "thermal_coeff")
+        self.reset()
+
+    def _param(self, value: float | np.ndarray, name: str) -> np.ndarray:
+        arr = np.asarray(value, dtype=np.float64)
+        if arr.ndim and arr.shape != (self.n_packs,):
+            raise ValueError(f"{name} must be a scalar or have shape ({self.n_packs},)")
+        return arr
+
+    def _column(self, value: float | np.ndarray, name: str) -> np.ndarray:
+        return np.array(np.broadcast_to(self._param(value, name), (self.n_packs,)))
+
+    def reset(self):
+        """Reset every pack to the initial state given at construction.
+
+        Voltage starts at the open-circuit value for the initial SOC
+        (``300 + soc``, 380 V at the default 80 %), which is what
+        ``BatteryDigitalTwin`` reports after its first step. The 400 V
+        ``BatteryState`` default is a placeholder that does not track SOC.
+        """
+        for name, value in self._initial.items():
+            setattr(self, name, self._column(value, name))
+        self.current = np.zeros(self.n_packs)
+        self.capacity_ah = self.nominal_capacity_ah * self.soh / 100.0
+        self.internal_resistance = self.nominal_resistance * np.exp(
+            self._resistance_growth_rate * self.cycle_count
+        )
+        self.voltage = 300.0 + self.soc - self.current * self.internal_resistance
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """Return a copy of the current state columns."""
+        return {name: getattr(self, name).copy() for name in self.STATE_FIELDS}
+
+    def pack_state(self, index: int) -> BatteryState:
+        """Return the state of one pack as a ``BatteryState``."""
+        return BatteryState(
+            ambient_temperature=float(self.ambient_temperature[index]),
+            **{name: float(getattr(self, name)[index]) for name in self.STATE_FIELDS},
+        )
+
+    def cycles_to_soh(self, targets: float | np.ndarray, max_cycles: int = 10_000) -> np.ndarray:
+        """
+        Cycles until each pack's SOH reaches each target (see ``DegradationHorizon``).
+
+        Args:
+            targets: target SOH values (%), scalar or shape ``(M,)``
+            max_cycles: horizon; targets not reached within it are NaN
+
+        Returns:
+            Array of shape ``(N,)`` or ``(N, M)``
+        """
+        horizon = DegradationHorizon(self._fade_rate, self._knee_point, self._knee_factor)
+        return horizon.cycles_to(self.soh, targets, max_cycles)
+
+    def step(self, dt: float, current: float | np.ndarray):
+        """
+        Advance all packs by one time step.
+
+        Args:
+            dt: time step in hours
+            current: current in Amps (positive=charge, negative=discharge),
+                scalar or one value per pack
+        """
+        i = np.broadcast_to(np.asarray(current, dtype=np.float64), (self.n_packs,))
+        r = self.internal_resistance
+        cap = self.capacity_ah
+
+        # SOC update (Coulomb counting)
+        soc = self.soc
+        soc += i * (100.0 * dt) / cap
+        np.clip(soc, 0.0, 100.0, out=soc)
+
+        # Voltage (simplified OCV + IR drop), 300-400 V OCV range
+        self.voltage = 300.0 + soc - i * r
+        self.current = i.copy()
+
+        # Thermal model: dT = I²R * coeff - cooling
+        heat = (i * i) * r * self._thermal_coeff
+        self.temperature += (heat - 0.1 * (self.temperature - self.ambient_temperature)) * dt
+
+        # Cycle counting (equivalent full cycles)
+        self.cycle_count += np.abs(i) * (dt / 2.0) / cap
+
+        # Degradation: capacity fade (faster below the knee), resistance growth
+        fade = self._fade_rate * dt * np.where(self.soh > self._knee_point, 1.0, self._knee_factor)
+        soh = self.soh
+        soh -= fade
+        np.maximum(soh, 0.0, out=soh)
+        self.capacity_ah = self.nominal_capacity_ah * soh / 100.0
+        self.internal_resistance = self.nominal_resistance * np.exp(
+            self._resistance_growth_rate * self.cycle_count
+        )
+
+    def simulate(
+        self,
+        currents: np.ndarray,
+        dt: float = 1.0,
+        fields: tuple[str, ...] | None = None,
+        every: int = 1,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Run a current profile through all packs.
+
+        Args:
+            currents: ``(T, N)`` current matrix in Amps, or ``(T,)`` to apply
+                the same profile to every pack
+            dt: time step in hours
+            fields: state fields to record, in order (default
+                ``STATE_FIELDS``); ``()`` records nothing
+            every: record the state after every ``every``-th step
+                (decimation); the last partial block is not recorded
+            out: optional preallocated ``(T // every, N, len(fields))`` array
+                to write history into (any float dtype, or a memmap)
+
+        Returns:
+            History array of shape ``(T // every, N, len(fields))``; record
+            ``r`` holds the state after step ``(r + 1) * every - 1``.
+        """
+        currents = np.asarray(currents, dtype=np.float64)
+        if currents.ndim == 1:
+            currents = currents[:, None]
+        if currents.ndim != 2 or currents.shape[1] not in (1, self.n_packs):
+            raise ValueError(f"currents must have shape (T,) or (T, {self.n_packs})")
+        if every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        fields = self.STATE_FIELDS if fields is None else tuple(fields)
+        unknown = set(fields) - set(self.STATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown state fields: {sorted(unknown)}")
+
+        n_steps = currents.shape[0]
+        shape = (n_steps // every, self.n_packs, len(fields))
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}, got {out.shape}")
+
+        shared = currents.shape[1] == 1
+        for t in range(n_steps):
+            self.step(dt, currents[t, 0] if shared else currents[t])
+            if (t + 1) % every == 0:
+                row = out[(t + 1) // every - 1]
+                for k, name in enumerate(fields):
+                    row[:, k] = getattr(self, name)
+        return out
@@ -7,19 +7,107 @@ of electric vehicles.
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.ensemble import IsolationForest
+    from sklearn.preprocessing import StandardScaler
 
 from .analysis import EVBatteryAnalyzer
 from .battery_scoring import BatteryScorer
 from .physics_features import PhysicsFeatureExtractor
+from .utils import normalize_columns, require_columns
+
+logger = logging.getLogger(__name__)
 
 # Warning suppression handled by individual functions, not module-level
 
 
+# ---------------------------------------------------------------------------
+# Parallel scoring helpers (module-level so they can be pickled)
+# ---------------------------------------------------------------------------
+def telemetry_hash(df: pd.DataFrame) -> str:
+    """Content hash of a telemetry DataFrame (values, index, columns, dtypes)."""
+    import pandas as pd
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _analyzer_params(analyzer: EVBatteryAnalyzer) -> dict[str, Any]:
+    """Constructor arguments that reproduce *analyzer* without its fitted state."""
+    return {
+        "contamination": analyzer.contamination,
+        "n_estimators": analyzer.model.n_estimators,
+        "random_state": analyzer.model.random_state,
+        "critical_threshold": analyzer.critical_threshold,
+        "warning_threshold": analyzer.warning_threshold,
+    }
+
+
+def _scorer_params(scorer: BatteryScorer) -> dict[str, Any]:
+    """Constructor arguments that reproduce *scorer*."""
+    return {
+        "soh_weight": scorer.soh_weight,
+        "anomaly_weight": scorer.anomaly_weight,
+        "cell_balance_weight": scorer.cell_balance_weight,
+        "thermal_weight": scorer.thermal_weight,
+        "soh_baseline": scorer.soh_baseline,
+        "cell_voltages": scorer.cell_voltages,
+    }
+
+
+def _single_threaded_analyzer(params: dict[str, Any]) -> EVBatteryAnalyzer:
+    analyzer = EVBatteryAnalyzer(**params)
+    analyzer.model.set_params(n_jobs=1)
+    return analyzer
+
+
+def _init_fleet_worker() -> None:
+    """Pin BLAS/OpenMP pools to one thread in each worker process."""
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:  # pragma: no cover - ships with scikit-learn
+        return
+    threadpool_limits(limits=1)
+
+
+def _score_battery_task(
+    df: pd.DataFrame,
+    scorer_params: dict[str, Any],
+    analyzer_params: dict[str, Any],
+    anomaly_result: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Score one battery with freshly fitted, single-threaded models.
+
+    If *anomaly_result* is given (from a ``FleetReferenceModel``), no
+    anomaly model is fitted and its percentage feeds the composite score.
+
+    Returns ``(score_result, anomaly_result)`` as produced by
+    ``BatteryScorer.compute_score`` and ``EVBatteryAnalyzer.analyze_telemetry``.
+    """
+    scorer = BatteryScorer(**scorer_params)
+    if anomaly_result is not None:
+        pct = anomaly_result.get("anomaly_percentage", 0.0)
+        return scorer.compute_score(df, anomaly_percentage=pct), anomaly_result
+    scorer._anomaly_analyzer.model.set_params(n_jobs=1)
+    score_result = scorer.compute_score(df)
+    anomaly_result = _single_threaded_analyzer(analyzer_params).analyze_telemetry(df)
+    return score_result, anomaly_result
+
+
 # ---------------------------------------------------------------------------
 # FleetAlert
 # ---------------------------------------------------------------------------
@@ -45,6 +133,156 @@ class FleetAlert:
         }
 
 
+# ---------------------------------------------------------------------------
+# FleetReferenceModel
+# ---------------------------------------------------------------------------
+class FleetReferenceModel:
+    """Shared, pre-fitted anomaly models — one per chemistry profile.
+
+    Instead of fitting an IsolationForest on each battery being scored, a
+    single scaler + IsolationForest per chemistry (keys of
+    ``chemistries.BUILTIN_PROFILES``) is fitted on a sampled fleet baseline.
+    Every battery of that chemistry is then scored against the same model,
+    which makes anomaly percentages comparable across vehicles.
+
+    ``fit`` builds the new model off to the side and swaps it in under a
+    lock, so it doubles as the retrain API when the baseline drifts;
+    concurrent ``score_batteries`` calls keep using the model they started
+    with.
+
+    Parameters
+    ----------
+    contamination, n_estimators, random_state :
+        IsolationForest parameters.
+    critical_threshold, warning_threshold : float
+        Score thresholds, with the same meaning as in ``EVBatteryAnalyzer``.
+    """
+
+    FEATURES: tuple[str, ...] = ("voltage", "current", "temp")
+
+    def __init__(
+        self,
+        contamination: float = 0.1,
+        n_estimators: int = 200,
+        random_state: int = 42,
+        critical_threshold: float = -0.8,
+        warning_threshold: float = -0.5,
+    ):
+        self.contamination = contamination
+        self.n_estimators = n_estimators
+        self.random_state = random_state
+        self.critical_threshold = critical_threshold
+        self.warning_threshold = warning_threshold
+        self._models: dict[str, tuple[StandardScaler, IsolationForest]] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+
+    @property
+    def chemistries(self) -> list[str]:
+        """Chemistries that currently have a fitted model."""
+        return list(self._models)
+
+    def fit(
+        self,
+        chemistry: str,
+        baseline: pd.DataFrame | list[pd.DataFrame],
+        max_samples: int = 50_000,
+    ) -> None:
+        """Fit (or refit and swap) the reference model for *chemistry*.
+
+        Parameters
+        ----------
+        chemistry : str
+            Key of ``chemistries.BUILTIN_PROFILES`` (e.g. "lfp", "nmc", "nca").
+        baseline : pd.DataFrame | list[pd.DataFrame]
+            Fleet telemetry to learn normal behaviour from.
+        max_samples : int
+            Rows are sampled uniformly down to this many before fitting.
+        """
+        import pandas as pd
+        from sklearn.ensemble import IsolationForest
+        from sklearn.preprocessing import StandardScaler
+
+        from .chemistries import get_profile
+
+        get_profile(chemistry)  # raises KeyError for unknown chemistries
+        frames = [baseline] if isinstance(baseline, pd.DataFrame) else list(baseline)
+        if not frames:
+            raise ValueError(f"Empty baseline for chemistry '{chemistry}'")
+        X = np.concatenate([self._features(df) for df in frames])
+        if len(X) == 0:
+            raise ValueError(f"Empty baseline for chemistry '{chemistry}'")
+        if len(X) > max_samples:
+            rng = np.random.default_rng(self.random_state)
+            X = X[rng.choice(len(X), size=max_samples, replace=False)]
+
+        scaler = StandardScaler().fit(X)
+        model = IsolationForest(
+            contamination=self.contamination,
+            n_estimators=self.n_estimators,
+            random_state=self.random_state,
+            n_jobs=-1,
+        ).fit(scaler.transform(X))
+        with self._lock:
+            self._models[chemistry] = (scaler, model)
+            self.version += 1
+        logger.info("Fitted %s reference model on %d samples", chemistry, len(X))
+
+    def score_batteries(
+        self, frames: dict[str, pd.DataFrame], chemistry: str
+    ) -> dict[str, dict[str, Any]]:
+        """Score many batteries of one chemistry with a single ``score_samples`` call.
+
+        Returns
+        -------
+        dict mapping battery_id -> dict with keys total_samples,
+        anomalies_detected, anomaly_percentage, severity, reference_model.
+        """
+        with self._lock:
+            if chemistry not in self._models:
+                raise KeyError(f"No reference model fitted for chemistry '{chemistry}'")
+            scaler, model = self._models[chemistry]
+        if not frames:
+            return {}
+
+        ids = list(frames)
+        blocks = [self._features(frames[bid]) for bid in ids]
+        lengths = np.array([len(b) for b in blocks])
+        scores = model.score_samples(scaler.transform(np.concatenate(blocks)))
+        # Same rule as EVBatteryAnalyzer.analyze_telemetry
+        flagged = (scores < model.offset_) | (scores < self.warning_threshold)
+
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        nonempty = lengths > 0
+        counts = np.zeros(len(ids), dtype=int)
+        min_scores = np.full(len(ids), np.inf)
+        counts[nonempty] = np.add.reduceat(flagged.astype(int), starts[nonempty])
+        min_scores[nonempty] = np.minimum.reduceat(scores, starts[nonempty])
+
+        results: dict[str, dict[str, Any]] = {}
+        for bid, n, count, min_score in zip(ids, lengths, counts, min_scores):
+            if min_score < self.critical_threshold:
+                severity = "CRITICAL"
+            elif min_score < self.warning_threshold:
+                severity = "WARNING"
+            else:
+                severity = "INFO"
+            results[bid] = {
+                "total_samples": int(n),
+                "anomalies_detected": int(count),
+                "anomaly_percentage": (count / n) * 100 if n else 0.0,
+                "severity": severity,
+                "reference_model": chemistry,
+            }
+        return results
+
+    @classmethod
+    def _features(cls, df: pd.DataFrame) -> np.ndarray:
+        df = normalize_columns(df)
+        require_columns(df, list(cls.FEATURES))
+        return df[list(cls.FEATURES)].to_numpy(dtype=float)
+
+
 # ---------------------------------------------------------------------------
 # FleetAnalytics
 # ---------------------------------------------------------------------------
@@ -67,6 +305,21 @@ class FleetAnalytics:
     physics : PhysicsFeatureExtractor | None
         Pre-configured physics feature extractor. If None, a default
         PhysicsFeatureExtractor is created.
+    max_workers : int | None
+        If set, fleet-wide methods (``get_fleet_summary``,
+        ``compare_batteries``, ``detect_fleet_anomalies``) first score all
+        unscored batteries with :meth:`score_all` using this many worker
+        processes. If None (default), batteries are scored serially on
+        demand with the shared ``scorer``/``analyzer`` instances.
+    reference_model : FleetReferenceModel | None
+        Shared per-chemistry anomaly model. When set, anomaly results and
+        the scorer's anomaly component come from this model instead of
+        per-battery fits. See :meth:`fit_reference_model`.
+    default_chemistry : str
+        Chemistry assumed for batteries added without one.
+    result_cache_size : int
+        Maximum number of content-hashed :meth:`score_all` results kept;
+        the least recently used are evicted first.
     """
 
     def __init__(
@@ -74,19 +327,37 @@ class FleetAnalytics:
         scorer: BatteryScorer | None = None,
         analyzer: EVBatteryAnalyzer | None = None,
         physics: PhysicsFeatureExtractor | None = None,
+        max_workers: int | None = None,
+        reference_model: FleetReferenceModel | None = None,
+        default_chemistry: str = "nmc",
+        result_cache_size: int = 1024,
     ):
         self._batteries: dict[str, pd.DataFrame] = {}
         self._scores: dict[str, dict[str, Any]] = {}
         self._anomalies: dict[str, dict[str, Any]] = {}
+        # Content-addressed results of score_all(): telemetry hash -> (score, anomaly),
+        # most recently used last
+        self._hashes: dict[str, str] = {}
+        self._results_by_hash: OrderedDict[str, tuple[dict[str, Any], dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self.result_cache_size = result_cache_size
 
         self.scorer = scorer or BatteryScorer()
         self.analyzer = analyzer or EVBatteryAnalyzer()
         self.physics = physics or PhysicsFeatureExtractor()
+        self.max_workers = max_workers
+        self.reference_model = reference_model
+        self.default_chemistry = default_chemistry
+        self._chemistries: dict[str, str] = {}
+        self._reference_version: int | None = None
 
     # ------------------------------------------------------------------
     # Battery management
     # ------------------------------------------------------------------
-    def add_battery(self, battery_id: str, telemetry_df: pd.DataFrame) -> None:
+    def add_battery(
+        self, battery_id: str, telemetry_df: pd.DataFrame, chemistry: str | None = None
+    ) -> None:
         """Register a battery and its telemetry data in the fleet.
 
         Parameters
@@ -96,12 +367,17 @@ class FleetAnalytics:
         telemetry_df : pd.DataFrame
             Telemetry data with columns: voltage, current, temp (or
             temperature), soc. Optionally soh, capacity, cycle_number.
+        chemistry : str | None
+            Chemistry profile key used to pick the reference model.
+            Defaults to ``default_chemistry``.
 
         Raises
         ------
         ValueError
             If battery_id is empty or telemetry_df is not a DataFrame.
         """
+        import pandas as pd
+
         if not battery_id or not isinstance(battery_id, str):
             raise ValueError("battery_id must be a non-empty string")
         if not isinstance(telemetry_df, pd.DataFrame):
@@ -110,15 +386,19 @@ class FleetAnalytics:
             raise ValueError("telemetry_df must not be empty")
 
         self._batteries[battery_id] = telemetry_df.copy()
+        self._chemistries[battery_id] = chemistry or self.default_chemistry
         # Invalidate cached results for this battery
         self._scores.pop(battery_id, None)
         self._anomalies.pop(battery_id, None)
+        self._hashes.pop(battery_id, None)
 
     def remove_battery(self, battery_id: str) -> None:
         """Remove a battery from the fleet."""
         self._batteries.pop(battery_id, None)
         self._scores.pop(battery_id, None)
         self._anomalies.pop(battery_id, None)
+        self._hashes.pop(battery_id, None)
+        self._chemistries.pop(battery_id, None)
 
     @property
     def battery_ids(self) -> list[str]:
@@ -150,13 +430,181 @@ class FleetAnalytics:
         dict with keys: score, grade, soh_score, anomaly_score,
             cell_balance_score, thermal_score, details
         """
+        self._sync_reference()
         if battery_id in self._scores:
             return self._scores[battery_id]
         df = self.get_telemetry(battery_id)
-        result = self.scorer.compute_score(df)
+        if self.reference_model is not None:
+            pct = self._analyze_anomaly(battery_id).get("anomaly_percentage", 0.0)
+            result = self.scorer.compute_score(df, anomaly_percentage=pct)
+        else:
+            result = self.scorer.compute_score(df)
         self._scores[battery_id] = result
         return result
 
+    # ------------------------------------------------------------------
+    # Shared reference model
+    # ------------------------------------------------------------------
+    def fit_reference_model(self, max_samples: int = 50_000) -> FleetReferenceModel:
+        """Fit one reference anomaly model per chemistry on the current fleet.
+
+        Telemetry of all batteries of each chemistry forms the baseline,
+        sampled down to *max_samples* rows. Creates ``reference_model`` if
+        needed; calling again retrains and swaps the models in place.
+        """
+        if not self._batteries:
+            raise ValueError("Cannot fit a reference model on an empty fleet")
+        if self.reference_model is None:
+            params = _analyzer_params(self.analyzer)
+            self.reference_model = FleetReferenceModel(**params)
+        by_chemistry: dict[str, list[pd.DataFrame]] = {}
+        for bid, df in self._batteries.items():
+            by_chemistry.setdefault(self._chemistries[bid], []).append(df)
+        for chemistry, frames in by_chemistry.items():
+            self.reference_model.fit(chemistry, frames, max_samples=max_samples)
+        return self.reference_model
+
+    def _sync_reference(self) -> None:
+        """Drop cached results if the reference model was refitted."""
+        version = self.reference_model.version if self.reference_model is not None else None
+        if version != self._reference_version:
+            self._scores.clear()
+            self._anomalies.clear()
+            self._reference_version = version
+
+    def _score_reference(self, battery_ids: list[str]) -> None:
+        """Fill anomaly results from the reference model, one call per chemistry."""
+        assert self.reference_model is not None
+        by_chemistry: dict[str, dict[str, pd.DataFrame]] = {}
+        for bid in battery_ids:
+            if bid not in self._anomalies:
+                chemistry = self._chemistries[bid]
+                by_chemistry.setdefault(chemistry, {})[bid] = self._batteries[bid]
+        for chemistry, frames in by_chemistry.items():
+            self._anomalies.update(self.reference_model.score_batteries(frames, chemistry))
+
+    def score_all(
+        self,
+        battery_ids: list[str] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Score many batteries in parallel worker processes.
+
+        Each battery is scored with freshly fitted models pinned to one
+        thread, so results do not depend on fleet order and parallel fits do
+        not oversubscribe cores. Results are keyed by a content hash of the
+        telemetry: batteries whose data has not changed since a previous
+        call (including re-added with identical data) are not rescored.
+        At most ``2 * max_workers`` batteries are in flight at once.
+
+        Parameters
+        ----------
+        battery_ids : list[str] | None
+            Batteries to score. If None, scores the whole fleet.
+        max_workers : int | None
+            Worker processes. Defaults to ``self.max_workers`` or, if that
+            is None, the CPU count. ``1`` scores in-process.
+
+        Returns
+        -------
+        dict mapping battery_id -> score result (as ``score_battery``).
+        """
+        ids = battery_ids or self.battery_ids
+        for bid in ids:
+            if bid not in self._batteries:
+                raise KeyError(f"Battery '{bid}' not found in fleet")
+        workers = max_workers or self.max_workers or os.cpu_count() or 1
+        scorer_params = _scorer_params(self.scorer)
+        analyzer_params = _analyzer_params(self.analyzer)
+        self._sync_reference()
+        config_key = repr(
+            (
+                sorted(scorer_params.items()),
+                sorted(analyzer_params.items()),
+                self._reference_version,
+            )
+        )
+
+        pending: dict[str, list[str]] = {}  # content key -> battery ids sharing it
+        for bid in ids:
+            if bid not in self._hashes:
+                self._hashes[bid] = telemetry_hash(self._batteries[bid])
+            key = hashlib.blake2b(
+                (config_key + self._hashes[bid]).encode(), digest_size=16
+            ).hexdigest()
+            if key in self._results_by_hash:
+                self._results_by_hash.move_to_end(key)
+                self._store_result(bid, self._results_by_hash[key])
+            else:
+                pending.setdefault(key, []).append(bid)
+
+        if pending:
+            logger.info("Scoring %d batteries (%d cached)", len(pending), len(ids) - len(pending))
+        reference: dict[str, dict[str, Any] | None] = {key: None for key in pending}
+        if self.reference_model is not None and pending:
+            self._score_reference([bids[0] for bids in pending.values()])
+            reference = {key: self._anomalies[bids[0]] for key, bids in pending.items()}
+
+        if workers == 1:
+            for key, bids in pending.items():
+                df = self._batteries[bids[0]]
+                result = _score_battery_task(df, scorer_params, analyzer_params, reference[key])
+                self._cache_result(key, result)
+                for bid in bids:
+                    self._store_result(bid, result)
+        elif pending:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_fleet_worker) as pool:
+                window = 2 * workers
+                queue = iter(pending.items())
+                in_flight: dict[Future, tuple[str, list[str]]] = {}
+                while True:
+                    while len(in_flight) < window:
+                        item = next(queue, None)
+                        if item is None:
+                            break
+                        key, bids = item
+                        future = pool.submit(
+                            _score_battery_task,
+                            self._batteries[bids[0]],
+                            scorer_params,
+                            analyzer_params,
+                            reference[key],
+                        )
+                        in_flight[future] = (key, bids)
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key, bids = in_flight.pop(future)
+                        result = future.result()
+                        self._cache_result(key, result)
+                        for bid in bids:
+                            self._store_result(bid, result)
+
+        return {bid: self._scores[bid] for bid in ids}
+
+    def _cache_result(self, key: str, result: tuple[dict[str, Any], dict[str, Any]]) -> None:
+        self._results_by_hash[key] = result
+        self._results_by_hash.move_to_end(key)
+        while len(self._results_by_hash) > self.result_cache_size:
+            self._results_by_hash.popitem(last=False)
+
+    def _store_result(self, battery_id: str, result: tuple[dict[str, Any], dict[str, Any]]) -> None:
+        self._scores[battery_id], self._anomalies[battery_id] = result
+
+    def _prepare(self, battery_ids: list[str]) -> None:
+        """Score missing batteries up front (reference model and/or worker pool)."""
+        self._sync_reference()
+        if self.reference_model is not None:
+            self._score_reference(battery_ids)
+        if self.max_workers is None:
+            return
+        missing = [
+            bid for bid in battery_ids if bid not in self._scores or bid not in self._anomalies
+        ]
+        if missing:
+            self.score_all(missing)
+
     # ------------------------------------------------------------------
     # Fleet summary
     # ------------------------------------------------------------------
@@ -191,6 +639,7 @@ class FleetAnalytics:
                 "batteries": [],
             }
 
+        self._prepare(self.battery_ids)
         battery_summaries: list[dict[str, Any]] = []
         scores: list[float] = []
         sohs: list[float] = []
@@ -258,11 +707,15 @@ class FleetAnalytics:
             cell_balance_score, thermal_score, anomaly_percentage,
             num_samples
         """
+        import pandas as pd
+
         ids = battery_ids or self.battery_ids
-        rows: list[dict[str, Any]] = []
         for bid in ids:
             if bid not in self._batteries:
                 raise KeyError(f"Battery '{bid}' not found in fleet")
+        self._prepare(ids)
+        rows: list[dict[str, Any]] = []
+        for bid in ids:
             sr = self.score_battery(bid)
             ar = self._analyze_anomaly(bid)
             rows.append(
@@ -383,6 +836,7 @@ class FleetAnalytics:
         list[FleetAlert]
         """
         alerts: list[FleetAlert] = []
+        self._prepare(self.battery_ids)
 
         for bid in self._batteries:
             # --- Score-based alerts ---
@@ -444,8 +898,14 @@ class FleetAnalytics:
     # ------------------------------------------------------------------
     def _analyze_anomaly(self, battery_id: str) -> dict[str, Any]:
         """Run anomaly detection for a battery (cached)."""
+        self._sync_reference()
         if battery_id in self._anomalies:
             return self._anomalies[battery_id]
+        if self.reference_model is not None:
+            if battery_id not in self._batteries:
+                raise KeyError(f"Battery '{battery_id}' not found in fleet")
+            self._score_reference([battery_id])
+            return self._anomalies[battery_id]
         df = self.get_telemetry(battery_id)
         result = self.analyzer.analyze_telemetry(df)
         self._anomalies[battery_id] = result
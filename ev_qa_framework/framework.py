@@ -12,11 +12,16 @@ CAN protocol support, telemetry monitoring, and ML-based anomaly detection.
 
 import logging
 import signal
-from typing import Any
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .analysis import EVBatteryAnalyzer
 
-from .analysis import EVBatteryAnalyzer
 from .config import FrameworkConfig
 
 # Configure logging
@@ -52,6 +57,28 @@ def _setup_signal_handlers():
 
 from .models import BatteryTelemetryModel
 
+# Numeric telemetry fields checked column-wise by ``run_test_suite_batch``
+_COLUMNAR_FIELDS: tuple[str, ...] = ("voltage", "current", "temperature", "soc", "soh")
+
+
+def _field_bounds(name: str) -> tuple[float, float]:
+    """Return the ``ge``/``le`` bounds declared on a ``BatteryTelemetryModel`` field."""
+    lo, hi = -np.inf, np.inf
+    for constraint in BatteryTelemetryModel.model_fields[name].metadata:
+        lo = getattr(constraint, "ge", lo)
+        hi = getattr(constraint, "le", hi)
+    return lo, hi
+
+
+def _is_valid_vin(vin: Any) -> bool:
+    """Mirror ``BatteryTelemetryModel.validate_vin_format`` for a single value."""
+    return (
+        isinstance(vin, str)
+        and len(vin) == 17
+        and vin.isalnum()
+        and not any(char in "IOQ" for char in vin.upper())
+    )
+
 
 class EVQAFramework:
     """Main QA Framework for EV & IoT testing"""
@@ -95,21 +122,36 @@ class EVQAFramework:
             )
             self.config.default_vin = self.DEFAULT_TEST_VIN
 
-        # Initialize ML analyzer with config parameters
-        self.ml_analyzer = EVBatteryAnalyzer(
-            contamination=self.config.ml_config.contamination,
-            n_estimators=self.config.ml_config.n_estimators,
-            random_state=self.config.ml_config.random_state,
-        )
+        # The ML analyzer (and scikit-learn with it) is built on first use,
+        # so rule-based validation never pays for the import
+        self._ml_analyzer: EVBatteryAnalyzer | None = None
         logger.info(
-            f"Initialized {self.name} with ML analyzer (contamination={self.config.ml_config.contamination})"
+            f"Initialized {self.name} (ML contamination={self.config.ml_config.contamination})"
         )
 
+    @property
+    def ml_analyzer(self) -> EVBatteryAnalyzer:
+        """Isolation Forest analyzer configured from ``config.ml_config``."""
+        if self._ml_analyzer is None:
+            from .analysis import EVBatteryAnalyzer
+
+            self._ml_analyzer = EVBatteryAnalyzer(
+                contamination=self.config.ml_config.contamination,
+                n_estimators=self.config.ml_config.n_estimators,
+                random_state=self.config.ml_config.random_state,
+            )
+        return self._ml_analyzer
+
+    @ml_analyzer.setter
+    def ml_analyzer(self, analyzer: EVBatteryAnalyzer) -> None:
+        self._ml_analyzer = analyzer
+
     def health_check(self) -> dict:
         """Return health status for HTTP /health endpoint."""
         status = {
             "status": "healthy",
-            "ml_model_trained": hasattr(self.ml_analyzer.model, "estimators_"),
+            "ml_model_trained": self._ml_analyzer is not None
+            and hasattr(self._ml_analyzer.model, "estimators_"),
             "chemistry": self.config.chemistry,
             "thresholds": {
                 "max_temperature": self.config.safety_thresholds.max_temperature,
@@ -207,8 +249,95 @@ class EVQAFramework:
                     )
         return anomalies
 
+    def _validate_record(
+        self, data: dict[str, Any], critical_issues: list[str]
+    ) -> tuple[BatteryTelemetryModel | None, bool]:
+        """Validate a single telemetry record the way ``run_test_suite`` does.
+
+        Returns the parsed model (or ``None`` if parsing failed) and the
+        pass/fail flag. Failure messages are appended to *critical_issues*.
+        """
+        # Compatibility layer: Inject VIN if missing (copy to avoid mutating input)
+        _data = dict(data)  # shallow copy to avoid mutating caller's data
+        if "vin" not in _data:
+            _data["vin"] = self.config.default_vin
+
+        try:
+            telemetry = BatteryTelemetryModel(**_data)
+        except Exception as e:
+            msg = f"Validation failed - {e}"
+            logger.error(msg)
+            critical_issues.append(msg)
+            # also return telemetry so anomalies logic can inspect
+            try:
+                return BatteryTelemetryModel(**data), False
+            except Exception as e:
+                logger.warning("Failed to parse telemetry for anomaly inspection: %s", e)
+                return None, False
+
+        # initial validation
+        is_valid, warnings = self.validate_telemetry(telemetry)
+        if not is_valid:
+            critical_issues.extend(warnings)
+        return telemetry, is_valid
+
     def run_test_suite(self, telemetry_data: list[dict[str, Any]]) -> dict[str, Any]:
         """Run full QA test suite with ML analysis"""
+        results, telemetries = self._run_rule_checks(telemetry_data)
+
+        # ML-based analysis
+        if telemetries:
+            ml_results = self.ml_analyzer.analyze_telemetry(self._telemetry_frame(telemetries))
+            results["ml_analysis"] = ml_results
+
+        self.test_results = results
+        logger.info(f"Test Results: {results}")
+        return results
+
+    def run_test_suites(self, suites: Sequence[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """
+        Run several independent test suites, sharing one ML scoring pass.
+
+        Each suite is validated and rule-checked on its own exactly as in
+        ``run_test_suite``. When the ML analyzer is already fitted, the
+        telemetry of all suites is scored with a single batched call;
+        otherwise the suites are analyzed one after another.
+
+        Args:
+            suites: One list of telemetry dicts per suite.
+
+        Returns:
+            One ``run_test_suite`` result dict per suite, in order.
+        """
+        if not self.ml_analyzer.is_fitted:
+            return [self.run_test_suite(suite) for suite in suites]
+
+        checked = [self._run_rule_checks(suite) for suite in suites]
+        scored = [i for i, (_, telemetries) in enumerate(checked) if telemetries]
+        ml_results = self.ml_analyzer.analyze_telemetry_batch(
+            [self._telemetry_frame(checked[i][1]) for i in scored]
+        )
+        for i, ml_result in zip(scored, ml_results):
+            checked[i][0]["ml_analysis"] = ml_result
+
+        all_results = [results for results, _ in checked]
+        if all_results:
+            self.test_results = all_results[-1]
+        return all_results
+
+    @staticmethod
+    def _telemetry_frame(telemetries: list[BatteryTelemetryModel]) -> pd.DataFrame:
+        # Convert Pydantic models to dicts for DataFrame
+        import pandas as pd
+
+        df = pd.DataFrame([t.model_dump() for t in telemetries])
+        df.rename(columns={"temperature": "temp"}, inplace=True)
+        return df
+
+    def _run_rule_checks(
+        self, telemetry_data: list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], list[BatteryTelemetryModel]]:
+        """Validate records and apply rule-based checks (everything but ML)."""
         results: dict[str, Any] = {
             "total_tests": len(telemetry_data),
             "passed": 0,
@@ -221,34 +350,10 @@ class EVQAFramework:
         telemetries: list[BatteryTelemetryModel] = []
         status: list[bool] = []  # True=passed, False=failed
         for data in telemetry_data:
-            # Compatibility layer: Inject VIN if missing (copy to avoid mutating input)
-            _data = dict(data)  # shallow copy to avoid mutating caller's data
-            if "vin" not in _data:
-                _data["vin"] = self.config.default_vin
-
-            try:
-                telemetry = BatteryTelemetryModel(**_data)
+            telemetry, ok = self._validate_record(data, results["critical_issues"])
+            if telemetry is not None:
                 telemetries.append(telemetry)
-
-                # initial validation
-                is_valid, warnings = self.validate_telemetry(telemetry)
-                if is_valid:
-                    status.append(True)
-                else:
-                    status.append(False)
-                    results["critical_issues"].extend(warnings)
-            except Exception as e:
-                msg = f"Validation failed - {e}"
-                logger.error(msg)
-                results["critical_issues"].append(msg)
-                status.append(False)
-                # also append telemetry so anomalies logic can inspect
-                try:
-                    telemetries.append(BatteryTelemetryModel(**data))
-                except Exception as e:
-                    logger.warning("Failed to parse telemetry for anomaly inspection: %s", e)
-                    pass
-                continue
+            status.append(ok)
 
         # compute initial counts
         results["passed"] = sum(1 for s in status if s)
@@ -277,13 +382,128 @@ class EVQAFramework:
                     results["passed"] -= 1
                     results["failed"] += 1
 
+        return results, telemetries
+
+    def run_test_suite_batch(self, telemetry: pd.DataFrame | Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Columnar variant of :meth:`run_test_suite` for large telemetry batches.
+
+        Safety thresholds, field ranges, VIN format and the SOC/SOH
+        plausibility rule are evaluated as NumPy masks over whole columns.
+        Only rows flagged by a mask are re-validated through
+        ``BatteryTelemetryModel``, so failure messages match the row-wise path.
+
+        Args:
+            telemetry: DataFrame or dict of equal-length arrays using the
+                ``BatteryTelemetryModel`` field names. A missing or null
+                ``vin`` is replaced with ``config.default_vin``.
+
+        Returns:
+            Same result dict as :meth:`run_test_suite`.
+        """
+        import pandas as pd
+
+        df = telemetry if isinstance(telemetry, pd.DataFrame) else pd.DataFrame(telemetry)
+        n = len(df)
+        results: dict[str, Any] = {
+            "total_tests": n,
+            "passed": 0,
+            "failed": 0,
+            "anomalies": [],
+            "ml_analysis": None,
+            "critical_issues": [],
+        }
+        thresholds = self.config.safety_thresholds
+
+        # Numeric columns: anything non-finite or missing goes to the row-wise path
+        values: dict[str, np.ndarray] = {}
+        suspect = np.zeros(n, dtype=bool)
+        for name in _COLUMNAR_FIELDS:
+            if name in df.columns:
+                numeric = pd.to_numeric(df[name], errors="coerce")
+                column = numeric.to_numpy(dtype=float, copy=True)
+            else:
+                column = np.full(n, np.nan)
+            values[name] = column
+            lo, hi = _field_bounds(name)
+            suspect |= ~np.isfinite(column) | (column < lo) | (column > hi)
+
+        voltage, temp = values["voltage"], values["temperature"]
+        soc, soh = values["soc"], values["soh"]
+        # Mirrors BatteryTelemetryModel.check_soc_soh_plausibility
+        suspect |= (soh < 30.0) & (soc > 80.0)
+        # Critical checks from validate_telemetry
+        suspect |= (temp > thresholds.max_temperature) | (temp < thresholds.min_temperature)
+        suspect |= (voltage < thresholds.min_voltage) | (voltage > thresholds.max_voltage)
+
+        # VIN format: validate each distinct VIN once, broadcast via factorize codes
+        if "vin" in df.columns:
+            vin_missing = df["vin"].isna().to_numpy()
+            vin_column = df["vin"].where(~vin_missing, self.config.default_vin)
+        else:
+            vin_missing = np.ones(n, dtype=bool)
+            vin_column = pd.Series([self.config.default_vin] * n, dtype=object)
+        codes, uniques = pd.factorize(vin_column)
+        vin_ok = np.array([_is_valid_vin(v) for v in uniques], dtype=bool)
+        vins = np.array([str(v).upper() for v in uniques], dtype=object)[codes]
+        suspect |= ~vin_ok[codes]
+
+        # Row-wise fallback for flagged rows only
+        status = ~suspect
+        parsed = ~suspect
+        fallback = np.flatnonzero(suspect)
+        if len(fallback):
+            logger.info("Columnar validation: re-validating %d/%d rows", len(fallback), n)
+        for idx, record in zip(fallback, df.iloc[fallback].to_dict("records")):
+            if vin_missing[idx]:
+                record.pop("vin", None)
+            model, ok = self._validate_record(record, results["critical_issues"])
+            status[idx] = ok
+            if model is not None:
+                parsed[idx] = True
+                vins[idx] = model.vin
+                for name in _COLUMNAR_FIELDS:
+                    values[name][idx] = getattr(model, name)
+
+        # Rule-based anomaly detection over parsed rows (same order as detect_anomalies)
+        temps = values["temperature"][parsed]
+        jump_threshold = thresholds.max_temperature_jump
+        jumps = np.abs(np.diff(temps))
+        anomalies = [
+            f"Temperature: {float(t)}°C (threshold: {thresholds.max_temperature}°C)"
+            for t in temps[temps > thresholds.max_temperature]
+        ]
+        anomalies.extend(
+            f"Sharp temperature jump: {float(j)}°C (threshold: {jump_threshold}°C)"
+            for j in jumps[jumps > jump_threshold]
+        )
+        results["anomalies"] = anomalies
+
+        if self.config.fail_on_anomaly and len(jumps):
+            # Jump positions index the parsed rows and are matched against
+            # status positionally, exactly as run_test_suite does
+            jump_idx = np.flatnonzero(jumps > jump_threshold) + 1
+            jump_idx = jump_idx[status[jump_idx - 1] & status[jump_idx]]
+            status[jump_idx] = False
+
+        results["passed"] = int(status.sum())
+        results["failed"] = n - results["passed"]
+
         # ML-based analysis
-        if telemetries:
-            # Convert Pydantic models to dicts for DataFrame
-            df = pd.DataFrame([t.model_dump() for t in telemetries])
-            df.rename(columns={"temperature": "temp"}, inplace=True)
-            ml_results = self.ml_analyzer.analyze_telemetry(df)
-            results["ml_analysis"] = ml_results
+        if parsed.any():
+            ml_frame = pd.DataFrame(
+                {
+                    "vin": vins[parsed],
+                    "voltage": voltage[parsed],
+                    "current": values["current"][parsed],
+                    "temp": temps,
+                    "soc": soc[parsed],
+                    "soh": soh[parsed],
+                }
+            )
+            if "timestamp" in df.columns:
+                ml_frame["timestamp"] = df["timestamp"].to_numpy()[parsed]
+            results["ml_analysis"] = self.ml_analyzer.analyze_telemetry(ml_frame)
 
         self.test_results = results
         logger.info(f"Test Results: {results}")
@@ -9,11 +9,15 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .config import FrameworkConfig
 
@@ -106,7 +110,7 @@ class HILInterface:
         self.bitrate = bitrate
         self.simulation = simulation or not HAS_CAN
         self.bus = None
-        self._sim_messages: list[CANMessage] = []
+        self._sim_messages: deque[CANMessage] = deque()
 
         if not self.simulation:
             try:
@@ -130,7 +134,7 @@ class HILInterface:
         """Receive a CAN message."""
         if self.simulation:
             if self._sim_messages:
-                return self._sim_messages.pop(0)
+                return self._sim_messages.popleft()
             return None
         elif self.bus:
             try:
@@ -344,6 +348,51 @@ class HILTestRunner:
                 errors=errors,
             )
 
+    def replay_trace(
+        self,
+        trace_path: str | Path,
+        speed: float | None = 1.0,
+        name: str | None = None,
+        **replay_options,
+    ) -> HILTestResult:
+        """
+        Replay a recorded CAN trace into the HIL interface.
+
+        Args:
+            trace_path: ``.evcan`` recording from ``CANRecorder``.
+            speed: Playback rate relative to the recording; ``None`` replays
+                as fast as possible.
+            name: Test name (defaults to the file name).
+            **replay_options: Passed to ``TraceReplayer.replay`` (``start``,
+                ``end``, ``can_ids``, ``stop_event``).
+
+        Returns:
+            HILTestResult with the replay statistics under ``data["replay"]``.
+        """
+        from .trace_replay import TraceReplayer
+
+        test_name = name or Path(trace_path).name
+        start_time = time.time()
+        try:
+            stats = TraceReplayer(trace_path).replay(self.hil, speed=speed, **replay_options)
+        except Exception as e:
+            return HILTestResult(
+                test_name=test_name,
+                passed=False,
+                duration_s=time.time() - start_time,
+                errors=[str(e)],
+            )
+
+        errors = [f"{stats.send_errors} frames failed to send"] if stats.send_errors else []
+        return HILTestResult(
+            test_name=test_name,
+            passed=not errors,
+            duration_s=time.time() - start_time,
+            messages_sent=stats.frames_sent,
+            errors=errors,
+            data={"replay": stats.to_dict()},
+        )
+
     def compare_expected_vs_actual(
         self,
         expected: pd.DataFrame,
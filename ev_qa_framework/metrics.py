@@ -6,7 +6,7 @@ text format so they can be scraped by a Prometheus server or consumed
 directly by Grafana via the built-in Prometheus datasource.
 """
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 # -- Battery state gauges (instantaneous readings) --
 
@@ -53,3 +53,43 @@ battery_cell_imbalance_max = Gauge(
     "Maximum voltage imbalance among cells (V)",
     ["vehicle_id"],
 )
+
+# -- Analysis API (micro-batching) --
+
+api_analysis_queue_depth = Gauge(
+    "api_analysis_queue_depth",
+    "Analysis requests waiting to be batched",
+)
+
+api_analysis_queue_wait_seconds = Histogram(
+    "api_analysis_queue_wait_seconds",
+    "Time an analysis request waits before its batch starts",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+api_analysis_latency_seconds = Histogram(
+    "api_analysis_latency_seconds",
+    "End-to-end latency of an analysis request",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+api_analysis_batch_size = Histogram(
+    "api_analysis_batch_size",
+    "Number of analysis requests coalesced into one batch",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+
+# -- BMS polling scheduler --
+
+bms_poll_latency_seconds = Histogram(
+    "bms_poll_latency_seconds",
+    "Latency of successful BMS telemetry reads",
+    ["device_id"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+bms_poll_misses_total = Counter(
+    "bms_poll_misses_total",
+    "BMS polls that produced no telemetry",
+    ["device_id", "reason"],
+)
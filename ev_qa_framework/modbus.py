@@ -9,7 +9,8 @@ Supports:
   03 (Read Holding Registers), 04 (Read Input Registers),
   05 (Write Single Coil), 06 (Write Single Register),
   15 (Write Multiple Coils), 16 (Write Multiple Registers)
-- CRC-16 validation for RTU frames
+- CRC-16 validation for RTU frames (table-driven, plus a batched NumPy
+  variant for validating captured frames offline)
 - Unit ID routing for multi-device RS-485 networks
 - BMS register map for common battery telemetry
 
@@ -17,6 +18,7 @@ Architecture:
     ModbusClient (base)
     ├── ModbusTCPClient  — TCP socket transport
     └── ModbusRTUClient  — serial (RS-485) transport
+    AsyncModbusTCPClient — asyncio TCP transport with pipelined transactions
 
 Usage:
     # Modbus TCP
@@ -31,18 +33,26 @@ Usage:
     client.connect()
     telemetry = client.read_battery_telemetry()
     client.disconnect()
+
+    # Modbus TCP, pipelined (one round-trip per telemetry snapshot)
+    async with AsyncModbusTCPClient("192.168.1.100") as client:
+        telemetry = await client.read_battery_telemetry()
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import socket
 import struct
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 from enum import IntEnum
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -224,11 +234,56 @@ FAULT_FLAGS = {
 }
 
 
+def coalesce_register_ranges(
+    ranges: Iterable[tuple[int, int]], max_gap: int = 16, max_quantity: int = 125
+) -> list[tuple[int, int]]:
+    """Merge ``(address, count)`` ranges into the fewest contiguous reads.
+
+    Ranges that overlap, touch, or are separated by at most *max_gap*
+    unused registers are combined, as long as the merged read stays within
+    *max_quantity* registers (125 for FC03).
+
+    Returns:
+        Sorted list of ``(start_address, quantity)`` reads.
+    """
+    merged: list[list[int]] = []
+    for address, count in sorted(ranges):
+        end = address + count
+        if merged and address - merged[-1][1] <= max_gap and end - merged[-1][0] <= max_quantity:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([address, end])
+    return [(start, end - start) for start, end in merged]
+
+
+# Reads covering the whole BMS register map (0x0000-0x0031 in one request)
+BMS_READ_PLAN: list[tuple[int, int]] = coalesce_register_ranges(
+    (reg["address"], reg["count"]) for reg in BMS_REGISTER_MAP.values()
+)
+
+
+def _decode_register(reg: dict[str, Any], raw: Sequence[int]) -> Any:
+    """Scale raw register words according to a BMS_REGISTER_MAP entry."""
+    if reg.get("wide"):
+        value = (raw[0] << 16) | raw[1]
+    elif reg.get("signed"):
+        value = raw[0]
+        if value >= 0x8000:
+            value -= 0x10000
+    else:
+        value = raw[0]
+
+    scaled = value * reg["scale"]
+    if "offset" in reg:
+        scaled += reg["offset"]
+    return scaled
+
+
 # ── CRC-16 (Modbus) ────────────────────────────────────────────────────────
 
 
-def _crc16_modbus(data: bytes) -> int:
-    """Compute Modbus CRC-16 (polynomial 0x8001, init 0xFFFF)."""
+def _crc16_modbus_bitwise(data: bytes) -> int:
+    """Bit-by-bit Modbus CRC-16; reference for the table-driven version."""
     crc = 0xFFFF
     for byte in data:
         crc ^= byte
@@ -240,6 +295,102 @@ def _crc16_modbus(data: bytes) -> int:
     return crc
 
 
+def _build_crc16_table() -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 0x0001 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _build_crc16_table()
+_CRC16_TABLE_NP = np.array(_CRC16_TABLE, dtype=np.uint16)
+
+
+def _crc16_modbus(data: bytes) -> int:
+    """Compute Modbus CRC-16 (polynomial 0x8001, init 0xFFFF)."""
+    crc = 0xFFFF
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def _frame_matrix(
+    frames: Sequence[bytes] | np.ndarray, lengths: Sequence[int] | np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pack frames into a zero-padded ``(N, max_len)`` uint8 matrix plus lengths."""
+    if isinstance(frames, np.ndarray):
+        if frames.ndim != 2:
+            raise ValueError(f"frames array must be 2-D, got shape {frames.shape}")
+        data = np.ascontiguousarray(frames, dtype=np.uint8)
+        if lengths is None:
+            lengths = np.full(len(data), data.shape[1], dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if lengths.shape != (len(data),) or (lengths > data.shape[1]).any():
+            raise ValueError("lengths must give one length per row, within the row width")
+        return data, lengths
+
+    frames = [bytes(frame) for frame in frames]
+    lengths = np.fromiter((len(frame) for frame in frames), dtype=np.int64, count=len(frames))
+    width = int(lengths.max()) if len(frames) else 0
+    data = np.zeros((len(frames), width), dtype=np.uint8)
+    data[np.arange(width) < lengths[:, None]] = np.frombuffer(b"".join(frames), dtype=np.uint8)
+    return data, lengths
+
+
+def crc16_modbus_batch(
+    frames: Sequence[bytes] | np.ndarray, lengths: Sequence[int] | np.ndarray | None = None
+) -> np.ndarray:
+    """Compute the Modbus CRC-16 of many frames at once.
+
+    The table lookup runs column by column across all frames, so the Python
+    loop is over byte positions rather than bytes.
+
+    Args:
+        frames: Sequence of byte strings, or a 2-D uint8 array (one frame per row).
+        lengths: For array input, the number of valid bytes in each row.
+            Defaults to the full row width.
+
+    Returns:
+        uint16 array with one CRC per frame.
+    """
+    data, lengths = _frame_matrix(frames, lengths)
+    crc = np.full(len(data), 0xFFFF, dtype=np.uint16)
+    ragged = bool((lengths != data.shape[1]).any())
+    for col in range(data.shape[1]):
+        updated = (crc >> 8) ^ _CRC16_TABLE_NP[(crc ^ data[:, col]) & 0xFF]
+        crc = np.where(col < lengths, updated, crc) if ragged else updated
+    return crc
+
+
+def validate_crc_batch(
+    frames: Sequence[bytes] | np.ndarray, lengths: Sequence[int] | np.ndarray | None = None
+) -> np.ndarray:
+    """Validate the trailing CRC of many captured RTU frames at once.
+
+    Args:
+        frames: Sequence of byte strings, or a 2-D uint8 array (one frame per row).
+        lengths: For array input, the number of valid bytes in each row.
+
+    Returns:
+        Boolean array, ``True`` where the frame's CRC matches. Frames
+        shorter than 4 bytes are invalid, as in ``_validate_crc``.
+    """
+    data, lengths = _frame_matrix(frames, lengths)
+    valid = lengths >= 4
+    if not valid.any():
+        return valid
+    rows = np.arange(len(data))
+    body_lengths = np.maximum(lengths - 2, 0)
+    crc_lo = data[rows, body_lengths].astype(np.uint16)
+    crc_hi = data[rows, np.where(valid, lengths - 1, 0)].astype(np.uint16)
+    received = crc_lo | (crc_hi << 8)
+    return valid & (crc16_modbus_batch(data, body_lengths) == received)
+
+
 def _validate_crc(frame: bytes) -> bool:
     """Validate CRC of an RTU response frame."""
     if len(frame) < 4:
@@ -511,20 +662,7 @@ class ModbusClient(ABC):
             )
         reg = BMS_REGISTER_MAP[name]
         raw = self.read_holding_registers(reg["address"], reg["count"])
-
-        if reg.get("wide"):
-            value = (raw[0] << 16) | raw[1]
-        elif reg.get("signed"):
-            value = raw[0]
-            if value >= 0x8000:
-                value -= 0x10000
-        else:
-            value = raw[0]
-
-        scaled = value * reg["scale"]
-        if "offset" in reg:
-            scaled += reg["offset"]
-        return scaled
+        return _decode_register(reg, raw)
 
     def health_check(self) -> dict[str, Any]:
         """Perform a health check by reading the status register.
@@ -798,6 +936,13 @@ class ModbusRTUClient(ModbusClient):
             self._serial = None
             raise ModbusConnectionError(f"Failed to open serial port {self.port}: {e}") from e
 
+    def set_baudrate(self, baudrate: int) -> None:
+        """Switch baud rate, reconfiguring the open port in place if connected."""
+        self.baudrate = baudrate
+        if self._serial is not None:
+            self._serial.baudrate = baudrate
+            self._serial.reset_input_buffer()
+
     def disconnect(self) -> None:
         """Close the serial connection."""
         if self._serial:
@@ -884,3 +1029,242 @@ class ModbusRTUClient(ModbusClient):
             raise ModbusResponseError(f"RTU frame too short: {len(frame)} bytes")
         # Strip unit_id (first byte) and CRC (last 2 bytes)
         return frame[1:-2]
+
+
+# ── Async Modbus TCP Client ─────────────────────────────────────────────────
+
+
+class AsyncModbusTCPClient:
+    """Pipelined asyncio Modbus TCP client.
+
+    Keeps up to ``max_in_flight`` transactions outstanding on one
+    connection and matches responses to requests by MBAP transaction ID,
+    so concurrent reads cost one round-trip instead of one each.
+    ``read_battery_telemetry`` fetches the whole ``BMS_REGISTER_MAP`` with
+    the coalesced :data:`BMS_READ_PLAN`.
+
+    Args:
+        host: IP address or hostname of the BMS.
+        port: TCP port (default 502).
+        unit_id: Modbus unit/slave ID (1-247).
+        timeout: Per-transaction response timeout in seconds.
+        retries: Number of attempts for a transaction that times out.
+        max_in_flight: Maximum number of outstanding transactions.
+        max_gap: Largest run of unmapped registers a coalesced read may span.
+            Use 0 for devices that reject reads of unmapped registers.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 502,
+        unit_id: int = 1,
+        timeout: float = 3.0,
+        retries: int = 3,
+        max_in_flight: int = 8,
+        max_gap: int = 16,
+    ):
+        if not 1 <= unit_id <= 247:
+            raise ModbusConfigurationError(f"unit_id must be 1-247, got {unit_id}")
+        if max_in_flight < 1:
+            raise ModbusConfigurationError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        self.host = host
+        self.port = port
+        self.unit_id = unit_id
+        self.timeout = timeout
+        self.retries = retries
+        self.max_in_flight = max_in_flight
+        self.read_plan = coalesce_register_ranges(
+            ((reg["address"], reg["count"]) for reg in BMS_REGISTER_MAP.values()),
+            max_gap=max_gap,
+        )
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._slots: asyncio.Semaphore | None = None
+        self._transaction_id = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> bool:
+        """Open the TCP connection and start the response reader."""
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ModbusConnectionError(f"Failed to connect to {self.host}:{self.port}: {e}") from e
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._reader_task = asyncio.create_task(self._read_responses())
+        logger.info("Modbus TCP (async) connected to %s:%d", self.host, self.port)
+        return True
+
+    async def disconnect(self) -> None:
+        """Close the connection and fail any outstanding transactions."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+        self._fail_pending(ModbusConnectionError("Connection closed"))
+        logger.info("Modbus TCP (async) disconnected from %s:%d", self.host, self.port)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
+    # ── Standard Modbus Operations ──────────────────────────────────────
+
+    async def read_holding_registers(self, start_address: int, quantity: int) -> list[int]:
+        """Read holding registers (Function Code 03)."""
+        if not 1 <= quantity <= 125:
+            raise ModbusConfigurationError(f"quantity must be 1-125, got {quantity}")
+        pdu = _build_read_pdu(FunctionCode.READ_HOLDING_REGISTERS, start_address, quantity)
+        response = await self._transact(pdu)
+        return _parse_read_response(response, FunctionCode.READ_HOLDING_REGISTERS, quantity)
+
+    async def read_input_registers(self, start_address: int, quantity: int) -> list[int]:
+        """Read input registers (Function Code 04)."""
+        if not 1 <= quantity <= 123:
+            raise ModbusConfigurationError(f"quantity must be 1-123, got {quantity}")
+        pdu = _build_read_pdu(FunctionCode.READ_INPUT_REGISTERS, start_address, quantity)
+        response = await self._transact(pdu)
+        return _parse_read_response(response, FunctionCode.READ_INPUT_REGISTERS, quantity)
+
+    async def write_single_register(self, register_address: int, value: int) -> None:
+        """Write a single holding register (Function Code 06)."""
+        response = await self._transact(_build_write_single_register_pdu(register_address, value))
+        self._check_write_response(response, "Write")
+
+    async def write_multiple_registers(self, start_address: int, values: list[int]) -> None:
+        """Write multiple holding registers (Function Code 16)."""
+        if not 1 <= len(values) <= 123:
+            raise ModbusConfigurationError(f"values length must be 1-123, got {len(values)}")
+        response = await self._transact(_build_write_multiple_registers_pdu(start_address, values))
+        self._check_write_response(response, "Write multiple")
+
+    async def read_register_blocks(self, ranges: Sequence[tuple[int, int]]) -> list[list[int]]:
+        """Read several ``(address, count)`` holding-register ranges concurrently."""
+        return list(await asyncio.gather(*(self.read_holding_registers(a, n) for a, n in ranges)))
+
+    # ── BMS-specific Operations ─────────────────────────────────────────
+
+    async def read_battery_telemetry(self) -> dict[str, Any]:
+        """Read all battery telemetry using the coalesced register plan.
+
+        Returns:
+            Same dict as ``ModbusClient.read_battery_telemetry``.
+        """
+        blocks = await self.read_register_blocks(self.read_plan)
+        registers: dict[int, int] = {}
+        for (start, _), values in zip(self.read_plan, blocks):
+            registers.update(zip(range(start, start + len(values)), values))
+
+        telemetry: dict[str, Any] = {}
+        for name, reg in BMS_REGISTER_MAP.items():
+            raw = [registers[reg["address"] + i] for i in range(reg["count"])]
+            telemetry[name] = _decode_register(reg, raw)
+        telemetry["fault_flags"] = ModbusClient._decode_fault_flags(telemetry["fault_flags"])
+        return telemetry
+
+    # ── Internal Methods ────────────────────────────────────────────────
+
+    def _next_tid(self) -> int:
+        """Next free transaction ID (wraps at 65535, skips IDs still in flight)."""
+        while True:
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            if self._transaction_id not in self._pending:
+                return self._transaction_id
+
+    async def _transact(self, pdu: bytes) -> bytes:
+        """Send one request PDU and return the matching response PDU."""
+        if not self.is_connected or self._slots is None:
+            raise ModbusConnectionError("Not connected")
+        last_error: Exception | None = None
+        async with self._slots:
+            for attempt in range(self.retries):
+                tid = self._next_tid()
+                future = asyncio.get_running_loop().create_future()
+                self._pending[tid] = future
+                try:
+                    self._writer.write(_build_tcp_mbap(tid, 1 + len(pdu), self.unit_id) + pdu)
+                    await self._writer.drain()
+                    return await asyncio.wait_for(future, self.timeout)
+                except asyncio.TimeoutError as e:
+                    last_error = e
+                    logger.warning(
+                        "Modbus transaction %d attempt %d/%d timed out",
+                        tid,
+                        attempt + 1,
+                        self.retries,
+                    )
+                except OSError as e:
+                    raise ModbusConnectionError(f"Send failed: {e}") from e
+                finally:
+                    self._pending.pop(tid, None)
+        raise ModbusTimeoutError(f"Transaction failed after {self.retries} attempts: {last_error}")
+
+    async def _read_responses(self) -> None:
+        """Read MBAP frames and resolve the matching pending transactions."""
+        assert self._reader is not None
+        try:
+            while True:
+                header = await self._reader.readexactly(7)
+                tid, pid, length, uid = struct.unpack(">HHHB", header)
+                if not 1 <= length <= 254:
+                    # Frame boundaries are lost; the stream cannot be resynchronised
+                    raise ModbusResponseError(f"Invalid MBAP length: {length}")
+                pdu = await self._reader.readexactly(length - 1)
+                future = self._pending.get(tid)
+                if future is None or future.done():
+                    logger.debug("Dropping response for unknown transaction %d", tid)
+                    continue
+                if pid != 0x0000:
+                    future.set_exception(ModbusResponseError(f"Invalid protocol ID: 0x{pid:04X}"))
+                elif uid != self.unit_id:
+                    future.set_exception(
+                        ModbusResponseError(f"Unit ID mismatch: got {uid}, expected {self.unit_id}")
+                    )
+                else:
+                    future.set_result(pdu)
+        except ModbusResponseError as e:
+            logger.error(
+                "Modbus TCP (async) %s:%d: %s, dropping connection", self.host, self.port, e
+            )
+            self._fail_pending(e)
+            if self._writer is not None:
+                self._writer.close()
+        except (asyncio.IncompleteReadError, OSError) as e:
+            self._fail_pending(ModbusConnectionError(f"Connection closed by remote: {e}"))
+            if self._writer is not None:
+                self._writer.close()
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _check_write_response(pdu: bytes, operation: str) -> None:
+        if pdu and pdu[0] & 0x80:
+            exc = pdu[1] if len(pdu) > 1 else 0
+            raise ModbusResponseError(
+                f"{operation} exception: code 0x{exc:02X}", exception_code=exc
+            )
+        if len(pdu) < 5:
+            raise ModbusResponseError(f"{operation} response too short")
@@ -10,7 +10,6 @@ internal resistance estimation, thermal diffusivity, and coulombic efficiency.
 from typing import Any
 
 import numpy as np
-from scipy.signal import find_peaks, savgol_filter
 
 
 class PhysicsFeatureExtractor:
@@ -84,6 +83,8 @@ class PhysicsFeatureExtractor:
                 - num_peaks: Number of detected peaks
                 - num_valleys: Number of detected valleys
         """
+        from scipy.signal import find_peaks, savgol_filter
+
         v = np.asarray(voltage, dtype=float)
         q = np.asarray(capacity, dtype=float)
 
@@ -8,12 +8,13 @@ will raise an ImportError only when instantiated, not at import time.
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import joblib
 import numpy as np
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 __all__ = ["SOHPredictor", "_import_tensorflow"]
 
@@ -43,6 +44,8 @@ class SOHPredictor:
     """
 
     def __init__(self, sequence_length: int = 10):
+        from sklearn.preprocessing import MinMaxScaler
+
         self.sequence_length = sequence_length
         self.model: Any | None = None
         self.scaler = MinMaxScaler()
@@ -15,12 +15,13 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import joblib
 import numpy as np
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -85,6 +86,8 @@ class SOHTransformer:
         n_features: int = 3,
         transformer_config: SOHTransformerConfig | None = None,
     ):
+        from sklearn.preprocessing import MinMaxScaler
+
         self.sequence_length = sequence_length
         self.n_features = n_features
         self.model: Any | None = None
@@ -6,13 +6,68 @@ Two modes:
 - ml: Isolation Forest on temperature features
 """
 
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import IsolationForest
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .utils import normalize_columns
 
 
+@dataclass(frozen=True)
+class TemperatureStats:
+    """Summary statistics of a temperature series, computed once and shared.
+
+    ``BatteryScorer`` builds one instance per pack and hands it to the
+    thermal predictor so the series is only scanned once.
+    """
+
+    n: int
+    min: float
+    max: float
+    mean: float
+    std: float  # population std (ddof=0)
+    volatility: float  # sample std (ddof=1)
+    slope: float  # least-squares trend, °C per sample
+    max_rise: float  # largest sample-to-sample increase
+
+    @classmethod
+    def from_temps(cls, temps: np.ndarray) -> "TemperatureStats":
+        """Compute statistics for a 1-D temperature array."""
+        temps = np.asarray(temps, dtype=float)
+        n = len(temps)
+        if n == 0:
+            return cls(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        if n == 1:
+            t = float(temps[0])
+            return cls(1, t, t, t, 0.0, 0.0, 0.0, 0.0)
+        return cls(
+            n=n,
+            min=float(np.min(temps)),
+            max=float(np.max(temps)),
+            mean=float(np.mean(temps)),
+            std=float(np.std(temps)),
+            volatility=float(np.std(temps, ddof=1)),
+            slope=float(np.polyfit(np.arange(n), temps, 1)[0]),
+            max_rise=float(np.max(np.diff(temps))),
+        )
+
+    def trend_features(self) -> dict[str, float]:
+        """Features in the format returned by ``analyze_temperature_trend``."""
+        return {
+            "temp_rise_rate": self.slope,
+            "max_temp": self.max,
+            "volatility": self.volatility,
+            "dt_dt": self.max_rise,
+        }
+
+
 class ThermalRunawayPredictor:
     """
     Predictor for thermal runaway risk in EV batteries.
@@ -27,6 +82,11 @@ class ThermalRunawayPredictor:
         Custom thresholds: critical_temp, high_temp, critical_dtdt, etc.
     contamination : float, default=0.1
         Expected contamination for IsolationForest (only in ML mode).
+    random_state : int, default=42
+        Seed for the IsolationForest and the bootstrap generator.
+    n_bootstrap : int, default=50
+        Bootstrap resamples used for ``confidence_interval`` (capped at the
+        number of samples). 0 disables the bootstrap.
     """
 
     def __init__(
@@ -36,10 +96,15 @@ class ThermalRunawayPredictor:
         thresholds: dict[str, float] | None = None,
         contamination: float = 0.1,
         random_state: int = 42,
+        n_bootstrap: int = 50,
     ):
         self.mode = mode.lower()
         if self.mode not in ("rule", "ml"):
             raise ValueError("mode must be 'rule' or 'ml'")
+        if n_bootstrap < 0:
+            raise ValueError("n_bootstrap must be >= 0")
+        self.n_bootstrap = n_bootstrap
+        self._rng = np.random.default_rng(random_state)
 
         self.rule_weights = {"rise_rate": 2.0, "max_temp": 1.5, "anomaly": 5.0, "dt_dt": 3.0}
         if rule_weights:
@@ -60,6 +125,8 @@ class ThermalRunawayPredictor:
         self._is_fitted = False
 
         if self.mode == "ml":
+            from sklearn.ensemble import IsolationForest
+
             self._isolation_forest = IsolationForest(
                 contamination=contamination,
                 random_state=random_state,
@@ -75,27 +142,7 @@ class ThermalRunawayPredictor:
         df_recent = normalize_columns(df_recent)
         if df_recent.empty or "temp" not in df_recent.columns:
             return {"temp_rise_rate": 0.0, "max_temp": 0.0, "volatility": 0.0, "dt_dt": 0.0}
-        temps = df_recent["temp"].values
-        n = len(temps)
-
-        if n < 2:
-            return {
-                "temp_rise_rate": 0.0,
-                "max_temp": float(temps[0]) if n == 1 else 0.0,
-                "volatility": 0.0,
-                "dt_dt": 0.0,
-            }
-
-        slope = float(np.polyfit(np.arange(n), temps, 1)[0])
-        gradients = np.diff(temps)
-        max_dt = float(np.max(gradients)) if len(gradients) > 0 else 0.0
-
-        return {
-            "temp_rise_rate": slope,
-            "max_temp": float(np.max(temps)),
-            "volatility": float(np.std(temps, ddof=1)),
-            "dt_dt": max_dt,
-        }
+        return TemperatureStats.from_temps(df_recent["temp"].to_numpy()).trend_features()
 
     def predict_risk(self, df_recent: pd.DataFrame) -> dict[str, object]:
         """Predict thermal runaway risk.
@@ -112,23 +159,33 @@ class ThermalRunawayPredictor:
             - Rule mode: proportion of temps deviating >2sigma from mean
             - ML mode: proportion of IsolationForest scores below -0.5
         """
-        """
-        Predict thermal runaway risk.
-
-        Returns dict: risk_level (LOW/MEDIUM/HIGH/CRITICAL), risk_score, confidence
-        """
         df_recent = normalize_columns(df_recent)
         if df_recent.empty or "temp" not in df_recent.columns:
             return {"risk_level": "LOW", "risk_score": 0.0, "confidence": 0.0}
-        if len(df_recent) < 2:
+        return self.predict_risk_from_temps(df_recent["temp"].to_numpy())
+
+    def predict_risk_from_temps(
+        self, temps: np.ndarray, stats: TemperatureStats | None = None
+    ) -> dict[str, object]:
+        """Predict thermal runaway risk from a bare temperature array.
+
+        Same result as :meth:`predict_risk`, without DataFrame handling.
+        Pass *stats* when they have already been computed for *temps*.
+        """
+        temps = np.asarray(temps)
+        if len(temps) == 0:
+            return {"risk_level": "LOW", "risk_score": 0.0, "confidence": 0.0}
+        if len(temps) < 2:
             return {"risk_level": "LOW", "risk_score": 0.0, "confidence": 1.0}
 
-        features = self.analyze_temperature_trend(df_recent)
+        if stats is None:
+            stats = TemperatureStats.from_temps(temps)
+        features = stats.trend_features()
         current_temp = features["max_temp"]
 
         if self.mode == "ml" and self._isolation_forest is not None:
             # ML mode, need to fit first
-            X = df_recent[["temp"]].values
+            X = temps.reshape(-1, 1)
             if not self._is_fitted:
                 self._isolation_forest.fit(X)
                 self._is_fitted = True
@@ -136,44 +193,14 @@ class ThermalRunawayPredictor:
             scores = self._isolation_forest.score_samples(X)
             anomaly_score = float(np.mean(scores < -0.5))
         else:
-            temps = df_recent["temp"].values
-            mean, std = float(np.mean(temps)), float(np.std(temps))
-            anomaly_score = float(np.sum(np.abs(temps - mean) > 2 * std)) / len(temps)
+            anomaly_score = float(np.sum(np.abs(temps - stats.mean) > 2 * stats.std)) / len(temps)
 
-        risk_score = (
-            features["temp_rise_rate"] * self.rule_weights["rise_rate"]
-            + max(0, features["max_temp"] - 50) * self.rule_weights["max_temp"]
-            + anomaly_score * self.rule_weights["anomaly"]
-            + features["dt_dt"] * self.rule_weights["dt_dt"]
-        )
-        # Temperature penalty already applied in _rule_score()
-        # The rule_weights["max_temp"] already handles temperature scoring above
-
-        risk_level = "LOW"
-        if (
-            risk_score > self.thresholds["critical_risk"]
-            or current_temp > self.thresholds["critical_temp"]
-        ):
-            risk_level = "CRITICAL"
-        elif features["dt_dt"] > self.thresholds["critical_dtdt"]:
-            risk_level = "CRITICAL"
-        elif (
-            risk_score > self.thresholds["high_risk"] or current_temp > self.thresholds["high_temp"]
-        ):
-            risk_level = "HIGH"
-        elif risk_score > self.thresholds["medium_risk"]:
-            risk_level = "MEDIUM"
+        risk_score = self._risk_score(features, anomaly_score)
+        risk_level = self._classify(risk_score, current_temp, features["dt_dt"])
 
         # Uncertainty quantification via bootstrap
-        temps = df_recent["temp"].values
-        n_bootstrap = min(50, len(temps))
-        bootstrap_scores = []
-        for _ in range(n_bootstrap):
-            sample = list(temps)
-            np.random.shuffle(sample)
-            s = np.array(sample[: max(5, len(sample) // 2)])
-            bootstrap_scores.append(self._rule_score(s))
-        score_std = float(np.std(bootstrap_scores)) if bootstrap_scores else 0.0
+        bootstrap_scores = self._bootstrap_scores(temps)
+        score_std = float(np.std(bootstrap_scores)) if len(bootstrap_scores) else 0.0
         ci_lower = max(0.0, risk_score - 1.96 * score_std)
         ci_upper = min(1.0, risk_score + 1.96 * score_std)
 
@@ -186,20 +213,389 @@ class ThermalRunawayPredictor:
             **features,
         }
 
+    def _risk_score(self, features: dict[str, float], anomaly_score: float) -> float:
+        """Weighted rule score from trend features and the anomaly share."""
+        return (
+            features["temp_rise_rate"] * self.rule_weights["rise_rate"]
+            + max(0, features["max_temp"] - 50) * self.rule_weights["max_temp"]
+            + anomaly_score * self.rule_weights["anomaly"]
+            + features["dt_dt"] * self.rule_weights["dt_dt"]
+        )
+
+    def _classify(self, risk_score: float, current_temp: float, dt_dt: float) -> str:
+        """Map a risk score and temperature extremes to a risk level."""
+        if (
+            risk_score > self.thresholds["critical_risk"]
+            or current_temp > self.thresholds["critical_temp"]
+        ):
+            return "CRITICAL"
+        if dt_dt > self.thresholds["critical_dtdt"]:
+            return "CRITICAL"
+        if risk_score > self.thresholds["high_risk"] or current_temp > self.thresholds["high_temp"]:
+            return "HIGH"
+        if risk_score > self.thresholds["medium_risk"]:
+            return "MEDIUM"
+        return "LOW"
+
+    def _bootstrap_scores(self, temps: np.ndarray) -> np.ndarray:
+        """Rule scores of shuffled half-samples of *temps*, in one batch.
+
+        Each row of the ``(B, k)`` index matrix holds the first ``k`` entries
+        of an independent permutation of the series.
+        """
+        n = len(temps)
+        n_resamples = min(self.n_bootstrap, n)
+        if n_resamples == 0 or n < 2:
+            return np.empty(0)
+        k = min(n, max(5, n // 2))
+        idx = self._rng.permuted(np.tile(np.arange(n), (n_resamples, 1)), axis=1)[:, :k]
+        return self._rule_scores_batch(np.asarray(temps, dtype=float)[idx])
+
+    def _rule_scores_batch(self, samples: np.ndarray) -> np.ndarray:
+        """Row-wise :meth:`_rule_score` for a ``(B, k)`` matrix, k >= 2."""
+        k = samples.shape[1]
+        # Closed-form least-squares slope against x = 0..k-1 (centred)
+        x = np.arange(k) - (k - 1) / 2.0
+        slopes = samples @ x / (x @ x)
+        max_temp = samples.max(axis=1)
+        dt_dt = np.diff(samples, axis=1).max(axis=1)
+        mean = samples.mean(axis=1, keepdims=True)
+        std = samples.std(axis=1, keepdims=True)
+        anomaly_score = np.count_nonzero(np.abs(samples - mean) > 2 * std, axis=1) / k
+        return (
+            slopes * self.rule_weights["rise_rate"]
+            + np.maximum(0, max_temp - 50) * self.rule_weights["max_temp"]
+            + anomaly_score * self.rule_weights["anomaly"]
+            + dt_dt * self.rule_weights["dt_dt"]
+        )
+
     def _rule_score(self, temps: np.ndarray) -> float:
         """Compute rule-based risk score from temperature array."""
-        n = len(temps)
-        if n < 2:
+        if len(temps) < 2:
             return 0.0
-        slope = float(np.polyfit(np.arange(n), temps, 1)[0])
-        max_temp = float(np.max(temps))
-        gradients = np.diff(temps)
-        dt_dt = float(np.max(gradients)) if len(gradients) > 0 else 0.0
-        mean, std = float(np.mean(temps)), float(np.std(temps))
-        anomaly_score = float(np.sum(np.abs(temps - mean) > 2 * std)) / len(temps)
+        stats = TemperatureStats.from_temps(temps)
+        anomaly_score = float(np.sum(np.abs(temps - stats.mean) > 2 * stats.std)) / len(temps)
         return (
-            slope * self.rule_weights["rise_rate"]
-            + max(0, max_temp - 50) * self.rule_weights["max_temp"]
+            stats.slope * self.rule_weights["rise_rate"]
+            + max(0, stats.max - 50) * self.rule_weights["max_temp"]
             + anomaly_score * self.rule_weights["anomaly"]
-            + dt_dt * self.rule_weights["dt_dt"]
+            + stats.max_rise * self.rule_weights["dt_dt"]
         )
+
+
+def _rule_predictor(predictor: ThermalRunawayPredictor | None) -> ThermalRunawayPredictor:
+    predictor = predictor if predictor is not None else ThermalRunawayPredictor()
+    if predictor.mode != "rule":
+        raise ValueError("rolling monitors support rule mode only")
+    return predictor
+
+
+def _window_slope(count: int, sum_y, sum_xy):
+    """Least-squares slope of y against x = 0..count-1 from running sums."""
+    sum_x = count * (count - 1) / 2.0
+    sum_xx = (count - 1) * count * (2 * count - 1) / 6.0
+    return (count * sum_xy - sum_x * sum_y) / (count * sum_xx - sum_x * sum_x)
+
+
+class ThermalRunawayMonitor:
+    """
+    Rolling-window thermal runaway risk for a single vehicle.
+
+    Feeds one temperature sample at a time and returns the same
+    risk_level / risk_score as ``ThermalRunawayPredictor.predict_risk`` on
+    the last ``window_size`` samples (without the bootstrap interval).
+
+    The slope comes from running least-squares sums, the window min, max
+    and max dT/dt from monotonic deques, and mean/variance from a sliding
+    Welford update, so each sample costs O(1). The 2-sigma outlier share is
+    one vectorised comparison over the ring buffer. Running sums are
+    recomputed from the buffer once per window to bound float drift.
+
+    Parameters
+    ----------
+    window_size : int, default=60
+        Number of most recent samples to evaluate (>= 2).
+    predictor : ThermalRunawayPredictor, optional
+        Source of rule weights and thresholds. Must be in rule mode.
+    """
+
+    def __init__(self, window_size: int = 60, predictor: ThermalRunawayPredictor | None = None):
+        if window_size < 2:
+            raise ValueError("window_size must be >= 2")
+        self.window_size = window_size
+        self.predictor = _rule_predictor(predictor)
+        self._buf = np.zeros(window_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._n_seen = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_xy = 0.0  # sum of (position in window) * temp
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._prev: float | None = None
+        self._min_q: deque[tuple[int, float]] = deque()
+        self._max_q: deque[tuple[int, float]] = deque()
+        self._rise_q: deque[tuple[int, float]] = deque()  # keyed by index of later sample
+
+    def __len__(self) -> int:
+        return self._count
+
+    def update(self, temp: float) -> dict[str, object]:
+        """Add one temperature sample and return the current risk assessment."""
+        temp = float(temp)
+        n = self.window_size
+        i = self._n_seen
+        slot = i % n
+
+        if self._count == n:
+            old = self._buf[slot]
+            # Dropping the oldest sample shifts every remaining x down by one
+            self._sum_xy += (n - 1) * temp - (self._sum - old)
+            self._sum += temp - old
+            new_mean = self._mean + (temp - old) / n
+            self._m2 += (temp - old) * (temp - new_mean + old - self._mean)
+            self._mean = new_mean
+        else:
+            self._sum_xy += self._count * temp
+            self._sum += temp
+            self._count += 1
+            delta = temp - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (temp - self._mean)
+        self._buf[slot] = temp
+        self._n_seen += 1
+        start = self._n_seen - self._count
+
+        min_q = self._min_q
+        while min_q and min_q[-1][1] >= temp:
+            min_q.pop()
+        min_q.append((i, temp))
+        while min_q[0][0] < start:
+            min_q.popleft()
+
+        max_q = self._max_q
+        while max_q and max_q[-1][1] <= temp:
+            max_q.pop()
+        max_q.append((i, temp))
+        while max_q[0][0] < start:
+            max_q.popleft()
+
+        rise_q = self._rise_q
+        if self._prev is not None:
+            rise = temp - self._prev
+            while rise_q and rise_q[-1][1] <= rise:
+                rise_q.pop()
+            rise_q.append((i, rise))
+        while rise_q and rise_q[0][0] <= start:
+            rise_q.popleft()
+        self._prev = temp
+
+        if self._n_seen % n == 0:
+            self._resync()
+        return self._evaluate()
+
+    @property
+    def stats(self) -> TemperatureStats:
+        """Current window statistics."""
+        count = self._count
+        if count < 2:
+            t = float(self._buf[(self._n_seen - 1) % self.window_size]) if count else 0.0
+            return TemperatureStats(count, t, t, t, 0.0, 0.0, 0.0, 0.0)
+        m2 = max(self._m2, 0.0)
+        return TemperatureStats(
+            n=count,
+            min=self._min_q[0][1],
+            max=self._max_q[0][1],
+            mean=self._mean,
+            std=float(np.sqrt(m2 / count)),
+            volatility=float(np.sqrt(m2 / (count - 1))),
+            slope=float(_window_slope(count, self._sum, self._sum_xy)),
+            max_rise=self._rise_q[0][1],
+        )
+
+    def _window(self) -> np.ndarray:
+        return self._buf if self._count == self.window_size else self._buf[: self._count]
+
+    def _resync(self) -> None:
+        # Called when the oldest sample sits in slot 0, so the buffer is in order
+        window = self._window()
+        self._sum = float(window.sum())
+        self._sum_xy = float(np.arange(self._count) @ window)
+        self._mean = float(window.mean())
+        self._m2 = float(((window - self._mean) ** 2).sum())
+
+    def _evaluate(self) -> dict[str, object]:
+        if self._count < 2:
+            return {"risk_level": "LOW", "risk_score": 0.0, "confidence": 1.0}
+        stats = self.stats
+        features = stats.trend_features()
+        window = self._window()
+        anomaly_score = np.count_nonzero(np.abs(window - stats.mean) > 2 * stats.std)
+        anomaly_score = float(anomaly_score) / self._count
+        risk_score = self.predictor._risk_score(features, anomaly_score)
+        return {
+            "risk_level": self.predictor._classify(risk_score, stats.max, stats.max_rise),
+            "risk_score": round(risk_score, 2),
+            "confidence": round(max(0.0, 1.0 - anomaly_score), 2),
+            **features,
+        }
+
+
+class FleetThermalMonitor:
+    """
+    Rolling-window thermal runaway risk for many vehicles sampled together.
+
+    Vectorised counterpart of :class:`ThermalRunawayMonitor`: state lives in
+    ``(n_vehicles, window_size)`` arrays and each :meth:`update` takes one
+    temperature per vehicle. Window max and max dT/dt are kept as running
+    maxima and only rescanned for the rows whose evicted value was the max.
+
+    Parameters
+    ----------
+    n_vehicles : int
+        Number of vehicles (rows).
+    window_size : int, default=60
+        Number of most recent samples to evaluate (>= 2).
+    predictor : ThermalRunawayPredictor, optional
+        Source of rule weights and thresholds. Must be in rule mode.
+    """
+
+    def __init__(
+        self,
+        n_vehicles: int,
+        window_size: int = 60,
+        predictor: ThermalRunawayPredictor | None = None,
+    ):
+        if n_vehicles < 1:
+            raise ValueError("n_vehicles must be >= 1")
+        if window_size < 2:
+            raise ValueError("window_size must be >= 2")
+        self.n_vehicles = n_vehicles
+        self.window_size = window_size
+        self.predictor = _rule_predictor(predictor)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        shape = (self.n_vehicles, self.window_size)
+        self._buf = np.zeros(shape)
+        self._rise = np.full(shape, -np.inf)  # diff stored in the later sample's slot
+        self._n_seen = 0
+        self._count = 0
+        self._sum = np.zeros(self.n_vehicles)
+        self._sum_xy = np.zeros(self.n_vehicles)
+        self._mean = np.zeros(self.n_vehicles)
+        self._m2 = np.zeros(self.n_vehicles)
+        self._max = np.full(self.n_vehicles, -np.inf)
+        self._max_rise = np.full(self.n_vehicles, -np.inf)
+
+    def update(self, temps) -> dict[str, np.ndarray]:
+        """Add one sample per vehicle and return per-vehicle risk arrays.
+
+        Returns a dict of arrays keyed like ``predict_risk``: risk_level,
+        risk_score, confidence, temp_rise_rate, max_temp, volatility, dt_dt.
+        """
+        temps = np.asarray(temps, dtype=float)
+        if temps.shape != (self.n_vehicles,):
+            raise ValueError(f"expected {self.n_vehicles} temperatures, got shape {temps.shape}")
+        n = self.window_size
+        i = self._n_seen
+        slot = i % n
+
+        if self._count == n:
+            old = self._buf[:, slot].copy()
+            self._sum_xy += (n - 1) * temps - (self._sum - old)
+            self._sum += temps - old
+            new_mean = self._mean + (temps - old) / n
+            self._m2 += (temps - old) * (temps - new_mean + old - self._mean)
+            self._mean = new_mean
+            stale_max = (old >= self._max) & (temps < self._max)
+        else:
+            self._sum_xy += self._count * temps
+            self._sum += temps
+            self._count += 1
+            delta = temps - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (temps - self._mean)
+            stale_max = None
+        if i > 0:
+            rise = temps - self._buf[:, (slot - 1) % n]
+            self._rise[:, slot] = rise
+            np.maximum(self._max_rise, rise, out=self._max_rise)
+        self._buf[:, slot] = temps
+        self._n_seen += 1
+        np.maximum(self._max, temps, out=self._max)
+        if stale_max is not None and stale_max.any():
+            self._max[stale_max] = self._buf[stale_max].max(axis=1)
+
+        if self._count == n:
+            # The oldest sample's predecessor just left the window
+            nxt = (slot + 1) % n
+            evicted = self._rise[:, nxt].copy()
+            self._rise[:, nxt] = -np.inf
+            stale_rise = evicted >= self._max_rise
+            if stale_rise.any():
+                self._max_rise[stale_rise] = self._rise[stale_rise].max(axis=1)
+
+        if self._n_seen % n == 0:
+            self._resync()
+        return self._evaluate()
+
+    def _window(self) -> np.ndarray:
+        return self._buf if self._count == self.window_size else self._buf[:, : self._count]
+
+    def _resync(self) -> None:
+        window = self._window()
+        self._sum = window.sum(axis=1)
+        self._sum_xy = window @ np.arange(self._count)
+        self._mean = window.mean(axis=1)
+        self._m2 = ((window - self._mean[:, None]) ** 2).sum(axis=1)
+        self._max = window.max(axis=1)
+        self._max_rise = self._rise.max(axis=1)
+
+    def _evaluate(self) -> dict[str, np.ndarray]:
+        count = self._count
+        v = self.n_vehicles
+        if count < 2:
+            return {
+                "risk_level": np.full(v, "LOW", dtype=object),
+                "risk_score": np.zeros(v),
+                "confidence": np.ones(v),
+            }
+        m2 = np.maximum(self._m2, 0.0)
+        std = np.sqrt(m2 / count)
+        slope = _window_slope(count, self._sum, self._sum_xy)
+        window = self._window()
+        outliers = np.abs(window - self._mean[:, None]) > 2 * std[:, None]
+        anomaly_score = np.count_nonzero(outliers, axis=1) / count
+
+        w = self.predictor.rule_weights
+        th = self.predictor.thresholds
+        risk_score = (
+            slope * w["rise_rate"]
+            + np.maximum(0, self._max - 50) * w["max_temp"]
+            + anomaly_score * w["anomaly"]
+            + self._max_rise * w["dt_dt"]
+        )
+        critical = (
+            (risk_score > th["critical_risk"])
+            | (self._max > th["critical_temp"])
+            | (self._max_rise > th["critical_dtdt"])
+        )
+        high = (risk_score > th["high_risk"]) | (self._max > th["high_temp"])
+        medium = risk_score > th["medium_risk"]
+        risk_level = np.select(
+            [critical, high, medium], ["CRITICAL", "HIGH", "MEDIUM"], default="LOW"
+        ).astype(object)
+        return {
+            "risk_level": risk_level,
+            "risk_score": np.round(risk_score, 2),
+            "confidence": np.round(np.maximum(0.0, 1.0 - anomaly_score), 2),
+            "temp_rise_rate": slope,
+            "max_temp": self._max.copy(),
+            "volatility": np.sqrt(m2 / (count - 1)),
+            "dt_dt": self._max_rise.copy(),
+        }
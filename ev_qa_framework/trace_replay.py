@@ -0,0 +1,287 @@
+"""Replay of recorded CAN traces for HIL tests and offline analytics.
+
+A :class:`TraceReplayer` memory-maps a recording written by
+:class:`~ev_qa_framework.can_recorder.CANRecorder`, so hours of field
+traffic cost no more RAM than the pages currently being touched. The same
+file can be
+
+- replayed into a python-can bus, a :class:`~ev_qa_framework.hil.HILInterface`
+  or any callable, at original timing, N× speed, or as fast as possible;
+- iterated as zero-copy NumPy views (:meth:`TraceReplayer.iter_chunks`) or
+  as :class:`~ev_qa_framework.vector_export.FrameBatch` chunks, which is
+  what ``VectorExporter.iter_frames`` uses for ``.evcan`` files.
+
+Usage:
+    replayer = TraceReplayer("drive.evcan")
+    stats = replayer.replay(bus, speed=10.0, start=60.0, end=120.0)
+
+    for chunk in replayer.iter_chunks(can_ids=[0x101]):
+        chunk["timestamp"], chunk["data"][:, :2]
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import can
+import numpy as np
+
+from .can_recorder import (
+    FLAG_ERROR,
+    FLAG_EXTENDED,
+    FLAG_REMOTE,
+    FRAME_DTYPE,
+    open_recording,
+)
+from .vector_export import FrameBatch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayStats:
+    """Outcome of one :meth:`TraceReplayer.replay` run."""
+
+    frames_sent: int = 0
+    send_errors: int = 0
+    duration_s: float = 0.0
+    max_lateness_s: float = 0.0  # worst delay behind schedule (timed replay only)
+    mean_lateness_s: float = 0.0
+    stopped: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "frames_sent": self.frames_sent,
+            "send_errors": self.send_errors,
+            "duration_s": self.duration_s,
+            "max_lateness_s": self.max_lateness_s,
+            "mean_lateness_s": self.mean_lateness_s,
+            "stopped": self.stopped,
+        }
+
+
+def _make_sender(target: Any) -> Callable[[int, bytes, int, float], None]:
+    """Adapt a bus, HILInterface or callable to ``send(can_id, data, flags, timestamp)``."""
+    from .hil import CANMessage, HILInterface
+
+    if isinstance(target, HILInterface):
+
+        def send_hil(can_id: int, data: bytes, flags: int, timestamp: float) -> None:
+            if flags & (FLAG_REMOTE | FLAG_ERROR):
+                # CANMessage has no remote/error flags; count these as send errors
+                # rather than replaying them as data frames
+                raise ValueError("HILInterface cannot send remote or error frames")
+            target.send(
+                CANMessage(
+                    arbitration_id=can_id,
+                    data=data,
+                    timestamp=timestamp,
+                    is_extended=bool(flags & FLAG_EXTENDED),
+                    dlc=len(data),
+                )
+            )
+
+        return send_hil
+
+    send = target.send if isinstance(target, can.BusABC) else target
+
+    def send_can(can_id: int, data: bytes, flags: int, timestamp: float) -> None:
+        send(
+            can.Message(
+                arbitration_id=can_id,
+                data=data,
+                timestamp=timestamp,
+                is_extended_id=bool(flags & FLAG_EXTENDED),
+                is_remote_frame=bool(flags & FLAG_REMOTE),
+                is_error_frame=bool(flags & FLAG_ERROR),
+                is_fd=len(data) > 8,
+            )
+        )
+
+    return send_can
+
+
+class TraceReplayer:
+    """Memory-mapped view over a CAN recording with timed replay.
+
+    Time windows (``start``/``end``, seconds relative to the first frame)
+    are resolved with a binary search on the timestamp column and stay
+    zero-copy; filtering by ``can_ids`` needs a boolean mask and copies the
+    selected frames chunk by chunk. Timestamps are assumed non-decreasing,
+    as written by a single-bus recorder.
+
+    Args:
+        source: Path to a recording, or an array of ``FRAME_DTYPE`` records.
+    """
+
+    def __init__(self, source: str | Path | np.ndarray):
+        if isinstance(source, np.ndarray):
+            if source.dtype != FRAME_DTYPE:
+                raise ValueError("frames must have dtype FRAME_DTYPE")
+            self.path: Path | None = None
+            self.frames = source
+        else:
+            self.path = Path(source)
+            self.frames = open_recording(self.path)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the first and last frame."""
+        if len(self.frames) < 2:
+            return 0.0
+        ts = self.frames["timestamp"]
+        return float(ts[-1] - ts[0])
+
+    def window(self, start: float | None = None, end: float | None = None) -> np.ndarray:
+        """Zero-copy view of the frames with ``start <= t - t0 < end``."""
+        frames = self.frames
+        if not len(frames) or (start is None and end is None):
+            return frames
+        ts = frames["timestamp"]
+        t0 = ts[0]
+        lo = 0 if start is None else int(np.searchsorted(ts, t0 + start, side="left"))
+        hi = len(frames) if end is None else int(np.searchsorted(ts, t0 + end, side="left"))
+        return frames[lo:hi]
+
+    def iter_chunks(
+        self,
+        chunk_size: int = 100_000,
+        start: float | None = None,
+        end: float | None = None,
+        can_ids: Iterable[int] | None = None,
+    ) -> Iterator[np.ndarray]:
+        """Yield ``FRAME_DTYPE`` chunks of at most *chunk_size* frames.
+
+        Without *can_ids* every chunk is a view into the memory map.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        frames = self.window(start, end)
+        wanted = None if can_ids is None else np.fromiter(can_ids, dtype=np.uint32)
+        for lo in range(0, len(frames), chunk_size):
+            chunk = frames[lo : lo + chunk_size]
+            if wanted is not None:
+                chunk = chunk[np.isin(chunk["can_id"], wanted)]
+                if not len(chunk):
+                    continue
+            yield chunk
+
+    def iter_batches(self, chunk_size: int = 100_000, **window: Any) -> Iterator[FrameBatch]:
+        """Yield data frames as :class:`FrameBatch` chunks (error and remote frames skipped)."""
+        for chunk in self.iter_chunks(chunk_size, **window):
+            skip = (chunk["flags"] & (FLAG_ERROR | FLAG_REMOTE)) != 0
+            if skip.any():
+                chunk = chunk[~skip]
+                if not len(chunk):
+                    continue
+            width = max(8, int(chunk["dlc"].max()))
+            yield FrameBatch(
+                timestamp=np.asarray(chunk["timestamp"], dtype=np.float64),
+                can_id=chunk["can_id"].astype(np.int64),
+                channel=chunk["channel"].astype(np.int64),
+                dlc=np.asarray(chunk["dlc"], dtype=np.uint8),
+                data=chunk["data"][:, :width],
+            )
+
+    def replay(
+        self,
+        target: Any,
+        speed: float | None = 1.0,
+        start: float | None = None,
+        end: float | None = None,
+        can_ids: Iterable[int] | None = None,
+        stop_event: threading.Event | None = None,
+        spin_threshold: float = 0.002,
+        chunk_size: int = 10_000,
+    ) -> ReplayStats:
+        """Send the recorded frames to *target*, reproducing their timing.
+
+        Each frame is due at ``t_start + (t_frame - t_first) / speed`` on the
+        monotonic clock. The scheduler sleeps until ``spin_threshold``
+        before the deadline and busy-waits the remainder, which keeps
+        inter-frame jitter well below the OS sleep granularity. Frames that
+        fall behind schedule are sent immediately rather than skipped, and
+        the delay is reported in the returned stats.
+
+        Args:
+            target: python-can bus, ``HILInterface``, or a callable taking a
+                ``can.Message``.
+            speed: Playback rate (2.0 = twice real time). ``None`` or ``0``
+                sends as fast as the target accepts.
+            start: Skip frames earlier than this many seconds into the trace.
+            end: Stop at this many seconds into the trace.
+            can_ids: Only replay these arbitration IDs.
+            stop_event: Set from another thread to abort the replay.
+            spin_threshold: Seconds before each deadline to stop sleeping
+                and spin. 0 disables spinning.
+            chunk_size: Frames converted from the memory map per step.
+        """
+        if speed is not None and speed < 0:
+            raise ValueError("speed must be >= 0")
+        timed = bool(speed)
+        send = _make_sender(target)
+        stats = ReplayStats()
+        lateness_total = 0.0
+
+        frames = self.window(start, end)
+        if not len(frames):
+            return stats
+        t_first = float(frames["timestamp"][0])
+        clock = time.perf_counter
+        t_start = clock()
+
+        for chunk in self.iter_chunks(chunk_size, start, end, can_ids):
+            ids = chunk["can_id"].tolist()
+            dlcs = chunk["dlc"].tolist()
+            flags = chunk["flags"].tolist()
+            stamps = chunk["timestamp"].tolist()
+            payload = np.ascontiguousarray(chunk["data"]).tobytes()
+            width = chunk["data"].shape[1]
+            due_times = (
+                ((chunk["timestamp"] - t_first) / speed + t_start).tolist() if timed else None
+            )
+
+            for k, can_id in enumerate(ids):
+                if stop_event is not None and stop_event.is_set():
+                    stats.stopped = True
+                    break
+                if timed:
+                    due = due_times[k]
+                    delay = due - clock()
+                    if delay > spin_threshold:
+                        time.sleep(delay - spin_threshold)
+                    while clock() < due:
+                        pass
+                    late = clock() - due
+                    lateness_total += late
+                    if late > stats.max_lateness_s:
+                        stats.max_lateness_s = late
+                offset = k * width
+                try:
+                    send(can_id, payload[offset : offset + dlcs[k]], flags[k], stamps[k])
+                    stats.frames_sent += 1
+                except Exception as e:
+                    stats.send_errors += 1
+                    logger.debug("Replay send of 0x%X failed: %s", can_id, e)
+            if stats.stopped:
+                break
+
+        stats.duration_s = clock() - t_start
+        if timed and stats.frames_sent + stats.send_errors:
+            stats.mean_lateness_s = lateness_total / (stats.frames_sent + stats.send_errors)
+        logger.info(
+            "Replayed %d frames in %.3fs (max lateness %.3f ms)",
+            stats.frames_sent,
+            stats.duration_s,
+            stats.max_lateness_s * 1e3,
+        )
+        return stats
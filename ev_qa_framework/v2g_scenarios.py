@@ -6,8 +6,12 @@ Generates V2G scenarios and analyzes their impact on battery health.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .battery_scoring import BatteryScorer
 from .config import FrameworkConfig
@@ -36,6 +40,8 @@ class V2GScenarioGenerator:
         Returns:
             DataFrame with 'current' and 'duration_h' columns
         """
+        import pandas as pd
+
         rng = np.random.default_rng(42)
 
         if grid_demand_profile == "typical":
@@ -80,6 +86,8 @@ class V2GScenarioGenerator:
         discharge_power_kw: float = 50.0,
     ) -> pd.DataFrame:
         """Generate peak shaving scenario."""
+        import pandas as pd
+
         duration = 24
         current = np.zeros(duration)
         discharge_current = -(discharge_power_kw * 1000) / self.nominal_voltage
@@ -99,6 +107,8 @@ class V2GScenarioGenerator:
         duration_hours: int = 4,
     ) -> pd.DataFrame:
         """Generate frequency regulation scenario."""
+        import pandas as pd
+
         rng = np.random.default_rng(42)
         n = duration_hours * 60  # 1-minute resolution
 
@@ -226,6 +236,8 @@ class V2SScenarioGenerator:
         Returns:
             DataFrame with 'current', 'voltage', 'duration_h', 'soc' columns
         """
+        import pandas as pd
+
         if station_type == "ac_slow":
             power_kw = 7.0
         elif station_type == "dc_fast":
@@ -265,6 +277,8 @@ class V2SScenarioGenerator:
         Returns:
             DataFrame with 'current', 'voltage', 'duration_h', 'soc' columns
         """
+        import pandas as pd
+
         rng = np.random.default_rng(42)
         time_step_h = 1.0 / 60  # 1-minute resolution
         n_samples = int(duration_hours * 60)
@@ -329,6 +343,8 @@ class ChargingStationSimulator:
         Returns:
             DataFrame with timestamps, current, voltage, soc, energy_delivered_kwh
         """
+        import pandas as pd
+
         if target_soc < initial_soc:
             raise ValueError("target_soc must be >= initial_soc")
 
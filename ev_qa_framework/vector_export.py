@@ -1,27 +1,119 @@
 """Vector CANoe/CANalyzer export module.
 
 Provides export and import of CAN traces and test results in formats
-readable by Vector tools (ASC, BLF, test vector CSV).
+readable by Vector tools (ASC, BLF, test vector CSV). Large traces can be
+streamed in fixed-size chunks with :meth:`VectorExporter.iter_frames` (which
+also reads binary ``.evcan`` recordings) and
+decoded into telemetry DataFrames with :meth:`VectorExporter.iter_telemetry_frames`.
 """
 
 from __future__ import annotations
 
 import csv
 import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .dbc_parser import DBCParser
 
 logger = logging.getLogger(__name__)
 
 # Try to import python-can BLFWriter
 try:
-    from can.io import BLFWriter
+    from can.io import BLFReader, BLFWriter
 
     _BLF_AVAILABLE = True
 except ImportError:
     _BLF_AVAILABLE = False
 
+# Signal name -> telemetry column for the built-in battery DBC
+# (see dbc_parser.battery_dbc_content); the resulting frames can be passed
+# straight to EVBatteryAnalyzer.analyze_telemetry().
+BATTERY_SIGNAL_MAP: dict[str, str] = {
+    "Voltage": "voltage",
+    "Current": "current",
+    "Temperature": "temp",
+    "SOC": "soc",
+    "StateOfHealth": "soh",
+}
+
+_ASC_HEADER_PREFIXES = ("date ", "base ", "internal ", "no ")
+
+
+@dataclass(frozen=True)
+class FrameBatch:
+    """A chunk of raw CAN frames in columnar form.
+
+    Attributes:
+        timestamp: float64 seconds, shape (N,)
+        can_id: int64 arbitration IDs, shape (N,)
+        channel: int64 channel numbers, shape (N,)
+        dlc: uint8 payload lengths, shape (N,)
+        data: uint8 payloads zero-padded to a common width, shape (N, W), W >= 8
+    """
+
+    timestamp: np.ndarray
+    can_id: np.ndarray
+    channel: np.ndarray
+    dlc: np.ndarray
+    data: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def from_records(cls, records: list[tuple[float, int, int, bytes]]) -> "FrameBatch":
+        """Build a batch from ``(timestamp, can_id, channel, data)`` tuples."""
+        n = len(records)
+        width = max(8, max((len(r[3]) for r in records), default=0))
+        data = np.zeros((n, width), dtype=np.uint8)
+        dlc = np.empty(n, dtype=np.uint8)
+        for i, (_, _, _, payload) in enumerate(records):
+            dlc[i] = len(payload)
+            data[i, : len(payload)] = np.frombuffer(payload, dtype=np.uint8)
+        return cls(
+            timestamp=np.fromiter((r[0] for r in records), dtype=np.float64, count=n),
+            can_id=np.fromiter((r[1] for r in records), dtype=np.int64, count=n),
+            channel=np.fromiter((r[2] for r in records), dtype=np.int64, count=n),
+            dlc=dlc,
+            data=data,
+        )
+
+
+def _parse_asc_line(line: str) -> tuple[float, int, int, bytes] | None:
+    """Parse one data line written by ``export_asc``.
+
+    Format: ``<channel> <timestamp_hex_us> <can_id_hex> <dlc> <data_hex>``.
+    Returns ``(timestamp, can_id, channel, data)`` or ``None`` for header
+    and unparseable lines.
+    """
+    line = line.strip()
+    if not line or line.startswith(_ASC_HEADER_PREFIXES):
+        return None
+    parts = line.split()
+    if len(parts) < 4:
+        return None
+    try:
+        channel = int(parts[0])
+        # Convert hex timestamp (microseconds) to seconds
+        ts = int(parts[1], 16) / 1_000_000.0
+        can_id = int(parts[2], 16)
+        dlc = int(parts[3])
+        data_hex = parts[4] if len(parts) > 4 else ""
+        data = bytes.fromhex(data_hex[: dlc * 2]) if data_hex else b""
+    except (ValueError, IndexError):
+        logger.debug("Skipping unparseable ASC line: %s", line)
+        return None
+    return ts, can_id, channel, data
+
 
 class VectorExporter:
     """Export and import CAN traces in Vector CANoe/CANalyzer formats."""
@@ -194,39 +286,155 @@ class VectorExporter:
         file_path = Path(file_path)
         messages: list[dict[str, Any]] = []
 
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("date ") or line.startswith("base ") or line.startswith("internal ") or line.startswith("no "):
-                continue
-
-            # Try to parse a data line: channel timestamp_hex can_id dlc data_hex
-            parts = line.split()
-            if len(parts) >= 4:
-                try:
-                    channel = int(parts[0])
-                    ts_hex = parts[1]
-                    can_id = int(parts[2], 16)
-                    dlc = int(parts[3])
-                    data_hex = parts[4] if len(parts) > 4 else ""
-
-                    # Convert hex timestamp (microseconds) to seconds
-                    ts = int(ts_hex, 16) / 1_000_000.0
-
-                    # Convert hex data to bytes
-                    data = bytes.fromhex(data_hex[: dlc * 2]) if data_hex else b""
-
-                    messages.append({
-                        "timestamp": ts,
-                        "can_id": can_id,
-                        "data": data,
-                        "channel": channel,
-                    })
-                except (ValueError, IndexError):
-                    # Skip unparseable lines
-                    logger.debug("Skipping unparseable ASC line: %s", line)
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                record = _parse_asc_line(line)
+                if record is None:
                     continue
+                ts, can_id, channel, data = record
+                messages.append({
+                    "timestamp": ts,
+                    "can_id": can_id,
+                    "data": data,
+                    "channel": channel,
+                })
 
         logger.info("Imported %d messages from ASC: %s", len(messages), file_path)
         return messages
+
+    def iter_frames(
+        self,
+        file_path: str | Path,
+        chunk_size: int = 100_000,
+    ) -> Iterator[FrameBatch]:
+        """Stream an ASC or BLF trace as columnar :class:`FrameBatch` chunks.
+
+        The file is read incrementally, so memory use is bounded by
+        *chunk_size* regardless of trace size. The format is chosen by file
+        suffix (``.blf`` → python-can ``BLFReader``, ``.evcan`` → memory-mapped
+        :class:`~ev_qa_framework.can_recorder.CANRecorder` recording, anything
+        else → ASC as written by :meth:`export_asc`).
+
+        Args:
+            file_path: Path to the trace file.
+            chunk_size: Maximum number of frames per yielded batch.
+
+        Yields:
+            FrameBatch objects with at most *chunk_size* frames each.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        file_path = Path(file_path)
+        if file_path.suffix.lower() == ".evcan":
+            from .trace_replay import TraceReplayer
+
+            yield from TraceReplayer(file_path).iter_batches(chunk_size)
+            return
+        total = 0
+        chunk: list[tuple[float, int, int, bytes]] = []
+        for record in self._iter_records(file_path):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                total += len(chunk)
+                yield FrameBatch.from_records(chunk)
+                chunk = []
+        if chunk:
+            total += len(chunk)
+            yield FrameBatch.from_records(chunk)
+        logger.info("Streamed %d frames from %s", total, file_path)
+
+    def iter_telemetry_frames(
+        self,
+        file_path: str | Path,
+        dbc: DBCParser,
+        chunk_size: int = 100_000,
+        signal_map: dict[str, str] | None = None,
+        fill_forward: bool = True,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a trace as DataFrames of decoded physical signals.
+
+        Each chunk from :meth:`iter_frames` is decoded with
+        ``DBCParser.decode_batch``. Rows are frames that carry at least one
+        selected signal, keyed by the ``timestamp`` column.
+
+        Args:
+            file_path: ASC, BLF or ``.evcan`` trace.
+            dbc: Parser used to decode frames.
+            chunk_size: Maximum number of frames per chunk.
+            signal_map: Optional ``{signal_name: column_name}``; when given
+                only these signals are kept and renamed. Use
+                :data:`BATTERY_SIGNAL_MAP` with the built-in DBC to get
+                ``voltage``/``current``/``temp``/``soc``/``soh`` columns that
+                ``EVBatteryAnalyzer.analyze_telemetry`` accepts directly.
+            fill_forward: Carry the last known value of each signal forward
+                (across chunk boundaries too) and drop rows recorded before
+                every selected signal has been seen. If False, signals not
+                carried by a frame are NaN.
+
+        Yields:
+            DataFrames with ``timestamp``, ``can_id``, ``channel`` and one
+            float64 column per selected signal. Empty chunks are skipped.
+        """
+        import pandas as pd
+
+        if signal_map is None:
+            names = list(dict.fromkeys(s for m in dbc.list_messages() for s in m.signals))
+            signal_map = {name: name for name in names}
+        columns = list(signal_map.values())
+        last = np.full(len(columns), np.nan)
+
+        for batch in self.iter_frames(file_path, chunk_size=chunk_size):
+            decoded = dbc.decode_batch(batch.can_id, batch.data)
+            values = np.full((len(batch), len(columns)), np.nan)
+            for j, signal in enumerate(signal_map):
+                if signal in decoded:
+                    values[:, j] = decoded[signal]
+            carried = ~np.isnan(values).all(axis=1)
+            if not carried.any():
+                continue
+            values = values[carried]
+
+            if fill_forward:
+                # Forward-fill column-wise, seeding with the previous chunk's last row
+                seeded = np.vstack([last, values])
+                valid = ~np.isnan(seeded)
+                idx = np.where(valid, np.arange(len(seeded))[:, None], 0)
+                np.maximum.accumulate(idx, axis=0, out=idx)
+                seeded = seeded[idx, np.arange(len(columns))]
+                last = seeded[-1]
+                values = seeded[1:]
+                complete = ~np.isnan(values).any(axis=1)
+                carried_idx = np.flatnonzero(carried)[complete]
+                values = values[complete]
+                if not len(values):
+                    continue
+            else:
+                carried_idx = np.flatnonzero(carried)
+
+            frame = pd.DataFrame(values, columns=columns)
+            frame.insert(0, "timestamp", batch.timestamp[carried_idx])
+            frame.insert(1, "can_id", batch.can_id[carried_idx])
+            frame.insert(2, "channel", batch.channel[carried_idx])
+            yield frame
+
+    def _iter_records(self, file_path: Path) -> Iterable[tuple[float, int, int, bytes]]:
+        """Yield ``(timestamp, can_id, channel, data)`` for every frame in a trace."""
+        if file_path.suffix.lower() == ".blf":
+            if not _BLF_AVAILABLE:
+                raise ImportError("python-can is required to read BLF files")
+            reader = BLFReader(str(file_path))
+            try:
+                for msg in reader:
+                    if msg.is_error_frame or msg.is_remote_frame:
+                        continue
+                    channel = msg.channel if isinstance(msg.channel, int) else 0
+                    yield msg.timestamp, msg.arbitration_id, channel, bytes(msg.data)
+            finally:
+                reader.stop()
+            return
+
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                record = _parse_asc_line(line)
+                if record is not None:
+                    yield record
@@ -0,0 +1,55 @@
+"""Benchmark project_grid against evaluating AgingModel.predict_soh point by point.
+
+Usage:
+    python scripts/bench_aging_grid.py [--years N] [--sample N]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework.chemistries import BUILTIN_PROFILES, project_grid  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=15, help="projection horizon in years")
+    parser.add_argument("--sample", type=int, default=5000, help="scalar points to time")
+    args = parser.parse_args()
+
+    axes = {
+        "temperature_c": np.arange(-10.0, 46.0, 2.5),
+        "soc_pct": np.arange(10.0, 101.0, 10.0),
+        "c_rate": np.array([0.3, 0.5, 1.0, 1.5, 2.0, 3.0]),
+        "dod_pct": np.arange(20.0, 101.0, 10.0),
+        "years": np.arange(0.0, args.years + 1.0),
+    }
+
+    start = time.perf_counter()
+    grid = project_grid(None, **axes)
+    t_grid = time.perf_counter() - start
+
+    # Scalar path: one predict_soh call per grid point, timed on a sample
+    points = itertools.islice(itertools.product(*axes.values()), args.sample)
+    models = [p.aging_model for p in BUILTIN_PROFILES.values()]
+    start = time.perf_counter()
+    n = 0
+    for point in points:
+        kwargs = dict(zip(axes, map(float, point)))
+        for model in models:
+            model.predict_soh(**kwargs)
+            n += 1
+    t_scalar = (time.perf_counter() - start) / n * grid.size
+
+    print(f"{grid.size:,} grid points {grid.shape}:")
+    print(f"  scalar predict_soh  {t_scalar:8.2f} s  (extrapolated from {n:,} calls)")
+    print(f"  project_grid        {t_grid:8.3f} s  ({t_scalar / t_grid:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
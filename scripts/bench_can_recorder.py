@@ -0,0 +1,53 @@
+"""Benchmark CANRecorder ingest rate against a target frame rate.
+
+Usage:
+    python scripts/bench_can_recorder.py [--frames N] [--fd]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import can
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework.can_recorder import CANRecorder, open_recording  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200_000, help="frames to record")
+    parser.add_argument("--fd", action="store_true", help="use 64-byte CAN FD payloads")
+    args = parser.parse_args()
+
+    size = 64 if args.fd else 8
+    msgs = [
+        can.Message(
+            arbitration_id=0x100 + i % 512,
+            data=os.urandom(size),
+            timestamp=i * 1.25e-4,
+            is_fd=args.fd,
+        )
+        for i in range(args.frames)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.evcan")
+        with CANRecorder(path) as recorder:
+            start = time.perf_counter()
+            for msg in msgs:
+                recorder.record(msg)
+            ingest = time.perf_counter() - start
+        total = time.perf_counter() - start
+        assert len(open_recording(path)) == recorder.flushed
+
+    print(f"{args.frames} frames ({size}-byte payloads):")
+    print(f"  ingest        {args.frames / ingest:12,.0f} frames/s")
+    print(f"  incl. flush   {args.frames / total:12,.0f} frames/s  (target 8,000/channel)")
+    print(f"  dropped       {recorder.dropped:12d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark DBC loading: cold parse vs disk cache vs in-process cache.
+
+Usage:
+    python scripts/bench_dbc_load.py [--messages N] [--signals N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework import dbc_parser  # noqa: E402
+from ev_qa_framework.dbc_parser import DBCParser  # noqa: E402
+
+
+def synthetic_dbc(n_messages: int, n_signals: int) -> str:
+    lines = ['VERSION "bench"', "", "BU_: ECU", ""]
+    width = 64 // n_signals
+    for i in range(1, n_messages + 1):
+        lines.append(f"BO_ {i} Msg{i}: 8 ECU")
+        for k in range(n_signals):
+            lines.append(f' SG_ Sig{i}_{k} : {k * width}|{width}@1+ (0.1,0) [0|100] "V" ECU')
+        lines.append("")
+    for i in range(1, n_messages + 1):
+        lines.append(f'CM_ BO_ {i} "message {i}";')
+        lines.append(f'BA_ "GenMsgCycleTime" BO_ {i} 100;')
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=3000, help="messages in the DBC")
+    parser.add_argument("--signals", type=int, default=8, help="signals per message")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.dbc")
+        cache_dir = os.path.join(tmp, "cache")
+        with open(path, "w") as f:
+            f.write(synthetic_dbc(args.messages, args.signals))
+
+        def cold():
+            dbc_parser._parse_memo.clear()
+            DBCParser(path, cache=False)
+
+        def warm_disk():
+            dbc_parser._parse_memo.clear()
+            DBCParser(path, cache=cache_dir)
+
+        def warm_memo():
+            DBCParser(path, cache=False)
+
+        warm_disk()  # populate the cache
+        t_cold = min(timeit.repeat(cold, number=1, repeat=3))
+        t_disk = min(timeit.repeat(warm_disk, number=1, repeat=5))
+        t_memo = min(timeit.repeat(warm_memo, number=1, repeat=5))
+
+    print(f"{args.messages} messages x {args.signals} signals:")
+    print(f"  cold parse      {t_cold * 1e3:8.1f} ms")
+    print(f"  disk cache      {t_disk * 1e3:8.1f} ms  ({t_cold / t_disk:.1f}x)")
+    print(f"  in-process      {t_memo * 1e3:8.1f} ms  ({t_cold / t_memo:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark BatteryFleetTwin against stepping BatteryDigitalTwin pack by pack.
+
+Usage:
+    python scripts/bench_fleet_twin.py [--packs N] [--steps T] [--every K]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework.digital_twin import BatteryDigitalTwin, BatteryFleetTwin  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packs", type=int, default=5000, help="packs in the fleet")
+    parser.add_argument("--steps", type=int, default=8760, help="hourly steps")
+    parser.add_argument("--every", type=int, default=24, help="record every K steps")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    currents = rng.normal(0.0, 30.0, size=(args.steps, args.packs)).astype(np.float32)
+
+    fleet = BatteryFleetTwin(args.packs, soh=rng.normal(98.0, 1.0, args.packs))
+    start = time.perf_counter()
+    history = fleet.simulate(currents, dt=1.0, fields=("soh", "temperature"), every=args.every)
+    t_fleet = time.perf_counter() - start
+
+    # The scalar twin is timed on a few packs and extrapolated
+    sample = min(args.packs, 5)
+    start = time.perf_counter()
+    for j in range(sample):
+        twin = BatteryDigitalTwin()
+        for current in currents[:, j].tolist():
+            twin.step(1.0, current)
+    t_scalar = (time.perf_counter() - start) / sample * args.packs
+
+    print(f"{args.packs} packs x {args.steps} steps, history {history.shape}:")
+    print(f"  BatteryDigitalTwin  {t_scalar:8.2f} s  (extrapolated from {sample} packs)")
+    print(f"  BatteryFleetTwin    {t_fleet:8.2f} s  ({t_scalar / t_fleet:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
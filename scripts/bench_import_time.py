@@ -0,0 +1,84 @@
+"""Check import times of the CLI and lightweight entry points against a budget.
+
+Each target is imported in a fresh interpreter under ``python -X importtime``;
+the cumulative time of the target module is compared with the budget, and
+importing any of the heavy ML/data libraries counts as a failure. Exits
+non-zero if a target is over budget, so it can gate CI.
+
+Usage:
+    python scripts/bench_import_time.py [--budget-ms N] [--repeat N] [--top N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported on first use
+HEAVY = ("pandas", "sklearn", "scipy", "matplotlib", "tensorflow", "torch")
+
+# target module -> budget in ms (None = use --budget-ms)
+TARGETS: dict[str, float | None] = {
+    "ev_qa_framework": None,
+    "ev_qa_framework.cli": None,
+    "ev_qa_framework.config": None,
+    "ev_qa_framework.models": 300.0,  # pydantic schema build dominates
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` for one fresh import of *module*."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            times[m.group(4)] = (int(m.group(1)), int(m.group(2)))
+    return times
+
+
+def heavy_modules(times: dict[str, tuple[int, int]]) -> list[str]:
+    return sorted({name.split(".")[0] for name in times if name.split(".")[0] in HEAVY})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=200.0, help="default budget per target")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per target (best is kept)")
+    parser.add_argument("--top", type=int, default=5, help="slowest dependencies to list")
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in TARGETS.items():
+        budget = args.budget_ms if budget is None else budget
+        runs = [import_times(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda t: t[module][1])
+        total_ms = best[module][1] / 1e3
+        heavy = heavy_modules(best)
+        ok = total_ms <= budget and not heavy
+        failed |= not ok
+        status = "ok  " if ok else "FAIL"
+        print(f"{status} {module:<28} {total_ms:8.1f} ms  (budget {budget:.0f} ms)")
+        if heavy:
+            print(f"     imports heavy modules: {', '.join(heavy)}")
+        slowest = sorted(
+            (item for item in best.items() if item[0] != module), key=lambda kv: -kv[1][0]
+        )
+        for name, (self_us, _) in slowest[: args.top]:
+            print(f"     {self_us / 1e3:8.1f} ms  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
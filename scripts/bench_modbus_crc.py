@@ -0,0 +1,47 @@
+"""Benchmark Modbus CRC-16: bit loop vs lookup table vs batched NumPy.
+
+Usage:
+    python scripts/bench_modbus_crc.py [--frames N] [--size BYTES]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework.modbus import (  # noqa: E402
+    _append_crc,
+    _crc16_modbus,
+    _crc16_modbus_bitwise,
+    _validate_crc,
+    validate_crc_batch,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10_000, help="captured frames to validate")
+    parser.add_argument("--size", type=int, default=25, help="payload bytes per frame")
+    args = parser.parse_args()
+
+    # FC03 response for 10 registers is 25 bytes including CRC
+    frames = [_append_crc(os.urandom(args.size - 2)) for _ in range(args.frames)]
+    frame = frames[0][:-2]
+
+    n = 20_000
+    bitwise = timeit.timeit(lambda: _crc16_modbus_bitwise(frame), number=n) / n
+    table = timeit.timeit(lambda: _crc16_modbus(frame), number=n) / n
+    print(f"single {len(frame)}-byte frame:")
+    print(f"  bit loop      {bitwise * 1e6:8.2f} us")
+    print(f"  lookup table  {table * 1e6:8.2f} us  ({bitwise / table:.1f}x)")
+
+    scalar = timeit.timeit(lambda: [_validate_crc(f) for f in frames], number=3) / 3
+    batch = timeit.timeit(lambda: validate_crc_batch(frames), number=3) / 3
+    print(f"validate {args.frames} captured frames:")
+    print(f"  per-frame     {scalar * 1e3:8.2f} ms")
+    print(f"  batched       {batch * 1e3:8.2f} ms  ({scalar / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
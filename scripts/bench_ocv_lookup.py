@@ -0,0 +1,80 @@
+"""Benchmark compiled OCV lookup tables against np.interp on the curve points.
+
+Usage:
+    python scripts/bench_ocv_lookup.py [--calls N] [--packs N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework.chemistries import get_profile  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000, help="scalar lookups to time")
+    parser.add_argument("--packs", type=int, default=1_000_000, help="packs per array lookup")
+    args = parser.parse_args()
+
+    profile = get_profile("lfp")
+    curve = profile.ocv_curve
+    soc_points, ocv_points = curve.soc_points, curve.ocv_points
+
+    def interp_pack_ocv(soc: float) -> float:
+        soc = max(soc_points[0], min(soc_points[-1], soc))
+        return float(np.interp(soc, soc_points, ocv_points)) * 96
+
+    def interp_soc(ocv: float) -> float:
+        ocv = max(ocv_points[0], min(ocv_points[-1], ocv))
+        return float(np.interp(ocv, ocv_points, soc_points))
+
+    rng = np.random.default_rng(0)
+    soc = rng.uniform(0.0, 100.0, args.packs)
+    ocv = curve.get_ocv(soc)
+    socs = soc[: args.calls].tolist()
+    ocvs = ocv[: args.calls].tolist()
+
+    cases = [
+        (
+            "pack_ocv, scalar calls",
+            lambda: [interp_pack_ocv(s) for s in socs],
+            lambda: [profile.pack_ocv(s) for s in socs],
+            len(socs),
+        ),
+        (
+            "get_soc_from_ocv, scalar calls",
+            lambda: [interp_soc(v) for v in ocvs],
+            lambda: [profile.get_soc_from_ocv(v) for v in ocvs],
+            len(ocvs),
+        ),
+        (
+            f"pack_ocv, ({args.packs},) array",
+            lambda: np.interp(soc, soc_points, ocv_points) * 96,
+            lambda: profile.pack_ocv(soc),
+            1,
+        ),
+        (
+            f"get_soc_from_ocv, ({args.packs},) array",
+            lambda: np.interp(ocv, ocv_points, soc_points),
+            lambda: profile.get_soc_from_ocv(ocv),
+            1,
+        ),
+    ]
+    table = curve.compile()
+    print(f"{profile.name}, tables of {table.ocv.size} / {table.soc.size} samples")
+    for label, before, after, calls in cases:
+        t_before = min(timeit.repeat(before, number=1, repeat=3)) / calls
+        t_after = min(timeit.repeat(after, number=1, repeat=3)) / calls
+        print(
+            f"  {label:<40} {t_before * 1e6:10.2f} us -> {t_after * 1e6:10.2f} us"
+            f"  ({t_before / t_after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark ThermalModel.simulate_cells against per-cell simulate_thermal loops.
+
+Usage:
+    python scripts/bench_thermal_cells.py [--cells N] [--steps N] [--sample N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ev_qa_framework.chemistries import THERMAL_NMC, neighbour_coupling  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=200, help="cells in the pack")
+    parser.add_argument("--steps", type=int, default=100_000, help="1 s time steps")
+    parser.add_argument("--sample", type=int, default=5, help="cells to time with the scalar loop")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    current = rng.uniform(-60.0, 60.0, args.steps)
+    resistance = THERMAL_NMC.reference_resistance * rng.normal(1.0, 0.05, args.cells)
+    coupling = neighbour_coupling(args.cells, 0.05)
+
+    start = time.perf_counter()
+    profile = current.tolist()
+    for _ in range(args.sample):
+        THERMAL_NMC.simulate_thermal(profile, 25.0, 25.0, 1.0)
+    t_scalar = (time.perf_counter() - start) / args.sample * args.cells
+
+    print(f"{args.cells} cells x {args.steps} steps:")
+    print(f"  simulate_thermal per cell   {t_scalar:8.2f} s  (extrapolated, no conduction)")
+    for label, kwargs in (
+        ("float64", {}),
+        ("float64 + coupling", {"coupling": coupling}),
+        ("float32 + coupling", {"coupling": coupling, "dtype": np.float32}),
+    ):
+        start = time.perf_counter()
+        temps = THERMAL_NMC.simulate_cells(
+            current, 25.0, 25.0, 1.0, reference_resistance=resistance, **kwargs
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"  simulate_cells {label:<18} {elapsed:8.2f} s  ({t_scalar / elapsed:5.1f}x)  "
+            f"spread {np.ptp(temps[-1]):.2f} K"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Tests for the analysis API: warm analyzer pool and micro-batching."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import get_batcher, router
+from api.service import AnalyzerPool, MicroBatcher, nominal_baseline
+
+
+def _request(seed: int, n: int = 15) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "voltage": float(rng.normal(380, 3)),
+            "current": float(rng.normal(50, 5)),
+            "temperature": float(rng.normal(30, 1)),
+            "soc": 80.0,
+            "soh": 95.0,
+        }
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    return AnalyzerPool(nominal_baseline(n_samples=500), size=2)
+
+
+class TestAnalyzerPool:
+    def test_instances_are_pretrained(self, pool):
+        with pool.acquire() as qa:
+            assert qa.ml_analyzer.is_fitted
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            AnalyzerPool(nominal_baseline(n_samples=50), size=0)
+
+
+class TestMicroBatcher:
+    def test_concurrent_requests_are_coalesced(self, pool):
+        batcher = MicroBatcher(pool, max_batch_size=8, max_delay=0.05)
+        calls = []
+        run = batcher._run
+        batcher._run = lambda suites: calls.append(len(suites)) or run(suites)
+
+        async def main():
+            try:
+                return await asyncio.gather(*[batcher.submit(_request(i)) for i in range(10)])
+            finally:
+                await batcher.stop()
+
+        results = asyncio.run(main())
+
+        assert sum(calls) == 10
+        assert max(calls) > 1
+        assert all(len(calls) and c <= 8 for c in calls)
+        with pool.acquire() as qa:
+            expected = [qa.run_test_suite(_request(i)) for i in range(10)]
+        assert results == expected
+
+    def test_bad_request_does_not_fail_neighbours(self, pool):
+        batcher = MicroBatcher(pool, max_delay=0.05)
+        good = _request(0)
+
+        async def main():
+            try:
+                return await asyncio.gather(
+                    batcher.submit(good), batcher.submit(None), return_exceptions=True
+                )
+            finally:
+                await batcher.stop()
+
+        ok, bad = asyncio.run(main())
+        assert ok["total_tests"] == len(good)
+        assert isinstance(bad, Exception)
+
+    def test_stop_during_delay_cancels_collected_request(self, pool):
+        batcher = MicroBatcher(pool, max_delay=0.5)
+
+        async def main():
+            request = asyncio.create_task(batcher.submit(_request(0)))
+            await asyncio.sleep(0.05)  # collector has taken it and is waiting
+            await batcher.stop()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(request, timeout=2.0)
+
+        asyncio.run(main())
+
+
+@pytest.fixture
+def client(pool):
+    """Test app sharing one batcher, stopped on the app's event loop at teardown."""
+    batcher = MicroBatcher(pool, max_delay=0.0)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_batcher] = lambda: batcher
+
+    with TestClient(app) as client:
+        yield client
+        client.portal.call(batcher.stop)
+
+
+class TestAnalyzeRoute:
+    def test_analyze_uses_batcher(self, client):
+        response = client.post("/api/analyze", json={"telemetry": _request(1)})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_samples"] == 15
+        assert body["severity"] in {"INFO", "WARNING", "CRITICAL"}
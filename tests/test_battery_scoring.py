@@ -356,3 +356,47 @@ class TestEdgeCases:
         df = make_telemetry(soh=0.0, temp=80.0, n=100)
         result = scorer.compute_score(df, cell_voltages=[4.2] * 11 + [1.0])
         assert result["score"] >= 0.0
+
+
+class TestComputeScoresBatch:
+    """Batch scoring shares one normalisation pass per pack."""
+
+    def test_matches_compute_score(self):
+        frames = [make_telemetry(soh=s, temp=t) for s, t in [(95.0, 25.0), (70.0, 45.0)]]
+        reference = BatteryScorer()
+        expected = [reference.compute_score(df) for df in frames]
+
+        batch = BatteryScorer().compute_scores_batch(frames)
+
+        assert list(batch.columns) == [
+            "score",
+            "grade",
+            "soh_score",
+            "anomaly_score",
+            "cell_balance_score",
+            "thermal_score",
+        ]
+        for (_, row), ref in zip(batch.iterrows(), expected):
+            for key in batch.columns:
+                assert row[key] == ref[key]
+
+    def test_mapping_keys_become_index(self, scorer):
+        frames = {"BAT-A": make_telemetry(soh=90.0), "BAT-B": make_telemetry(soh=60.0)}
+        batch = scorer.compute_scores_batch(frames)
+        assert list(batch.index) == ["BAT-A", "BAT-B"]
+        assert batch.loc["BAT-B", "soh_score"] == 59.0
+
+    def test_per_pack_cell_voltages(self, scorer):
+        frames = [make_telemetry(), make_telemetry()]
+        voltages = [make_cell_voltages(), [4.2] * 11 + [1.0]]
+        batch = scorer.compute_scores_batch(frames, cell_voltages=voltages)
+        assert batch["cell_balance_score"].tolist()[0] == 100.0
+        assert batch["cell_balance_score"].tolist()[1] < 100.0
+
+    def test_cell_voltages_length_mismatch(self, scorer):
+        with pytest.raises(ValueError):
+            scorer.compute_scores_batch([make_telemetry()], cell_voltages=[None, None])
+
+    def test_temperature_alias_is_normalised(self, scorer):
+        df = make_telemetry(temp=45.0).rename(columns={"temp": "temperature"})
+        assert scorer.compute_score(df)["thermal_score"] < 100.0
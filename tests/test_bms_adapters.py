@@ -7,6 +7,7 @@ produce valid BMSTelemetry-compatible dicts from known CAN data bytes.
 from __future__ import annotations
 
 import struct
+import time
 
 import pytest
 
@@ -510,6 +511,70 @@ class TestBMSTelemetryCompatibility:
         assert d["soh"] == 95.0
 
 
+# ═══════════════════════════════════════════════════════════════════
+# Shared CAN Dispatch Tests
+# ═══════════════════════════════════════════════════════════════════
+
+
+def _frame(can_id: int, data: bytes, extended: bool = False):
+    import can
+
+    return can.Message(arbitration_id=can_id, data=data, is_extended_id=extended)
+
+
+class TestAdapterDispatch:
+    def test_read_uses_latest_frames_without_waiting(self):
+        from ev_qa_framework.can_bus import CANDispatcher
+
+        dispatcher = CANDispatcher()
+        adapter = TeslaBMSAdapter(channel="vcan0", dispatcher=dispatcher)
+        assert adapter.connect() is True
+
+        dispatcher.on_message_received(_frame(0x352, struct.pack(">Hh", 40000, -1500) + b"\0" * 4))
+        dispatcher.on_message_received(_frame(0x353, bytes([160]) + b"\0" * 7))
+        dispatcher.on_message_received(_frame(0x353, bytes([170]) + b"\0" * 7))
+
+        start = time.perf_counter()
+        t = adapter.read_telemetry()
+        assert time.perf_counter() - start < 0.05
+
+        assert t.pack_voltage == pytest.approx(400.0)
+        assert t.pack_current == pytest.approx(-15.0)
+        assert t.soc == pytest.approx(85.0)  # latest frame wins
+        assert t.temperature_max is None
+        assert t.timestamp > 0
+
+    def test_adapters_share_one_dispatcher(self):
+        from ev_qa_framework.can_bus import CANDispatcher
+
+        dispatcher = CANDispatcher()
+        tesla = TeslaBMSAdapter(dispatcher=dispatcher)
+        byd = BYDBMSAdapter(dispatcher=dispatcher)
+        tesla.connect()
+        byd.connect()
+
+        dispatcher.on_message_received(_frame(0x353, bytes([100]) + b"\0" * 7))
+        dispatcher.on_message_received(
+            _frame(0x1806E5F4, struct.pack(">H", 3500) + b"\0" * 6, extended=True)
+        )
+
+        assert tesla.read_telemetry().soc == pytest.approx(50.0)
+        assert tesla.read_telemetry().pack_voltage is None
+        assert byd.read_telemetry().pack_voltage == pytest.approx(350.0)
+
+    def test_disconnect_keeps_shared_dispatcher(self):
+        from ev_qa_framework.can_bus import CANDispatcher
+
+        dispatcher = CANDispatcher()
+        adapter = NioBMSAdapter(dispatcher=dispatcher)
+        adapter.connect()
+        adapter.disconnect()
+
+        assert adapter.is_connected is False
+        assert adapter._dispatcher is dispatcher
+        assert adapter.read_telemetry().timestamp == 0.0
+
+
 # ═══════════════════════════════════════════════════════════════════
 # Lazy Import Tests
 # ═══════════════════════════════════════════════════════════════════
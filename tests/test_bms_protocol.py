@@ -6,18 +6,29 @@ Tests cover:
 - BMSCANInterface (with mock CAN receiver)
 - BMSModbusTCPInterface (with mock Modbus TCP client)
 - BMSModbusRTUInterface (with mock Modbus RTU client)
-- Protocol auto-detection (scan functions)
+- Protocol auto-detection (scan functions, parallel scanners)
 - BMSProtocolManager (unified interface, auto-detect, fallback)
+- BMSPollingScheduler (concurrent multi-device polling)
 """
 
+import asyncio
+import socket
+import socketserver
+import struct
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from ev_qa_framework.bms_protocol import (
     BMSCANInterface,
+    BMSInterface,
     # Interfaces
     BMSModbusRTUInterface,
     BMSModbusTCPInterface,
+    # Scheduler
+    BMSPollingScheduler,
     # Manager
     BMSProtocolManager,
     # Data model
@@ -27,7 +38,12 @@ from ev_qa_framework.bms_protocol import (
     # Enums
     ProtocolType,
     _auto_detect_serial_ports,
+    _iter_concurrent,
+    expand_hosts,
+    iter_scan_modbus_rtu,
+    iter_scan_modbus_tcp,
     scan_can_interfaces,
+    scan_modbus_rtu,
     scan_modbus_tcp,
 )
 
@@ -549,6 +565,187 @@ class TestAutoDetection:
         assert ports == []
 
 
+# ═══════════════════════════════════════════════════════════════════
+# Parallel Scanner Tests
+# ═══════════════════════════════════════════════════════════════════
+
+
+class _ModbusStandIn(socketserver.BaseRequestHandler):
+    """Answers every FC03 request with a single register (0x1234)."""
+
+    def handle(self):
+        data = self.request.recv(12)
+        if len(data) < 12:
+            return
+        tid, _, _, unit = struct.unpack(">HHHB", data[:7])
+        pdu = bytes([0x03, 2, 0x12, 0x34])
+        self.request.sendall(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu)
+
+
+class _SilentStandIn(socketserver.BaseRequestHandler):
+    """Accepts the connection and closes it without a Modbus reply."""
+
+    def handle(self):
+        pass
+
+
+def _serve(handler):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _closed_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class _FakeRTUClient:
+    """Stands in for ModbusRTUClient; only answers at ``answer_baud``."""
+
+    answer_baud: dict[str, int] = {}
+    opened: list[str] = []
+
+    def __init__(self, port, baudrate=9600, unit_id=1, timeout=1.0, retries=3):
+        self.port = port
+        self.baudrate = baudrate
+        self.baud_switches = 0
+
+    def connect(self):
+        if self.port not in self.answer_baud:
+            raise OSError("no such port")
+        self.opened.append(self.port)
+        return True
+
+    def set_baudrate(self, baudrate):
+        self.baudrate = baudrate
+
+    def read_holding_registers(self, start, quantity):
+        if self.baudrate != self.answer_baud[self.port]:
+            raise TimeoutError("no response")
+        return [0]
+
+    def disconnect(self):
+        pass
+
+
+class TestParallelScanners:
+    def test_expand_hosts_cidr(self):
+        hosts = list(expand_hosts(["10.0.0.0/30", "bms.local", "10.0.1.7/32"]))
+        assert hosts == ["10.0.0.1", "10.0.0.2", "bms.local", "10.0.1.7"]
+
+    def test_expand_hosts_is_lazy(self):
+        hosts = expand_hosts(["10.0.0.0/8"])
+        assert next(hosts) == "10.0.0.1"
+
+    def test_iter_concurrent_yields_fast_results_first(self):
+        def work(delay):
+            time.sleep(delay)
+            return delay
+
+        results = list(_iter_concurrent(work, [0.2, 0.0, 0.05], max_workers=3))
+        assert results == [(1, 0.0), (2, 0.05), (0, 0.2)]
+
+    def test_iter_concurrent_caps_in_flight(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work(_):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return None
+
+        assert list(_iter_concurrent(work, range(20), max_workers=4)) == []
+        assert max(peak) <= 4
+
+    def test_iter_concurrent_is_concurrent(self):
+        start = time.perf_counter()
+        list(_iter_concurrent(lambda _: time.sleep(0.1), range(8), max_workers=8))
+        assert time.perf_counter() - start < 0.5
+
+    def test_scan_tcp_against_stand_in_server(self):
+        server = _serve(_ModbusStandIn)
+        port = server.server_address[1]
+        try:
+            found = scan_modbus_tcp(hosts=["127.0.0.1"], port=port, timeout=0.5, probe=True)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(found) == 1
+        assert found[0].config == {"host": "127.0.0.1", "port": port, "unit_id": 1}
+
+    def test_scan_tcp_probe_rejects_non_modbus_listener(self):
+        server = _serve(_SilentStandIn)
+        port = server.server_address[1]
+        try:
+            plain = scan_modbus_tcp(hosts=["127.0.0.1"], port=port, timeout=0.5)
+            probed = scan_modbus_tcp(hosts=["127.0.0.1"], port=port, timeout=0.5, probe=True)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(plain) == 1
+        assert probed == []
+
+    def test_scan_tcp_cidr_sweep(self):
+        server = _serve(_ModbusStandIn)
+        port = server.server_address[1]
+        try:
+            found = list(
+                iter_scan_modbus_tcp(hosts=["127.0.0.0/29"], port=port, timeout=0.5, probe=True)
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        # Only 127.0.0.1 has the server bound
+        assert [d.config["host"] for d in found] == ["127.0.0.1"]
+
+    def test_scan_tcp_closed_port(self):
+        assert scan_modbus_tcp(hosts=["127.0.0.1"], port=_closed_port(), timeout=0.5) == []
+
+    @patch("socket.socket")
+    def test_scan_tcp_preserves_host_order(self, mock_socket_cls):
+        mock_socket_cls.return_value.connect_ex.return_value = 0
+        hosts = [f"10.0.0.{i}" for i in range(1, 30)]
+        found = scan_modbus_tcp(hosts=hosts, timeout=0.1, max_workers=8)
+        assert [d.config["host"] for d in found] == hosts
+
+    @patch("ev_qa_framework.modbus.ModbusRTUClient", _FakeRTUClient)
+    def test_scan_rtu_reuses_port_across_baudrates(self):
+        _FakeRTUClient.answer_baud = {"/dev/ttyUSB0": 38400, "/dev/ttyUSB1": 9600}
+        _FakeRTUClient.opened = []
+
+        found = scan_modbus_rtu(
+            ports=["/dev/ttyUSB0", "/dev/ttyUSB1", "/dev/ttyUSB9"],
+            baudrates=[9600, 19200, 38400],
+        )
+
+        assert [(d.config["port"], d.config["baudrate"]) for d in found] == [
+            ("/dev/ttyUSB0", 38400),
+            ("/dev/ttyUSB1", 9600),
+        ]
+        # One open per port regardless of how many baud rates were tried
+        assert sorted(_FakeRTUClient.opened) == ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+
+    @patch("ev_qa_framework.modbus.ModbusRTUClient", _FakeRTUClient)
+    def test_iter_scan_rtu_no_response(self):
+        _FakeRTUClient.answer_baud = {"/dev/ttyUSB0": 115200}
+        _FakeRTUClient.opened = []
+        found = list(iter_scan_modbus_rtu(ports=["/dev/ttyUSB0"], baudrates=[9600, 19200]))
+        assert found == []
+
+    def test_scan_rtu_no_baudrates(self):
+        assert scan_modbus_rtu(ports=["/dev/ttyUSB0"], baudrates=[]) == []
+
+
 # ═══════════════════════════════════════════════════════════════════
 # BMSProtocolManager Tests
 # ═══════════════════════════════════════════════════════════════════
@@ -854,3 +1051,238 @@ class TestBMSProtocolManager:
 
         assert result is False
         assert mgr.is_connected is False
+
+
+# ═══════════════════════════════════════════════════════════════════
+# BMSPollingScheduler Tests
+# ═══════════════════════════════════════════════════════════════════
+
+
+class _FakeBMS(BMSInterface):
+    """In-memory BMS whose reads can be delayed, fail, or hang."""
+
+    def __init__(self, delay=0.0, fail=False, hang=None):
+        super().__init__(ProtocolType.MODBUS_TCP)
+        self.delay = delay
+        self.fail = fail
+        self.hang = hang  # threading.Event the read blocks on
+        self.reads = 0
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        self._connected = True
+        return True
+
+    def disconnect(self):
+        self._connected = False
+
+    def read_telemetry(self):
+        self.reads += 1
+        if self.hang is not None:
+            self.hang.wait(5.0)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            return BMSTelemetry(protocol="modbus_tcp", source="error")
+        return BMSTelemetry(soc=80.0, protocol="modbus_tcp", timestamp=time.time(), source="x")
+
+    def health_check(self):
+        return {"connected": self._connected}
+
+
+def _run_scheduler(scheduler, duration):
+    async def run():
+        await scheduler.start()
+        await asyncio.sleep(duration)
+        await scheduler.stop()
+
+    try:
+        asyncio.run(run())
+    finally:
+        scheduler.close()
+
+
+class TestBMSPollingScheduler:
+    def test_polls_each_device_at_its_rate(self):
+        fast, slow = _FakeBMS(), _FakeBMS()
+        scheduler = BMSPollingScheduler(jitter=0.0, seed=0)
+        scheduler.add_device("fast", fast, interval=0.02)
+        scheduler.add_device("slow", slow, interval=0.1)
+
+        _run_scheduler(scheduler, 0.5)
+
+        assert 15 <= fast.reads <= 26
+        assert 4 <= slow.reads <= 6
+        assert fast.connects == 1  # connected lazily on first poll
+
+    def test_queue_receives_telemetry_tagged_with_device(self):
+        scheduler = BMSPollingScheduler(seed=0)
+        scheduler.add_device("rack-1", _FakeBMS(), interval=0.02)
+        scheduler.add_device("rack-2", _FakeBMS(), interval=0.02)
+
+        _run_scheduler(scheduler, 0.2)
+
+        sources = set()
+        while not scheduler.queue.empty():
+            telemetry = scheduler.queue.get_nowait()
+            assert telemetry.soc == 80.0
+            sources.add(telemetry.source)
+        assert sources == {"rack-1", "rack-2"}
+
+    def test_hung_device_does_not_stall_healthy_ones(self):
+        release = threading.Event()
+        healthy, hung = _FakeBMS(), _FakeBMS(hang=release)
+        scheduler = BMSPollingScheduler(timeout=0.05, max_backoff=0.2, max_workers=4, seed=0)
+        scheduler.add_device("healthy", healthy, interval=0.02)
+        scheduler.add_device("hung", hung, interval=0.02)
+
+        try:
+            _run_scheduler(scheduler, 0.5)
+        finally:
+            release.set()
+
+        stats = scheduler.stats()
+        assert stats["healthy"].misses == 0
+        assert stats["healthy"].polls >= 15
+        assert stats["hung"].timeouts == 1
+        # Later polls find the first read still blocked and never start another
+        assert hung.reads == 1
+        assert stats["hung"].misses == stats["hung"].polls
+        assert stats["hung"].backoff == 0.2
+
+    def test_failing_device_backs_off_exponentially(self):
+        flaky = _FakeBMS(fail=True)
+        scheduler = BMSPollingScheduler(jitter=0.0, max_backoff=10.0, seed=0)
+        scheduler.add_device("flaky", flaky, interval=0.01)
+
+        _run_scheduler(scheduler, 0.3)
+
+        stats = scheduler.stats()["flaky"]
+        # Retries after 0.02, 0.04, 0.08, 0.16 s -> at most 5 reads in 0.3 s
+        assert 3 <= flaky.reads <= 5
+        assert stats.misses == stats.polls == flaky.reads
+        assert stats.backoff == 0.01 * 2**stats.consecutive_failures
+        assert stats.last_success is None
+
+    def test_recovers_after_failure(self):
+        flaky = _FakeBMS(fail=True)
+        scheduler = BMSPollingScheduler(max_backoff=0.05, seed=0)
+        scheduler.add_device("flaky", flaky, interval=0.01)
+
+        async def run():
+            await scheduler.start()
+            await asyncio.sleep(0.1)
+            flaky.fail = False
+            await asyncio.sleep(0.2)
+            await scheduler.stop()
+
+        asyncio.run(run())
+        scheduler.close()
+
+        stats = scheduler.stats()["flaky"]
+        assert stats.consecutive_failures == 0
+        assert stats.backoff == 0.0
+        assert stats.last_success is not None
+        assert stats.mean_latency is not None
+
+    def test_bounded_queue_drops_oldest(self):
+        scheduler = BMSPollingScheduler(queue_size=3, seed=0)
+        scheduler.add_device("rack", _FakeBMS(), interval=0.01)
+
+        _run_scheduler(scheduler, 0.2)
+
+        assert scheduler.queue.qsize() == 3
+        assert scheduler.dropped == scheduler.stats()["rack"].polls - 3
+        items = [scheduler.queue.get_nowait() for _ in range(3)]
+        assert [t.timestamp for t in items] == sorted(t.timestamp for t in items)
+
+    def test_add_device_while_running(self):
+        scheduler = BMSPollingScheduler(seed=0)
+        late = _FakeBMS()
+
+        async def run():
+            await scheduler.start()
+            await asyncio.sleep(0.05)
+            scheduler.add_device("late", late, interval=0.02)
+            await asyncio.sleep(0.2)
+            await scheduler.stop()
+
+        asyncio.run(run())
+        scheduler.close()
+
+        assert late.reads >= 5
+
+    def test_stop_lets_runner_exit_without_cancelling(self):
+        scheduler = BMSPollingScheduler(seed=0)
+        scheduler.add_device("rack", _FakeBMS(), interval=0.005)
+
+        async def run():
+            await scheduler.start()
+            runner = scheduler._runner
+            await asyncio.sleep(0.1)
+            await asyncio.wait_for(scheduler.stop(), 2.0)
+            return runner
+
+        runner = asyncio.run(run())
+        scheduler.close()
+
+        assert runner.done() and not runner.cancelled()
+        assert not scheduler.is_running
+
+    def test_readded_device_ignores_stale_poll(self):
+        release = threading.Event()
+        old, new = _FakeBMS(hang=release), _FakeBMS()
+        scheduler = BMSPollingScheduler(timeout=1.0, jitter=0.0, seed=0)
+        scheduler.add_device("rack", old, interval=0.01)
+
+        async def run():
+            await scheduler.start()
+            while old.reads == 0:
+                await asyncio.sleep(0.005)
+            scheduler.remove_device("rack")
+            scheduler.add_device("rack", new, interval=10.0)
+            release.set()
+            await asyncio.sleep(0.05)
+            entries = [entry for entry in scheduler._heap if entry[2] == "rack"]
+            await scheduler.stop()
+            return entries
+
+        entries = asyncio.run(run())
+        scheduler.close()
+
+        assert len(entries) == 1
+        assert scheduler.stats()["rack"].polls == 0
+        assert scheduler.queue.empty()
+
+    def test_remove_device(self):
+        scheduler = BMSPollingScheduler(seed=0)
+        scheduler.add_device("rack", _FakeBMS(), interval=0.1)
+        scheduler.remove_device("rack")
+        assert scheduler.stats() == {}
+
+    def test_duplicate_device_rejected(self):
+        scheduler = BMSPollingScheduler()
+        scheduler.add_device("rack", _FakeBMS())
+        with pytest.raises(ValueError):
+            scheduler.add_device("rack", _FakeBMS())
+        with pytest.raises(ValueError):
+            scheduler.add_device("other", _FakeBMS(), interval=0)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            BMSPollingScheduler(queue_size=0)
+        with pytest.raises(ValueError):
+            BMSPollingScheduler(timeout=0)
+        with pytest.raises(ValueError):
+            BMSPollingScheduler(jitter=1.0)
+
+    def test_stats_to_dict(self):
+        scheduler = BMSPollingScheduler(seed=0)
+        scheduler.add_device("rack", _FakeBMS(), interval=0.02)
+        _run_scheduler(scheduler, 0.1)
+
+        data = scheduler.stats()["rack"].to_dict()
+        assert data["polls"] >= 1
+        assert data["misses"] == 0
+        assert data["mean_latency"] >= 0
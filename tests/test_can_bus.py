@@ -10,8 +10,12 @@ import pytest
 
 from ev_qa_framework.can_bus import (
     CANBatterySimulator,
+    CANDispatcher,
     CANTelemetryReceiver,
+    CyclicFrameSender,
+    DBCFileSimulator,
 )
+from ev_qa_framework.dbc_parser import FrameSynthesizer, builtin_dbc
 
 
 # ---------------------------------------------------------------------------
@@ -166,3 +170,227 @@ def test_can_sim_receiver(_mock_bus):
     assert "soc" in data
     assert 400 <= data["voltage"] <= 410
     assert data["soc"] == 80
+
+
+# ---------------------------------------------------------------------------
+# CANDispatcher: notifier-driven routing by arbitration ID
+# ---------------------------------------------------------------------------
+def _msg(can_id, data=b"\x00" * 8):
+    return can.Message(arbitration_id=can_id, data=data, is_extended_id=False)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestCANDispatcher:
+    def test_routes_by_arbitration_id(self):
+        dispatcher = CANDispatcher()
+        seen_a, seen_b, seen_all = [], [], []
+        dispatcher.subscribe(0x100, seen_a.append)
+        dispatcher.subscribe(0x200, seen_b.append)
+        dispatcher.subscribe(None, seen_all.append)
+
+        for can_id in (0x100, 0x200, 0x300, 0x100):
+            dispatcher.on_message_received(_msg(can_id))
+
+        assert [m.arbitration_id for m in seen_a] == [0x100, 0x100]
+        assert [m.arbitration_id for m in seen_b] == [0x200]
+        assert len(seen_all) == 4
+        assert dispatcher.frame_count == 4
+
+    def test_unsubscribe(self):
+        dispatcher = CANDispatcher()
+        seen = []
+        unsubscribe = dispatcher.subscribe(0x100, seen.append)
+        dispatcher.on_message_received(_msg(0x100))
+        unsubscribe()
+        dispatcher.on_message_received(_msg(0x100))
+        assert len(seen) == 1
+
+    def test_latest_value_cache(self):
+        dispatcher = CANDispatcher()
+        dispatcher.on_message_received(_msg(0x100, b"\x01"))
+        dispatcher.on_message_received(_msg(0x200, b"\x02"))
+        dispatcher.on_message_received(_msg(0x100, b"\x03"))
+
+        assert dispatcher.latest(0x100) == b"\x03"
+        assert dispatcher.latest(0x999) is None
+        assert dispatcher.snapshot() == {0x100: b"\x03", 0x200: b"\x02"}
+        assert dispatcher.snapshot([0x200, 0x999]) == {0x200: b"\x02"}
+        assert dispatcher.last_seen(0x100) is not None
+
+        dispatcher.clear()
+        assert dispatcher.snapshot() == {}
+
+    def test_snapshot_is_a_copy(self):
+        dispatcher = CANDispatcher()
+        dispatcher.on_message_received(_msg(0x100, b"\x01"))
+        snap = dispatcher.snapshot()
+        dispatcher.on_message_received(_msg(0x100, b"\x02"))
+        assert snap[0x100] == b"\x01"
+
+    def test_failing_handler_does_not_block_others(self):
+        dispatcher = CANDispatcher()
+        seen = []
+
+        def broken(_msg):
+            raise ValueError("bad frame")
+
+        dispatcher.subscribe(0x100, broken)
+        dispatcher.subscribe(0x100, seen.append)
+        dispatcher.on_message_received(_msg(0x100))
+
+        assert len(seen) == 1
+        assert dispatcher.error_count == 1
+
+    def test_on_error_does_not_block_event_loop(self):
+        loop = MagicMock()
+        dispatcher = CANDispatcher(loop=loop)
+        with patch("ev_qa_framework.can_bus.time.sleep") as sleep:
+            dispatcher.on_error(can.CanError("bus off"))
+        sleep.assert_not_called()
+        assert dispatcher.error_count == 1
+
+        with patch("ev_qa_framework.can_bus.time.sleep") as sleep:
+            CANDispatcher().on_error(can.CanError("bus off"))
+        sleep.assert_called_once()
+
+    def test_notifier_delivers_frames_from_bus(self):
+        rx = can.interface.Bus(channel="dispatch_test", interface="virtual")
+        tx = can.interface.Bus(channel="dispatch_test", interface="virtual")
+        seen = []
+        try:
+            with CANDispatcher(rx, timeout=0.1) as dispatcher:
+                dispatcher.subscribe(0x101, seen.append)
+                tx.send(_msg(0x101, b"\x0f\xa0\x01\xf4\x00\x00\x00\x00"))
+                tx.send(_msg(0x102, b"\x23\x50\x00\x00\x00\x00\x00\x00"))
+                assert _wait_for(lambda: dispatcher.frame_count == 2)
+            assert not dispatcher.is_running
+        finally:
+            rx.shutdown()
+            tx.shutdown()
+
+        assert len(seen) == 1
+        assert dispatcher.latest(0x102)[:2] == b"\x23\x50"
+
+    def test_receiver_bus_serves_extra_consumers(self):
+        receiver = CANTelemetryReceiver(channel="vcan_dispatch")
+        tx = can.interface.Bus(channel="vcan_dispatch", interface="virtual")
+        extra = []
+        receiver.dispatcher.subscribe(0x7E8, extra.append)
+        receiver.start()
+        try:
+            assert receiver._thread is None  # notifier-driven, no polling thread
+            tx.send(_msg(0x102, b"\x23\x50\x00\x00\x00\x00\x00\x00"))
+            tx.send(_msg(0x7E8))
+            assert _wait_for(lambda: extra and receiver.get_telemetry()["soc"] == 80)
+        finally:
+            receiver.stop()
+            tx.shutdown()
+
+        assert receiver.get_telemetry()["temperature"] == 35.0
+
+
+# ---------------------------------------------------------------------------
+# Cyclic frame generation
+# ---------------------------------------------------------------------------
+class TestCyclicFrameSender:
+    def test_sends_each_message_at_its_cycle_time(self):
+        sent = []
+        sender = CyclicFrameSender(
+            FrameSynthesizer(builtin_dbc(), seed=0), sent.append, {0x101: 0.01, 0x102: 0.05}
+        )
+        sender.start()
+        time.sleep(0.5)
+        sender.stop()
+
+        ids = [m.arbitration_id for m in sent]
+        # 50 and 10 frames expected; allow for thread start-up and scheduling noise
+        assert 40 <= ids.count(0x101) <= 52
+        assert 8 <= ids.count(0x102) <= 11
+        assert sender.frames_sent == len(sent)
+        assert all(len(m.data) == 8 and not m.is_extended_id for m in sent)
+
+    def test_high_frame_rate(self):
+        sent = []
+        ids = list(builtin_dbc().messages)
+        sender = CyclicFrameSender(
+            FrameSynthesizer(builtin_dbc(), seed=0), sent.append, {i: 0.0007 for i in ids}
+        )
+        assert sender.frame_rate == pytest.approx(10_000)
+        sender.start()
+        time.sleep(1.0)
+        sender.stop()
+        assert len(sent) >= 8_000
+
+    def test_send_errors_are_counted(self):
+        def send(_msg):
+            raise can.CanError("tx buffer full")
+
+        sender = CyclicFrameSender(FrameSynthesizer(builtin_dbc()), send, {0x101: 0.005})
+        sender.start()
+        assert _wait_for(lambda: sender.send_errors >= 3)
+        sender.stop()
+        assert sender.frames_sent == 0
+        assert not sender.is_running
+
+    def test_rejects_non_positive_cycle_time(self):
+        with pytest.raises(ValueError):
+            CyclicFrameSender(FrameSynthesizer(builtin_dbc()), print, {0x101: 0})
+
+
+class TestSimulatorCycleTimes:
+    def test_dbc_cycle_times_with_overrides(self):
+        sim = DBCFileSimulator(cycle_times={0x103: 0.5}, default_cycle_time=2.0)
+        assert sim.cycle_times[0x101] == pytest.approx(0.1)  # GenMsgCycleTime 100 ms
+        assert sim.cycle_times[0x103] == 0.5
+        assert sim.cycle_times[0xFEF6] == pytest.approx(1.0)  # DBC default 1000 ms
+
+    def test_rate_multiplier(self):
+        sim = DBCFileSimulator(rate_multiplier=10)
+        assert sim.cycle_times[0x101] == pytest.approx(0.01)
+        assert sim.frame_rate == pytest.approx(10 * (2 * 10 + 5 * 1))
+        with pytest.raises(ValueError):
+            DBCFileSimulator(rate_multiplier=0)
+
+    def test_dbc_simulator_traffic_decodes(self):
+        rx = can.interface.Bus(channel="vcan_dbc_sim", interface="virtual")
+        sim = DBCFileSimulator(rate_multiplier=20, seed=1)
+        try:
+            sim.start(channel="vcan_dbc_sim")
+            frames = [rx.recv(timeout=1.0) for _ in range(100)]
+        finally:
+            sim.stop()
+            rx.shutdown()
+
+        assert {m.arbitration_id for m in frames} >= {0x101, 0x102}
+        for m in frames:
+            decoded = sim.dbc.decode(m.arbitration_id, bytes(m.data))
+            for name, value in decoded.items():
+                sig = sim.dbc.get_signal(m.arbitration_id, name)
+                assert sig.min_val - 1e-9 <= value <= sig.max_val + 1e-9
+        assert sim.stats["frames_sent"] >= 100
+
+    def test_battery_simulator_interval(self):
+        receiver = CANTelemetryReceiver(channel="vcan_battery_interval")
+        sim = CANBatterySimulator(channel="vcan_battery_interval", interval=0.01, seed=0)
+        receiver.start()
+        sim.start()
+        try:
+            assert _wait_for(lambda: receiver.get_telemetry()["soc"] == 80)
+            time.sleep(0.2)
+        finally:
+            sim.stop()
+            receiver.stop()
+
+        data = receiver.get_telemetry()
+        assert 394.0 <= data["voltage"] <= 398.0
+        assert 45.0 <= data["current"] <= 55.0
+        assert 34.0 <= data["temperature"] <= 37.0
+        assert sim.stats["frames_sent"] >= 20
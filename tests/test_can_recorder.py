@@ -0,0 +1,224 @@
+"""Tests for the binary CAN recorder."""
+
+import threading
+import time
+
+import can
+import numpy as np
+import pytest
+
+from ev_qa_framework.can_bus import CANDispatcher
+from ev_qa_framework.can_recorder import (
+    FLAG_BRS,
+    FLAG_EXTENDED,
+    FLAG_FD,
+    FLAG_REMOTE,
+    FLAG_RX,
+    FRAME_DTYPE,
+    HEADER_SIZE,
+    CANRecorder,
+    RecordingFormatError,
+    open_recording,
+    read_header,
+)
+
+
+def _msg(can_id, data=b"\x01\x02\x03\x04\x05\x06\x07\x08", timestamp=0.0, **kwargs):
+    kwargs.setdefault("is_extended_id", False)
+    return can.Message(arbitration_id=can_id, data=data, timestamp=timestamp, **kwargs)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestRecordingFormat:
+    def test_record_size(self):
+        assert FRAME_DTYPE.itemsize == 80
+
+    def test_roundtrip_fields(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path, chunk_size=4) as recorder:
+            recorder.record(_msg(0x123, b"\xaa\xbb", timestamp=1.5), channel=2)
+            recorder.record(
+                _msg(
+                    0x18FF50E5,
+                    bytes(range(64)),
+                    2.0,
+                    is_extended_id=True,
+                    is_fd=True,
+                    bitrate_switch=True,
+                )
+            )
+            recorder.record(_msg(0x7DF, b"", 2.5, is_remote_frame=True))
+
+        frames = open_recording(path)
+        assert len(frames) == 3
+        np.testing.assert_array_equal(frames["timestamp"], [1.5, 2.0, 2.5])
+        np.testing.assert_array_equal(frames["can_id"], [0x123, 0x18FF50E5, 0x7DF])
+        np.testing.assert_array_equal(frames["channel"], [2, 0, 0])
+        np.testing.assert_array_equal(frames["dlc"], [2, 64, 0])
+        assert frames["data"][0, :3].tolist() == [0xAA, 0xBB, 0]
+        assert frames["data"][1].tolist() == list(range(64))
+        assert frames["flags"][0] == FLAG_RX
+        assert frames["flags"][1] == FLAG_RX | FLAG_EXTENDED | FLAG_FD | FLAG_BRS
+        assert frames["flags"][2] == FLAG_RX | FLAG_REMOTE
+
+    def test_header(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        recorder = CANRecorder(path)
+        recorder.start(start_time=1234.5)
+        recorder.stop()
+
+        header = read_header(path)
+        assert header.start_time == 1234.5
+        assert header.record_size == FRAME_DTYPE.itemsize
+        assert len(open_recording(path)) == 0
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"\x00" * 200)
+        with pytest.raises(RecordingFormatError):
+            open_recording(path)
+
+    def test_rejects_short_file(self, tmp_path):
+        path = tmp_path / "short.bin"
+        path.write_bytes(b"EVQA")
+        with pytest.raises(RecordingFormatError):
+            read_header(path)
+
+    def test_ignores_truncated_tail(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path) as recorder:
+            for i in range(5):
+                recorder.record(_msg(i))
+        with open(path, "ab") as f:
+            f.write(b"\x01" * 30)  # half-written record
+
+        assert len(open_recording(path)) == 5
+
+
+class TestCANRecorder:
+    def test_flushes_in_fixed_chunks(self, tmp_path):
+        recorder = CANRecorder(tmp_path / "trace.evcan", chunk_size=10)
+        recorder.start()
+        for i in range(25):
+            recorder.record(_msg(i))
+        assert _wait_for(lambda: recorder.flushed == 20)
+        assert recorder.stats["pending"] == 5
+
+        recorder.flush()
+        assert recorder.flushed == 25
+        assert recorder.chunks_flushed == 3
+        recorder.stop()
+
+    def test_file_readable_while_recording(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path, chunk_size=8) as recorder:
+            for i in range(8):
+                recorder.record(_msg(i))
+            recorder.flush()
+            assert open_recording(path)["can_id"].tolist() == list(range(8))
+
+    def test_buffers_are_cleared_between_chunks(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path, chunk_size=2, n_buffers=2) as recorder:
+            for _ in range(4):
+                recorder.record(_msg(1, b"\xff" * 8))
+                recorder.flush()
+            recorder.record(_msg(2, b"\x01"))
+
+        frames = open_recording(path)
+        assert frames["data"][-1, :8].tolist() == [1, 0, 0, 0, 0, 0, 0, 0]
+
+    def test_drops_when_writer_is_stalled(self, tmp_path):
+        recorder = CANRecorder(tmp_path / "trace.evcan", chunk_size=4, n_buffers=2)
+        recorder.start()
+        release = threading.Event()
+        real_write = recorder._file.write
+
+        def slow_write(data):
+            release.wait(5.0)
+            return real_write(data)
+
+        recorder._file.write = slow_write
+        for i in range(20):
+            recorder.record(_msg(i))
+
+        stats = recorder.stats
+        assert stats["received"] == 20
+        assert stats["dropped"] == 12  # two 4-frame buffers accepted, then nothing free
+        release.set()
+        recorder.stop()
+        assert recorder.flushed == 8
+
+    def test_sustains_high_frame_rate(self, tmp_path):
+        msgs = [_msg(i % 2048, timestamp=i * 1e-4) for i in range(80_000)]
+        with CANRecorder(tmp_path / "trace.evcan") as recorder:
+            start = time.perf_counter()
+            for msg in msgs:
+                recorder.record(msg)
+            elapsed = time.perf_counter() - start
+
+        assert recorder.dropped == 0
+        assert recorder.flushed == 80_000
+        # 8,000 frames/s per channel -> 80k frames must take well under 10 s
+        assert elapsed < 10.0
+        frames = open_recording(recorder.path)
+        np.testing.assert_array_equal(frames["can_id"][:5], [0, 1, 2, 3, 4])
+
+    def test_attach_bus(self, tmp_path):
+        rx = can.interface.Bus(channel="recorder_test", interface="virtual")
+        tx = can.interface.Bus(channel="recorder_test", interface="virtual")
+        path = tmp_path / "trace.evcan"
+        try:
+            with CANRecorder(path) as recorder:
+                recorder.attach(rx, channel=1)
+                for i in range(50):
+                    tx.send(_msg(0x100 + i))
+                assert _wait_for(lambda: recorder.received == 50)
+        finally:
+            rx.shutdown()
+            tx.shutdown()
+
+        frames = open_recording(path)
+        assert frames["can_id"].tolist() == [0x100 + i for i in range(50)]
+        assert set(frames["channel"].tolist()) == {1}
+
+    def test_attach_dispatcher(self, tmp_path):
+        dispatcher = CANDispatcher()
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path) as recorder:
+            recorder.attach(dispatcher, channel=3)
+            dispatcher.on_message_received(_msg(0x101))
+            dispatcher.on_message_received(_msg(0x102))
+        # Detached on stop
+        dispatcher.on_message_received(_msg(0x103))
+
+        frames = open_recording(path)
+        assert frames["can_id"].tolist() == [0x101, 0x102]
+        assert recorder.received == 2
+
+    def test_attach_disconnected_interface(self, tmp_path):
+        from ev_qa_framework.can_bus import CANHardwareInterface
+
+        with CANRecorder(tmp_path / "trace.evcan") as recorder:
+            with pytest.raises(ValueError):
+                recorder.attach(CANHardwareInterface(channel="can0"))
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            CANRecorder(tmp_path / "x", chunk_size=0)
+        with pytest.raises(ValueError):
+            CANRecorder(tmp_path / "x", n_buffers=1)
+
+    def test_header_size_is_fixed(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path) as recorder:
+            recorder.record(_msg(1))
+        assert path.stat().st_size == HEADER_SIZE + FRAME_DTYPE.itemsize
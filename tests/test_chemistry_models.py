@@ -21,11 +21,15 @@ from ev_qa_framework.chemistries import (
     THERMAL_LFP,
     THERMAL_NCA,
     THERMAL_NMC,
+    AgingGrid,
     AgingModel,
     OCVCurve,
+    OCVTable,
     ThermalModel,
     ThermalParams,
     get_profile,
+    neighbour_coupling,
+    project_grid,
 )
 
 # ===================================================================
@@ -125,6 +129,91 @@ class TestOCVCurve:
         assert restored.get_ocv(50.0) == OCV_LFP.get_ocv(50.0)
 
 
+class TestOCVTable:
+    """Compiled OCV lookup tables and vectorized pack helpers."""
+
+    @pytest.mark.parametrize("curve", [OCV_LFP, OCV_NMC, OCV_NCA])
+    def test_forward_matches_interp(self, curve):
+        soc = np.linspace(-5.0, 105.0, 5001)  # large enough for the dense path
+        expected = np.interp(soc, curve.soc_points, curve.ocv_points)
+        np.testing.assert_allclose(curve.get_ocv(soc), expected, atol=1e-12)
+        np.testing.assert_allclose(curve.get_ocv(soc[:50]), expected[:50], atol=1e-12)
+        for value in (0.0, 12.34, 50.0, 99.99):
+            expected_value = np.interp(value, curve.soc_points, curve.ocv_points)
+            assert curve.get_ocv(value) == pytest.approx(expected_value)
+
+    @pytest.mark.parametrize("curve", [OCV_LFP, OCV_NMC, OCV_NCA])
+    def test_inverse_roundtrip(self, curve):
+        soc = np.linspace(0.0, 100.0, 4001)
+        np.testing.assert_allclose(curve.get_soc_from_ocv(curve.get_ocv(soc)), soc, atol=1e-6)
+        assert curve.get_soc_from_ocv(curve.get_ocv(37.5)) == pytest.approx(37.5, abs=1e-6)
+
+    def test_lfp_plateau_inverse(self):
+        """The inverse stays exact across the flat LFP plateau."""
+        soc = np.arange(20.0, 80.5, 0.5)
+        np.testing.assert_allclose(OCV_LFP.get_soc_from_ocv(OCV_LFP.get_ocv(soc)), soc, atol=1e-3)
+
+    def test_flat_and_non_monotonic_segments(self):
+        curve = OCVCurve(
+            soc_points=[0, 20, 40, 60, 80, 100], ocv_points=[3.0, 3.3, 3.3, 3.29, 3.3, 4.0]
+        )
+        # 3.3 V is reached from SOC 20 to 80 on the monotonic envelope -> midpoint
+        assert curve.get_soc_from_ocv(3.3) == pytest.approx(50.0, abs=1e-6)
+        dense = curve.get_soc_from_ocv(np.full(3000, 3.3))
+        np.testing.assert_allclose(dense, 50.0, atol=1e-6)
+        soc = curve.get_soc_from_ocv(np.linspace(2.9, 4.1, 200))
+        assert np.all(np.diff(soc) >= 0)
+        assert soc[0] == 0.0 and soc[-1] == 100.0
+
+    def test_clamping_and_nan(self):
+        assert OCV_NMC.get_ocv(-10.0) == OCV_NMC.get_ocv(0.0)
+        assert OCV_NMC.get_soc_from_ocv(5.0) == 100.0
+        big = np.full(5000, np.nan)
+        big[0] = 50.0
+        ocv = OCV_NMC.get_ocv(big)
+        assert ocv[0] == pytest.approx(OCV_NMC.get_ocv(50.0))
+        assert np.isnan(ocv[1:]).all()
+        assert np.isnan(OCV_NMC.get_ocv(float("nan")))
+
+    def test_scalar_types(self):
+        assert isinstance(OCV_NMC.get_ocv(50), float)
+        assert isinstance(OCV_NMC.get_ocv(np.float64(50.0)), float)
+        assert OCV_NMC.get_ocv([10.0, 90.0]).shape == (2,)
+        np.testing.assert_array_equal(OCVCurve().get_ocv(np.zeros(3)), [3.7, 3.7, 3.7])
+
+    def test_compile_is_memoized_and_tracks_edits(self):
+        curve = OCVCurve(soc_points=[0.0, 100.0], ocv_points=[3.0, 4.0])
+        table = curve.compile()
+        assert isinstance(table, OCVTable)
+        assert curve.compile() is table
+        assert curve.compile(soc_resolution=0.5).ocv.size == 201
+        curve.ocv_points[1] = 4.2
+        assert curve.compile() is not table
+        assert curve.get_ocv(100.0) == pytest.approx(4.2)
+
+    def test_compile_rejects_bad_points(self):
+        with pytest.raises(ValueError):
+            OCVCurve(soc_points=[0.0, 50.0, 40.0], ocv_points=[3.0, 3.5, 3.6]).compile()
+        with pytest.raises(ValueError):
+            OCVCurve(soc_points=[0.0, 100.0], ocv_points=[3.0]).compile()
+        with pytest.raises(ValueError):
+            OCV_NMC.compile(voltage_resolution=0.0)
+
+    def test_pack_helpers_vectorized(self):
+        profile = get_profile("nmc")
+        soc = np.linspace(0.0, 100.0, 10)
+        pack = profile.pack_ocv(soc)
+        assert pack.shape == (10,)
+        assert pack[3] == pytest.approx(profile.pack_ocv(float(soc[3])))
+        np.testing.assert_allclose(profile.pack_soc_from_ocv(pack), soc, atol=1e-6)
+        cells = np.array([96] * 5 + [108] * 5)
+        np.testing.assert_allclose(profile.pack_ocv(soc, cells) / cells, pack / 96)
+        np.testing.assert_allclose(
+            profile.pack_soc_from_ocv(profile.pack_ocv(soc, cells), cells), soc, atol=1e-6
+        )
+        assert profile.pack_soc_from_ocv(profile.pack_ocv(42.0)) == pytest.approx(42.0, abs=1e-6)
+
+
 # ===================================================================
 # Aging Model Tests
 # ===================================================================
@@ -236,6 +325,104 @@ class TestAgingModel:
 # ===================================================================
 
 
+class TestAgingArrays:
+    """Array-native aging model and project_grid."""
+
+    def test_rates_broadcast(self):
+        temps = np.array([0.0, 25.0, 45.0])
+        cal = AGING_NMC.calendar_aging_rate(temps[:, None], np.array([20.0, 80.0]))
+        cyc = AGING_NMC.cycle_aging_rate(temps, c_rate=2.0, dod_pct=[50.0, 80.0, 100.0])
+        assert cal.shape == (3, 2)
+        assert cal[1, 1] == pytest.approx(AGING_NMC.calendar_aging_rate(25.0, 80.0))
+        assert cyc[2] == pytest.approx(AGING_NMC.cycle_aging_rate(45.0, 2.0, 100.0))
+        assert isinstance(AGING_NMC.calendar_aging_rate(np.float64(25.0)), float)
+
+    def test_predict_soh_matches_scalar_per_element(self):
+        rng = np.random.default_rng(3)
+        n = 400
+        args = {
+            "initial_soh": rng.uniform(70.0, 100.0, n),
+            "years": np.where(rng.random(n) < 0.5, rng.integers(0, 15, n), rng.uniform(0, 15, n)),
+            "cycles_per_year": rng.integers(100, 700, n).astype(float),
+            "temperature_c": rng.uniform(-10.0, 45.0, n),
+            "soc_pct": rng.uniform(10.0, 100.0, n),
+            "c_rate": rng.uniform(0.3, 3.0, n),
+            "dod_pct": rng.uniform(20.0, 100.0, n),
+        }
+        batch = AGING_NCA.predict_soh(**args)
+        expected = [
+            AGING_NCA.predict_soh(**{k: float(v[i]) for k, v in args.items()}) for i in range(n)
+        ]
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=1e-9)
+        # The sample crosses the knee point and the zero floor
+        assert (batch < AGING_NCA.knee_point_soh).any()
+        assert (batch == 0.0).any()
+
+    def test_knee_applies_per_element(self):
+        model = AgingModel(knee_point_soh=90.0, knee_factor=3.0)
+        soh = model.predict_soh(initial_soh=np.array([100.0, 89.0]), years=1.0)
+        loss_above = 100.0 - soh[0]
+        assert 89.0 - soh[1] == pytest.approx(3.0 * loss_above)
+
+    def test_project_grid_single_profile(self):
+        grid = project_grid(
+            "lfp", temperature_c=[0.0, 25.0, 45.0], years=np.arange(0, 11), cycles_per_year=500
+        )
+        assert isinstance(grid, AgingGrid)
+        assert grid.dims == ("temperature_c", "years")
+        assert grid.shape == (3, 11)
+        assert grid.attrs == {"chemistry": "lfp", "cycles_per_year": 500.0}
+        assert grid.sel(temperature_c=25.0, years=10) == pytest.approx(
+            AGING_LFP.predict_soh(years=10, temperature_c=25.0, cycles_per_year=500)
+        )
+        np.testing.assert_array_equal(grid.sel(years=0).values, [100.0, 100.0, 100.0])
+
+    def test_project_grid_all_profiles(self):
+        grid = project_grid(
+            None,
+            temperature_c=np.arange(-10.0, 46.0, 5.0),
+            soc_pct=[20.0, 50.0, 90.0],
+            c_rate=[0.5, 1.0, 2.0],
+            dod_pct=[50.0, 80.0],
+            years=np.arange(0.0, 16.0),
+        )
+        assert grid.dims[0] == "chemistry"
+        assert grid.shape == (3, 12, 3, 3, 2, 16)
+        assert list(grid.coords["chemistry"]) == ["lfp", "nmc", "nca"]
+        point = grid.sel(
+            chemistry="nmc", temperature_c=35.0, soc_pct=90.0, c_rate=2.0, dod_pct=80.0, years=12.0
+        )
+        assert point == pytest.approx(
+            AGING_NMC.predict_soh(
+                years=12.0, temperature_c=35.0, soc_pct=90.0, c_rate=2.0, dod_pct=80.0
+            )
+        )
+        sub = grid.sel(chemistry=["lfp", "nca"], years=[0.0, 15.0])
+        assert sub.shape == (2, 12, 3, 3, 2, 2)
+        assert list(sub.coords["years"]) == [0.0, 15.0]
+
+    def test_grid_to_dataframe(self):
+        grid = project_grid(AGING_NMC, temperature_c=[25.0, 35.0], years=[1.0, 2.0])
+        df = grid.to_dataframe()
+        assert list(df.columns) == ["temperature_c", "years", "soh"]
+        assert len(df) == 4
+        row = df[(df.temperature_c == 35.0) & (df.years == 2.0)]
+        assert row["soh"].iloc[0] == pytest.approx(grid.values[1, 1])
+
+    def test_grid_errors(self):
+        with pytest.raises(ValueError):
+            project_grid("nmc", humidity=[10.0, 20.0])
+        with pytest.raises(ValueError):
+            project_grid("nmc", years=np.zeros((2, 2)))
+        with pytest.raises(KeyError):
+            project_grid("abc", years=[1.0])
+        grid = project_grid("nmc", years=[1.0, 2.0])
+        with pytest.raises(KeyError):
+            grid.sel(years=3.0)
+        with pytest.raises(KeyError):
+            grid.sel(temperature_c=25.0)
+
+
 class TestThermalModel:
     """Tests for ThermalModel — temperature evolution."""
 
@@ -334,6 +521,95 @@ class TestThermalModel:
 # ===================================================================
 
 
+class TestThermalCells:
+    """Array-based multi-cell solver ThermalModel.simulate_cells."""
+
+    def test_matches_single_cell(self):
+        profile = np.random.default_rng(1).uniform(-150.0, 150.0, 500)
+        expected = THERMAL_NCA.simulate_thermal(list(profile), 20.0, 30.0, 5.0)
+        temps = THERMAL_NCA.simulate_cells(profile, 20.0, 30.0, 5.0)
+        assert temps.shape == (501, 1)
+        np.testing.assert_allclose(temps[:, 0], expected, rtol=1e-12)
+        temps32 = THERMAL_NCA.simulate_cells(profile, 20.0, 30.0, 5.0, dtype=np.float32)
+        assert temps32.dtype == np.float32
+        np.testing.assert_allclose(temps32[:, 0], expected, rtol=1e-5)
+
+    def test_per_cell_parameters_match_scalar_models(self):
+        profile = np.linspace(0.0, 120.0, 300)
+        resistance = np.array([0.04, 0.05, 0.06])
+        ambient = np.array([20.0, 25.0, 35.0])
+        temps = THERMAL_NMC.simulate_cells(
+            profile, 25.0, ambient, 2.0, reference_resistance=resistance, chunk_size=64
+        )
+        assert temps.shape == (301, 3)
+        for i in range(3):
+            model = ThermalModel(
+                thermal_params=THERMAL_NMC.thermal_params,
+                cell_mass_kg=THERMAL_NMC.cell_mass_kg,
+                heat_transfer_coeff=THERMAL_NMC.heat_transfer_coeff,
+                reference_resistance=resistance[i],
+                resistance_temp_coeff=THERMAL_NMC.resistance_temp_coeff,
+            )
+            expected = model.simulate_thermal(list(profile), 25.0, ambient[i], 2.0)
+            np.testing.assert_allclose(temps[:, i], expected, rtol=1e-12)
+
+    def test_per_cell_currents_and_decimation(self):
+        currents = np.column_stack([np.full(100, 10.0), np.full(100, 80.0)])
+        full = THERMAL_LFP.simulate_cells(currents, 25.0, 25.0)
+        every = THERMAL_LFP.simulate_cells(currents, 25.0, 25.0, every=30)
+        assert every.shape == (4, 2)
+        np.testing.assert_allclose(every, full[::30])
+        assert full[-1, 1] > full[-1, 0]
+
+    def test_conduction_conserves_heat(self):
+        model = ThermalModel(heat_transfer_coeff=0.0)
+        initial = np.array([20.0, 30.0, 40.0, 50.0])
+        temps = model.simulate_cells(
+            np.zeros(5000), initial, 25.0, 1.0, coupling=neighbour_coupling(4, 0.5)
+        )
+        np.testing.assert_allclose(temps.mean(axis=1), 35.0)
+        assert np.ptp(temps[-1]) < 0.5
+        assert np.all(np.diff(temps[:, 0]) >= 0)
+
+    def test_coupling_narrows_spread(self):
+        profile = np.full(600, 60.0)
+        resistance = np.linspace(0.04, 0.06, 8)
+        kwargs = {"reference_resistance": resistance}
+        free = THERMAL_NMC.simulate_cells(profile, 25.0, 25.0, **kwargs)
+        coupled = THERMAL_NMC.simulate_cells(
+            profile, 25.0, 25.0, coupling=neighbour_coupling(8, 0.2, ring=True), **kwargs
+        )
+        assert np.ptp(coupled[-1]) < np.ptp(free[-1])
+
+    def test_neighbour_coupling(self):
+        g = neighbour_coupling(4, 2.0)
+        np.testing.assert_array_equal(g.sum(axis=1), [2.0, 4.0, 4.0, 2.0])
+        np.testing.assert_array_equal(g, g.T)
+        assert neighbour_coupling(4, 2.0, ring=True)[0, 3] == 2.0
+
+    def test_out_array(self):
+        out = np.zeros((11, 3), dtype=np.float32)
+        result = THERMAL_NMC.simulate_cells(np.ones(10), 25.0, 25.0, n_cells=3, out=out)
+        assert result is out
+        assert out[0, 0] == 25.0
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            THERMAL_NMC.simulate_cells(
+                np.ones(10), [25.0, 26.0], 25.0, reference_resistance=[0.1] * 3
+            )
+        with pytest.raises(ValueError):
+            THERMAL_NMC.simulate_cells(np.ones(10), 25.0, 25.0, coupling=np.ones((2, 3)))
+        with pytest.raises(ValueError):
+            THERMAL_NMC.simulate_cells(np.ones(10), 25.0, 25.0, dtype=np.int32)
+        with pytest.raises(ValueError):
+            THERMAL_NMC.simulate_cells(np.ones(10), 25.0, 25.0, out=np.empty((10, 1)))
+        with pytest.raises(ValueError, match="too large"):
+            THERMAL_NMC.simulate_cells(
+                np.ones(10), 25.0, 25.0, 60.0, coupling=neighbour_coupling(3, 10.0)
+            )
+
+
 class TestProfileChemistryModels:
     """Tests for chemistry models integrated into BatteryChemistryProfile."""
 
@@ -75,7 +75,7 @@ def mock_analysis_results():
 @pytest.fixture
 def mock_analyzer(mock_analysis_results):
     """A mocked EVBatteryAnalyzer instance."""
-    with patch("ev_qa_framework.cli.EVBatteryAnalyzer") as MockCls:
+    with patch("ev_qa_framework.analysis.EVBatteryAnalyzer") as MockCls:
         instance = MagicMock()
         instance.analyze_telemetry.return_value = mock_analysis_results
         MockCls.return_value = instance
@@ -85,7 +85,7 @@ def mock_analyzer(mock_analysis_results):
 @pytest.fixture
 def mock_can_simulator():
     """Mock CANBatterySimulator."""
-    with patch("ev_qa_framework.cli.CANBatterySimulator") as MockCls:
+    with patch("ev_qa_framework.can_bus.CANBatterySimulator") as MockCls:
         instance = MagicMock()
         MockCls.return_value = instance
         yield MockCls, instance
@@ -94,7 +94,7 @@ def mock_can_simulator():
 @pytest.fixture
 def mock_can_receiver():
     """Mock CANTelemetryReceiver."""
-    with patch("ev_qa_framework.cli.CANTelemetryReceiver") as MockCls:
+    with patch("ev_qa_framework.can_bus.CANTelemetryReceiver") as MockCls:
         instance = MagicMock()
         instance.get_telemetry.return_value = {
             "voltage": 396.5,
@@ -109,7 +109,7 @@ def mock_can_receiver():
 @pytest.fixture
 def mock_soh_predictor():
     """Mock SOHPredictor."""
-    with patch("ev_qa_framework.cli.SOHPredictor") as MockCls:
+    with patch("ev_qa_framework.soh_predictor.SOHPredictor") as MockCls:
         instance = MagicMock()
         MockCls.return_value = instance
         yield MockCls, instance
@@ -200,7 +200,7 @@ class TestAnalyzeCsv:
             csv_path, index=False
         )
 
-        with patch("ev_qa_framework.cli.EVBatteryAnalyzer") as MockCls:
+        with patch("ev_qa_framework.analysis.EVBatteryAnalyzer") as MockCls:
             instance = MagicMock()
             instance.analyze_telemetry.return_value = {
                 "total_samples": 0,
@@ -307,7 +307,7 @@ class TestRunDbcEmulate:
         """DBC emulation with built-in DBC (no path)."""
         from ev_qa_framework.cli import run_dbc_emulate
 
-        with patch("ev_qa_framework.cli.DBCFileSimulator") as MockCls:
+        with patch("ev_qa_framework.can_bus.DBCFileSimulator") as MockCls:
             instance = MagicMock()
             instance.dbc = MagicMock()
             instance.dbc.messages = {0x101: MagicMock(), 0x102: MagicMock()}
@@ -330,7 +330,7 @@ class TestRunDbcEmulate:
         """DBC emulation with a custom DBC file path."""
         from ev_qa_framework.cli import run_dbc_emulate
 
-        with patch("ev_qa_framework.cli.DBCFileSimulator") as MockCls:
+        with patch("ev_qa_framework.can_bus.DBCFileSimulator") as MockCls:
             instance = MagicMock()
             instance.dbc = MagicMock()
             instance.dbc.messages = {0x200: MagicMock()}
@@ -348,7 +348,7 @@ class TestRunDbcEmulate:
         """Duration 0 should still start/stop but not loop."""
         from ev_qa_framework.cli import run_dbc_emulate
 
-        with patch("ev_qa_framework.cli.DBCFileSimulator") as MockCls:
+        with patch("ev_qa_framework.can_bus.DBCFileSimulator") as MockCls:
             instance = MagicMock()
             instance.dbc = MagicMock()
             instance.dbc.messages = {}
@@ -363,7 +363,7 @@ class TestRunDbcEmulate:
         """Simulator is stopped even if an error occurs during the loop."""
         from ev_qa_framework.cli import run_dbc_emulate
 
-        with patch("ev_qa_framework.cli.DBCFileSimulator") as MockCls:
+        with patch("ev_qa_framework.can_bus.DBCFileSimulator") as MockCls:
             instance = MagicMock()
             instance.dbc = MagicMock()
             instance.dbc.messages = {0x101: MagicMock()}
@@ -416,7 +416,7 @@ class TestTrainSohModel:
         """Verify pd.read_csv is called with the correct path."""
         from ev_qa_framework.cli import train_soh_model
 
-        with patch("ev_qa_framework.cli.pd.read_csv", wraps=pd.read_csv) as mock_read:
+        with patch("pandas.read_csv", wraps=pd.read_csv) as mock_read:
             train_soh_model(sample_csv, "/tmp/model")
             mock_read.assert_called_once_with(sample_csv)
 
@@ -622,7 +622,7 @@ class TestEdgeCases:
         """DBC emulate stop() is called even on keyboard interrupt."""
         from ev_qa_framework.cli import run_dbc_emulate
 
-        with patch("ev_qa_framework.cli.DBCFileSimulator") as MockCls:
+        with patch("ev_qa_framework.can_bus.DBCFileSimulator") as MockCls:
             instance = MagicMock()
             instance.dbc = MagicMock()
             instance.dbc.messages = {0x101: MagicMock()}
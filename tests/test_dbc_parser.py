@@ -1,8 +1,10 @@
 """Tests for DBCParser."""
 
 import os
+import random
 import tempfile
 
+import numpy as np
 import pytest
 
 from ev_qa_framework.dbc_parser import DBCParser, battery_dbc_content, builtin_dbc
@@ -213,3 +215,287 @@ class TestBatteryDBCContent:
         sig = Signal("Test", 0, 16, "Intel", False, 0.1, 0.0, 0, 1000, "V")
         assert sig.physical_to_raw(400.0) == 4000
         assert sig.physical_to_raw(0.0) == 0
+
+
+class TestCompiledDecode:
+    """Compiled decode plans must match the bit-by-bit reference extraction."""
+
+    @pytest.fixture
+    def random_parser(self, builtin):
+        from ev_qa_framework.dbc_parser import Message, Signal
+
+        rng = random.Random(0)
+        for can_id in range(1, 40):
+            msg = Message(id=can_id, name=f"M{can_id}", dlc=8, transmitter="X")
+            for k in range(rng.randint(1, 6)):
+                length = rng.randint(1, 64)
+                name = f"S{can_id}_{k}"
+                msg.signals[name] = Signal(
+                    name,
+                    rng.randint(0, 64 - length),
+                    length,
+                    rng.choice(["Intel", "Motorola"]),
+                    rng.random() < 0.5,
+                    rng.choice([1.0, 0.1, 0.001]),
+                    rng.choice([0.0, -40.0]),
+                    0,
+                    0,
+                    "",
+                )
+            builtin.messages[can_id] = msg
+        builtin.compile()
+        return builtin
+
+    @staticmethod
+    def _reference(parser, can_id, data):
+        msg = parser.messages[can_id]
+        return {
+            name: sig.raw_to_physical(DBCParser._extract_raw(data, sig))
+            for name, sig in msg.signals.items()
+        }
+
+    def test_decode_matches_reference(self, random_parser):
+        rng = random.Random(1)
+        for _ in range(500):
+            can_id = rng.choice(list(random_parser.messages))
+            data = bytes(rng.randrange(256) for _ in range(8))
+            assert random_parser.decode(can_id, data) == self._reference(
+                random_parser, can_id, data
+            )
+            short = data[: rng.randint(0, 7)]
+            assert random_parser.decode(can_id, short) == self._reference(
+                random_parser, can_id, short
+            )
+
+    def test_decode_batch_matches_decode(self, random_parser):
+        rng = np.random.default_rng(2)
+        ids = rng.choice(list(random_parser.messages), size=400)
+        payloads = rng.integers(0, 256, size=(400, 8), dtype=np.uint8)
+        columns = random_parser.decode_batch(ids, payloads)
+        for i, can_id in enumerate(ids):
+            expected = random_parser.decode(int(can_id), bytes(payloads[i]))
+            for name, column in columns.items():
+                if name in expected:
+                    assert column[i] == expected[name]
+                else:
+                    assert np.isnan(column[i])
+
+    def test_decode_batch_unknown_ids_and_shape(self, builtin):
+        columns = builtin.decode_batch([0x7FF], np.zeros((1, 8), dtype=np.uint8))
+        assert columns == {}
+        with pytest.raises(ValueError):
+            builtin.decode_batch([257, 258], np.zeros((1, 8), dtype=np.uint8))
+
+    def test_signal_value_uses_plan(self, builtin):
+        data = bytes([0x7D, 0x0F, 0xE5, 0x04, 0x00, 0x00, 0x00, 0x00])
+        assert (
+            builtin.get_signal_value(257, data, "Voltage") == builtin.decode(257, data)["Voltage"]
+        )
+        assert builtin.get_signal_value(257, data, "Missing") is None
+
+
+class TestEncode:
+    """Encoding is the inverse of the compiled decode."""
+
+    def test_encode_roundtrip(self, builtin):
+        data = builtin.encode(257, {"Voltage": 396.2, "Current": -12.5})
+        assert len(data) == 8
+        decoded = builtin.decode(257, data)
+        assert decoded["Voltage"] == pytest.approx(396.2)
+        assert decoded["Current"] == pytest.approx(-12.5)
+
+    def test_encode_saturates_and_defaults(self, builtin):
+        decoded = builtin.decode(258, builtin.encode(258, {"SOC": 400}))
+        assert decoded["SOC"] == 255
+        assert decoded["Temperature"] == -40  # raw 0
+
+    def test_encode_errors(self, builtin):
+        with pytest.raises(ValueError):
+            builtin.encode(0x7FF, {})
+        with pytest.raises(ValueError):
+            builtin.encode(257, {"Missing": 1.0})
+        with pytest.raises(ValueError):
+            builtin.encode_batch(257, {"Voltage": [1.0, 2.0], "Current": [1.0]})
+
+    def test_encode_batch_raw_matches_reference(self, builtin):
+        from ev_qa_framework.dbc_parser import Message, Signal
+
+        rng = random.Random(3)
+        for can_id in range(1, 200):
+            length = rng.randint(1, 64)
+            sig = Signal(
+                "S",
+                rng.randint(0, 64 - length),
+                length,
+                rng.choice(["Intel", "Motorola"]),
+                rng.random() < 0.5,
+                1.0,
+                0.0,
+                0,
+                0,
+                "",
+            )
+            builtin.messages[can_id] = Message(
+                id=can_id, name=f"M{can_id}", dlc=8, transmitter="X", signals={"S": sig}
+            )
+            lo = -(1 << (length - 1)) if sig.signed else 0
+            hi = (1 << (length - 1)) - 1 if sig.signed else (1 << length) - 1
+            values = [rng.randint(lo, min(hi, 2**63 - 1)) for _ in range(10)]
+
+            block = builtin.encode_batch(can_id, {"S": values}, raw=True)
+            assert block.shape == (10, 8)
+            for i, value in enumerate(values):
+                assert DBCParser._extract_raw(bytes(block[i]), sig) == value
+
+
+class TestCycleTimes:
+    def test_builtin_cycle_times(self, builtin):
+        assert builtin.get_message(257).cycle_time == 100
+        assert builtin.get_message(258).cycle_time == 100
+        assert builtin.get_message(259).cycle_time == 1000  # BA_DEF_DEF_ default
+
+    def test_no_attribute_means_zero(self, minimal_dbc):
+        assert DBCParser(minimal_dbc).get_message(257).cycle_time == 0
+
+
+class TestFrameSynthesizer:
+    def test_values_within_dbc_ranges(self, builtin):
+        from ev_qa_framework.dbc_parser import FrameSynthesizer
+
+        synth = FrameSynthesizer(builtin, seed=0)
+        for can_id, msg in builtin.messages.items():
+            block = synth.synthesize(can_id, 500)
+            assert block.shape == (500, 8)
+            assert block.dtype == np.uint8
+            columns = builtin.decode_batch(np.full(500, can_id), block)
+            for name, sig in msg.signals.items():
+                assert columns[name].min() >= sig.min_val - 1e-9
+                assert columns[name].max() <= sig.max_val + 1e-9
+
+    def test_seed_is_reproducible(self, builtin):
+        from ev_qa_framework.dbc_parser import FrameSynthesizer
+
+        a = FrameSynthesizer(builtin, seed=42).synthesize(257, 50)
+        b = FrameSynthesizer(builtin, seed=42).synthesize(257, 50)
+        np.testing.assert_array_equal(a, b)
+
+    def test_range_overrides(self, builtin):
+        from ev_qa_framework.dbc_parser import FrameSynthesizer
+
+        synth = FrameSynthesizer(builtin, ranges={"SOC": (80, 80), "Temperature": (20, 25)})
+        columns = builtin.decode_batch(np.full(200, 258), synth.synthesize(258, 200))
+        assert set(columns["SOC"].tolist()) == {80.0}
+        assert columns["Temperature"].min() >= 20
+        assert columns["Temperature"].max() <= 25
+
+    def test_unknown_id(self, builtin):
+        from ev_qa_framework.dbc_parser import FrameSynthesizer
+
+        with pytest.raises(ValueError):
+            FrameSynthesizer(builtin).synthesize(0x7FF, 1)
+
+
+class TestParseCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_memo(self):
+        from ev_qa_framework import dbc_parser
+
+        dbc_parser._parse_memo.clear()
+        yield
+        dbc_parser._parse_memo.clear()
+
+    @staticmethod
+    def _forbid_parse(monkeypatch):
+        def fail(self):
+            raise AssertionError("DBC was re-parsed")
+
+        monkeypatch.setattr(DBCParser, "_parse", fail)
+
+    def test_warm_load_skips_parse(self, minimal_dbc, tmp_path, monkeypatch):
+        from ev_qa_framework import dbc_parser
+
+        cold = DBCParser(minimal_dbc, cache=tmp_path)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        dbc_parser._parse_memo.clear()
+        self._forbid_parse(monkeypatch)
+        warm = DBCParser(minimal_dbc, cache=tmp_path)
+
+        assert warm.get_message(257) == cold.get_message(257)
+        assert warm.get_message_by_name("TestMessage").comment == "Test message"
+        data = bytes([0xA0, 0x0F, 0x0C, 0xFE, 0, 0, 0, 0])
+        assert warm.decode(257, data) == cold.decode(257, data)
+
+    def test_in_process_memo(self, minimal_dbc, monkeypatch):
+        first = DBCParser(minimal_dbc, cache=False)
+        self._forbid_parse(monkeypatch)
+        second = DBCParser(minimal_dbc, cache=False)
+
+        assert second.get_message(257) == first.get_message(257)
+        # Each parser owns its definitions
+        assert second.get_message(257) is not first.get_message(257)
+        second.get_signal(257, "Voltage").scale = 1.0
+        assert first.get_signal(257, "Voltage").scale == 0.1
+
+    def test_changed_file_is_reparsed(self, minimal_dbc, tmp_path):
+        DBCParser(minimal_dbc, cache=tmp_path)
+        with open(minimal_dbc, "a") as f:
+            f.write('\nBO_ 300 Extra: 8 TEST_ECU\n SG_ X : 0|8@1+ (1,0) [0|255] "" TEST_ECU\n')
+        parser = DBCParser(minimal_dbc, cache=tmp_path)
+        assert 300 in parser.messages
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_corrupt_cache_is_ignored(self, minimal_dbc, tmp_path):
+        from ev_qa_framework import dbc_parser
+
+        DBCParser(minimal_dbc, cache=tmp_path)
+        (cache_file,) = tmp_path.glob("*.json")
+        cache_file.write_text("{not json")
+        dbc_parser._parse_memo.clear()
+
+        parser = DBCParser(minimal_dbc, cache=tmp_path)
+        assert 257 in parser.messages
+
+    def test_cache_disabled_writes_nothing(self, minimal_dbc, tmp_path, monkeypatch):
+        monkeypatch.setenv("EV_QA_DBC_CACHE_DIR", str(tmp_path))
+        DBCParser(minimal_dbc, cache=False)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disk_cache_off_by_default(self, minimal_dbc, tmp_path, monkeypatch):
+        monkeypatch.delenv("EV_QA_DBC_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setenv("HOME", str(tmp_path))
+        DBCParser(minimal_dbc)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_concurrent_loads_share_memo(self, minimal_dbc):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ev_qa_framework import dbc_parser
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parsers = list(pool.map(lambda _: DBCParser(minimal_dbc, cache=False), range(32)))
+        assert all(p.get_message(257) == parsers[0].get_message(257) for p in parsers)
+        assert len(dbc_parser._parse_memo) == 1
+
+    def test_default_cache_dir_from_env(self, minimal_dbc, tmp_path, monkeypatch):
+        from ev_qa_framework.dbc_parser import default_cache_dir
+
+        monkeypatch.setenv("EV_QA_DBC_CACHE_DIR", str(tmp_path))
+        assert default_cache_dir() == tmp_path
+        DBCParser(minimal_dbc)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_builtin_loads_without_tempfile(self, monkeypatch):
+        def no_tempfile(*args, **kwargs):
+            raise AssertionError("tempfile used")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_tempfile)
+        parser = builtin_dbc()
+        assert parser.filepath == ""
+        assert parser.get_message(257).cycle_time == 100
+
+    def test_from_string(self):
+        parser = DBCParser.from_string(battery_dbc_content())
+        assert parser.version == "EV-QA-Framework v1.0"
+        assert len(parser.messages) == len(builtin_dbc().messages)
@@ -1,9 +1,16 @@
 """Tests for Battery Digital Twin."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from ev_qa_framework.config import FrameworkConfig
-from ev_qa_framework.digital_twin import BatteryDigitalTwin, BatteryState
+from ev_qa_framework.digital_twin import (
+    BatteryDigitalTwin,
+    BatteryFleetTwin,
+    BatteryState,
+    DegradationHorizon,
+)
 
 
 class TestBatteryState:
@@ -177,3 +184,145 @@ class TestDegradationSummary:
         twin.state.soh = 65.0
         summary = twin.get_degradation_summary()
         assert summary["estimated_cycles_to_70"] == 0.0
+
+
+def _stepped_soh(soh, n_cycles):
+    twin = BatteryDigitalTwin()
+    twin.state.soh = soh
+    for _ in range(n_cycles):
+        twin.step(1.0, 50.0)
+        twin.step(1.0, -50.0)
+    return twin.state.soh
+
+
+class TestDegradationHorizon:
+    @pytest.mark.parametrize("soh,n_cycles", [(100.0, 50), (80.3011, 200), (79.0, 30), (5.0, 300)])
+    def test_soh_after_matches_stepping(self, soh, n_cycles):
+        twin = BatteryDigitalTwin()
+        twin.state.soh = soh
+        assert twin.predict_soh(n_cycles) == pytest.approx(_stepped_soh(soh, n_cycles), abs=1e-6)
+
+    def test_cycles_across_knee(self):
+        horizon = DegradationHorizon()
+        # 20 points above the knee at 0.004/cycle, then 0.008/cycle below it
+        cycles = horizon.cycles_to(100.0, [90.0, 80.0, 70.0])
+        np.testing.assert_array_equal(cycles, [2500, 5000, 6250])
+        assert horizon.cycles_to(80.3, 75.1) == np.ceil(0.3 / 0.004 + 4.9 / 0.008)
+
+    def test_cycles_match_binary_search_on_stepping(self):
+        twin = BatteryDigitalTwin()
+        twin.state.soh = 80.31
+        (cycles,) = twin.estimate_cycles_to_soh((79.9513,))
+        assert _stepped_soh(80.31, int(cycles)) <= 79.9513
+        assert _stepped_soh(80.31, int(cycles) - 1) > 79.9513
+
+    def test_many_states_and_targets(self):
+        horizon = DegradationHorizon()
+        cycles = horizon.cycles_to(np.array([100.0, 85.0, 60.0]), np.array([80.0, 70.0]))
+        assert cycles.shape == (3, 2)
+        np.testing.assert_array_equal(cycles[2], [0.0, 0.0])
+        assert cycles[1, 0] == 1250.0
+
+    def test_beyond_horizon_is_nan(self):
+        horizon = DegradationHorizon()
+        assert np.isnan(horizon.cycles_to(100.0, 70.0, max_cycles=1000))
+        assert np.isnan(horizon.cycles_to(50.0, -1.0))
+
+    def test_summary_uses_memoized_horizon(self):
+        from ev_qa_framework.digital_twin import _cycles_to_soh_cached
+
+        twin = BatteryDigitalTwin()
+        twin.state.soh = 91.234
+        first = twin.get_degradation_summary()
+        hits = _cycles_to_soh_cached.cache_info().hits
+        assert twin.get_degradation_summary() == first
+        assert _cycles_to_soh_cached.cache_info().hits == hits + 1
+        assert first["estimated_cycles_to_80"] == np.ceil(11.234 / 0.004)
+
+    def test_fleet_cycles_to_soh(self):
+        fleet = BatteryFleetTwin(3, soh=[100.0, 90.0, 70.0], fade_rate=[0.002, 0.004, 0.002])
+        np.testing.assert_array_equal(
+            fleet.cycles_to_soh([80.0, 70.0]), [[5000, 6250], [1250, 1875], [0, 0]]
+        )
+
+
+class TestBatteryFleetTwin:
+    def _reference(self, soc, currents, dt):
+        twin = BatteryDigitalTwin()
+        twin.state.soc = soc
+        for current in currents:
+            twin.step(dt, float(current))
+        return twin.state
+
+    def test_matches_single_pack_twin(self):
+        rng = np.random.default_rng(0)
+        currents = rng.normal(0.0, 40.0, size=(300, 3))
+        fleet = BatteryFleetTwin(3, soc=[80.0, 50.0, 20.0])
+        history = fleet.simulate(currents, dt=0.5)
+
+        assert history.shape == (300, 3, len(BatteryFleetTwin.STATE_FIELDS))
+        for j, soc in enumerate([80.0, 50.0, 20.0]):
+            expected = self._reference(soc, currents[:, j], 0.5).to_dict()
+            actual = fleet.pack_state(j).to_dict()
+            for name in BatteryFleetTwin.STATE_FIELDS:
+                assert actual[name] == pytest.approx(expected[name], rel=1e-9), name
+            assert history[-1, j, BatteryFleetTwin.STATE_FIELDS.index("soh")] == pytest.approx(
+                expected["soh"]
+            )
+
+    def test_knee_point_accelerates_fade(self):
+        fleet = BatteryFleetTwin(2, soh=[90.0, 70.0])
+        fleet.step(1.0, 0.0)
+        np.testing.assert_allclose(fleet.soh, [90.0 - 0.002, 70.0 - 0.004])
+
+    def test_shared_profile_and_decimation(self):
+        fleet = BatteryFleetTwin(4)
+        history = fleet.simulate(np.full(10, 20.0), dt=0.1, fields=("soc", "soh"), every=3)
+
+        assert history.shape == (3, 4, 2)
+        np.testing.assert_allclose(history[:, 0, 0], history[:, 3, 0])
+        twin = BatteryDigitalTwin()
+        for _ in range(9):
+            twin.step(0.1, 20.0)
+        assert history[-1, 0, 0] == pytest.approx(twin.state.soc)
+
+    def test_writes_into_preallocated_array(self):
+        fleet = BatteryFleetTwin(2)
+        out = np.zeros((5, 2, 1), dtype=np.float32)
+        result = fleet.simulate(np.ones((5, 2)), fields=("temperature",), out=out)
+        assert result is out
+        assert np.all(out[-1] > 25.0)
+
+    def test_per_pack_parameters(self):
+        fleet = BatteryFleetTwin(2, fade_rate=[0.001, 0.004])
+        fleet.simulate(np.zeros(10), dt=1.0, fields=())
+        np.testing.assert_allclose(fleet.soh, [99.99, 99.96])
+
+    def test_reset_restores_initial_state(self):
+        fleet = BatteryFleetTwin(3, soc=[10.0, 20.0, 30.0])
+        fleet.simulate(np.full((5, 3), 50.0), fields=())
+        fleet.reset()
+        np.testing.assert_allclose(fleet.soc, [10.0, 20.0, 30.0])
+        assert np.all(fleet.cycle_count == 0.0)
+
+    def test_reset_voltage_is_open_circuit(self):
+        fleet = BatteryFleetTwin(2, soc=[80.0, 40.0])
+        np.testing.assert_allclose(fleet.voltage, [380.0, 340.0])
+        twin = BatteryDigitalTwin()
+        twin.step(0.1, 0.0)
+        assert fleet.voltage[0] == pytest.approx(twin.state.voltage)
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            BatteryFleetTwin(0)
+        with pytest.raises(ValueError):
+            BatteryFleetTwin(3, soc=[1.0, 2.0])
+        fleet = BatteryFleetTwin(3)
+        with pytest.raises(ValueError):
+            fleet.simulate(np.zeros((4, 2)))
+        with pytest.raises(ValueError):
+            fleet.simulate(np.zeros(4), fields=("bogus",))
+        with pytest.raises(ValueError):
+            fleet.simulate(np.zeros(4), every=0)
+        with pytest.raises(ValueError):
+            fleet.simulate(np.zeros(4), out=np.zeros((2, 3, 8)))
@@ -146,5 +146,115 @@ class TestEVQAFramework:
         assert results["failed"] == 1
 
 
+class TestRunTestSuiteBatch:
+    """Columnar run_test_suite_batch must match the row-wise run_test_suite"""
+
+    @staticmethod
+    def _rows():
+        rows = [
+            {
+                "voltage": 390.0 + i % 5,
+                "current": 50,
+                "temperature": 30 + (i % 3),
+                "soc": 80,
+                "soh": 98,
+            }
+            for i in range(30)
+        ]
+        rows[3]["voltage"] = 100.0  # below min_voltage
+        rows[7]["temperature"] = 70.0  # above max_temperature, also a jump
+        rows[11]["soh"] = 20.0  # implausible SOC/SOH -> Pydantic error
+        rows[15]["vin"] = "BADVIN"  # wrong length
+        rows[19]["voltage"] = 1200.0  # outside model range
+        rows[22]["soc"] = 5.0  # non-critical warning only
+        return rows
+
+    @pytest.mark.parametrize("fail_on_anomaly", [False, True])
+    def test_matches_row_wise(self, fail_on_anomaly):
+        import pandas as pd
+
+        rows = self._rows()
+        qa_rows = EVQAFramework("rows")
+        qa_cols = EVQAFramework("cols")
+        qa_rows.config.fail_on_anomaly = fail_on_anomaly
+        qa_cols.config.fail_on_anomaly = fail_on_anomaly
+
+        expected = qa_rows.run_test_suite(rows)
+        actual = qa_cols.run_test_suite_batch(pd.DataFrame(rows))
+
+        for key in ("total_tests", "passed", "failed", "critical_issues", "anomalies"):
+            assert actual[key] == expected[key], key
+        for key in ("total_samples", "anomalies_detected", "severity"):
+            assert actual["ml_analysis"][key] == expected["ml_analysis"][key], key
+
+    def test_accepts_dict_of_arrays(self):
+        import numpy as np
+
+        n = 50
+        data = {
+            "voltage": np.full(n, 390.0),
+            "current": np.linspace(10, 60, n),
+            "temperature": np.full(n, 35.0),
+            "soc": np.full(n, 80.0),
+            "soh": np.full(n, 98.0),
+        }
+        results = EVQAFramework("cols").run_test_suite_batch(data)
+        assert results["total_tests"] == n
+        assert results["passed"] == n
+        assert results["critical_issues"] == []
+        assert results["ml_analysis"]["total_samples"] == n
+
+    def test_does_not_mutate_input(self):
+        import pandas as pd
+
+        df = pd.DataFrame(self._rows())
+        before = df.copy()
+        EVQAFramework("cols").run_test_suite_batch(df)
+        pd.testing.assert_frame_equal(df, before)
+
+
+class TestRunTestSuites:
+    """Several suites sharing one ML scoring pass"""
+
+    @staticmethod
+    def _suite(offset, n=20):
+        return [
+            {
+                "voltage": 390.0 + offset + i % 4,
+                "current": 50 + i,
+                "temperature": 30,
+                "soc": 80,
+                "soh": 98,
+            }
+            for i in range(n)
+        ]
+
+    def test_matches_run_test_suite_when_fitted(self):
+        import pandas as pd
+
+        baseline = pd.DataFrame(
+            {
+                "voltage": [390.0 + i % 7 for i in range(200)],
+                "current": list(range(200)),
+                "temp": 30.0,
+            }
+        )
+        suites = [self._suite(0), self._suite(5), [{"voltage": 100.0}]]
+        qa_many = EVQAFramework("many")
+        qa_one = EVQAFramework("one")
+        qa_many.ml_analyzer.fit(baseline)
+        qa_one.ml_analyzer.fit(baseline)
+
+        results = qa_many.run_test_suites(suites)
+
+        assert results == [qa_one.run_test_suite(suite) for suite in suites]
+        assert results[2]["ml_analysis"] is None
+
+    def test_unfitted_falls_back_to_sequential(self):
+        results = EVQAFramework("many").run_test_suites([self._suite(0), self._suite(1)])
+        assert [r["total_tests"] for r in results] == [20, 20]
+        assert all(r["ml_analysis"]["total_samples"] == 20 for r in results)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
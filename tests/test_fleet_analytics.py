@@ -421,3 +421,171 @@ class TestCustomComponents:
         fleet.add_battery("bat_1", df)
         summary = fleet.get_fleet_summary()
         assert summary["fleet_size"] == 1
+
+
+# ===================================================================
+# 6. Parallel, content-cached fleet engine
+# ===================================================================
+
+
+class TestParallelFleetEngine:
+    def test_score_all_matches_in_process(self, mixed_fleet: FleetAnalytics):
+        parallel = mixed_fleet.score_all(max_workers=2)
+        serial = FleetAnalytics()
+        for bid in mixed_fleet.battery_ids:
+            serial.add_battery(bid, mixed_fleet.get_telemetry(bid))
+        in_process = serial.score_all(max_workers=1)
+        assert set(parallel) == set(mixed_fleet.battery_ids)
+        for bid in parallel:
+            assert parallel[bid]["score"] == in_process[bid]["score"]
+
+    def test_unchanged_batteries_not_rescored(self, monkeypatch):
+        from ev_qa_framework import fleet_analytics
+
+        calls = []
+        original = fleet_analytics._score_battery_task
+
+        def counting(df, *args):
+            calls.append(len(df))
+            return original(df, *args)
+
+        monkeypatch.setattr(fleet_analytics, "_score_battery_task", counting)
+        fleet = FleetAnalytics(max_workers=1)
+        fleet.add_battery("a", make_telemetry(seed=1))
+        fleet.add_battery("b", make_telemetry(seed=2))
+        fleet.get_fleet_summary()
+        assert len(calls) == 2
+
+        # Re-adding identical data hits the content cache
+        fleet.add_battery("a", make_telemetry(seed=1))
+        fleet.compare_batteries()
+        assert len(calls) == 2
+
+        # Changed telemetry is rescored
+        fleet.add_battery("b", make_telemetry(seed=3))
+        fleet.detect_fleet_anomalies()
+        assert len(calls) == 3
+
+    def test_identical_batteries_scored_once(self, monkeypatch):
+        from ev_qa_framework import fleet_analytics
+
+        calls = []
+        original = fleet_analytics._score_battery_task
+        monkeypatch.setattr(
+            fleet_analytics,
+            "_score_battery_task",
+            lambda df, *a: calls.append(1) or original(df, *a),
+        )
+        fleet = FleetAnalytics()
+        fleet.add_battery("a", make_telemetry(seed=5))
+        fleet.add_battery("b", make_telemetry(seed=5))
+        results = fleet.score_all(max_workers=1)
+        assert len(calls) == 1
+        assert results["a"] == results["b"]
+
+    def test_result_cache_is_bounded(self, monkeypatch):
+        from ev_qa_framework import fleet_analytics
+
+        calls = []
+        original = fleet_analytics._score_battery_task
+        monkeypatch.setattr(
+            fleet_analytics,
+            "_score_battery_task",
+            lambda df, *a: calls.append(1) or original(df, *a),
+        )
+        fleet = FleetAnalytics(result_cache_size=2)
+        for seed in range(4):  # successive snapshots of one battery
+            fleet.add_battery("a", make_telemetry(seed=seed))
+            fleet.score_all(max_workers=1)
+        assert len(fleet._results_by_hash) == 2
+        assert len(calls) == 4
+
+        # Snapshot 3 is still cached, snapshot 0 was evicted
+        fleet.add_battery("a", make_telemetry(seed=3))
+        fleet.score_all(max_workers=1)
+        assert len(calls) == 4
+        fleet.add_battery("a", make_telemetry(seed=0))
+        fleet.score_all(max_workers=1)
+        assert len(calls) == 5
+
+    def test_score_all_unknown_battery(self, fleet: FleetAnalytics):
+        with pytest.raises(KeyError):
+            fleet.score_all(["missing"])
+
+    def test_telemetry_hash(self):
+        from ev_qa_framework.fleet_analytics import telemetry_hash
+
+        df = make_telemetry(seed=1)
+        assert telemetry_hash(df) == telemetry_hash(df.copy())
+        changed = df.copy()
+        changed.loc[0, "voltage"] += 0.001
+        assert telemetry_hash(df) != telemetry_hash(changed)
+
+
+# ===================================================================
+# 7. Shared per-chemistry reference model
+# ===================================================================
+
+
+class TestFleetReferenceModel:
+    @pytest.fixture
+    def reference_fleet(self) -> FleetAnalytics:
+        fl = FleetAnalytics()
+        for i in range(4):
+            fl.add_battery(f"nmc_{i}", make_telemetry(seed=i), chemistry="nmc")
+        fl.add_battery("nmc_bad", make_anomalous_telemetry(n_anomalies=20), chemistry="nmc")
+        for i in range(2):
+            fl.add_battery(f"lfp_{i}", make_telemetry(voltage=330.0, seed=10 + i), chemistry="lfp")
+        return fl
+
+    def test_fit_per_chemistry(self, reference_fleet: FleetAnalytics):
+        model = reference_fleet.fit_reference_model()
+        assert sorted(model.chemistries) == ["lfp", "nmc"]
+
+    def test_unknown_chemistry_rejected(self):
+        from ev_qa_framework.fleet_analytics import FleetReferenceModel
+
+        with pytest.raises(KeyError):
+            FleetReferenceModel().fit("lead_acid", make_telemetry())
+
+    def test_score_batteries_matches_per_battery_calls(self, reference_fleet: FleetAnalytics):
+        model = reference_fleet.fit_reference_model()
+        frames = {
+            bid: reference_fleet.get_telemetry(bid)
+            for bid in reference_fleet.battery_ids
+            if bid.startswith("nmc")
+        }
+        batch = model.score_batteries(frames, "nmc")
+        for bid, df in frames.items():
+            single = model.score_batteries({bid: df}, "nmc")[bid]
+            assert single == batch[bid]
+
+    def test_anomalous_battery_stands_out(self, reference_fleet: FleetAnalytics):
+        reference_fleet.fit_reference_model()
+        table = reference_fleet.compare_batteries().set_index("battery_id")
+        healthy = table.loc[[f"nmc_{i}" for i in range(4)], "anomaly_percentage"]
+        assert table.loc["nmc_bad", "anomaly_percentage"] > healthy.max()
+        # The scorer's anomaly component uses the same reference percentage
+        pct = table.loc["nmc_bad", "anomaly_percentage"]
+        assert table.loc["nmc_bad", "anomaly_score"] == pytest.approx(max(0.0, 100.0 - 2 * pct))
+
+    def test_retrain_invalidates_cached_results(self, reference_fleet: FleetAnalytics):
+        model = reference_fleet.fit_reference_model()
+        before = reference_fleet._analyze_anomaly("nmc_0")
+        model.fit("nmc", make_anomalous_telemetry(n=400, n_anomalies=0, seed=3))
+        after = reference_fleet._analyze_anomaly("nmc_0")
+        assert after is not before
+
+    def test_missing_model_for_chemistry(self):
+        from ev_qa_framework.fleet_analytics import FleetReferenceModel
+
+        fl = FleetAnalytics(reference_model=FleetReferenceModel())
+        fl.add_battery("a", make_telemetry(), chemistry="nca")
+        with pytest.raises(KeyError):
+            fl.get_fleet_summary()
+
+    def test_score_all_uses_reference(self, reference_fleet: FleetAnalytics):
+        reference_fleet.fit_reference_model()
+        results = reference_fleet.score_all(max_workers=1)
+        assert reference_fleet._anomalies["nmc_bad"]["reference_model"] == "nmc"
+        assert set(results) == set(reference_fleet.battery_ids)
@@ -0,0 +1,77 @@
+"""Import-time regression tests: heavy dependencies must load on first use only."""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("pandas", "sklearn", "scipy", "matplotlib", "tensorflow")
+_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$")
+
+
+def _import_profile(code: str) -> tuple[dict[str, int], str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            cumulative[m.group(2)] = int(m.group(1))
+    return cumulative, proc.stdout
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "ev_qa_framework",
+        "ev_qa_framework.cli",
+        "ev_qa_framework.config",
+        "ev_qa_framework.models",
+        "ev_qa_framework.framework",
+        "ev_qa_framework.analysis",
+        "ev_qa_framework.fleet_analytics",
+        "ev_qa_framework.cell_balance",
+        "ev_qa_framework.soh_predictor",
+    ],
+)
+def test_no_heavy_imports(module):
+    loaded, _ = _import_profile(f"import {module}")
+    heavy = sorted({name for name in loaded if name.split(".")[0] in HEAVY})
+    assert not heavy, f"{module} imports {heavy[:5]} at import time"
+
+
+def test_cli_import_budget():
+    # Best of three to keep scheduler noise out of the measurement
+    runs = [_import_profile("import ev_qa_framework.cli")[0] for _ in range(3)]
+    best = min(run["ev_qa_framework.cli"] for run in runs)
+    assert best < 200_000, f"ev_qa_framework.cli took {best / 1e3:.1f} ms to import"
+
+
+def test_help_does_not_load_heavy_modules():
+    code = (
+        "import sys\n"
+        "from ev_qa_framework.cli import main\n"
+        "sys.argv = ['ev-qa', '--help']\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit as e:\n"
+        "    assert not e.code\n"
+    )
+    loaded, out = _import_profile(code)
+    assert "usage:" in out
+    assert not [name for name in loaded if name.split(".")[0] in HEAVY]
+
+
+def test_lazy_names_resolve():
+    import ev_qa_framework
+
+    assert ev_qa_framework.EVQAFramework.__name__ == "EVQAFramework"
+    assert "EVBatteryAnalyzer" in ev_qa_framework.__all__
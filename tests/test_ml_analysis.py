@@ -2,11 +2,17 @@
 Tests for ML battery telemetry analyzer.
 """
 
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
 
-from ev_qa_framework.analysis import EVBatteryAnalyzer
+from ev_qa_framework.analysis import (
+    EVBatteryAnalyzer,
+    StreamingAnomalyDetector,
+    _CompiledForest,
+)
 
 
 class TestEVBatteryAnalyzer:
@@ -184,5 +190,137 @@ class TestEVBatteryAnalyzerEdgeCases:
         assert results["anomalies_detected"] > 0
 
 
+class TestAnalyzeTelemetryBatch:
+    """Pre-fitted analyzer scoring several frames in one pass."""
+
+    @staticmethod
+    def _frame(seed, n=60, spike=False):
+        rng = np.random.default_rng(seed)
+        df = pd.DataFrame(
+            {
+                "voltage": rng.normal(400, 2, n),
+                "current": rng.normal(50, 5, n),
+                "temperature": rng.normal(30, 1, n),
+                "soc": np.full(n, 80.0),
+            }
+        )
+        if spike:
+            df.loc[n // 2, "voltage"] = 480.0
+        return df
+
+    def test_matches_analyze_telemetry(self):
+        analyzer = EVBatteryAnalyzer(random_state=0).fit(self._frame(0, n=500))
+        frames = [self._frame(1), self._frame(2, spike=True), self._frame(3, n=5)]
+
+        batch = analyzer.analyze_telemetry_batch(frames)
+        single = [analyzer.analyze_telemetry(df) for df in frames]
+
+        assert batch == single
+        assert batch[2]["severity"] == "UNKNOWN"
+        assert batch[1]["anomalies_detected"] >= 1
+
+    def test_requires_fitted_model(self):
+        with pytest.raises(ValueError):
+            EVBatteryAnalyzer().analyze_telemetry_batch([self._frame(0)])
+
+    def test_fit_sets_is_fitted(self):
+        analyzer = EVBatteryAnalyzer()
+        assert not analyzer.is_fitted
+        analyzer.fit(self._frame(0))
+        assert analyzer.is_fitted
+
+
+class TestStreamingAnomalyDetector:
+    """Tests for the incremental StreamingAnomalyDetector."""
+
+    @staticmethod
+    def _samples(n, seed=0):
+        rng = np.random.default_rng(seed)
+        return [
+            {"voltage": v, "current": c, "temp": t}
+            for v, c, t in zip(rng.normal(400, 1, n), rng.normal(100, 5, n), rng.normal(35, 0.5, n))
+        ]
+
+    def test_warmup_returns_none(self):
+        detector = StreamingAnomalyDetector(window_size=20, background=False)
+        results = [detector.update(s) for s in self._samples(9)]
+        assert results == [None] * 9
+        assert detector.update(self._samples(1)[0]) is not None
+
+    def test_missing_features_ignored(self):
+        detector = StreamingAnomalyDetector(background=False)
+        assert detector.update({"voltage": 400.0}) is None
+
+    def test_running_stats_match_window(self):
+        window = 25
+        samples = self._samples(100)
+        detector = StreamingAnomalyDetector(window_size=window, background=False)
+        for s in samples:
+            detector.update(s)
+        X = np.array([[s["voltage"], s["current"], s["temp"]] for s in samples[-window:]])
+        np.testing.assert_allclose(detector.mean, X.mean(axis=0), rtol=1e-9)
+        np.testing.assert_allclose(detector.std, X.std(axis=0), rtol=1e-6)
+
+    def test_running_stats_stay_exact_on_long_streams(self):
+        # A high-variance stretch followed by a near-constant one makes the
+        # incremental M2 cancel catastrophically without the periodic resync
+        n, window = 20_000, 64
+        rng = np.random.default_rng(2)
+        voltage = np.where(
+            np.arange(n) < n // 2, rng.uniform(-1e7, 1e7, n), 400 + rng.normal(0, 1e-3, n)
+        )
+        X = np.column_stack([voltage, rng.normal(100, 5, n), rng.normal(35, 0.5, n)])
+        detector = StreamingAnomalyDetector(
+            window_size=window, retrain_every=10**9, n_estimators=5, background=False
+        )
+        for i, row in enumerate(X):
+            detector.update(dict(zip(("voltage", "current", "temp"), row)))
+            if i >= n - 3 * window:  # check every step of the last few passes
+                tail = X[i + 1 - window : i + 1]
+                np.testing.assert_allclose(detector.mean, tail.mean(axis=0), rtol=1e-9)
+                np.testing.assert_allclose(detector.std, np.sqrt(np.var(tail, axis=0)), rtol=1e-6)
+        assert np.all(detector._m2 >= 0.0)
+
+    def test_detects_outlier(self):
+        detector = StreamingAnomalyDetector(window_size=100, background=False)
+        for s in self._samples(100):
+            detector.update(s)
+        result = detector.update({"voltage": 600.0, "current": 400.0, "temp": 90.0})
+        assert result["is_anomaly"] is True
+        assert result["window_size"] == 100
+
+    def test_background_retrain_swaps_model(self):
+        detector = StreamingAnomalyDetector(window_size=50, retrain_every=5)
+        samples = self._samples(20)
+        for s in samples[:10]:
+            detector.update(s)
+        first_model = detector._model
+        for s in samples[10:15]:
+            detector.update(s)
+        detector._pending.result(timeout=30)
+        deadline = time.monotonic() + 5
+        while detector._model is first_model and time.monotonic() < deadline:
+            time.sleep(0.01)  # done-callbacks run just after result() is released
+        assert detector._model is not first_model
+
+    def test_compiled_forest_matches_sklearn(self):
+        from sklearn.ensemble import IsolationForest
+
+        rng = np.random.default_rng(1)
+        model = IsolationForest(n_estimators=50, random_state=42).fit(rng.normal(size=(200, 3)))
+        X = rng.normal(size=(300, 3)) * 2
+        np.testing.assert_allclose(
+            _CompiledForest(model).score_samples(X), model.score_samples(X), atol=1e-12
+        )
+
+    def test_reset(self):
+        detector = StreamingAnomalyDetector(background=False)
+        for s in self._samples(20):
+            detector.update(s)
+        detector.reset()
+        assert detector._model is None
+        assert detector.update(self._samples(1)[0]) is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -11,18 +11,23 @@ Tests cover:
 - Read/write register operations
 """
 
+import asyncio
+import os
 import socket
 import struct
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from ev_qa_framework.modbus import (
+    BMS_READ_PLAN,
     BMS_REGISTER_MAP,
     FAULT_FLAGS,
+    # Clients
+    AsyncModbusTCPClient,
     # Constants / Enums
     FunctionCode,
-    # Clients
     ModbusConfigurationError,
     ModbusConnectionError,
     ModbusCRCError,
@@ -40,8 +45,12 @@ from ev_qa_framework.modbus import (
     _build_write_single_register_pdu,
     # CRC
     _crc16_modbus,
+    _crc16_modbus_bitwise,
     _parse_read_response,
     _validate_crc,
+    coalesce_register_ranges,
+    crc16_modbus_batch,
+    validate_crc_batch,
 )
 
 # ═══════════════════════════════════════════════════════════════════
@@ -124,6 +133,52 @@ class TestCRC16:
         assert _validate_crc(b"\x01\x02") is False
         assert _validate_crc(b"") is False
 
+    def test_crc_reference_frame(self):
+        """Read 10 holding registers from unit 1: CRC bytes are C5 CD."""
+        assert _crc16_modbus(bytes.fromhex("01030000000A")) == 0xCDC5
+
+    def test_table_matches_bitwise(self):
+        for size in (0, 1, 2, 7, 64, 255):
+            data = os.urandom(size)
+            assert _crc16_modbus(data) == _crc16_modbus_bitwise(data)
+
+
+class TestCRC16Batch:
+    @staticmethod
+    def _frames(n=200):
+        return [_append_crc(os.urandom(2 + i % 40)) for i in range(n)]
+
+    def test_crc_matches_scalar(self):
+        frames = self._frames()
+        assert crc16_modbus_batch(frames).tolist() == [_crc16_modbus(f) for f in frames]
+
+    def test_validate_matches_scalar(self):
+        frames = self._frames()
+        frames[3] = frames[3][:-1] + bytes([frames[3][-1] ^ 0x01])
+        frames += [b"", b"\x01\x02", b"\x01\x03\x00"]
+        expected = [_validate_crc(f) for f in frames]
+        assert validate_crc_batch(frames).tolist() == expected
+        assert not expected[3]
+
+    def test_padded_array_with_lengths(self):
+        frames = [_append_crc(b"\x01\x03\x00\x00\x00\x0a"), _append_crc(b"\x02\x06\x00\x01")]
+        data = np.zeros((2, 16), dtype=np.uint8)
+        for row, frame in zip(data, frames):
+            row[: len(frame)] = list(frame)
+        assert validate_crc_batch(data, lengths=[8, 6]).tolist() == [True, True]
+
+    def test_uniform_array(self):
+        data = np.frombuffer(b"".join(self._frames(4)[:1] * 4), dtype=np.uint8).reshape(4, -1)
+        assert validate_crc_batch(data).all()
+
+    def test_rejects_1d_array(self):
+        with pytest.raises(ValueError):
+            crc16_modbus_batch(np.zeros(8, dtype=np.uint8))
+
+    def test_empty(self):
+        assert len(crc16_modbus_batch([])) == 0
+        assert len(validate_crc_batch([])) == 0
+
 
 # ═══════════════════════════════════════════════════════════════════
 # PDU Builder Tests
@@ -684,6 +739,20 @@ class TestModbusRTUClient:
         assert client.is_connected is True
         mock_serial_cls.assert_called_once()
 
+    @patch("serial.Serial")
+    def test_set_baudrate_reuses_open_port(self, mock_serial_cls):
+        mock_ser = MagicMock()
+        mock_serial_cls.return_value = mock_ser
+
+        client = ModbusRTUClient("/dev/ttyUSB0")
+        client.connect()
+        client.set_baudrate(38400)
+
+        assert client.baudrate == 38400
+        assert mock_ser.baudrate == 38400
+        mock_ser.reset_input_buffer.assert_called_once()
+        mock_serial_cls.assert_called_once()
+
     @patch("serial.Serial")
     def test_connect_failure(self, mock_serial_cls):
         mock_serial_cls.side_effect = OSError("Port not found")
@@ -955,3 +1024,269 @@ class TestTransactionRetry:
         assert regs == [10]
         # Should succeed on first attempt
         assert mock_sock.recv.call_count <= 10  # At most a few recv calls
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Register Coalescing Tests
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestCoalesceRegisterRanges:
+    def test_bms_map_is_one_read(self):
+        assert BMS_READ_PLAN == [(0x0000, 0x0032)]
+
+    def test_no_gap_allowed(self):
+        plan = coalesce_register_ranges(
+            ((r["address"], r["count"]) for r in BMS_REGISTER_MAP.values()), max_gap=0
+        )
+        assert plan == [(0x0000, 7), (0x0010, 3), (0x0020, 2), (0x0030, 2)]
+
+    def test_overlapping_and_unsorted(self):
+        assert coalesce_register_ranges([(10, 5), (0, 4), (12, 10)], max_gap=0) == [
+            (0, 4),
+            (10, 12),
+        ]
+
+    def test_respects_max_quantity(self):
+        plan = coalesce_register_ranges([(0, 100), (100, 50)], max_quantity=125)
+        assert plan == [(0, 100), (100, 50)]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Async (pipelined) Modbus TCP Client Tests
+# ═══════════════════════════════════════════════════════════════════
+
+
+class _FakeModbusServer:
+    """Minimal asyncio Modbus TCP slave answering FC03/06/16.
+
+    Requests are collected for ``hold`` seconds and then answered in
+    reverse order, so the client has to match on transaction ID.
+    """
+
+    def __init__(self, registers: dict[int, int], unit_id: int = 1, hold: float = 0.02):
+        self.registers = registers
+        self.unit_id = unit_id
+        self.hold = hold
+        self.requests: list[tuple[int, int, int]] = []  # (fc, address, quantity)
+        self.max_outstanding = 0
+        self.drop_next = 0
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        batch: list[tuple[int, bytes]] = []
+
+        async def flush():
+            await asyncio.sleep(self.hold)
+            self.max_outstanding = max(self.max_outstanding, len(batch))
+            for tid, pdu in reversed(batch):
+                writer.write(struct.pack(">HHHB", tid, 0, len(pdu) + 1, self.unit_id) + pdu)
+            batch.clear()
+            await writer.drain()
+
+        flusher = None
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                tid, _, length, _ = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                if self.drop_next:
+                    self.drop_next -= 1
+                    continue
+                batch.append((tid, self._respond(pdu)))
+                if flusher is None or flusher.done():
+                    flusher = asyncio.create_task(flush())
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def _respond(self, pdu: bytes) -> bytes:
+        fc, address, quantity = struct.unpack(">BHH", pdu[:5])
+        self.requests.append((fc, address, quantity))
+        if fc == 0x03:
+            if address + quantity > 0x0100:
+                return bytes([0x83, 0x02])
+            values = [self.registers.get(address + i, 0) for i in range(quantity)]
+            return struct.pack(f">BB{quantity}H", fc, quantity * 2, *values)
+        if fc == 0x06:
+            self.registers[address] = quantity
+            return pdu[:5]
+        if fc == 0x10:
+            values = struct.unpack(f">{quantity}H", pdu[6 : 6 + 2 * quantity])
+            for i, value in enumerate(values):
+                self.registers[address + i] = value
+            return pdu[:5]
+        return bytes([fc | 0x80, 0x01])
+
+
+_BMS_REGISTERS = {
+    0x0000: 4000,
+    0x0001: 0xFE0C,  # -50.0 A
+    0x0002: 800,
+    0x0003: 950,
+    0x0004: 700,
+    0x0005: 600,
+    0x0006: 650,
+    0x0010: 3500,
+    0x0011: 3700,
+    0x0012: 200,
+    0x0020: 0x0001,
+    0x0021: 0x0002,
+    0x0030: 0b10001,
+    0x0031: 3,
+}
+
+
+class TestAsyncModbusTCPClient:
+    def test_battery_telemetry_in_one_read(self):
+        asyncio.run(self._battery_telemetry_in_one_read())
+
+    async def _battery_telemetry_in_one_read(self):
+        async with _FakeModbusServer(dict(_BMS_REGISTERS)) as server:
+            async with AsyncModbusTCPClient("127.0.0.1", server.port) as client:
+                telemetry = await client.read_battery_telemetry()
+
+        assert server.requests == [(0x03, 0x0000, 0x0032)]
+        assert telemetry["pack_voltage"] == pytest.approx(400.0)
+        assert telemetry["pack_current"] == pytest.approx(-50.0)
+        assert telemetry["temperature_avg"] == pytest.approx(25.0)
+        assert telemetry["cell_voltage_delta"] == pytest.approx(0.2)
+        assert telemetry["charge_cycle_count"] == 0x00010002
+        assert telemetry["fault_flags"] == ["Overvoltage", "Overtemperature"]
+        assert telemetry["status_flags"] == 3
+
+    def test_matches_sync_decoding(self):
+        asyncio.run(self._matches_sync_decoding())
+
+    async def _matches_sync_decoding(self):
+        """Same register values decode identically via the sync client path."""
+        async with _FakeModbusServer(dict(_BMS_REGISTERS)) as server:
+            async with AsyncModbusTCPClient("127.0.0.1", server.port, max_gap=0) as client:
+                async_telemetry = await client.read_battery_telemetry()
+        assert len(server.requests) == 4
+
+        sync_client = ModbusTCPClient("127.0.0.1", unit_id=1)
+        sync_client._connected = True
+        blocks = {
+            (a, n): [_BMS_REGISTERS.get(a + i, 0) for i in range(n)]
+            for a, n in [(0x0000, 7), (0x0010, 3), (0x0020, 2), (0x0030, 2)]
+        }
+        with patch.object(
+            ModbusTCPClient, "read_holding_registers", side_effect=lambda a, n: blocks[(a, n)]
+        ):
+            assert sync_client.read_battery_telemetry() == async_telemetry
+
+    def test_pipelined_reads_matched_by_tid(self):
+        asyncio.run(self._pipelined_reads_matched_by_tid())
+
+    async def _pipelined_reads_matched_by_tid(self):
+        registers = {i: i * 3 for i in range(0x40)}
+        async with _FakeModbusServer(registers, hold=0.05) as server:
+            async with AsyncModbusTCPClient("127.0.0.1", server.port, max_in_flight=4) as client:
+                ranges = [(i * 4, 4) for i in range(8)]
+                start = asyncio.get_running_loop().time()
+                blocks = await client.read_register_blocks(ranges)
+                elapsed = asyncio.get_running_loop().time() - start
+
+        for (address, count), values in zip(ranges, blocks):
+            assert values == [registers[address + i] for i in range(count)]
+        assert server.max_outstanding == 4
+        # Two pipelined waves, not eight sequential round-trips
+        assert elapsed < 8 * 0.05
+
+    def test_writes(self):
+        asyncio.run(self._writes())
+
+    async def _writes(self):
+        async with _FakeModbusServer({}) as server:
+            async with AsyncModbusTCPClient("127.0.0.1", server.port) as client:
+                await client.write_single_register(0x0040, 7)
+                await client.write_multiple_registers(0x0041, [1, 2])
+        assert server.registers[0x0040] == 7
+        assert server.registers[0x0042] == 2
+
+    def test_exception_response(self):
+        asyncio.run(self._exception_response())
+
+    async def _exception_response(self):
+        async with _FakeModbusServer({}) as server:
+            async with AsyncModbusTCPClient("127.0.0.1", server.port) as client:
+                with pytest.raises(ModbusResponseError) as exc_info:
+                    await client.read_holding_registers(0x00FF, 2)
+        assert exc_info.value.exception_code == 0x02
+
+    def test_timeout_retries(self):
+        asyncio.run(self._timeout_retries())
+
+    async def _timeout_retries(self):
+        async with _FakeModbusServer({0: 5}) as server:
+            server.drop_next = 1
+            async with AsyncModbusTCPClient(
+                "127.0.0.1", server.port, timeout=0.2, retries=2
+            ) as client:
+                assert await client.read_holding_registers(0, 1) == [5]
+            server.drop_next = 2
+            async with AsyncModbusTCPClient(
+                "127.0.0.1", server.port, timeout=0.2, retries=2
+            ) as client:
+                with pytest.raises(ModbusTimeoutError):
+                    await client.read_holding_registers(0, 1)
+
+    def test_invalid_mbap_length_fails_pending(self):
+        asyncio.run(self._invalid_mbap_length_fails_pending())
+
+    async def _invalid_mbap_length_fails_pending(self):
+        async def handle(reader, writer):
+            header = await reader.readexactly(7)
+            tid = struct.unpack(">H", header[:2])[0]
+            await reader.readexactly(struct.unpack(">H", header[4:6])[0] - 1)
+            writer.write(struct.pack(">HHHB", tid, 0, 0, 1))  # length 0 is invalid
+            await writer.drain()
+            await reader.read()  # hold the connection open until the client drops it
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            client = AsyncModbusTCPClient("127.0.0.1", port, timeout=5.0, retries=1)
+            await client.connect()
+            start = asyncio.get_running_loop().time()
+            with pytest.raises(ModbusResponseError, match="MBAP length"):
+                await client.read_holding_registers(0, 1)
+            assert asyncio.get_running_loop().time() - start < 1.0  # not the 5 s timeout
+            assert not client.is_connected
+            with pytest.raises(ModbusConnectionError):
+                await client.read_holding_registers(0, 1)
+            await client.disconnect()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    def test_not_connected(self):
+        asyncio.run(self._not_connected())
+
+    async def _not_connected(self):
+        client = AsyncModbusTCPClient("127.0.0.1")
+        with pytest.raises(ModbusConnectionError):
+            await client.read_holding_registers(0, 1)
+
+    def test_connect_refused(self):
+        asyncio.run(self._connect_refused())
+
+    async def _connect_refused(self):
+        with pytest.raises(ModbusConnectionError):
+            await AsyncModbusTCPClient("127.0.0.1", port=1, timeout=0.5).connect()
+
+    def test_invalid_config(self):
+        with pytest.raises(ModbusConfigurationError):
+            AsyncModbusTCPClient("127.0.0.1", unit_id=0)
+        with pytest.raises(ModbusConfigurationError):
+            AsyncModbusTCPClient("127.0.0.1", max_in_flight=0)
@@ -13,7 +13,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from ev_qa_framework.thermal_runaway import ThermalRunawayPredictor
+from ev_qa_framework.thermal_runaway import (
+    FleetThermalMonitor,
+    TemperatureStats,
+    ThermalRunawayMonitor,
+    ThermalRunawayPredictor,
+)
 
 
 class TestThermalRunawayPredictorInit:
@@ -187,3 +192,149 @@ class TestPredictRisk:
         df = pd.DataFrame({"temp": np.random.normal(30, 5, 1000).tolist()})
         result = ThermalRunawayPredictor().predict_risk(df)
         assert "risk_level" in result
+
+
+class TestTemperatureStats:
+    """Shared statistics match the DataFrame-based feature extraction."""
+
+    def test_trend_features_match(self):
+        rng = np.random.default_rng(3)
+        temps = 30 + np.cumsum(rng.normal(0.2, 0.5, 80))
+        predictor = ThermalRunawayPredictor()
+        expected = predictor.analyze_temperature_trend(pd.DataFrame({"temp": temps}))
+        assert TemperatureStats.from_temps(temps).trend_features() == expected
+
+    def test_short_series(self):
+        assert TemperatureStats.from_temps(np.array([])).n == 0
+        single = TemperatureStats.from_temps(np.array([42.0]))
+        assert single.max == 42.0
+        assert single.slope == 0.0 and single.volatility == 0.0
+
+    def test_predict_from_temps_matches_predict_risk(self):
+        temps = np.linspace(25, 60, 40)
+        from_df = ThermalRunawayPredictor().predict_risk(pd.DataFrame({"temp": temps}))
+        stats = TemperatureStats.from_temps(temps)
+        from_arr = ThermalRunawayPredictor().predict_risk_from_temps(temps, stats)
+        assert from_arr == from_df
+
+
+class TestBootstrap:
+    """Vectorised, seeded bootstrap uncertainty."""
+
+    def test_batch_matches_scalar_rule_score(self):
+        rng = np.random.default_rng(11)
+        samples = 40 + rng.normal(0, 3, (20, 12)).cumsum(axis=1)
+        predictor = ThermalRunawayPredictor()
+        batch = predictor._rule_scores_batch(samples)
+        expected = [predictor._rule_score(row) for row in samples]
+        np.testing.assert_allclose(batch, expected, rtol=1e-9, atol=1e-9)
+
+    def test_reproducible_with_seed(self):
+        df = pd.DataFrame({"temp": np.random.default_rng(5).normal(45, 4, 120)})
+        a = ThermalRunawayPredictor(random_state=7).predict_risk(df)
+        b = ThermalRunawayPredictor(random_state=7).predict_risk(df)
+        assert a["confidence_interval"] == b["confidence_interval"]
+        assert a["score_uncertainty"] == b["score_uncertainty"]
+
+    def test_resample_count(self):
+        temps = np.random.default_rng(1).normal(40, 3, 200)
+        assert len(ThermalRunawayPredictor(n_bootstrap=200)._bootstrap_scores(temps)) == 200
+        # Capped at the series length
+        assert len(ThermalRunawayPredictor(n_bootstrap=500)._bootstrap_scores(temps)) == 200
+
+    def test_disabled_bootstrap(self):
+        df = pd.DataFrame({"temp": np.linspace(30, 40, 30)})
+        result = ThermalRunawayPredictor(n_bootstrap=0).predict_risk(df)
+        assert result["score_uncertainty"] == 0.0
+
+    def test_negative_resamples_rejected(self):
+        with pytest.raises(ValueError):
+            ThermalRunawayPredictor(n_bootstrap=-1)
+
+
+def _fleet_traces(n_vehicles=4, n=250, seed=0):
+    rng = np.random.default_rng(seed)
+    data = 35 + np.cumsum(rng.normal(0.05, 0.6, (n_vehicles, n)), axis=1)
+    data[1, n // 2 :] += np.linspace(0, 90, n - n // 2)  # runaway
+    data[2, n // 3] += 15  # single spike
+    return data
+
+
+class TestThermalRunawayMonitor:
+    """Incremental monitor matches predict_risk on the trailing window."""
+
+    WINDOW = 25
+
+    def test_matches_predict_risk(self):
+        predictor = ThermalRunawayPredictor()
+        for temps in _fleet_traces():
+            monitor = ThermalRunawayMonitor(self.WINDOW)
+            for t in range(len(temps)):
+                result = monitor.update(temps[t])
+                window = temps[max(0, t - self.WINDOW + 1) : t + 1]
+                expected = predictor.predict_risk_from_temps(window)
+                assert result["risk_level"] == expected["risk_level"]
+                assert result["risk_score"] == pytest.approx(expected["risk_score"], abs=0.011)
+                if len(window) >= 2:
+                    for key in ("temp_rise_rate", "max_temp", "volatility", "dt_dt"):
+                        assert result[key] == pytest.approx(expected[key], abs=1e-8)
+
+    def test_stats_min_max_track_window(self):
+        temps = _fleet_traces()[0]
+        monitor = ThermalRunawayMonitor(self.WINDOW)
+        for t in range(len(temps)):
+            monitor.update(temps[t])
+            window = temps[max(0, t - self.WINDOW + 1) : t + 1]
+            stats = monitor.stats
+            assert stats.min == np.min(window)
+            assert stats.max == np.max(window)
+
+    def test_detects_runaway(self):
+        monitor = ThermalRunawayMonitor(30)
+        levels = [monitor.update(t)["risk_level"] for t in _fleet_traces()[1]]
+        assert levels[0] == "LOW"
+        assert "CRITICAL" in levels[150:]
+
+    def test_single_sample(self):
+        monitor = ThermalRunawayMonitor(10)
+        assert monitor.update(30.0)["risk_level"] == "LOW"
+        assert len(monitor) == 1
+
+    def test_reset(self):
+        monitor = ThermalRunawayMonitor(5)
+        for t in range(20):
+            monitor.update(30.0 + t)
+        monitor.reset()
+        assert len(monitor) == 0
+        assert monitor.update(30.0)["risk_score"] == 0.0
+
+    def test_rejects_ml_predictor(self):
+        with pytest.raises(ValueError):
+            ThermalRunawayMonitor(predictor=ThermalRunawayPredictor(mode="ml"))
+
+    def test_rejects_small_window(self):
+        with pytest.raises(ValueError):
+            ThermalRunawayMonitor(window_size=1)
+
+
+class TestFleetThermalMonitor:
+    """2D multi-vehicle monitor matches the per-vehicle monitor."""
+
+    def test_matches_single_monitors(self):
+        data = _fleet_traces()
+        fleet = FleetThermalMonitor(len(data), window_size=20)
+        singles = [ThermalRunawayMonitor(20) for _ in data]
+        for t in range(data.shape[1]):
+            batch = fleet.update(data[:, t])
+            for v, monitor in enumerate(singles):
+                result = monitor.update(data[v, t])
+                assert batch["risk_level"][v] == result["risk_level"]
+                assert batch["risk_score"][v] == pytest.approx(result["risk_score"], abs=1e-9)
+                if t > 0:
+                    assert batch["dt_dt"][v] == pytest.approx(result["dt_dt"], abs=1e-9)
+                    assert batch["max_temp"][v] == pytest.approx(result["max_temp"])
+
+    def test_shape_validation(self):
+        fleet = FleetThermalMonitor(3)
+        with pytest.raises(ValueError):
+            fleet.update([30.0, 31.0])
@@ -0,0 +1,201 @@
+"""Tests for memory-mapped CAN trace replay."""
+
+import threading
+import time
+
+import can
+import numpy as np
+import pytest
+
+from ev_qa_framework.can_recorder import FRAME_DTYPE, CANRecorder
+from ev_qa_framework.hil import HILInterface, HILTestRunner
+from ev_qa_framework.trace_replay import TraceReplayer
+from ev_qa_framework.vector_export import VectorExporter
+
+
+def _record(path, n=50, period=0.01, t0=100.0):
+    with CANRecorder(path, chunk_size=16) as recorder:
+        for i in range(n):
+            recorder.record(
+                can.Message(
+                    arbitration_id=0x100 + i % 3,
+                    data=bytes([i, i + 1, i + 2]),
+                    timestamp=t0 + i * period,
+                    is_extended_id=False,
+                )
+            )
+    return path
+
+
+@pytest.fixture
+def trace(tmp_path):
+    return _record(tmp_path / "trace.evcan")
+
+
+class TestTraceViews:
+    def test_len_and_duration(self, trace):
+        replayer = TraceReplayer(trace)
+        assert len(replayer) == 50
+        assert replayer.duration == pytest.approx(0.49)
+
+    def test_window_is_zero_copy(self, trace):
+        replayer = TraceReplayer(trace)
+        view = replayer.window(start=0.1, end=0.2)
+        assert len(view) == 10
+        assert view["timestamp"][0] == pytest.approx(100.1)
+        assert np.shares_memory(view, replayer.frames)
+
+    def test_iter_chunks(self, trace):
+        replayer = TraceReplayer(trace)
+        chunks = list(replayer.iter_chunks(chunk_size=20))
+        assert [len(c) for c in chunks] == [20, 20, 10]
+        assert all(np.shares_memory(c, replayer.frames) for c in chunks)
+
+    def test_iter_chunks_filters_ids(self, trace):
+        chunks = list(TraceReplayer(trace).iter_chunks(chunk_size=20, can_ids=[0x101]))
+        ids = np.concatenate([c["can_id"] for c in chunks])
+        assert set(ids.tolist()) == {0x101}
+        assert len(ids) == 17
+
+    def test_from_array(self):
+        frames = np.zeros(3, dtype=FRAME_DTYPE)
+        frames["timestamp"] = [0.0, 1.0, 2.0]
+        assert TraceReplayer(frames).duration == 2.0
+        with pytest.raises(ValueError):
+            TraceReplayer(np.zeros(3))
+
+    def test_iter_batches_skip_error_frames(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path) as recorder:
+            recorder.record(can.Message(arbitration_id=0x1, data=b"\x01", is_extended_id=False))
+            recorder.record(can.Message(is_error_frame=True))
+            recorder.record(can.Message(arbitration_id=0x2, is_remote_frame=True))
+        batches = list(TraceReplayer(path).iter_batches())
+        assert len(batches) == 1
+        assert batches[0].can_id.tolist() == [1]
+        assert batches[0].data.shape == (1, 8)
+
+    def test_vector_exporter_reads_recordings(self, trace):
+        batches = list(VectorExporter().iter_frames(trace, chunk_size=30))
+        assert [len(b) for b in batches] == [30, 20]
+        assert batches[0].data[1, :3].tolist() == [1, 2, 3]
+        assert batches[0].dlc[0] == 3
+
+
+class TestReplay:
+    def test_fast_replay_preserves_frames(self, trace):
+        received = []
+        stats = TraceReplayer(trace).replay(received.append, speed=None)
+
+        assert stats.frames_sent == 50
+        assert stats.max_lateness_s == 0.0
+        assert [m.arbitration_id for m in received[:4]] == [0x100, 0x101, 0x102, 0x100]
+        assert bytes(received[5].data) == bytes([5, 6, 7])
+        assert received[5].timestamp == pytest.approx(100.05)
+        assert received[0].is_extended_id is False
+
+    def test_timed_replay_follows_recorded_timing(self, trace):
+        sent_at = []
+        stats = TraceReplayer(trace).replay(
+            lambda m: sent_at.append(time.perf_counter()), speed=2.0
+        )
+
+        assert stats.frames_sent == 50
+        gaps = np.diff(sent_at)
+        # 10 ms recorded spacing at 2x speed
+        assert np.median(gaps) == pytest.approx(0.005, abs=0.001)
+        assert stats.duration_s == pytest.approx(0.245, abs=0.05)
+        assert stats.max_lateness_s < 0.05
+
+    def test_replay_window_and_ids(self, trace):
+        received = []
+        stats = TraceReplayer(trace).replay(
+            received.append, speed=None, start=0.1, end=0.3, can_ids=[0x100]
+        )
+        assert stats.frames_sent == len(received) == 6
+        assert {m.arbitration_id for m in received} == {0x100}
+
+    def test_stop_event(self, trace):
+        stop = threading.Event()
+        received = []
+
+        def send(msg):
+            received.append(msg)
+            if len(received) == 5:
+                stop.set()
+
+        stats = TraceReplayer(trace).replay(send, speed=None, stop_event=stop)
+        assert stats.stopped is True
+        assert stats.frames_sent == 5
+
+    def test_send_errors_are_counted(self, trace):
+        def send(msg):
+            if msg.arbitration_id == 0x102:
+                raise can.CanError("tx buffer full")
+
+        stats = TraceReplayer(trace).replay(send, speed=None)
+        assert stats.send_errors == 16
+        assert stats.frames_sent == 34
+
+    def test_replay_into_bus(self, trace):
+        tx = can.interface.Bus(channel="replay_test", interface="virtual")
+        rx = can.interface.Bus(channel="replay_test", interface="virtual")
+        try:
+            TraceReplayer(trace).replay(tx, speed=None)
+            received = [rx.recv(timeout=1.0) for _ in range(50)]
+        finally:
+            tx.shutdown()
+            rx.shutdown()
+        assert [m.arbitration_id for m in received[:3]] == [0x100, 0x101, 0x102]
+
+    def test_replay_into_hil_interface(self, trace):
+        hil = HILInterface(simulation=True)
+        TraceReplayer(trace).replay(hil, speed=None)
+
+        first = hil.receive()
+        assert first.arbitration_id == 0x100
+        assert first.data == bytes([0, 1, 2])
+        assert first.dlc == 3
+        assert len(hil._sim_messages) == 49
+
+    def test_replay_keeps_remote_and_error_flags(self, tmp_path):
+        path = tmp_path / "trace.evcan"
+        with CANRecorder(path) as recorder:
+            recorder.record(can.Message(arbitration_id=0x1, data=b"\x01", is_extended_id=False))
+            recorder.record(can.Message(arbitration_id=0x2, dlc=4, is_remote_frame=True))
+            recorder.record(can.Message(is_error_frame=True))
+        received = []
+        TraceReplayer(path).replay(received.append, speed=None)
+
+        assert [(m.is_remote_frame, m.is_error_frame) for m in received] == [
+            (False, False),
+            (True, False),
+            (False, True),
+        ]
+        assert len(received[1].data) == 0
+
+        hil = HILInterface(simulation=True)
+        stats = TraceReplayer(path).replay(hil, speed=None)
+        assert stats.frames_sent == 1
+        assert stats.send_errors == 2
+
+    def test_negative_speed_rejected(self, trace):
+        with pytest.raises(ValueError):
+            TraceReplayer(trace).replay(lambda m: None, speed=-1.0)
+
+
+class TestHILTraceReplay:
+    def test_replay_trace(self, trace):
+        runner = HILTestRunner(simulation=True)
+        result = runner.replay_trace(trace, speed=None)
+
+        assert result.passed is True
+        assert result.test_name == "trace.evcan"
+        assert result.messages_sent == 50
+        assert result.data["replay"]["frames_sent"] == 50
+
+    def test_replay_missing_trace(self, tmp_path):
+        runner = HILTestRunner(simulation=True)
+        result = runner.replay_trace(tmp_path / "missing.evcan")
+        assert result.passed is False
+        assert result.errors
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import math
+
+import pandas as pd
 import pytest
 
 from ev_qa_framework.vector_export import VectorExporter
@@ -223,3 +226,114 @@ class TestTestVectorExport:
 
         content = result.read_text(encoding="utf-8")
         assert "unknown" in content  # default test_name
+
+
+@pytest.fixture
+def battery_trace():
+    """Interleaved built-in DBC frames: 0x101, 0x102, 0x103 every 10 ms."""
+    trace = []
+    for i in range(60):
+        t = i * 0.01
+        voltage = int((390.0 + i * 0.1) * 10)
+        current = int(50.0 * 10)
+        trace.append(
+            {
+                "timestamp": t,
+                "can_id": 0x101,
+                "channel": 0,
+                "data": voltage.to_bytes(2, "little") + current.to_bytes(2, "little") + bytes(4),
+            }
+        )
+        trace.append(
+            {
+                "timestamp": t + 0.001,
+                "can_id": 0x102,
+                "channel": 0,
+                "data": bytes([35 + 40 + i % 3, 80]) + bytes(6),
+            }
+        )
+        trace.append(
+            {"timestamp": t + 0.002, "can_id": 0x103, "channel": 0, "data": bytes([97]) + bytes(7)}
+        )
+        trace.append({"timestamp": t + 0.003, "can_id": 0x7FF, "channel": 0, "data": bytes(8)})
+    return trace
+
+
+class TestStreamingImport:
+    """Chunked ASC/BLF ingestion into columnar frames."""
+
+    def test_iter_frames_chunks(self, exporter, sample_trace, tmp_path):
+        path = exporter.export_asc(sample_trace, tmp_path / "t.asc")
+        batches = list(exporter.iter_frames(path, chunk_size=2))
+        assert [len(b) for b in batches] == [2, 1]
+        assert batches[0].data.shape == (2, 8)
+        assert batches[0].can_id.tolist() == [0x123, 0x456]
+        assert batches[0].dlc.tolist() == [8, 3]
+        assert bytes(batches[0].data[1, :3]) == bytes([0xAA, 0xBB, 0xCC])
+
+    def test_iter_frames_matches_import_asc(self, exporter, sample_trace, tmp_path):
+        path = exporter.export_asc(sample_trace, tmp_path / "t.asc")
+        imported = exporter.import_asc(path)
+        (batch,) = exporter.iter_frames(path)
+        assert batch.timestamp.tolist() == [m["timestamp"] for m in imported]
+        assert [bytes(batch.data[i, : batch.dlc[i]]) for i in range(len(batch))] == [
+            m["data"] for m in imported
+        ]
+
+    def test_iter_frames_invalid_chunk_size(self, exporter, tmp_path):
+        with pytest.raises(ValueError):
+            next(exporter.iter_frames(tmp_path / "t.asc", chunk_size=0))
+
+    def test_telemetry_frames_across_chunks(self, exporter, battery_trace, tmp_path):
+        from ev_qa_framework.dbc_parser import builtin_dbc
+        from ev_qa_framework.vector_export import BATTERY_SIGNAL_MAP
+
+        path = exporter.export_asc(battery_trace, tmp_path / "battery.asc")
+        dbc = builtin_dbc()
+        chunked = list(
+            exporter.iter_telemetry_frames(path, dbc, chunk_size=7, signal_map=BATTERY_SIGNAL_MAP)
+        )
+        whole = list(
+            exporter.iter_telemetry_frames(
+                path, dbc, chunk_size=10_000, signal_map=BATTERY_SIGNAL_MAP
+            )
+        )
+        assert len(chunked) > 1
+        combined = pd.concat(chunked, ignore_index=True)
+        pd.testing.assert_frame_equal(combined, whole[0])
+        # First complete row is the first 0x103 frame; unknown IDs are dropped
+        assert combined["can_id"].iloc[0] == 0x103
+        assert 0x7FF not in combined["can_id"].values
+        assert not combined[list(BATTERY_SIGNAL_MAP.values())].isna().any().any()
+
+    def test_telemetry_frames_feed_analyzer(self, exporter, battery_trace, tmp_path):
+        from ev_qa_framework.analysis import EVBatteryAnalyzer
+        from ev_qa_framework.dbc_parser import builtin_dbc
+        from ev_qa_framework.vector_export import BATTERY_SIGNAL_MAP
+
+        path = exporter.export_asc(battery_trace, tmp_path / "battery.asc")
+        (frame,) = exporter.iter_telemetry_frames(
+            path, builtin_dbc(), signal_map=BATTERY_SIGNAL_MAP
+        )
+        result = EVBatteryAnalyzer().analyze_telemetry(frame)
+        assert result["total_samples"] == len(frame)
+        assert "error" not in result
+
+    def test_telemetry_frames_sparse(self, exporter, battery_trace, tmp_path):
+        from ev_qa_framework.dbc_parser import builtin_dbc
+
+        path = exporter.export_asc(battery_trace, tmp_path / "battery.asc")
+        (frame,) = exporter.iter_telemetry_frames(path, builtin_dbc(), fill_forward=False)
+        first = frame.iloc[0]
+        assert first["Voltage"] == pytest.approx(390.0)
+        assert math.isnan(first["Temperature"])
+
+    def test_blf_stream(self, exporter, battery_trace, tmp_path):
+        from ev_qa_framework import vector_export
+
+        if not vector_export._BLF_AVAILABLE:
+            pytest.skip("python-can BLF support not installed")
+        path = exporter.export_blf(battery_trace, tmp_path / "battery.blf")
+        batches = list(exporter.iter_frames(path, chunk_size=100))
+        assert sum(len(b) for b in batches) == len(battery_trace)
+        assert batches[0].can_id[0] == 0x101